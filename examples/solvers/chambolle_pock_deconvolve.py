@@ -20,19 +20,19 @@ n = 128
 # Discretized spaces
 space = odl.uniform_discr([0, 0], [n, n], [n, n])
 
-# Initialize convolution operator by Fourier formula
-#     conv(f, g) = F^{-1}[F[f] * F[g]]
-# Where F[.] is the Fourier transform and the fourier transform of a guassian
-# with standard deviation filter_width is another gaussian with width
-# 1 / filter_width
+# Initialize convolution operator with a Gaussian kernel of standard
+# deviation filter_width, sampled up to 4 standard deviations from the center
+# and normalized to sum 1. The operator evaluates the convolution by direct
+# summation, FFT or overlap-add, depending on the sizes of image and kernel.
 filter_width = 3.0  # standard deviation of the Gaussian filter
-ft = odl.trafos.FourierTransform(space)
-c = filter_width ** 2 / 4.0 ** 2
-gaussian = ft.range.element(lambda x: np.exp(-(x[0] ** 2 + x[1] ** 2) * c))
-convolution = ft.inverse * gaussian * ft
+kernel_pts = np.arange(-4 * filter_width, 4 * filter_width + 1)
+kernel_x, kernel_y = np.meshgrid(kernel_pts, kernel_pts, indexing='ij')
+kernel = np.exp(-(kernel_x ** 2 + kernel_y ** 2) / (2 * filter_width ** 2))
+kernel /= kernel.sum()
+convolution = odl.trafos.Convolution(space, kernel)
 
 # Optional: Run diagnostics to assure the adjoint is properly implemented
-# odl.diagnostics.OperatorTest(conv_op).run_tests()
+# odl.diagnostics.OperatorTest(convolution).run_tests()
 
 # Create phantom
 phantom = odl.phantom.shepp_logan(space, modified=True)
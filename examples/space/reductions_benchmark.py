@@ -0,0 +1,57 @@
+"""Benchmark of inner product, norm and distance of large vectors.
+
+The weightings of `NumpyFn` use chunked and multithreaded reductions
+without temporary arrays of full size. This example compares them to
+the plain NumPy implementations that were used before.
+"""
+
+import numpy as np
+import odl
+from odl.util.testutils import Timer
+
+n = 10 ** 7
+iterations = 10
+weights = np.random.rand(n) + 0.5
+
+const_spc = odl.rn(n, weighting=2.0)
+array_spc = odl.rn(n, weighting=weights)
+array_spc_p = odl.rn(n, weighting=weights, exponent=1.5)
+
+x, y = np.random.rand(n), np.random.rand(n)
+cx, cy = const_spc.element(x.copy()), const_spc.element(y.copy())
+ax, ay = array_spc.element(x.copy()), array_spc.element(y.copy())
+px = array_spc_p.element(x.copy())
+
+
+def plain_const_dist():
+    return np.sqrt(2.0) * np.linalg.norm(x - y)
+
+
+def plain_array_inner():
+    return np.dot(x * weights, y)
+
+
+def plain_array_norm():
+    return np.sqrt(np.dot(x * weights, x))
+
+
+def plain_array_pnorm():
+    return np.sum(weights * np.abs(x) ** 1.5) ** (1 / 1.5)
+
+
+cases = [('const dist', plain_const_dist, lambda: cx.dist(cy)),
+         ('array inner', plain_array_inner, lambda: ax.inner(ay)),
+         ('array norm', plain_array_norm, lambda: ax.norm()),
+         ('array 1.5-norm', plain_array_pnorm, lambda: px.norm())]
+
+for name, plain, odl_version in cases:
+    print(' {}:'.format(name))
+    with Timer('plain numpy'):
+        for _ in range(iterations):
+            result = plain()
+    print('result: {}'.format(result))
+
+    with Timer('odl numpy'):
+        for _ in range(iterations):
+            result = odl_version()
+    print('result: {}'.format(result))
@@ -0,0 +1,52 @@
+"""Benchmark of the evaluation engines of the convolution operator.
+
+`Convolution` can evaluate the sum directly, with one zero-padded real FFT
+or with overlap-add of FFTs of image blocks. This example compares the
+engines for different image and kernel sizes, together with the convolution
+``ft.inverse * kernel_ft * ft`` from the continuous Fourier transform that
+was used before, and prints the engine that is chosen automatically.
+"""
+
+import numpy as np
+import odl
+from odl.util.testutils import Timer
+
+iterations = 10
+# Pairs of image shape and kernel shape
+cases = [((10 ** 6,), (9,)),
+         ((10 ** 6,), (101,)),
+         ((10 ** 6,), (1001,)),
+         ((256, 256), (3, 3)),
+         ((512, 512), (15, 15)),
+         ((1024, 1024), (33, 33)),
+         ((64, 64, 64), (3, 3, 3)),
+         ((128, 128, 128), (11, 11, 11))]
+
+for shape, kernel_shape in cases:
+    print(' image shape {}, kernel shape {}:'.format(shape, kernel_shape))
+    space = odl.uniform_discr([0] * len(shape), shape, shape)
+    x = odl.phantom.white_noise(space)
+    kernel = np.random.rand(*kernel_shape)
+
+    for engine in ('direct', 'fft', 'oadd'):
+        if (engine == 'direct' and
+                np.prod(shape) * np.prod(kernel_shape) > 10 ** 8):
+            print('{:>30s} : {:>10s} '.format(engine, 'skipped'))
+            continue
+        conv = odl.trafos.Convolution(space, kernel, engine=engine)
+        conv(x)  # Warm-up, e.g., for FFTW planning
+        with Timer(engine):
+            for _ in range(iterations):
+                conv(x)
+
+    # Full complex transforms, with the kernel spectrum as multiplier
+    ft = odl.trafos.FourierTransform(space)
+    kernel_ft = ft.range.element(np.random.rand(*ft.range.shape))
+    ft_conv = ft.inverse * kernel_ft * ft
+    ft_conv(x)
+    with Timer('FourierTransform'):
+        for _ in range(iterations):
+            ft_conv(x)
+
+    auto_engine = odl.trafos.Convolution(space, kernel).engine
+    print('{:>30s} : {:>10s} '.format('chosen engine', auto_engine))
@@ -588,7 +588,7 @@ extended-mrc-format-not-used-by-2dx
             raise ValueError("`groupby` '{}' not understood"
                              "".format(groupby_in))
 
-    def read_data(self, dstart=None, dend=None, swap_axes=True):
+    def read_data(self, dstart=None, dend=None, swap_axes=True, mmap=False):
         """Read the data from `file` and return it as Numpy array.
 
         Parameters
@@ -606,19 +606,77 @@ extended-mrc-format-not-used-by-2dx
             If ``True``, use `data_axis_order` to swap the axes in the
             returned array. In that case, the shape of the array may no
             longer agree with `data_storage_shape`.
+        mmap : bool, optional
+            If ``True``, return a read-only `numpy.memmap` view of the
+            data instead of reading it. Reshaping and axis swapping do
+            not copy, hence only the accessed parts of the data are read
+            from disk.
 
         Returns
         -------
-        data : `numpy.ndarray`
-            The data read from `file`.
+        data : `numpy.ndarray` or `numpy.memmap`
+            The data read from `file`, or a view of it for
+            ``mmap=True``.
+
+        See Also
+        --------
+        __getitem__ : Read a part of the data.
         """
-        data = super().read_data(dstart, dend).reshape(self.data_shape,
-                                                       order='F')
+        data = super().read_data(dstart, dend, mmap=mmap)
+        data = data.reshape(self.data_storage_shape, order='F')
         if swap_axes:
             data = np.transpose(data, axes=self.data_axis_order)
             assert data.shape == self.data_shape
         return data
 
+    def __getitem__(self, indices):
+        """Return ``self.read_data()[indices]`` without reading all data.
+
+        The data block is mapped into memory, and only the parts of
+        `file` that are covered by ``indices`` are read, e.g., a
+        sub-volume or a range of tilt images. Indexing refers to the
+        axes of `data_shape`, i.e., after swapping the axes according
+        to `data_axis_order`. The header is read first if necessary.
+
+        Parameters
+        ----------
+        indices : index expression
+            Any index expression supported by `numpy.ndarray`, e.g.,
+            ``reader[:, :, 10:20]`` or ``reader[::2, 5]``.
+
+        Returns
+        -------
+        values : `numpy.ndarray` or scalar
+            The indexed part of the data. Arrays are newly allocated
+            and do not depend on `file`.
+
+        Examples
+        --------
+        Read the central slice of a volume, stored in 'file.mrc':
+
+        >>> with FileReaderMRC('file.mrc') as reader:  # doctest: +SKIP
+        ...     central_slice = reader[:, :, reader.data_shape[2] // 2]
+        """
+        if not self.header:
+            self.read_header()
+
+        dstart = int(self.header_size)
+        data_size = int(np.prod(self.data_shape)) * self.data_dtype.itemsize
+        dend = dstart + data_size
+        try:
+            self.file.fileno()
+        except (AttributeError, IOError, ValueError):
+            # No file descriptor to map, fall back to a full read
+            data = self.read_data(dstart, dend)
+        else:
+            data = self.read_data(dstart, dend, mmap=True)
+
+        values = data[indices]
+        if isinstance(values, np.ndarray):
+            # Copy to plain array, reading the values and unmapping `file`
+            values = np.array(values)
+        return values
+
 
 class FileWriterMRC(MRCHeaderProperties, FileWriterRawBinaryWithHeader):
 
@@ -215,5 +215,36 @@ def test_mrc_io(shape, mrc_mode_dtype, ispg_kind, axis_order):
         assert reader.labels == ()
 
 
+def test_mrc_reader_slicing(mrc_mode_dtype, axis_order):
+    """Test reading data with and without memory map, and slicing."""
+    _, dtype = mrc_mode_dtype
+    shape = (5, 6, 7)
+    header = mrc_header_from_params(shape, dtype, 'volume',
+                                    axis_order=axis_order)
+    data = np.random.randint(0, 10, size=shape).astype(dtype)
+
+    with tempfile.NamedTemporaryFile() as named_file:
+        file = named_file.file
+        with FileWriterMRC(file, header) as writer:
+            writer.write(data)
+
+        reader = FileReaderMRC(file)
+        assert np.array_equal(reader[1:4, ::2, -1], data[1:4, ::2, -1])
+
+        reader.read_header()
+        assert np.array_equal(reader.read_data(), data)
+        mapped_data = reader.read_data(mmap=True)
+        assert isinstance(mapped_data, np.memmap)
+        assert np.array_equal(mapped_data, data)
+
+        for indices in [(slice(None), slice(None), 3),
+                        (slice(1, 4), slice(None, None, -2)),
+                        (Ellipsis, [0, 4]),
+                        (0, 5, 6)]:
+            values = reader[indices]
+            assert np.array_equal(values, data[indices])
+            assert not isinstance(values, np.memmap)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
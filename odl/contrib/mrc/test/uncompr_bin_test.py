@@ -67,6 +67,11 @@ def test_uncompr_bin_io_without_header(shape, floating_dtype, order):
                 reader.data_storage_shape, order=order)
             assert np.array_equal(file_data, flat_data)
 
+            # whole file as memory map
+            file_data = reader.read_data(mmap=True)
+            assert isinstance(file_data, np.memmap)
+            assert np.array_equal(file_data, data.ravel(order))
+
             # read an arbitrary section ('F' ordering only, otherwise stuff is
             # not contiguous)
             if order == 'F':
@@ -79,6 +84,10 @@ def test_uncompr_bin_io_without_header(shape, floating_dtype, order):
                                                 dend=section_end)
                 assert np.array_equal(file_section, flat_section)
 
+                file_section = reader.read_data(dstart=section_start,
+                                                dend=section_end, mmap=True)
+                assert np.array_equal(file_section, flat_section)
+
 
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -464,7 +464,7 @@ class FileReaderRawBinaryWithHeader(object):
 
         return header
 
-    def read_data(self, dstart=None, dend=None):
+    def read_data(self, dstart=None, dend=None, mmap=False):
         """Read data from `file` and return it as Numpy array.
 
         Parameters
@@ -478,11 +478,18 @@ class FileReaderRawBinaryWithHeader(object):
             End position in bytes until which data is read (exclusive).
             Backwards indexing with negative values is also supported.
             Use a value different from the file size to extract a data subset.
+        mmap : bool, optional
+            If ``True``, do not read the data but map the byte range
+            into memory and return a read-only `numpy.memmap`. Only the
+            parts of the array that are accessed later on are actually
+            read from disk, which is useful for large files. This
+            requires `file` to be backed by a file descriptor.
 
         Returns
         -------
-        data : `numpy.ndarray`
-            The data read from `file`.
+        data : `numpy.ndarray` or `numpy.memmap`
+            The data read from `file`, or a view of it for
+            ``mmap=True``.
 
         See Also
         --------
@@ -524,6 +531,13 @@ class FileReaderRawBinaryWithHeader(object):
                 'the itemsize {} of the data type {}'
                 ''.format(dend_abs - dstart_abs, self.data_dtype.itemsize,
                           self.data_dtype))
+        if mmap:
+            # Make pending writes through `file` visible to the mapping
+            if hasattr(self.file, 'flush'):
+                self.file.flush()
+            return np.memmap(self.file, dtype=self.data_dtype, mode='r',
+                             offset=dstart_abs, shape=(int(num_elems),))
+
         self.file.seek(dstart_abs)
         array = np.empty(int(num_elems), dtype=self.data_dtype)
         self.file.readinto(array.data)
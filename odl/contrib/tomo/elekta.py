@@ -13,7 +13,7 @@ import odl
 
 
 __all__ = ('elekta_icon_geometry', 'elekta_icon_space',
-           'elekta_icon_fbp')
+           'elekta_icon_fbp', 'elekta_icon_incremental_fbp')
 
 
 def elekta_icon_geometry(sad=780.0, sdd=1000.0,
@@ -190,6 +190,63 @@ def elekta_icon_fbp(ray_transform,
     return fbp_op
 
 
+def elekta_icon_incremental_fbp(ray_transform,
+                                padding=False, filter_type='Hann',
+                                frequency_scaling=0.6, parker_weighting=True):
+    """Incremental version of `elekta_icon_fbp` for streamed projections.
+
+    Projections can be reconstructed batch by batch while they are
+    acquired, such that the reconstruction is available right after the
+    last projection.
+
+    Parameters
+    ----------
+    ray_transform : `RayTransform`
+        The ray transform to be used, should have an Elekta Icon geometry.
+    padding : bool, optional
+        If the fbp filter should use padding, increases memory use
+        significantly.
+    filter_type : str, optional
+        Type of filter to apply in the FBP filter.
+    frequency_scaling : float, optional
+        Frequency scaling for FBP filter
+    parker_weighting : bool, optional
+        Whether Parker weighting should be applied to compensate for partial
+        scan.
+
+    Returns
+    -------
+    incremental_fbp : `odl.tomo.IncrementalFBP`
+
+    Examples
+    --------
+    Create incremental FBP for a small geometry and add the first
+    projections:
+
+    >>> from odl.contrib import tomo
+    >>> geometry = tomo.elekta_icon_geometry(detector_shape=[100, 100])
+    >>> space = tomo.elekta_icon_space(shape=(112, 112, 112))
+    >>> ray_transform = odl.tomo.RayTransform(space, geometry)
+    >>> inc_fbp = tomo.elekta_icon_incremental_fbp(ray_transform)
+    >>> projections = np.zeros((10,) + ray_transform.range.shape[1:])
+    >>> reco = inc_fbp.add_projections(projections)
+
+    See Also
+    --------
+    elekta_icon_fbp : Reconstruction of the full data
+    """
+    if parker_weighting:
+        weighting = odl.tomo.parker_weighting(ray_transform)
+    else:
+        weighting = None
+
+    return odl.tomo.IncrementalFBP(ray_transform,
+                                   padding=padding,
+                                   filter_type=filter_type,
+                                   frequency_scaling=frequency_scaling,
+                                   weighting=weighting)
+
+
 if __name__ == '__main__':
     # Run doctests
     # pylint: disable=wrong-import-position
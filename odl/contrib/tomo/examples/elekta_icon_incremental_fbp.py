@@ -0,0 +1,37 @@
+"""Example of reconstructing Elekta Icon data while it is acquired.
+
+In this example we create artificial data in the Elekta Icon geometry and
+feed it in batches of projections to an incremental FDK reconstruction,
+as if the projections were read out from the detector one after another.
+The reconstruction is ready as soon as the last batch has been added.
+
+Note that this is a 3d dataset and requires some memory to run.
+"""
+
+import odl
+from odl.contrib import tomo
+
+# Get default geometry and space
+geometry = tomo.elekta_icon_geometry()
+space = tomo.elekta_icon_space(shape=(112, 112, 112))
+
+# Create ray transform
+ray_transform = odl.tomo.RayTransform(space, geometry,
+                                      use_cache=False)
+
+# Create artificial data
+phantom = odl.phantom.shepp_logan(space, modified=True)
+projections = ray_transform(phantom).asarray()
+
+# Get incremental FDK reconstruction
+inc_fbp = tomo.elekta_icon_incremental_fbp(ray_transform)
+
+# Add the projections in batches as they "arrive"
+batch_size = 32
+with odl.util.Timer('incremental reconstruction'):
+    for start in range(0, projections.shape[0], batch_size):
+        inc_fbp.add_projections(projections[start:start + batch_size])
+
+# Display the results
+phantom.show('phantom xz', coords=[None, 0, None])
+inc_fbp.reconstruction.show('reconstruction xz', coords=[None, 0, None])
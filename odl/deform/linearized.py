@@ -17,6 +17,7 @@ from builtins import super
 import numpy as np
 
 from odl.discr import DiscreteLp, Gradient, Divergence
+from odl.discr.discr_mappings import _interpolation_matrix
 from odl.operator import Operator, PointwiseInner
 from odl.space import ProductSpace
 
@@ -80,6 +81,40 @@ def _linear_deform(template, displacement, out=None):
     return template.interpolation(image_pts.T, out=out, bounds_check=False)
 
 
+def _linear_deform_matrix(space, displacement):
+    """Return the matrix of the linearized deformation with ``displacement``.
+
+    Parameters
+    ----------
+    space : `DiscreteLp`
+        Space of the templates to be deformed.
+    displacement : element of power space of ``space.real_space``
+        Vector field (displacement field) used to deform the templates.
+
+    Returns
+    -------
+    matrix : `scipy.sparse.csr_matrix`
+        Matrix mapping the flat values of a template to the flat values
+        of the deformed template, both ordered as ``space.order``.
+    """
+    grid = space.grid
+    order = space.order
+
+    # Deformed points per axis, without creating the full point array
+    deformed_pts = []
+    for i, (cvec, vi) in enumerate(zip(grid.coord_vectors, displacement)):
+        bcast_shape = [1] * space.ndim
+        bcast_shape[i] = -1
+        xi = np.broadcast_to(cvec.reshape(bcast_shape), space.shape)
+        deformed_pts.append(xi.ravel(order=order) + vi.ntuple.asarray())
+
+    schemes = space.interp_byaxis
+    variants = ['left' if scm == 'nearest' else None for scm in schemes]
+    return _interpolation_matrix(grid.coord_vectors, deformed_pts, schemes,
+                                 variants, order=order,
+                                 dtype=space.real_dtype)
+
+
 class LinDeformFixedTempl(Operator):
 
     """Deformation operator with fixed template acting on displacement fields.
@@ -342,6 +377,9 @@ class LinDeformFixedDisp(Operator):
                     ''.format(templ_space.partition, space[0].partition))
 
         self.__displacement = displacement
+        self.__interp_matrix = None
+        self.__inverse = None
+        self.__adjoint = None
         super().__init__(domain=templ_space, range=templ_space, linear=True)
 
     @property
@@ -349,9 +387,39 @@ class LinDeformFixedDisp(Operator):
         """Fixed displacement field of this deformation operator."""
         return self.__displacement
 
+    @property
+    def interp_matrix(self):
+        """Sparse matrix of the interpolation in the deformed points.
+
+        The matrix is computed on first access and cached, such that
+        applying the operator to a template amounts to a sparse
+        matrix-vector product with the flat template values.
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr(0, 1, 5, interp='linear')
+        >>> disp_field = space.tangent_bundle.element([[0, 0, 0, -0.1, 0]])
+        >>> op = LinDeformFixedDisp(disp_field)
+        >>> print(op.interp_matrix.toarray())
+        [[ 1.   0.   0.   0.   0. ]
+         [ 0.   1.   0.   0.   0. ]
+         [ 0.   0.   1.   0.   0. ]
+         [ 0.   0.   0.5  0.5  0. ]
+         [ 0.   0.   0.   0.   1. ]]
+        """
+        if self.__interp_matrix is None:
+            self.__interp_matrix = _linear_deform_matrix(self.domain,
+                                                         self.displacement)
+        return self.__interp_matrix
+
     def _call(self, template, out=None):
         """Implementation of ``self(template[, out])``."""
-        return _linear_deform(template, self.displacement, out)
+        result = self.interp_matrix.dot(template.ntuple.asarray())
+        if out is None:
+            return result
+        else:
+            out[:] = result
+            return out
 
     @property
     def inverse(self):
@@ -360,22 +428,28 @@ class LinDeformFixedDisp(Operator):
         Note that this implementation uses an approximation that is only
         valid for small displacements.
         """
-        return LinDeformFixedDisp(-self.displacement, templ_space=self.domain)
+        if self.__inverse is None:
+            self.__inverse = LinDeformFixedDisp(-self.displacement,
+                                                templ_space=self.domain)
+        return self.__inverse
 
     @property
     def adjoint(self):
         """Adjoint of the linear operator.
 
         Note that this implementation uses an approximation that is only
-        valid for small displacements.
+        valid for small displacements. The exact adjoint of the discretized
+        operator is given by the transpose of `interp_matrix`.
         """
-        # TODO allow users to select what method to use here.
-        div_op = Divergence(domain=self.displacement.space, method='forward',
-                            pad_mode='symmetric')
-        jacobian_det = self.domain.element(
-            np.exp(-div_op(self.displacement)))
-
-        return jacobian_det * self.inverse
+        if self.__adjoint is None:
+            # TODO allow users to select what method to use here.
+            div_op = Divergence(domain=self.displacement.space,
+                                method='forward', pad_mode='symmetric')
+            jacobian_det = self.domain.element(
+                np.exp(-div_op(self.displacement)))
+            self.__adjoint = jacobian_det * self.inverse
+
+        return self.__adjoint
 
     def __repr__(self):
         """Return ``repr(self)``."""
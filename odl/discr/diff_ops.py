@@ -14,11 +14,13 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import super
 
+from multiprocessing import cpu_count
 import numpy as np
 
 from odl.discr.lp_discr import DiscreteLp
 from odl.operator.tensor_ops import PointwiseTensorFieldOperator
 from odl.space import ProductSpace
+from odl.space.reductions import _thread_pool
 
 
 __all__ = ('PartialDerivative', 'Gradient', 'Divergence', 'Laplacian')
@@ -46,6 +48,14 @@ _ADJ_PADDING = {'constant': 'constant',
                 'order2': 'order2_adjoint',
                 'order2_adjoint': 'order2'}
 
+# Number of elements per slab in `finite_diff`. Slabs of the involved
+# arrays together should fit into the CPU cache.
+FINITE_DIFF_SLAB_SIZE = 2 ** 15
+
+# Minimum number of elements per thread in `finite_diff`. Smaller arrays
+# are processed with fewer threads, down to a single one.
+FINITE_DIFF_MIN_SIZE_PER_THREAD = 2 ** 18
+
 
 class PartialDerivative(PointwiseTensorFieldOperator):
 
@@ -139,8 +149,8 @@ class PartialDerivative(PointwiseTensorFieldOperator):
                     method=self.method, pad_mode=self.pad_mode,
                     pad_const=self.pad_const)
 
-        # self assignment: no overhead in the case out_arr is a view
-        out[:] = out_arr
+        if not _is_data_view(out):
+            out[:] = out_arr
         return out
 
     def derivative(self, point=None):
@@ -312,6 +322,7 @@ class Gradient(PointwiseTensorFieldOperator):
         dx = self.domain.cell_sides
 
         for axis in range(ndim):
+            # Written directly to `out` if `out_arr` is a view
             out_arr = out[axis].asarray()
 
             finite_diff(x_arr, axis=axis, dx=dx[axis], method=self.method,
@@ -319,7 +330,8 @@ class Gradient(PointwiseTensorFieldOperator):
                         pad_const=self.pad_const,
                         out=out_arr)
 
-            out[axis][:] = out_arr
+            if not _is_data_view(out[axis]):
+                out[axis][:] = out_arr
 
         return out
 
@@ -491,20 +503,18 @@ class Divergence(PointwiseTensorFieldOperator):
         ndim = self.range.ndim
         dx = self.range.cell_sides
 
+        # The partial derivatives are added to `out_arr` in place, without
+        # temporaries of full size
         out_arr = out.asarray()
-        tmp = np.empty(out.shape, out.dtype, order=out.space.order)
         for axis in range(ndim):
-            finite_diff(x[axis], axis=axis, dx=dx[axis], method=self.method,
+            finite_diff(x[axis].asarray(), axis=axis, dx=dx[axis],
+                        method=self.method,
                         pad_mode=self.pad_mode,
                         pad_const=self.pad_const,
-                        out=tmp)
-            if axis == 0:
-                out_arr[:] = tmp
-            else:
-                out_arr += tmp
+                        out=out_arr, accumulate=(axis > 0))
 
-        # self assignment: no overhead in the case asarray is a view
-        out[:] = out_arr
+        if not _is_data_view(out):
+            out[:] = out_arr
         return out
 
     def derivative(self, point=None):
@@ -740,6 +750,9 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     pad_const : float, optional
         For ``pad_mode == 'constant'``, ``f`` assumes ``pad_const`` for
         indices outside the domain of ``f``
+    accumulate : bool, optional
+        If ``True``, add the partial derivative to ``out`` instead of
+        overwriting it. This requires ``out`` to be given.
 
     Returns
     -------
@@ -747,6 +760,11 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
         N-dimensional array of the same shape as ``f``. If ``out`` was
         provided, the returned object is a reference to it.
 
+    Notes
+    -----
+    The interior values are computed with slicing only, in slabs that fit
+    into the CPU cache. Large arrays are processed with several threads.
+
     Examples
     --------
     >>> f = np.array([ 0., 1., 2., 3., 4., 5., 6., 7., 8., 9.])
@@ -778,6 +796,12 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     >>> out = f.copy()
     >>> out is finite_diff(f, axis=0, out=out)
     True
+
+    Adding to an existing array:
+
+    >>> out = np.ones(10)
+    >>> finite_diff(f, axis=0, out=out, accumulate=True)
+    array([ 2.,  2.,  2.,  2.,  2.,  2.,  2.,  2.,  2.,  -8.])
     """
     f_arr = np.asarray(f)
     ndim = f_arr.ndim
@@ -805,8 +829,11 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
         raise ValueError('`pad_mode` {} not understood'
                          ''.format(pad_mode))
     pad_const = float(kwargs.pop('pad_const', 0))
+    accumulate = bool(kwargs.pop('accumulate', False))
 
     if out is None:
+        if accumulate:
+            raise ValueError('`out` required for `accumulate=True`')
         out = np.empty_like(f_arr)
     else:
         if out.shape != f.shape:
@@ -823,28 +850,88 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     if kwargs:
         raise ValueError('unkown keyword argument(s): {}'.format(kwargs))
 
-    # create slice objects: initially all are [:, :, ..., :]
+    _finite_diff_impl(f_arr, out, axis, dx, method, pad_mode, pad_const,
+                      accumulate)
+    return out
+
+
+def _is_data_view(x):
+    """Return ``True`` if ``x.asarray()`` is a view of the data of ``x``.
+
+    This holds for `DiscreteLp` elements with NumPy based data storage.
+    """
+    return x.space.impl == 'numpy'
+
+
+def _finite_diff_impl(f_arr, out, axis, dx, method, pad_mode, pad_const,
+                      accumulate=False):
+    """Write or add the finite difference along ``axis`` to ``out``.
 
+    The interior is computed slab by slab, with several threads for large
+    arrays. The boundary values are computed in a small scratch array and
+    added to the outermost slices of ``out``. With ``accumulate=True``, the
+    temporaries have the size of a slab only.
+    """
     # Swap axes so that the axis of interest is first. This is a O(1)
     # operation and is done to simplify the code below.
-    out, out_in = np.swapaxes(out, 0, axis), out
+    out = np.swapaxes(out, 0, axis)
     f_arr = np.swapaxes(f_arr, 0, axis)
+    n = f_arr.shape[0]
 
     # Interior of the domain of f
     if method == 'central':
         # 1D equivalent: out[1:-1] = (f[2:] - f[:-2])/2.0
-        np.subtract(f_arr[2:], f_arr[:-2], out=out[1:-1])
-        out[1:-1] /= 2.0
-
+        upper, lower, scale = slice(2, None), slice(None, -2), 2.0 * dx
     elif method == 'forward':
         # 1D equivalent: out[1:-1] = (f[2:] - f[1:-1])
-        np.subtract(f_arr[2:], f_arr[1:-1], out=out[1:-1])
-
+        upper, lower, scale = slice(2, None), slice(1, -1), dx
     elif method == 'backward':
         # 1D equivalent: out[1:-1] = (f[1:-1] - f[:-2])
-        np.subtract(f_arr[1:-1], f_arr[:-2], out=out[1:-1])
+        upper, lower, scale = slice(1, -1), slice(None, -2), dx
+
+    def interior_kernel(slab):
+        out_slab = out[(slice(1, -1),) + slab]
+        if accumulate:
+            tmp = np.subtract(f_arr[(upper,) + slab], f_arr[(lower,) + slab])
+            tmp /= scale
+            out_slab += tmp
+        else:
+            np.subtract(f_arr[(upper,) + slab], f_arr[(lower,) + slab],
+                        out=out_slab)
+            out_slab /= scale
+
+    # Slabs along the axis that was originally the first one, or the
+    # second one if the first is the difference axis
+    slab_axis = axis if axis != 0 else 1
+    _run_in_slabs(interior_kernel, f_arr.shape, slab_axis)
+
+    # Boundaries, computed in a scratch array for the (up to) 3 outermost
+    # slices on each side. It is indexed like the full array, i.e.,
+    # ``edges[-1]`` corresponds to ``out[-1]``.
+    if n > 6:
+        edge_indices = [0, 1, 2, n - 3, n - 2, n - 1]
+    else:
+        edge_indices = list(range(n))
+    edges = np.zeros((len(edge_indices),) + f_arr.shape[1:], dtype=out.dtype)
+    _finite_diff_boundary(f_arr, edges, method, pad_mode, pad_const)
+    edges /= dx
+
+    if accumulate:
+        out[edge_indices] += edges
+    else:
+        # The outermost slices are not written in the interior part
+        out[0] = edges[0]
+        out[-1] = edges[-1]
+        out[edge_indices[1:-1]] += edges[1:-1]
 
-    # Boundaries
+
+def _finite_diff_boundary(f_arr, out, method, pad_mode, pad_const):
+    """Compute the boundary values of a finite difference along axis 0.
+
+    The values in the first and last slices of ``out`` are overwritten,
+    while the neighboring slices are incremented for some padding modes.
+    Division by the step size is not included.
+    """
     if pad_mode == 'constant':
         # Assume constant value c for indices outside the domain of ``f``
 
@@ -1022,10 +1109,35 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     else:
         raise NotImplementedError('unknown pad_mode')
 
-    # divide by step size
-    out /= dx
 
-    return out_in
+def _run_in_slabs(kernel, shape, slab_axis):
+    """Call ``kernel(slab)`` for slabs of an array along ``slab_axis``.
+
+    The slabs are tuples of slices for the axes ``1, ..., ndim - 1``.
+    Large arrays are processed with several threads.
+    """
+    if len(shape) == 1:
+        kernel(())
+        return
+
+    size = int(np.prod(shape))
+    threads = max(1, min(cpu_count(),
+                         size // FINITE_DIFF_MIN_SIZE_PER_THREAD))
+    num_slabs = max(threads, -(-size // FINITE_DIFF_SLAB_SIZE))
+    num_slabs = min(num_slabs, shape[slab_axis])
+    bounds = np.linspace(0, shape[slab_axis], num_slabs + 1).astype(int)
+
+    slabs = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        slab = [slice(None)] * (len(shape) - 1)
+        slab[slab_axis - 1] = slice(start, stop)
+        slabs.append(tuple(slab))
+
+    if threads > 1:
+        _thread_pool(threads).map(kernel, slabs)
+    else:
+        for slab in slabs:
+            kernel(slab)
 
 
 if __name__ == '__main__':
@@ -20,6 +20,7 @@ from builtins import str, super, zip
 
 from itertools import product
 import numpy as np
+import scipy.sparse
 
 from odl.operator import Operator
 from odl.discr.partition import RectPartition
@@ -28,6 +29,12 @@ from odl.space import FunctionSet, FunctionSpace
 from odl.util import (
     is_valid_input_meshgrid, out_shape_from_array, out_shape_from_meshgrid)
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 __all__ = ('FunctionSetMapping',
            'PointCollocation', 'NearestInterpolation', 'LinearInterpolation',
@@ -35,6 +42,14 @@ __all__ = ('FunctionSetMapping',
 
 _SUPPORTED_INTERP_SCHEMES = ['nearest', 'linear']
 
+# Minimum number of evaluation points for which the compiled kernel is
+# used in `_PerAxisInterpolator`. Below, the NumPy code is fast enough.
+INTERP_NUMBA_MIN_SIZE = 2 ** 10
+
+# Data types supported by the compiled kernel
+_NUMBA_DTYPES = (np.dtype('float32'), np.dtype('float64'),
+                 np.dtype('complex64'), np.dtype('complex128'))
+
 
 class FunctionSetMapping(Operator):
 
@@ -775,6 +790,18 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
                                  'dtype {}'
                                  ''.format(out.dtype, self.values.dtype))
 
+        if self.input_type == 'meshgrid' and _is_separable_meshgrid(x):
+            return self._evaluate_separable(x, out)
+
+        indices, norm_distances = self._find_indices(x)
+        return self._evaluate(indices, norm_distances, out)
+
+    def _evaluate_separable(self, x, out=None):
+        """Evaluate in a sparse meshgrid ``x``.
+
+        Can be overridden by subclasses to make use of the tensor product
+        structure of ``x``.
+        """
         indices, norm_distances = self._find_indices(x)
         return self._evaluate(indices, norm_distances, out)
 
@@ -783,27 +810,48 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
 
         Can be overridden by subclasses to improve efficiency.
         """
-        # find relevant edges between which xi are situated
-        index_vecs = []
-        # compute distance to lower edge in unity units
-        norm_distances = []
+        return _find_indices(self.coord_vecs, x)
 
-        # iterate through dimensions
-        for xi, cvec in zip(x, self.coord_vecs):
-            idcs = np.searchsorted(cvec, xi) - 1
+    def _evaluate(self, indices, norm_distances, out=None):
+        """Evaluation method, needs to be overridden."""
+        raise NotImplementedError('abstract method')
 
-            idcs[idcs < 0] = 0
-            idcs[idcs > cvec.size - 2] = cvec.size - 2
-            index_vecs.append(idcs)
 
-            norm_distances.append((xi - cvec[idcs]) /
-                                  (cvec[idcs + 1] - cvec[idcs]))
+def _find_indices(coord_vecs, x):
+    """Find indices and distances of the nodes ``x`` in a grid.
 
-        return index_vecs, norm_distances
+    Parameters
+    ----------
+    coord_vecs : sequence of `numpy.ndarray`'s
+        Coordinate vectors defining the interpolation grid
+    x : sequence of `numpy.ndarray`'s
+        Coordinates of the nodes, one array per axis
 
-    def _evaluate(self, indices, norm_distances, out=None):
-        """Evaluation method, needs to be overridden."""
-        raise NotImplementedError('abstract method')
+    Returns
+    -------
+    index_vecs : list of `numpy.ndarray`'s
+        Per axis, the indices of the grid points left of the nodes
+    norm_distances : list of `numpy.ndarray`'s
+        Per axis, the distances of the nodes to those grid points in
+        units of the local cell size
+    """
+    # find relevant edges between which xi are situated
+    index_vecs = []
+    # compute distance to lower edge in unity units
+    norm_distances = []
+
+    # iterate through dimensions
+    for xi, cvec in zip(x, coord_vecs):
+        idcs = np.searchsorted(cvec, xi) - 1
+
+        idcs[idcs < 0] = 0
+        idcs[idcs > cvec.size - 2] = cvec.size - 2
+        index_vecs.append(idcs)
+
+        norm_distances.append((xi - cvec[idcs]) /
+                              (cvec[idcs + 1] - cvec[idcs]))
+
+    return index_vecs, norm_distances
 
 
 class _NearestInterpolator(_Interpolator):
@@ -837,6 +885,13 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
             raise ValueError("variant '{}' not understood".format(variant_))
         self.variant = variant_
 
+    def _evaluate_separable(self, x, out=None):
+        """Evaluate nearest interpolation in a sparse meshgrid."""
+        ndim = len(self.coord_vecs)
+        return _evaluate_separable(self.coord_vecs, self.values, x,
+                                   ['nearest'] * ndim, [self.variant] * ndim,
+                                   out)
+
     def _evaluate(self, indices, norm_distances, out=None):
         """Evaluate nearest interpolation."""
         idx_res = []
@@ -940,6 +995,146 @@ def _create_weight_edge_lists(indices, norm_distances, schemes, variants):
     return low_weights, high_weights, edge_indices
 
 
+def _is_separable_meshgrid(x):
+    """Return ``True`` if each ``x[i]`` only varies along axis ``i``."""
+    return all(xi.ndim == len(x) and
+               all(n == 1 for j, n in enumerate(xi.shape) if j != i)
+               for i, xi in enumerate(x))
+
+
+def _evaluate_separable(coord_vecs, values, x, schemes, nn_variants,
+                        out=None):
+    """Evaluate a per-axis interpolation in a sparse meshgrid ``x``.
+
+    Since the interpolation weights factor into per-axis weights and the
+    nodes form a tensor product grid, the interpolation can be applied
+    as a sequence of 1D interpolations along the axes. Per axis, only
+    index and weight arrays of the length of ``x[i]`` are needed, and
+    each step is a cheap contraction along one axis.
+
+    Parameters
+    ----------
+    coord_vecs : sequence of `numpy.ndarray`'s
+        Coordinate vectors defining the interpolation grid
+    values : `numpy.ndarray`
+        Grid values to use for interpolation
+    x : sequence of `numpy.ndarray`'s
+        Sparse meshgrid of the evaluation nodes, such that ``x[i]`` only
+        varies along axis ``i``.
+    schemes : sequence of strings
+        Indicates which interpolation scheme to use for which axis
+    nn_variants : sequence of strings
+        Which variant ('left' or 'right') to use in nearest neighbor
+        interpolation for which axis.
+    out : `numpy.ndarray`, optional
+        Array to which the results are written.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        Interpolated values. If ``out`` was given, the returned object
+        is a reference to it.
+    """
+    ndim = len(coord_vecs)
+    x = [np.ravel(xi) for xi in x]
+
+    # Start with the axes that reduce the array size the most
+    axes = sorted(range(ndim), key=lambda i: len(x[i]) / len(coord_vecs[i]))
+
+    result = values
+    for axis in axes:
+        (idcs,), (ndist,) = _find_indices([coord_vecs[axis]], [x[axis]])
+        if schemes[axis] == 'nearest':
+            w_lo, _, edge = _compute_nearest_weights_edge(
+                idcs, ndist, nn_variants[axis])
+            # Exactly one of the weights is 1, the other one 0
+            result = np.take(result, np.where(w_lo == 1, *edge), axis=axis)
+        elif schemes[axis] == 'linear':
+            w_lo, w_hi, edge = _compute_linear_weights_edge(idcs, ndist)
+            # Broadcast the weights along `axis`
+            wslice = [None] * result.ndim
+            wslice[axis] = slice(None)
+            wslice = tuple(wslice)
+            result = (np.take(result, edge[0], axis=axis) * w_lo[wslice] +
+                      np.take(result, edge[1], axis=axis) * w_hi[wslice])
+        else:
+            raise ValueError("scheme '{}' at index {} not supported"
+                             "".format(schemes[axis], axis))
+
+    if out is None:
+        out = np.array(result, dtype=values.dtype, copy=False, ndmin=1)
+    else:
+        out[:] = result
+    return out
+
+
+def _interpolation_matrix(coord_vecs, x, schemes, nn_variants, order='C',
+                          dtype=float):
+    """Return the sparse matrix of a per-axis interpolation in nodes ``x``.
+
+    Row ``j`` of the matrix holds the weights that `_PerAxisInterpolator`
+    uses for the node ``j``, such that interpolating grid values ``f``,
+    flattened according to ``order``, in the nodes amounts to
+    ``matrix.dot(f)``.
+
+    Parameters
+    ----------
+    coord_vecs : sequence of `numpy.ndarray`'s
+        Coordinate vectors defining the interpolation grid
+    x : sequence of `numpy.ndarray`'s
+        Coordinates of the nodes, one array per axis
+    schemes : sequence of strings
+        Indicates which interpolation scheme to use for which axis
+    nn_variants : sequence of strings
+        Which variant ('left' or 'right') to use in nearest neighbor
+        interpolation for which axis.
+    order : {'C', 'F'}, optional
+        Ordering of the grid values in the flat array.
+    dtype : optional
+        Real floating point data type of the weights.
+
+    Returns
+    -------
+    matrix : `scipy.sparse.csr_matrix`
+        Interpolation matrix of shape ``(len(x[0]), grid_size)``. Weights
+        that are zero are not stored, and indices are 32-bit integers
+        if possible.
+    """
+    shape = tuple(len(cvec) for cvec in coord_vecs)
+    size = int(np.prod(shape))
+    npts = len(x[0])
+
+    indices, norm_distances = _find_indices(coord_vecs, x)
+    low_weights, high_weights, edge_indices = _create_weight_edge_lists(
+        indices, norm_distances, schemes, nn_variants)
+
+    # One column per corner of the cells, resulting in 2**ndim columns
+    ncorners = 2 ** len(coord_vecs)
+    max_idx = max(size, npts * ncorners)
+    idx_dtype = np.int32 if max_idx <= np.iinfo(np.int32).max else np.int64
+    cols = np.empty((npts, ncorners), dtype=idx_dtype)
+    weights = np.empty((npts, ncorners), dtype=dtype)
+    for i, (lo_hi, edge) in enumerate(
+            zip(product(*([['l', 'h']] * len(coord_vecs))),
+                product(*edge_indices))):
+        weight = 1.0
+        for lh, w_lo, w_hi in zip(lo_hi, low_weights, high_weights):
+            if lh == 'l':
+                weight = weight * w_lo
+            else:
+                weight = weight * w_hi
+        weights[:, i] = weight
+        # Negative indices are used for the last grid point
+        cols[:, i] = np.ravel_multi_index(edge, shape, mode='wrap',
+                                          order=order)
+
+    indptr = np.arange(0, npts * ncorners + 1, ncorners, dtype=idx_dtype)
+    matrix = scipy.sparse.csr_matrix(
+        (weights.ravel(), cols.ravel(), indptr), shape=(npts, size))
+    matrix.eliminate_zeros()
+    return matrix
+
+
 class _PerAxisInterpolator(_Interpolator):
 
     """Interpolator where the scheme is set per axis.
@@ -969,11 +1164,25 @@ class _PerAxisInterpolator(_Interpolator):
         self.schemes = schemes
         self.nn_variants = nn_variants
 
+    def _evaluate_separable(self, x, out=None):
+        """Evaluate the interpolation in a sparse meshgrid."""
+        return _evaluate_separable(self.coord_vecs, self.values, x,
+                                   self.schemes, self.nn_variants, out)
+
     def _evaluate(self, indices, norm_distances, out=None):
         """Evaluate linear interpolation.
 
         Modified for in-place evaluation and treatment of out-of-bounds
-        points by implicitly assuming 0 at the next node."""
+        points by implicitly assuming 0 at the next node.
+
+        If Numba is available, large inputs are evaluated by a compiled
+        kernel that handles all cell corners of a point in one go and
+        runs in parallel over the points.
+        """
+        if _use_numba_kernel(self.values, indices, norm_distances, out):
+            return _evaluate_numba(self.values, indices, norm_distances,
+                                   self.schemes, self.nn_variants, out)
+
         # slice for broadcasting over trailing dimensions in self.values
         vslice = (slice(None),) + (None,) * (self.values.ndim - len(indices))
 
@@ -1009,6 +1218,123 @@ class _PerAxisInterpolator(_Interpolator):
         return np.array(out, copy=False, ndmin=1)
 
 
+def _use_numba_kernel(values, indices, norm_distances, out):
+    """Return ``True`` if `_evaluate_numba` can and should be used."""
+    if not NUMBA_AVAILABLE or values.ndim != len(indices):
+        return False
+    if values.dtype not in _NUMBA_DTYPES:
+        return False
+    if out is not None and out.dtype != values.dtype:
+        return False
+    npts = np.prod(out_shape_from_meshgrid(norm_distances))
+    return npts >= INTERP_NUMBA_MIN_SIZE
+
+
+def _evaluate_numba(values, indices, norm_distances, schemes, nn_variants,
+                    out=None):
+    """Evaluate a per-axis interpolation with a compiled kernel.
+
+    The result is the same as the one of `_PerAxisInterpolator._evaluate`,
+    including the order in which the contributions of the cell corners
+    are summed up.
+    """
+    out_shape = out_shape_from_meshgrid(norm_distances)
+    if out is None:
+        out = np.empty(out_shape, dtype=values.dtype)
+
+    # Flat index and distance arrays per axis, copied only for meshgrids
+    idcs = tuple(np.broadcast_to(idx, out_shape).astype('int64', copy=False)
+                 .ravel() for idx in indices)
+    dists = tuple(np.broadcast_to(ndist, out_shape)
+                  .astype('float64', copy=False).ravel()
+                  for ndist in norm_distances)
+
+    # Schemes as integer codes, see `_per_axis_interp_kernel`
+    codes = np.array([0 if scm == 'linear' else
+                      1 if var == 'left' else 2
+                      for scm, var in zip(schemes, nn_variants)],
+                     dtype='int64')
+
+    # Access the values through their flat memory and strides
+    if not (values.flags.c_contiguous or values.flags.f_contiguous):
+        values = np.ascontiguousarray(values)
+    flat_values = values.ravel(order='K')
+    strides = np.array(values.strides, dtype='int64') // values.itemsize
+    shape = np.array(values.shape, dtype='int64')
+
+    if out.flags.c_contiguous:
+        _per_axis_interp_kernel(flat_values, strides, shape, idcs, dists,
+                                codes, out.reshape(-1))
+    else:
+        flat_out = np.empty(out.size, dtype=out.dtype)
+        _per_axis_interp_kernel(flat_values, strides, shape, idcs, dists,
+                                codes, flat_out)
+        out[:] = flat_out.reshape(out_shape)
+
+    return np.array(out, copy=False, ndmin=1)
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def _per_axis_interp_kernel(values, strides, shape, indices, norm_dists,
+                                schemes, out):
+        """Compiled per-axis interpolation of flat ``values`` into ``out``.
+
+        ``indices`` and ``norm_dists`` are tuples with one flat array per
+        axis. ``schemes`` holds one code per axis, 0 for linear, 1 for nearest
+        with ``'left'`` and 2 for nearest with ``'right'`` variant.
+        The weights and edge indices are as in
+        `_compute_linear_weights_edge` and `_compute_nearest_weights_edge`.
+        """
+        ndim = len(indices)
+        for p in numba.prange(out.size):
+            out[p] = 0
+            # Corners in the order of `itertools.product`, i.e., the
+            # last axis varies fastest
+            for corner in range(2 ** ndim):
+                weight = 1.0
+                offset = 0
+                for ax in range(ndim):
+                    upper = (corner >> (ndim - 1 - ax)) & 1
+                    idx = indices[ax][p]
+                    ndist = norm_dists[ax][p]
+
+                    if schemes[ax] == 0:
+                        w_lo = 1.0 - ndist
+                        w_hi = ndist
+                    else:
+                        if ((schemes[ax] == 1 and ndist <= 0.5) or
+                                (schemes[ax] == 2 and ndist < 0.5)):
+                            w_lo = 1.0
+                        else:
+                            w_lo = 0.0
+                        w_hi = 1.0 - w_lo
+
+                    if ndist < 0:
+                        w_lo = 0.0
+                        if schemes[ax] == 0:
+                            w_hi += 1.0
+                        else:
+                            w_hi = 1.0
+                    elif ndist > 1:
+                        if schemes[ax] == 0:
+                            w_lo += 1.0
+                        else:
+                            w_lo = 1.0
+                        w_hi = 0.0
+
+                    if upper:
+                        weight = weight * w_hi
+                        idx = 0 if ndist < 0 else idx + 1
+                    else:
+                        weight = weight * w_lo
+                        idx = shape[ax] - 1 if ndist > 1 else idx
+                    offset += idx * strides[ax]
+
+                out[p] += values[offset] * weight
+
+
 class _LinearInterpolator(_PerAxisInterpolator):
 
     """Linear (i.e. bi-/tri-/multi-linear) interpolator.
@@ -489,11 +489,14 @@ class DiscreteLp(DiscretizedSpace):
                 weighting = self.weighting
 
             dtype_s = dtype_str(self.dtype)
+            acc_dtype = getattr(self.weighting, 'accumulate_dtype', None)
+            acc_dtype_s = None if acc_dtype is None else dtype_str(acc_dtype)
             optargs = [('exponent', self.exponent, 2.0),
                        ('interp', self.interp, 'nearest'),
                        ('impl', self.impl, 'numpy'),
                        ('nodes_on_bdry', nodes_on_bdry, False),
                        ('dtype', dtype_s, default_dtype_s),
+                       ('accumulate_dtype', acc_dtype_s, None),
                        ('order', self.order, 'C'),
                        ('weighting', weighting, 'const'),
                        ('axis_labels', self.axis_labels, default_ax_lbl)]
@@ -966,6 +969,11 @@ def uniform_discr_frompartition(partition, exponent=2.0, interp='nearest',
             'const' : weight is a constant, the cell volume (default)
 
             'none' : no weighting
+    accumulate_dtype : optional
+        Floating point data type in which inner products, norms and
+        distances are accumulated, e.g., ``'float64'`` for
+        ``dtype='float32'``. Elements are stored in ``dtype``.
+        Default: ``None``, i.e., accumulation in ``dtype``.
 
     Returns
     -------
@@ -1003,6 +1011,7 @@ def uniform_discr_frompartition(partition, exponent=2.0, interp='nearest',
         dtype = ds_type.default_dtype()
 
     order = kwargs.pop('order', 'C')
+    accumulate_dtype = kwargs.pop('accumulate_dtype', None)
 
     weighting = kwargs.pop('weighting', 'const')
     if not isinstance(weighting, Weighting):
@@ -1015,12 +1024,16 @@ def uniform_discr_frompartition(partition, exponent=2.0, interp='nearest',
             raise ValueError("`weighting` '{}' not understood"
                              "".format(weighting_in))
 
+    ds_kwargs = {}
+    if accumulate_dtype is not None:
+        ds_kwargs['accumulate_dtype'] = accumulate_dtype
+
     if dtype is not None:
         dspace = ds_type(partition.size, dtype=dtype, impl=impl,
-                         weighting=weighting, exponent=exponent)
+                         weighting=weighting, exponent=exponent, **ds_kwargs)
     else:
         dspace = ds_type(partition.size, impl=impl, weighting=weighting,
-                         exponent=exponent)
+                         exponent=exponent, **ds_kwargs)
 
     return DiscreteLp(fspace, partition, dspace, exponent, interp, order=order,
                       **kwargs)
@@ -1078,6 +1091,11 @@ def uniform_discr_fromspace(fspace, shape, exponent=2.0, interp='nearest',
             'const' : Weight is a constant, the cell volume (default).
 
             'none' : No weighting.
+    accumulate_dtype : optional
+        Floating point data type in which inner products, norms and
+        distances are accumulated, e.g., ``'float64'`` for
+        ``dtype='float32'``. Elements are stored in ``dtype``.
+        Default: ``None``, i.e., accumulation in ``dtype``.
 
     Returns
     -------
@@ -1193,6 +1211,11 @@ def uniform_discr_fromintv(interval, shape, exponent=2.0, interp='nearest',
             'const' : weight is a constant, the cell volume (default)
 
             'none' : no weighting
+    accumulate_dtype : optional
+        Floating point data type in which inner products, norms and
+        distances are accumulated, e.g., ``'float64'`` for
+        ``dtype='float32'``. Elements are stored in ``dtype``.
+        Default: ``None``, i.e., accumulation in ``dtype``.
 
     Returns
     -------
@@ -1279,6 +1302,11 @@ def uniform_discr(min_pt, max_pt, shape, exponent=2.0, interp='nearest',
             'const' : weight is a constant, the cell volume (default)
 
             'none' : no weighting
+    accumulate_dtype : optional
+        Floating point data type in which inner products, norms and
+        distances are accumulated, e.g., ``'float64'`` for
+        ``dtype='float32'``. Elements are stored in ``dtype``.
+        Default: ``None``, i.e., accumulation in ``dtype``.
 
     Returns
     -------
@@ -1432,6 +1460,11 @@ def uniform_discr_fromdiscr(discr, min_pt=None, max_pt=None,
             'const' : weight is a constant, the cell volume (default)
 
             'none' : no weighting
+    accumulate_dtype : optional
+        Floating point data type in which inner products, norms and
+        distances are accumulated, e.g., ``'float64'`` for
+        ``dtype='float32'``. Elements are stored in ``dtype``.
+        Default: ``None``, i.e., accumulation in ``dtype``.
 
     Notes
     -----
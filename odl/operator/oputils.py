@@ -14,14 +14,27 @@ from future import standard_library
 from future.utils import raise_from, native
 standard_library.install_aliases()
 
+import hashlib
+import json
 import numpy as np
+import os
+import types
 
 from odl.space.base_ntuples import FnBase
 from odl.space import ProductSpace
 from odl.util import as_flat_array
 
-__all__ = ('matrix_representation', 'power_method_opnorm', 'as_scipy_operator',
-           'as_scipy_functional', 'as_proximal_lang_operator')
+__all__ = ('matrix_representation', 'power_method_opnorm', 'lanczos_opnorm',
+           'cached_opnorm', 'clear_opnorm_cache', 'operator_fingerprint',
+           'as_scipy_operator', 'as_scipy_functional',
+           'as_proximal_lang_operator')
+
+
+# In-memory cache of `cached_opnorm`, mapping keys to norms
+_OPNORM_CACHE = {}
+
+# Seed of the random starting point of `lanczos_opnorm`
+_OPNORM_SEED = 1
 
 
 def matrix_representation(op):
@@ -257,6 +270,373 @@ def power_method_opnorm(op, xstart=None, maxiter=100, rtol=1e-05, atol=1e-08,
     return opnorm
 
 
+def lanczos_opnorm(op, xstart=None, maxiter=100, rtol=1e-05, callback=None):
+    """Estimate the operator norm with Lanczos bidiagonalization.
+
+    Compared to `power_method_opnorm`, this method uses all previously
+    computed directions (Krylov subspace) instead of only the last one,
+    which typically leads to much faster convergence. In each iteration,
+    ``op`` and ``op.adjoint`` are evaluated once.
+
+    Parameters
+    ----------
+    op : `Operator`
+        Linear operator whose norm is to be estimated. The
+        `Operator.adjoint` must be defined.
+    xstart : ``op.domain`` `element-like`, optional
+        Starting point of the iteration. By default, white noise with
+        a fixed seed is used, which makes the result reproducible.
+    maxiter : positive int, optional
+        Maximum number of iterations.
+    rtol : float, optional
+        Relative accuracy of the estimate at which to stop, see Notes.
+    callback : callable, optional
+        Function called with the current estimate in each iteration.
+
+    Returns
+    -------
+    est_opnorm : float
+        The estimated operator norm of ``op``.
+
+    See Also
+    --------
+    power_method_opnorm
+    cached_opnorm
+
+    Examples
+    --------
+    >>> space = odl.uniform_discr(0, 1, 5)
+    >>> id = odl.IdentityOperator(space)
+    >>> lanczos_opnorm(3 * id)
+    3.0
+
+    The estimate converges after few iterations also for operators
+    with many similar singular values:
+
+    >>> space = odl.uniform_discr([0, 0], [1, 1], (50, 50))
+    >>> grad = odl.Gradient(space)
+    >>> abs(lanczos_opnorm(grad, rtol=1e-8) - np.sqrt(8) * 50) < 0.1
+    True
+
+    Notes
+    -----
+    After :math:`k` iterations, the method has computed orthonormal
+    bases :math:`V_k` and :math:`U_k` and an upper bidiagonal
+    :math:`k \\times k` matrix :math:`B_k` with :math:`A V_k = U_k B_k`.
+    The largest singular value :math:`\\sigma_k` of :math:`B_k` is a
+    lower bound for :math:`||A||` that increases with :math:`k`.
+    For the corresponding singular vectors, the residual in the normal
+    equation is given by :math:`\\sigma_k r_k` with
+    :math:`r_k = \\beta_k |p_k|`, where :math:`\\beta_k` is the last
+    off-diagonal entry of the bidiagonal matrix and :math:`p_k` the last
+    component of the left singular vector of :math:`B_k`.
+    Hence, :math:`A^* A` has an eigenvalue in the interval
+
+    .. math::
+        [\\sigma_k^2 - \\sigma_k r_k, \\sigma_k^2 + \\sigma_k r_k].
+
+    The iteration stops as soon as :math:`r_k \\leq` ``rtol``
+    :math:`\\cdot\\ \\sigma_k`. With a random starting point, this
+    eigenvalue is the largest one with high probability, see
+    `[KW1992] <https://doi.org/10.1137/0613066>`_.
+
+    The method does not store the Krylov bases. Without
+    reorthogonalization, copies of converged singular values can appear
+    in :math:`B_k`, which does not affect the estimate of the largest one.
+
+    References
+    ----------
+    [KW1992] Kuczynski, J, and Wozniakowski, H. *Estimating the largest
+    eigenvalue by the power and Lanczos algorithms with a random start*.
+    SIAM Journal on Matrix Analysis and Applications, 13.4 (1992),
+    pp 1094--1122.
+    """
+    maxiter, maxiter_in = int(maxiter), maxiter
+    if maxiter <= 0:
+        raise ValueError('`maxiter` must be positive, got {}'
+                         ''.format(maxiter_in))
+
+    if xstart is None:
+        from odl.phantom import white_noise
+        v = white_noise(op.domain, seed=_OPNORM_SEED)
+    else:
+        # copy to ensure xstart is not modified
+        v = op.domain.element(xstart).copy()
+
+    v_norm = v.norm()
+    if v_norm == 0:
+        raise ValueError('``xstart`` must be nonzero')
+    v /= v_norm
+
+    alphas = []
+    betas = []
+    u = op.range.zero()
+    tmp_ran = op.range.element()
+    tmp_dom = op.domain.element()
+    opnorm = 0.0
+
+    for i in range(maxiter):
+        # u_i = (A v_i - beta_{i-1} u_{i-1}) / alpha_i
+        op(v, out=tmp_ran)
+        if betas:
+            tmp_ran.lincomb(1, tmp_ran, -betas[-1], u)
+        alpha = tmp_ran.norm()
+        if alpha == 0:
+            # Invariant subspace found, the estimate is exact
+            break
+        u.lincomb(1 / alpha, tmp_ran)
+        alphas.append(alpha)
+
+        # v_{i+1} = (A^* u_i - alpha_i v_i) / beta_i
+        op.adjoint(u, out=tmp_dom)
+        tmp_dom.lincomb(1, tmp_dom, -alpha, v)
+        beta = tmp_dom.norm()
+        if not np.isfinite(beta):
+            raise ValueError('reached nonfinite iterate after {} '
+                             'iterations'.format(i))
+        betas.append(beta)
+
+        # Largest singular value of the bidiagonal matrix and residual
+        bidiag = np.diag(alphas) + np.diag(betas[:-1], k=1)
+        left, sing_vals, _ = np.linalg.svd(bidiag)
+        opnorm = float(sing_vals[0])
+        residual = beta * abs(left[-1, 0])
+
+        if callback is not None:
+            callback(opnorm)
+
+        if residual <= rtol * opnorm or beta == 0:
+            break
+
+        v.lincomb(1 / beta, tmp_dom)
+
+    if not alphas:
+        raise ValueError('``xstart`` is in the null space of ``op``')
+
+    return opnorm
+
+
+def operator_fingerprint(op):
+    """Return a structural fingerprint of an operator.
+
+    The fingerprint is a hash over the type of ``op`` and its internal
+    state, in particular domain, range, all stored arrays and
+    space elements, and, recursively, the state of sub-operators and
+    other objects like ray transform geometries. Two operators with the
+    same fingerprint are structurally identical, hence have the same
+    operator norm.
+
+    Caches and temporary arrays are not taken into account.
+
+    Parameters
+    ----------
+    op : `Operator`
+        Operator for which the fingerprint should be computed.
+
+    Returns
+    -------
+    fingerprint : str or None
+        Hexadecimal digest of the structure of ``op``, or ``None`` if
+        some part of the structure cannot be reliably identified, e.g.,
+        an anonymous function.
+
+    Examples
+    --------
+    >>> space = odl.uniform_discr(0, 1, 5)
+    >>> fp = operator_fingerprint(3 * odl.IdentityOperator(space))
+    >>> fp == operator_fingerprint(3 * odl.IdentityOperator(space))
+    True
+    >>> fp == operator_fingerprint(2 * odl.IdentityOperator(space))
+    False
+    """
+    try:
+        structure = _structure(op, set())
+    except _NotFingerprintable:
+        return None
+    return hashlib.sha1(repr(structure).encode('utf-8')).hexdigest()
+
+
+# Attributes holding caches or temporaries instead of structural information.
+# Private attributes are matched without the class name prefix that is
+# added by name mangling, e.g., ``_interp_matrix`` for ``self.__interp_matrix``
+_FINGERPRINT_SKIP_ATTRS = frozenset(['_adjoint', '_inverse',
+                                     '_astra_wrapper', '_fftw_plan',
+                                     '_tmp_r', '_tmp_f',
+                                     '_mat_pow', '_eigval', '_eigvec',
+                                     '_initialized', '_interp_matrix',
+                                     '_sensitivity', '_subset_ops',
+                                     '_subset_parent'])
+
+
+class _NotFingerprintable(Exception):
+
+    """Raised if an object has no reliable structural description."""
+
+
+def _structure(obj, visited):
+    """Return a description of ``obj`` that can be hashed via ``repr``."""
+    from odl.set.sets import Set
+    from odl.set.space import LinearSpaceElement
+
+    if obj is None or isinstance(obj, (bool, int, float, complex, str,
+                                       bytes, np.generic, np.dtype)):
+        return repr(obj)
+    elif isinstance(obj, np.ndarray):
+        data = np.ascontiguousarray(obj)
+        return ('ndarray', data.dtype.str, data.shape,
+                hashlib.sha1(data.view(np.uint8)).hexdigest())
+    elif isinstance(obj, Set):
+        # The ``repr`` shortens large weighting arrays, hence weightings
+        # and the spaces of product spaces are described separately
+        desc = repr(obj)
+        weighting = getattr(obj, 'weighting', None)
+        spaces = getattr(obj, 'spaces', None)
+        if '...' in desc and weighting is None and spaces is None:
+            raise _NotFingerprintable(desc)
+        return (type(obj).__name__, desc, _structure(weighting, visited),
+                _structure(spaces, visited))
+    elif isinstance(obj, LinearSpaceElement) and hasattr(obj, 'parts'):
+        return ('element', _structure(obj.space, visited),
+                _structure(obj.parts, visited))
+    elif isinstance(obj, LinearSpaceElement) and hasattr(obj, 'asarray'):
+        return ('element', _structure(obj.space, visited),
+                _structure(obj.asarray(), visited))
+    elif isinstance(obj, (list, tuple)):
+        return tuple(_structure(o, visited) for o in obj)
+    elif isinstance(obj, dict):
+        return tuple(sorted((repr(key), _structure(val, visited))
+                            for key, val in obj.items()))
+    elif isinstance(obj, (types.FunctionType, types.BuiltinFunctionType,
+                          np.ufunc)):
+        # Functions are identified by name, which is only meaningful
+        # for module-level functions without captured state
+        name = getattr(obj, '__qualname__', getattr(obj, '__name__', ''))
+        if ('<lambda>' in name or '<locals>' in name or
+                getattr(obj, '__closure__', None) is not None):
+            raise _NotFingerprintable(repr(obj))
+        return ('function', getattr(obj, '__module__', None), name)
+    elif isinstance(obj, types.MethodType):
+        return ('method', _structure(obj.__self__, visited),
+                obj.__func__.__name__)
+    elif hasattr(obj, '__dict__'):
+        if id(obj) in visited:
+            return 'cycle'
+        visited.add(id(obj))
+        attrs = []
+        for name, val in sorted(vars(obj).items()):
+            if name.startswith('_') and '__' in name[1:]:
+                # Name-mangled private attribute
+                basename = '_' + name.split('__', 1)[1]
+            else:
+                basename = name
+            if (basename in _FINGERPRINT_SKIP_ATTRS or
+                    'cache' in name.lower()):
+                continue
+            attrs.append((name, _structure(val, visited)))
+        return (type(obj).__module__, type(obj).__name__, tuple(attrs))
+    else:
+        raise _NotFingerprintable(repr(obj))
+
+
+def cached_opnorm(op, estimator=None, cache_file=None, **kwargs):
+    """Return the operator norm of ``op``, estimating it only once.
+
+    Estimates are stored in memory for the lifetime of the process and,
+    if ``cache_file`` is given, in a file that can be reused by later
+    processes. The cache key is the `operator_fingerprint` of ``op``
+    together with the estimator and its parameters. Hence, repeated
+    jobs with the same setup, e.g., the same ray transform geometry,
+    get the norm without any operator evaluation.
+
+    Parameters
+    ----------
+    op : `Operator`
+        Operator whose norm is to be estimated.
+    estimator : callable, optional
+        Function used as ``estimator(op, **kwargs)`` to estimate the
+        norm if it is not found in the cache. By default,
+        `lanczos_opnorm` is used for linear operators and
+        `power_method_opnorm` otherwise.
+    cache_file : str, optional
+        Path to a JSON file used as persistent cache. It is created if
+        it does not exist.
+    kwargs :
+        Further keyword arguments passed to ``estimator``.
+
+    Returns
+    -------
+    opnorm : float
+        The (cached) estimated operator norm of ``op``.
+
+    See Also
+    --------
+    clear_opnorm_cache
+
+    Examples
+    --------
+    The second call does not evaluate the operator:
+
+    >>> space = odl.uniform_discr([0, 0], [1, 1], (50, 50))
+    >>> grad = odl.Gradient(space)
+    >>> opnorm = cached_opnorm(grad, maxiter=50)
+    >>> cached_opnorm(grad, maxiter=50) == opnorm
+    True
+
+    Notes
+    -----
+    Operators whose structure cannot be reliably identified, see
+    `operator_fingerprint`, are not cached. The same holds for estimator
+    parameters like anonymous callback functions.
+
+    The file cache is not protected against concurrent writes from
+    several processes. In the worst case, an entry gets lost and is
+    estimated again.
+    """
+    if estimator is None:
+        estimator = lanczos_opnorm if op.is_linear else power_method_opnorm
+
+    fingerprint = operator_fingerprint(op)
+    if fingerprint is None:
+        return estimator(op, **kwargs)
+
+    # All parameters enter the key, arrays and elements like ``xstart`` by
+    # value. Without a reliable description, the cache is bypassed.
+    try:
+        params = _structure(kwargs, set())
+    except _NotFingerprintable:
+        return estimator(op, **kwargs)
+    params_hash = hashlib.sha1(repr(params).encode('utf-8')).hexdigest()
+    key = '{}:{}:{}'.format(fingerprint,
+                            getattr(estimator, '__name__', repr(estimator)),
+                            params_hash)
+
+    if key in _OPNORM_CACHE:
+        return _OPNORM_CACHE[key]
+
+    file_cache = {}
+    if cache_file is not None and os.path.exists(cache_file):
+        with open(cache_file, 'r') as f:
+            file_cache = json.load(f)
+        if key in file_cache:
+            _OPNORM_CACHE[key] = file_cache[key]
+            return file_cache[key]
+
+    opnorm = float(estimator(op, **kwargs))
+    _OPNORM_CACHE[key] = opnorm
+
+    if cache_file is not None:
+        file_cache[key] = opnorm
+        with open(cache_file, 'w') as f:
+            json.dump(file_cache, f, indent=1, sort_keys=True)
+
+    return opnorm
+
+
+def clear_opnorm_cache():
+    """Remove all entries from the in-memory cache of `cached_opnorm`."""
+    _OPNORM_CACHE.clear()
+
+
 def as_scipy_operator(op):
     """Wrap ``op`` as a ``scipy.sparse.linalg.LinearOperator``.
 
@@ -224,7 +224,9 @@ class PointwiseNorm(PointwiseTensorFieldOperator):
 
     def _call(self, f, out):
         """Implement ``self(f, out)``."""
-        if self.exponent == 1.0:
+        if self.domain.is_contiguous:
+            self._call_vecfield_contiguous(f, out)
+        elif self.exponent == 1.0:
             self._call_vecfield_1(f, out)
         elif self.exponent == float('inf'):
             self._call_vecfield_inf(f, out)
@@ -286,6 +288,29 @@ class PointwiseNorm(PointwiseTensorFieldOperator):
 
         out.ufuncs.power(1 / self.exponent, out=out)
 
+    def _call_vecfield_contiguous(self, vf, out):
+        """Implement ``self(vf, out)`` with array operations on all parts."""
+        arr = vf.asarray()
+        if self.exponent == 2.0 and self.base_space.field == RealNumbers():
+            abs_pow = arr * arr
+        else:
+            abs_pow = np.abs(arr)
+            if self.exponent not in (1.0, float('inf')):
+                abs_pow **= self.exponent
+
+        if self.exponent == float('inf'):
+            if self.is_weighted:
+                abs_pow *= self.weights.reshape((-1,) + (1,) * (arr.ndim - 1))
+            out[:] = np.max(abs_pow, axis=0)
+        else:
+            if self.is_weighted:
+                result = np.tensordot(self.weights, abs_pow, axes=1)
+            else:
+                result = np.sum(abs_pow, axis=0)
+            if self.exponent != 1.0:
+                result **= 1 / self.exponent
+            out[:] = result
+
     def _abs_pow_ufunc(self, fi, out):
         """Compute |F_i(x)|^p point-wise and write to ``out``."""
         # Optimization for a very common case
@@ -20,6 +20,8 @@ standard_library.install_aliases()
 import numpy as np
 
 from odl.operator import Operator
+from odl.solvers.nonsmooth.proximal_operators import (
+    proximal_convex_conj_l1_gradient)
 
 
 __all__ = ('chambolle_pock_solver',)
@@ -125,6 +127,12 @@ def chambolle_pock_solver(x, f, g, L, tau, sigma, niter, **kwargs):
     :math:`F((x_1, x_2)) = \|x_1\|_2^2 + \|x_2\|_1`, :math:`G(x)=0`. See the
     examples folder for more information on how to do this.
 
+    For such problems, the dual update of a group L1-norm of a
+    `Gradient`, i.e., when ``L`` is a `Gradient` or a `BroadcastOperator`
+    containing one and ``f`` is the matching (scaled) `GroupL1Norm` or a
+    `SeparableSum` containing it, is done in a single pass over the data
+    with `proximal_convex_conj_l1_gradient`.
+
     For a more detailed documentation see :ref:`chambolle_pock`.
 
     References on the algorithm can be found in [CP2011a] and [CP2011b].
@@ -226,59 +234,158 @@ def chambolle_pock_solver(x, f, g, L, tau, sigma, niter, **kwargs):
         raise TypeError('`y` {} is not in the range of `L` '
                         '{}'.format(y.space, L.range))
 
+    # Split the dual update if group L1-norms of gradients can be fused
+    dual_parts = _fused_dual_parts(f, L)
+
     # Get the proximals
     proximal_dual = f.convex_conj.proximal
     proximal_primal = g.proximal
     proximal_constant = (gamma is None)
     if proximal_constant:
         # Pre-compute proximals for efficiency
-        proximal_dual_sigma = proximal_dual(sigma)
+        if dual_parts is None:
+            proximal_dual_sigma = proximal_dual(sigma)
+        else:
+            dual_parts_sigma = _dual_parts_with_step(dual_parts, sigma)
         proximal_primal_tau = proximal_primal(tau)
 
-    # Temporary copy to store previous iterate
-    x_old = x.space.element()
-
     # Temporaries
     dual_tmp = L.range.element()
     primal_tmp = L.domain.element()
 
-    for _ in range(niter):
-        # Copy required for relaxation
-        x_old.assign(x)
-
-        # Gradient ascent in the dual variable y
-        # Compute dual_tmp = y + sigma * L(x_relax)
-        L(x_relax, out=dual_tmp)
-        dual_tmp.lincomb(1, y, sigma, dual_tmp)
+    if dual_parts is not None:
+        if len(dual_parts) == 1:
+            y_parts, dual_tmp_parts = [y], [dual_tmp]
+        else:
+            y_parts, dual_tmp_parts = y.parts, dual_tmp.parts
 
-        # Apply the dual proximal
-        if not proximal_constant:
-            proximal_dual_sigma = proximal_dual(sigma)
-        proximal_dual_sigma(dual_tmp, out=y)
+    for _ in range(niter):
+        if dual_parts is None:
+            # Gradient ascent in the dual variable y
+            # Compute dual_tmp = y + sigma * L(x_relax)
+            L(x_relax, out=dual_tmp)
+            dual_tmp.lincomb(1, y, sigma, dual_tmp)
+
+            # Apply the dual proximal
+            if not proximal_constant:
+                proximal_dual_sigma = proximal_dual(sigma)
+            proximal_dual_sigma(dual_tmp, out=y)
+        else:
+            # Same as above, one part of y at a time
+            if not proximal_constant:
+                dual_parts_sigma = _dual_parts_with_step(dual_parts, sigma)
+            for (op, prox, tv_update), y_i, dual_tmp_i in zip(
+                    dual_parts_sigma, y_parts, dual_tmp_parts):
+                if tv_update is not None:
+                    tv_update([y_i, x_relax], out=y_i)
+                else:
+                    op(x_relax, out=dual_tmp_i)
+                    dual_tmp_i.lincomb(1, y_i, sigma, dual_tmp_i)
+                    prox(dual_tmp_i, out=y_i)
 
         # Gradient descent in the primal variable x
         # Compute primal_tmp = x + (- tau) * L.derivative(x).adjoint(y)
         L.derivative(x).adjoint(y, out=primal_tmp)
         primal_tmp.lincomb(1, x, -tau, primal_tmp)
 
+        # Acceleration, the step sizes are updated after the proximal
+        if gamma is not None:
+            theta = float(1 / np.sqrt(1 + 2 * gamma * tau))
+
+        # Over-relaxation in the primal variable x, the part with the
+        # previous iterate is computed before x is overwritten, such that
+        # no copy of x is needed
+        x_relax.lincomb(-theta, x)
+
         # Apply the primal proximal
         if not proximal_constant:
             proximal_primal_tau = proximal_primal(tau)
         proximal_primal_tau(primal_tmp, out=x)
 
-        # Acceleration
         if gamma is not None:
-            theta = float(1 / np.sqrt(1 + 2 * gamma * tau))
             tau *= theta
             sigma /= theta
 
-        # Over-relaxation in the primal variable x
-        x_relax.lincomb(1 + theta, x, -theta, x_old)
+        # Compute x_relax = x + theta * (x - x_old)
+        x_relax.lincomb(1, x_relax, 1 + theta, x)
 
         if callback is not None:
             callback(x)
 
 
+def _group_l1_params(func):
+    """Return ``(lam, isotropic)`` if ``func`` is a scaled group L1-norm.
+
+    Here, ``func == lam * GroupL1Norm(...)``. ``None`` is returned for
+    other functionals and for group L1-norms whose convex conjugate has no
+    closed-form proximal.
+    """
+    # Avoid circular import
+    from odl.solvers.functional.default_functionals import GroupL1Norm
+    from odl.solvers.functional.functional import FunctionalLeftScalarMult
+
+    lam = 1.0
+    if isinstance(func, FunctionalLeftScalarMult):
+        lam, func = func.scalar, func.functional
+
+    if (isinstance(func, GroupL1Norm) and lam > 0 and
+            func.pointwise_norm.exponent in (1, 2)):
+        return lam, func.pointwise_norm.exponent == 2
+    else:
+        return None
+
+
+def _fused_dual_parts(f, L):
+    """Return the parts of the dual update, or ``None`` if none is fused.
+
+    Group L1-norms of a `Gradient` are updated with
+    `proximal_convex_conj_l1_gradient`. This applies if ``L`` is a
+    `Gradient`, or a `BroadcastOperator` where a `Gradient` is paired with
+    such a norm in the `SeparableSum` ``f``.
+
+    Returns
+    -------
+    dual_parts : list or None
+        One tuple ``(op, proximal_factory, tv_update_factory)`` per part of
+        the dual variable, where exactly one of the factories is ``None``.
+    """
+    # Avoid circular import
+    from odl.discr.diff_ops import Gradient
+    from odl.operator.pspace_ops import BroadcastOperator
+    from odl.solvers.functional.default_functionals import SeparableSum
+
+    if isinstance(L, Gradient):
+        ops, funcs = [L], [f]
+    elif isinstance(L, BroadcastOperator) and isinstance(f, SeparableSum):
+        ops, funcs = L.operators, f.functionals
+    else:
+        return None
+
+    dual_parts = []
+    for op, func in zip(ops, funcs):
+        params = _group_l1_params(func)
+        if isinstance(op, Gradient) and params is not None:
+            lam, isotropic = params
+            tv_update = proximal_convex_conj_l1_gradient(
+                op, lam=lam, isotropic=isotropic)
+            dual_parts.append((op, None, tv_update))
+        else:
+            dual_parts.append((op, func.convex_conj.proximal, None))
+
+    if all(tv_update is None for _, _, tv_update in dual_parts):
+        return None
+    else:
+        return dual_parts
+
+
+def _dual_parts_with_step(dual_parts, sigma):
+    """Return ``dual_parts`` with the factories initialized with ``sigma``."""
+    return [(op,
+             None if prox is None else prox(sigma),
+             None if tv_update is None else tv_update(sigma))
+            for op, prox, tv_update in dual_parts]
+
+
 if __name__ == '__main__':
     # pylint: disable=wrong-import-position
     from odl.util.testutils import run_doctests
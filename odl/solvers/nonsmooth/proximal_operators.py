@@ -32,9 +32,9 @@ import scipy.special
 
 from odl.operator import (Operator, IdentityOperator, ScalingOperator,
                           ConstantOperator, DiagonalOperator)
-from odl.space import ProductSpace
+from odl.space import ProductSpace, fused_multiply_add
 from odl.set import LinearSpaceElement
-from odl.util import cache_arguments
+from odl.util import cache_arguments, is_real_floating_dtype
 
 
 __all__ = ('combine_proximals', 'proximal_convex_conj', 'proximal_translation',
@@ -42,6 +42,7 @@ __all__ = ('combine_proximals', 'proximal_convex_conj', 'proximal_translation',
            'proximal_composition', 'proximal_const_func',
            'proximal_box_constraint', 'proximal_nonnegativity',
            'proximal_l1', 'proximal_convex_conj_l1',
+           'proximal_convex_conj_l1_gradient',
            'proximal_l2', 'proximal_convex_conj_l2',
            'proximal_l2_squared', 'proximal_convex_conj_l2_squared',
            'proximal_convex_conj_kl', 'proximal_convex_conj_kl_cross_entropy')
@@ -1038,10 +1039,18 @@ def proximal_convex_conj_l1(space, lam=1, g=None, isotropic=False):
                 # Calculate |x| = pointwise 2-norm of x
 
                 tmp = diff[0] ** 2
-                sq_tmp = x[0].space.element()
-                for x_i in diff[1:]:
-                    x_i.multiply(x_i, out=sq_tmp)
-                    tmp += sq_tmp
+                if getattr(space[0], 'impl', None) == 'numpy':
+                    # Add the squares in one pass without temporary
+                    tmp_arr = tmp.asarray()
+                    for x_i in diff[1:]:
+                        x_arr = x_i.asarray()
+                        fused_multiply_add(1, x_arr, x_arr, 1, tmp_arr,
+                                           out=tmp_arr)
+                else:
+                    sq_tmp = x[0].space.element()
+                    for x_i in diff[1:]:
+                        x_i.multiply(x_i, out=sq_tmp)
+                        tmp += sq_tmp
                 tmp.ufuncs.sqrt(out=tmp)
 
                 # Pointwise maximum of |x| and lambda
@@ -1070,6 +1079,103 @@ def proximal_convex_conj_l1(space, lam=1, g=None, isotropic=False):
     return ProximalConvexConjL1
 
 
+def proximal_convex_conj_l1_gradient(gradient, lam=1, isotropic=True):
+    """Fused dual update factory for the group L1-norm of a gradient.
+
+    Function for the operator that performs the dual update step of
+    primal-dual methods for problems with a term ::
+
+        F(grad x) = lam || |grad x| ||_1
+
+    in one sweep, i.e., it computes ::
+
+        p <- prox[sigma * F^*](p + sigma * grad(x))
+
+    for a dual variable ``p`` in ``gradient.range`` and a primal
+    variable ``x`` in ``gradient.domain``.
+
+    Parameters
+    ----------
+    gradient : `Gradient`
+        The gradient operator whose image is penalized.
+    lam : positive float, optional
+        Scaling factor or regularization parameter.
+    isotropic : bool, optional
+        If ``True``, take the vectorial 2-norm point-wise. Otherwise,
+        use the vectorial 1-norm.
+
+    Returns
+    -------
+    update_factory : function
+        Factory for the update operator to be initialized with a step
+        size ``sigma``. The operator maps ``[p, x]`` from
+        ``ProductSpace(gradient.range, gradient.domain)`` to
+        ``gradient.range``, and ``p`` may be used as ``out``.
+
+    Notes
+    -----
+    The result is the same as evaluating ``gradient``, a linear
+    combination and `proximal_convex_conj_l1` one after the other.
+    For `DiscreteLp` spaces with NumPy based real data storage, the
+    steps are instead carried out for one slab of the data after
+    another, such that each array is traversed only once and only
+    slab-sized temporaries are needed.
+
+    See Also
+    --------
+    proximal_convex_conj_l1 : proximal used in the update
+    odl.discr.diff_ops.Gradient : gradient operator
+    """
+    # Avoid circular import
+    from odl.discr.diff_ops import Gradient
+
+    if not isinstance(gradient, Gradient):
+        raise TypeError('`gradient` {!r} is not a `Gradient` instance'
+                        ''.format(gradient))
+
+    space = gradient.range
+    prox_factory = proximal_convex_conj_l1(space, lam=lam,
+                                           isotropic=isotropic)
+
+    # Fix for rounding errors, as in `proximal_convex_conj_l1`
+    eps = np.finfo(getattr(space, 'dtype', float)).resolution * 10
+    lam = float(lam * (1 - eps))
+
+    fused = (gradient.domain.impl == 'numpy' and
+             gradient.domain.ndim > 0 and
+             is_real_floating_dtype(gradient.domain.dtype))
+
+    class ProximalConvexConjL1Gradient(Operator):
+
+        """Fused dual update for the group L1-norm of a gradient."""
+
+        def __init__(self, sigma):
+            """Initialize a new instance.
+
+            Parameters
+            ----------
+            sigma : positive float
+                Step size parameter
+            """
+            self.sigma = float(sigma)
+            super().__init__(
+                domain=ProductSpace(space, gradient.domain),
+                range=space, linear=False)
+
+        def _call(self, x, out):
+            """Apply the operator to ``x`` and store the result in ``out``."""
+            p, f = x
+            if fused:
+                _tv_dual_update(gradient, p, f, self.sigma, lam, isotropic,
+                                out)
+            else:
+                tmp = gradient(f)
+                tmp.lincomb(1, p, self.sigma, tmp)
+                prox_factory(self.sigma)(tmp, out=out)
+
+    return ProximalConvexConjL1Gradient
+
+
 def proximal_l1(space, lam=1, g=None, isotropic=False):
     """Proximal operator factory of the l1-norm/distance.
 
@@ -1395,6 +1501,84 @@ def proximal_convex_conj_kl_cross_entropy(space, lam=1, g=None):
     return ProximalConvexConjKLCrossEntropy
 
 
+def _tv_dual_update(gradient, p, f, sigma, lam, isotropic, out):
+    """Write ``prox[sigma * F^*](p + sigma * gradient(f))`` to ``out``.
+
+    The computation is done for one slab along the first array axis after
+    another. Differences along that axis are computed with a halo of rows
+    around the slab, which covers the stencils of all methods and padding
+    modes of `finite_diff`. For periodic padding, the halo wraps around.
+    """
+    # Avoid circular import
+    from odl.discr.diff_ops import finite_diff, FINITE_DIFF_SLAB_SIZE
+
+    out_arrs = [out_i.asarray() for out_i in out]
+    p_arrs = [p_i.asarray() for p_i in p]
+    f_arr = f.asarray()
+    if f_arr.size == 0:
+        return
+
+    dx = gradient.domain.cell_sides
+    diff_kwargs = {'method': gradient.method,
+                   'pad_mode': gradient.pad_mode,
+                   'pad_const': gradient.pad_const}
+
+    halo = 3
+    n = f_arr.shape[0]
+    rows = min(max(FINITE_DIFF_SLAB_SIZE * n // f_arr.size, 1), n)
+    tmp = np.empty((rows,) + f_arr.shape[1:], dtype=f_arr.dtype)
+    ext = np.empty((rows + 2 * halo,) + f_arr.shape[1:], dtype=f_arr.dtype)
+    periodic = (gradient.pad_mode == 'periodic')
+    if periodic:
+        ext_in = np.empty_like(ext)
+    if isotropic:
+        sq_norm = np.empty_like(tmp)
+
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        slab = slice(start, stop)
+        tmp_slab = tmp[:stop - start]
+
+        # out = p + sigma * grad(f) on the slab
+        for axis, (p_arr, out_arr) in enumerate(zip(p_arrs, out_arrs)):
+            if axis == 0:
+                if periodic:
+                    # The halo wraps around at the array boundaries
+                    lo, hi = start - halo, stop + halo
+                    f_ext = np.take(f_arr, np.arange(lo, hi) % n, axis=0,
+                                    out=ext_in[:hi - lo])
+                else:
+                    lo, hi = max(start - halo, 0), min(stop + halo, n)
+                    f_ext = f_arr[lo:hi]
+                ext_slab = ext[:hi - lo]
+                finite_diff(f_ext, axis=0, dx=dx[0], out=ext_slab,
+                            **diff_kwargs)
+                np.multiply(ext_slab[start - lo:stop - lo], sigma,
+                            out=tmp_slab)
+            else:
+                finite_diff(f_arr[slab], axis=axis, dx=dx[axis],
+                            out=tmp_slab, **diff_kwargs)
+                tmp_slab *= sigma
+            np.add(p_arr[slab], tmp_slab, out=out_arr[slab])
+
+        # Projection onto the pointwise lam-ball
+        if isotropic:
+            sq_norm_slab = sq_norm[:stop - start]
+            np.multiply(out_arrs[0][slab], out_arrs[0][slab],
+                        out=sq_norm_slab)
+            for out_arr in out_arrs[1:]:
+                np.multiply(out_arr[slab], out_arr[slab], out=tmp_slab)
+                sq_norm_slab += tmp_slab
+            np.sqrt(sq_norm_slab, out=sq_norm_slab)
+            np.maximum(sq_norm_slab, lam, out=sq_norm_slab)
+            sq_norm_slab /= lam
+            for out_arr in out_arrs:
+                out_arr[slab] /= sq_norm_slab
+        else:
+            for out_arr in out_arrs:
+                np.clip(out_arr[slab], -lam, lam, out=out_arr[slab])
+
+
 if __name__ == '__main__':
     # pylint: disable=wrong-import-position
     from odl.util.testutils import run_doctests
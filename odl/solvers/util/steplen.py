@@ -133,6 +133,9 @@ class BacktrackingLineSearch(LineSearch):
         self.alpha = float(alpha)
 
         self.total_num_iter = 0
+        # Temporary for the trial points, reused across calls
+        self._point = None
+
         # Use a default value that allows the shortest step to be < 10 times
         # machine epsilon.
         if max_num_iter is None:
@@ -192,8 +195,10 @@ class BacktrackingLineSearch(LineSearch):
             raise ValueError('function returned invalid value {} in starting '
                              'point ({})'.format(fx, x))
 
-        # Create temporary
-        point = x.copy()
+        # Get temporary, it is overwritten before it is read
+        point = self._point
+        if point is None or point.space != x.space:
+            point = self._point = x.space.element()
 
         num_iter = 0
         while True:
@@ -15,6 +15,12 @@ __all__ = ('base_ntuples', 'weighting')
 from . import base_ntuples
 from . import weighting
 
+from .fused_kernels import *
+__all__ += fused_kernels.__all__
+
+from .reductions import *
+__all__ += reductions.__all__
+
 from .npy_ntuples import *
 __all__ += npy_ntuples.__all__
 
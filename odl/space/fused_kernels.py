@@ -0,0 +1,334 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Fused pointwise kernels for arrays, e.g., ``out = a * x + b * y``.
+
+Evaluating expressions like ``a * x + b * y`` with NumPy creates a
+temporary array per operation and runs several passes over memory.
+The kernels in this module evaluate such expressions in a single pass.
+If `numexpr <https://github.com/pydata/numexpr>`_ is installed, it is
+used for the supported data types. Otherwise, the arrays are processed
+in blocks that fit into the CPU cache, using a single small temporary
+array.
+"""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import range
+
+import numpy as np
+
+from odl.util.utility import dtype_repr
+
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+
+__all__ = ('fused_lincomb', 'fused_multiply_add', 'fused_multiply',
+           'fused_divide', 'fused_kernel_impl', 'NUMEXPR_AVAILABLE')
+
+
+# Number of elements per block of the NumPy implementation. Blocks of all
+# involved arrays together should fit into the CPU cache.
+FUSED_BLOCK_SIZE = 2 ** 15
+
+# Arrays of at most this size are evaluated in one block, since the
+# overhead of numexpr is larger than the gain
+NUMEXPR_MIN_SIZE = 2 ** 14
+
+# Data types supported by numexpr
+_NUMEXPR_DTYPES = (np.dtype('float32'), np.dtype('float64'),
+                   np.dtype('complex128'))
+
+
+def fused_kernel_impl(out):
+    """Return the implementation used for ``out`` by default.
+
+    Parameters
+    ----------
+    out : `numpy.ndarray`
+        Array to which the result of a kernel is written.
+
+    Returns
+    -------
+    impl : {'numexpr', 'numpy'}
+        ``'numexpr'`` if numexpr is available and supports ``out``,
+        ``'numpy'`` otherwise.
+
+    Examples
+    --------
+    Small arrays are always handled by NumPy:
+
+    >>> fused_kernel_impl(np.zeros(3))
+    'numpy'
+    """
+    if (NUMEXPR_AVAILABLE and out.dtype in _NUMEXPR_DTYPES and
+            out.size > NUMEXPR_MIN_SIZE):
+        return 'numexpr'
+    else:
+        return 'numpy'
+
+
+def fused_lincomb(a, x1, b, x2, out, impl=None):
+    """Compute ``out = a * x1 + b * x2`` in one pass.
+
+    Parameters
+    ----------
+    a, b : scalar
+        Coefficients of the linear combination.
+    x1, x2 : `numpy.ndarray`
+        Arrays in the linear combination, with the same shape as ``out``.
+        They may be identical to ``out``.
+    out : `numpy.ndarray`
+        Array to which the result is written.
+    impl : {'numexpr', 'numpy'}, optional
+        Implementation to use. By default, `fused_kernel_impl` is used.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        The array ``out``.
+
+    Examples
+    --------
+    >>> x = np.array([1, 2, 3], dtype='float32')
+    >>> y = np.array([4, 5, 6], dtype='float32')
+    >>> out = np.empty(3, dtype='float32')
+    >>> fused_lincomb(2, x, -1, y, out)
+    array([-2., -1.,  0.], dtype=float32)
+
+    The output can be one of the inputs:
+
+    >>> fused_lincomb(2, x, -1, y, out=y)
+    array([-2., -1.,  0.], dtype=float32)
+    """
+    a, b = _scalars(out, a, b)
+    if _use_numexpr(impl, out):
+        return _numexpr_evaluate('a * x1 + b * x2',
+                                 dict(a=a, x1=x1, b=b, x2=x2), out)
+
+    def kernel(tmp, out, x1, x2):
+        # A scaled input is stored in `tmp` before `out` is written,
+        # hence `out` may alias any input
+        if a == 1 and b == 1:
+            np.add(x1, x2, out=out)
+        elif b == 1:
+            np.multiply(x1, a, out=tmp)
+            np.add(x2, tmp, out=out)
+        elif a == 1:
+            np.multiply(x2, b, out=tmp)
+            np.add(x1, tmp, out=out)
+        else:
+            np.multiply(x2, b, out=tmp)
+            np.multiply(x1, a, out=out)
+            out += tmp
+
+    if b == 0:
+        return _scale(a, x1, out, impl='numpy')
+    elif a == 0:
+        return _scale(b, x2, out, impl='numpy')
+    else:
+        return _blocked(kernel, out, x1, x2)
+
+
+def fused_multiply_add(a, x1, x2, b, x3, out, impl=None):
+    """Compute ``out = a * x1 * x2 + b * x3`` in one pass.
+
+    Parameters
+    ----------
+    a, b : scalar
+        Coefficients of the product and the summand.
+    x1, x2, x3 : `numpy.ndarray`
+        Arrays in the expression, with the same shape as ``out``.
+        They may be identical to ``out``.
+    out : `numpy.ndarray`
+        Array to which the result is written.
+    impl : {'numexpr', 'numpy'}, optional
+        Implementation to use. By default, `fused_kernel_impl` is used.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        The array ``out``.
+
+    Examples
+    --------
+    >>> x = np.array([1, 2, 3], dtype=complex)
+    >>> y = np.array([1j, 1, -1], dtype=complex)
+    >>> z = np.ones(3, dtype=complex)
+    >>> fused_multiply_add(2, x, y, 1, z, out=z)
+    array([ 1.+2.j,  5.+0.j, -5.+0.j])
+    """
+    a, b = _scalars(out, a, b)
+    if _use_numexpr(impl, out):
+        return _numexpr_evaluate('a * x1 * x2 + b * x3',
+                                 dict(a=a, x1=x1, x2=x2, b=b, x3=x3), out)
+
+    def kernel(tmp, out, x1, x2, x3):
+        # The product is computed first, hence `out` may alias any input
+        np.multiply(x1, x2, out=tmp)
+        if a != 1:
+            tmp *= a
+
+        if b == 0:
+            np.copyto(out, tmp)
+        elif b == 1:
+            np.add(x3, tmp, out=out)
+        else:
+            np.multiply(x3, b, out=out)
+            out += tmp
+
+    return _blocked(kernel, out, x1, x2, x3)
+
+
+def fused_multiply(x1, x2, out, impl=None):
+    """Compute ``out = x1 * x2``.
+
+    This is a single pass also in NumPy, but numexpr evaluates it with
+    several threads.
+
+    Parameters
+    ----------
+    x1, x2 : `numpy.ndarray`
+        Factors, with the same shape as ``out``.
+    out : `numpy.ndarray`
+        Array to which the result is written.
+    impl : {'numexpr', 'numpy'}, optional
+        Implementation to use. By default, `fused_kernel_impl` is used.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        The array ``out``.
+    """
+    if _use_numexpr(impl, out):
+        return _numexpr_evaluate('x1 * x2', dict(x1=x1, x2=x2), out)
+    return np.multiply(x1, x2, out=out)
+
+
+def fused_divide(x1, x2, out, impl=None):
+    """Compute ``out = x1 / x2``.
+
+    This is a single pass also in NumPy, but numexpr evaluates it with
+    several threads.
+
+    Parameters
+    ----------
+    x1, x2 : `numpy.ndarray`
+        Dividend and divisor, with the same shape as ``out``.
+    out : `numpy.ndarray`
+        Array to which the result is written.
+    impl : {'numexpr', 'numpy'}, optional
+        Implementation to use. By default, `fused_kernel_impl` is used.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        The array ``out``.
+    """
+    if _use_numexpr(impl, out):
+        return _numexpr_evaluate('x1 / x2', dict(x1=x1, x2=x2), out)
+    return np.divide(x1, x2, out=out)
+
+
+def _scale(a, x, out, impl=None):
+    """Compute ``out = a * x``, a single pass in all implementations."""
+    a = _scalars(out, a)[0]
+    if _use_numexpr(impl, out):
+        return _numexpr_evaluate('a * x', dict(a=a, x=x), out)
+
+    if a == 0:
+        out.fill(0)
+    elif a == 1:
+        if out is not x:
+            np.copyto(out, x)
+    else:
+        np.multiply(x, a, out=out)
+    return out
+
+
+def _scalars(out, *scalars):
+    """Return ``scalars`` converted to the data type of ``out``.
+
+    This makes sure that the computation is done in the precision of
+    ``out``, e.g., single precision.
+    """
+    return [out.dtype.type(s) for s in scalars]
+
+
+def _use_numexpr(impl, out):
+    """Return ``True`` if numexpr should be used for ``out``."""
+    if impl is None:
+        impl = fused_kernel_impl(out)
+    else:
+        impl, impl_in = str(impl).lower(), impl
+        if impl not in ('numexpr', 'numpy'):
+            raise ValueError('`impl` {!r} not understood'.format(impl_in))
+        if impl == 'numexpr' and not NUMEXPR_AVAILABLE:
+            raise ValueError('`impl` is numexpr, but numexpr is not '
+                             'available')
+        if impl == 'numexpr' and out.dtype not in _NUMEXPR_DTYPES:
+            raise ValueError('data type {} not supported by numexpr'
+                             ''.format(dtype_repr(out.dtype)))
+    return impl == 'numexpr'
+
+
+def _numexpr_evaluate(expr, local_dict, out):
+    """Evaluate ``expr`` with numexpr and write the result to ``out``."""
+    numexpr.evaluate(expr, local_dict=local_dict, out=out,
+                     casting='same_kind')
+    return out
+
+
+def _blocked(kernel, out, *inputs):
+    """Run ``kernel(tmp, out, *inputs)`` on blocks of the arrays.
+
+    Each block of ``out`` is written only after reading the corresponding
+    blocks of the inputs, hence ``out`` may be one of the inputs.
+    """
+    views = _flat_views(out, *inputs)
+    size = out.size
+    if views is None or size <= FUSED_BLOCK_SIZE:
+        # Not blockable or small, evaluate in one go
+        tmp = np.empty(out.shape, dtype=out.dtype)
+        kernel(tmp, out, *inputs)
+        return out
+
+    out_flat = views[0]
+    inputs_flat = views[1:]
+    tmp = np.empty(FUSED_BLOCK_SIZE, dtype=out.dtype)
+    for start in range(0, size, FUSED_BLOCK_SIZE):
+        stop = min(start + FUSED_BLOCK_SIZE, size)
+        kernel(tmp[:stop - start], out_flat[start:stop],
+               *[x[start:stop] for x in inputs_flat])
+    return out
+
+
+def _flat_views(*arrays):
+    """Return flat views of ``arrays`` or ``None`` if not possible.
+
+    One-dimensional arrays can be blocked by slicing, regardless of
+    their strides. Other arrays need to be contiguous in the same order.
+    """
+    if all(arr.ndim == 1 for arr in arrays):
+        return arrays
+    if all(arr.flags.c_contiguous for arr in arrays):
+        return [arr.reshape(-1) for arr in arrays]
+    if all(arr.flags.f_contiguous for arr in arrays):
+        return [arr.reshape(-1, order='F') for arr in arrays]
+    return None
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
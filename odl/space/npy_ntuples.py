@@ -29,7 +29,11 @@ from odl.space.weighting import (
     Weighting, MatrixWeighting, ArrayWeighting,
     ConstWeighting, NoWeighting,
     CustomInner, CustomNorm, CustomDist)
-from odl.util import dtype_repr, is_real_dtype
+from odl.space.fused_kernels import (
+    fused_lincomb, fused_multiply, fused_divide)
+from odl.space.reductions import (
+    parallel_inner, parallel_pnorm, parallel_pdist)
+from odl.util import dtype_repr, is_floating_dtype, is_real_dtype
 from odl.util.ufuncs import NumpyNtuplesUfuncs
 
 
@@ -498,6 +502,11 @@ def _lincomb_impl(a, x1, b, x2, out, dtype):
     if size > THRESHOLD_MEDIUM and _blas_is_applicable(x1, x2, out):
         axpy, scal, copy = linalg.blas.get_blas_funcs(
             ['axpy', 'scal', 'copy'], arrays=(x1.data, x2.data, out.data))
+    elif is_floating_dtype(dtype):
+        # Single pass over the data with a fused kernel, handles all
+        # alignment options
+        fused_lincomb(a, x1.data, b, x2.data, out.data)
+        return
     else:
         # Use fallbacks otherwise
         def fallback_axpy(x1, x2, n, a):
@@ -683,6 +692,15 @@ class NumpyFn(FnBase, NumpyNtuples):
 
             Default: ``False``.
 
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a
+            ``'float32'`` space. Elements and element-wise operations
+            stay in ``dtype``. This option can only be used with
+            constant or array weighting.
+
+            Default: ``None``, i.e., accumulation in ``dtype``.
+
         kwargs :
             Further keyword arguments are passed to the weighting
             classes.
@@ -701,6 +719,9 @@ class NumpyFn(FnBase, NumpyNtuples):
         >>> space = NumpyFn(3, 'float', weighting=[1, 2, 3])
         >>> space
         rn(3, weighting=[1, 2, 3])
+        >>> space = NumpyFn(3, 'float32', accumulate_dtype='float64')
+        >>> space
+        rn(3, 'float32', accumulate_dtype='float')
         """
         # TODO: fix dead link `scipy.sparse.spmatrix`
         NumpyNtuples.__init__(self, size, dtype)
@@ -712,6 +733,7 @@ class NumpyFn(FnBase, NumpyNtuples):
         weighting = kwargs.pop('weighting', None)
         exponent = kwargs.pop('exponent', 2.0)
         dist_using_inner = bool(kwargs.pop('dist_using_inner', False))
+        accumulate_dtype = kwargs.pop('accumulate_dtype', None)
 
         # Check validity of option combination (3 or 4 out of 4 must be None)
         if sum(x is None for x in (dist, norm, inner, weighting)) < 3:
@@ -722,13 +744,21 @@ class NumpyFn(FnBase, NumpyNtuples):
             raise ValueError('`exponent` cannot be used together with '
                              '`dist`, `norm` and `inner`')
 
+        if accumulate_dtype is not None and (
+                any(x is not None for x in (dist, norm, inner)) or
+                isinstance(weighting, Weighting) or isspmatrix(weighting) or
+                np.ndim(weighting) == 2):
+            raise ValueError('`accumulate_dtype` can only be used with '
+                             'constant or array weighting')
+
         # Set the weighting
         if weighting is not None:
             if isinstance(weighting, Weighting):
                 self.__weighting = weighting
             elif np.isscalar(weighting):
                 self.__weighting = NumpyFnConstWeighting(
-                    weighting, exponent, dist_using_inner=dist_using_inner)
+                    weighting, exponent, dist_using_inner=dist_using_inner,
+                    accumulate_dtype=accumulate_dtype)
             elif weighting is None:
                 # Need to wait until dist, norm and inner are handled
                 pass
@@ -743,7 +773,8 @@ class NumpyFn(FnBase, NumpyNtuples):
                                      ''.format(weighting))
                 if arr.ndim == 1:
                     self.__weighting = NumpyFnArrayWeighting(
-                        arr, exponent, dist_using_inner=dist_using_inner)
+                        arr, exponent, dist_using_inner=dist_using_inner,
+                        accumulate_dtype=accumulate_dtype)
                 elif arr.ndim == 2:
                     self.__weighting = NumpyFnMatrixWeighting(
                         arr, exponent, dist_using_inner=dist_using_inner,
@@ -760,7 +791,8 @@ class NumpyFn(FnBase, NumpyNtuples):
             self.__weighting = NumpyFnCustomInner(inner)
         else:  # all None -> no weighing
             self.__weighting = NumpyFnNoWeighting(
-                exponent, dist_using_inner=dist_using_inner)
+                exponent, dist_using_inner=dist_using_inner,
+                accumulate_dtype=accumulate_dtype)
 
     @property
     def exponent(self):
@@ -777,6 +809,11 @@ class NumpyFn(FnBase, NumpyNtuples):
         """``True`` if the weighting is not `NumpyFnNoWeighting`."""
         return not isinstance(self.weighting, NumpyFnNoWeighting)
 
+    @property
+    def accumulate_dtype(self):
+        """Data type for accumulation in reductions, ``None`` if not set."""
+        return self.weighting.accumulate_dtype
+
     def _lincomb(self, a, x1, b, x2, out):
         """Linear combination of ``x1`` and ``x2``.
 
@@ -948,7 +985,7 @@ class NumpyFn(FnBase, NumpyNtuples):
         >>> out
         cn(3).element([(5+1j), (6+3j), (4-8j)])
         """
-        np.multiply(x1.data, x2.data, out=out.data)
+        fused_multiply(x1.data, x2.data, out=out.data)
 
     def _divide(self, x1, x2, out):
         """Entry-wise division of two vectors, assigned to out.
@@ -975,7 +1012,7 @@ class NumpyFn(FnBase, NumpyNtuples):
         >>> out
         rn(3).element([3.0, 2.5, 3.0])
         """
-        np.divide(x1.data, x2.data, out=out.data)
+        fused_divide(x1.data, x2.data, out=out.data)
 
     def __eq__(self, other):
         """Return ``self == other``.
@@ -1397,9 +1434,12 @@ def npy_weighted_dist(weights, exponent=2.0, use_inner=False):
                       dist_using_inner=use_inner).dist
 
 
-def _norm_default(x):
+def _norm_default(x, accumulate_dtype=None):
     """Default Euclidean norm implementation."""
-    if _blas_is_applicable(x):
+    if _needs_accumulation(x, accumulate_dtype):
+        return parallel_pnorm(x.data, 2.0,
+                              accumulate_dtype=accumulate_dtype)
+    elif _blas_is_applicable(x):
         nrm2 = linalg.blas.get_blas_funcs('nrm2', dtype=x.dtype)
         norm = partial(nrm2, n=native(x.size))
     else:
@@ -1407,38 +1447,41 @@ def _norm_default(x):
     return norm(x.data)
 
 
-def _pnorm_default(x, p):
+def _pnorm_default(x, p, accumulate_dtype=None):
     """Default p-norm implementation."""
-    return np.linalg.norm(x.data, ord=p)
+    return parallel_pnorm(x.data, p,
+                          accumulate_dtype=accumulate_dtype)
 
 
-def _pnorm_diagweight(x, p, w):
+def _pnorm_diagweight(x, p, w, accumulate_dtype=None):
     """Diagonally weighted p-norm implementation."""
-    # This is faster than first applying the weights and then summing with
-    # BLAS dot or nrm2
-    xp = np.abs(x.data)
-    if np.isfinite(p):
-        xp = np.power(xp, p, out=xp)
-        xp *= w  # w is a plain NumPy array
-        return np.sum(xp) ** (1 / p)
-    else:
-        xp *= w
-        return np.max(xp)
+    # Chunked reduction, no temporary arrays of full size
+    return parallel_pnorm(x.data, p, weights=np.asarray(w),
+                          accumulate_dtype=accumulate_dtype)
+
 
+def _needs_accumulation(x, accumulate_dtype):
+    """Return ``True`` if ``x`` has lower precision than the accumulation."""
+    return (accumulate_dtype is not None and
+            np.result_type(x.dtype, accumulate_dtype) != x.dtype)
 
-def _inner_default(x1, x2):
+
+def _inner_default(x1, x2, accumulate_dtype=None):
     """Default Euclidean inner product implementation."""
     size = x1.size
+    data1, data2 = x1.data, x2.data
 
     # x2 as first argument because we want linearity in x1
 
-    if size > THRESHOLD_MEDIUM and _blas_is_applicable(x1, x2):
+    if _needs_accumulation(x1, accumulate_dtype):
+        dot = parallel_inner(data1, data2, accumulate_dtype=accumulate_dtype)
+    elif size > THRESHOLD_MEDIUM and _blas_is_applicable(x1, x2):
         dotc = linalg.blas.get_blas_funcs('dotc', dtype=x1.dtype)
-        dot = dotc(x2.data, x1.data, n=native(size))
+        dot = dotc(data2, data1, n=native(size))
     elif is_real_dtype(x1.dtype):
-        dot = np.dot(x2.data, x1.data)  # still much faster than vdot
+        dot = np.dot(data2, data1)  # still much faster than vdot
     else:
-        dot = np.vdot(x2.data, x1.data)  # slowest alternative
+        dot = np.vdot(data2, data1)  # slowest alternative
 
     return dot
 
@@ -1615,7 +1658,8 @@ class NumpyFnArrayWeighting(ArrayWeighting):
     See ``Notes`` for mathematical details.
     """
 
-    def __init__(self, array, exponent=2.0, dist_using_inner=False):
+    def __init__(self, array, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -1635,6 +1679,11 @@ class NumpyFnArrayWeighting(ArrayWeighting):
             exactly zero for equal (but not identical) ``x`` and ``y``.
 
             This option can only be used if ``exponent`` is 2.0.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. ``None`` means the data type
+            of the elements.
 
         Notes
         -----
@@ -1679,7 +1728,8 @@ class NumpyFnArrayWeighting(ArrayWeighting):
           checked during initialization.
         """
         super().__init__(array, impl='numpy', exponent=exponent,
-                         dist_using_inner=dist_using_inner)
+                         dist_using_inner=dist_using_inner,
+                         accumulate_dtype=accumulate_dtype)
 
     def inner(self, x1, x2):
         """Return the weighted inner product of two vectors.
@@ -1699,7 +1749,9 @@ class NumpyFnArrayWeighting(ArrayWeighting):
                                       'exponent != 2 (got {})'
                                       ''.format(self.exponent))
         else:
-            inner = _inner_default(x1 * self.array, x2)
+            inner = parallel_inner(x1.data, x2.data,
+                                   weights=np.asarray(self.array),
+                                   accumulate_dtype=self.accumulate_dtype)
             if is_real_dtype(x1.dtype):
                 return float(inner)
             else:
@@ -1718,13 +1770,29 @@ class NumpyFnArrayWeighting(ArrayWeighting):
         norm : float
             The norm of the provided vector
         """
-        if self.exponent == 2.0:
-            norm_squared = self.inner(x, x).real  # TODO: optimize?!
-            if norm_squared < 0:
-                norm_squared = 0.0  # Compensate for numerical error
-            return np.sqrt(norm_squared)
+        return float(_pnorm_diagweight(x, self.exponent, self.array,
+                                       self.accumulate_dtype))
+
+    def dist(self, x1, x2):
+        """Calculate the array-weighted distance between two vectors.
+
+        Parameters
+        ----------
+        x1, x2 : `NumpyFnVector`
+            Vectors whose mutual distance is calculated
+
+        Returns
+        -------
+        dist : float
+            The distance between the vectors
+        """
+        if self.dist_using_inner:
+            return super().dist(x1, x2)
         else:
-            return float(_pnorm_diagweight(x, self.exponent, self.array))
+            return parallel_pdist(x1.data, x2.data,
+                                  self.exponent,
+                                  weights=np.asarray(self.array),
+                                  accumulate_dtype=self.accumulate_dtype)
 
 
 class NumpyFnConstWeighting(ConstWeighting):
@@ -1735,7 +1803,8 @@ class NumpyFnConstWeighting(ConstWeighting):
     See ``Notes`` for mathematical details.
     """
 
-    def __init__(self, constant, exponent=2.0, dist_using_inner=False):
+    def __init__(self, constant, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -1755,6 +1824,11 @@ class NumpyFnConstWeighting(ConstWeighting):
             exactly zero for equal (but not identical) ``x`` and ``y``.
 
             This option can only be used if ``exponent`` is 2.0.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. ``None`` means the data type
+            of the elements.
 
         Notes
         -----
@@ -1794,7 +1868,8 @@ class NumpyFnConstWeighting(ConstWeighting):
           inner product or norm, respectively.
         """
         super().__init__(constant, impl='numpy', exponent=exponent,
-                         dist_using_inner=dist_using_inner)
+                         dist_using_inner=dist_using_inner,
+                         accumulate_dtype=accumulate_dtype)
 
     def inner(self, x1, x2):
         """Calculate the constant-weighted inner product of two vectors.
@@ -1814,7 +1889,8 @@ class NumpyFnConstWeighting(ConstWeighting):
                                       'exponent != 2 (got {})'
                                       ''.format(self.exponent))
         else:
-            inner = self.const * _inner_default(x1, x2)
+            inner = self.const * _inner_default(x1, x2,
+                                                self.accumulate_dtype)
             return x1.space.field.element(inner)
 
     def norm(self, x):
@@ -1830,13 +1906,15 @@ class NumpyFnConstWeighting(ConstWeighting):
         norm : float
             The norm of the vector
         """
+        acc_dtype = self.accumulate_dtype
         if self.exponent == 2.0:
-            return np.sqrt(self.const) * float(_norm_default(x))
+            return np.sqrt(self.const) * float(_norm_default(x, acc_dtype))
         elif self.exponent == float('inf'):
-            return self.const * float(_pnorm_default(x, self.exponent))
+            return self.const * float(_pnorm_default(x, self.exponent,
+                                                     acc_dtype))
         else:
             return (self.const ** (1 / self.exponent) *
-                    float(_pnorm_default(x, self.exponent)))
+                    float(_pnorm_default(x, self.exponent, acc_dtype)))
 
     def dist(self, x1, x2):
         """Calculate the constant-weighted distance between two vectors.
@@ -1852,18 +1930,24 @@ class NumpyFnConstWeighting(ConstWeighting):
             The distance between the vectors
         """
         if self.dist_using_inner:
-            dist_squared = (_norm_default(x1) ** 2 + _norm_default(x2) ** 2 -
-                            2 * _inner_default(x1, x2).real)
+            acc_dtype = self.accumulate_dtype
+            dist_squared = (_norm_default(x1, acc_dtype) ** 2 +
+                            _norm_default(x2, acc_dtype) ** 2 -
+                            2 * _inner_default(x1, x2, acc_dtype).real)
             if dist_squared < 0.0:  # Compensate for numerical error
                 dist_squared = 0.0
             return np.sqrt(self.const) * float(np.sqrt(dist_squared))
-        elif self.exponent == 2.0:
-            return np.sqrt(self.const) * _norm_default(x1 - x2)
+
+        # Chunked reduction, no temporary for `x1 - x2`
+        dist = parallel_pdist(x1.data, x2.data,
+                              self.exponent,
+                              accumulate_dtype=self.accumulate_dtype)
+        if self.exponent == 2.0:
+            return np.sqrt(self.const) * dist
         elif self.exponent == float('inf'):
-            return self.const * float(_pnorm_default(x1 - x2, self.exponent))
+            return self.const * dist
         else:
-            return (self.const ** (1 / self.exponent) *
-                    float(_pnorm_default(x1 - x2, self.exponent)))
+            return self.const ** (1 / self.exponent) * dist
 
 
 class NumpyFnNoWeighting(NoWeighting, NumpyFnConstWeighting):
@@ -1884,6 +1968,7 @@ class NumpyFnNoWeighting(NoWeighting, NumpyFnConstWeighting):
 
     def __new__(cls, *args, **kwargs):
         """Implement singleton pattern if ``exp==2.0``."""
+        accumulate_dtype = kwargs.pop('accumulate_dtype', None)
         if len(args) == 0:
             exponent = kwargs.pop('exponent', 2.0)
             dist_using_inner = kwargs.pop('dist_using_inner', False)
@@ -1896,14 +1981,16 @@ class NumpyFnNoWeighting(NoWeighting, NumpyFnConstWeighting):
             dist_using_inner = args[1]
             args = args[2:]
 
-        if exponent == 2.0 and not dist_using_inner:
+        if (exponent == 2.0 and not dist_using_inner and
+                accumulate_dtype is None):
             if not cls._instance:
                 cls._instance = super().__new__(cls, *args, **kwargs)
             return cls._instance
         else:
             return super().__new__(cls, *args, **kwargs)
 
-    def __init__(self, exponent=2.0, dist_using_inner=False):
+    def __init__(self, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -1921,9 +2008,15 @@ class NumpyFnNoWeighting(NoWeighting, NumpyFnConstWeighting):
             exactly zero for equal (but not identical) ``x`` and ``y``.
 
             This option can only be used if ``exponent`` is 2.0.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. ``None`` means the data type
+            of the elements.
         """
         super().__init__(impl='numpy', exponent=exponent,
-                         dist_using_inner=dist_using_inner)
+                         dist_using_inner=dist_using_inner,
+                         accumulate_dtype=accumulate_dtype)
 
 
 class NumpyFnCustomInner(CustomInner):
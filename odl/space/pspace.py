@@ -19,10 +19,13 @@ from itertools import product
 import numpy as np
 
 from odl.set import LinearSpace, LinearSpaceElement, RealNumbers
+from odl.space.fused_kernels import (
+    fused_lincomb, fused_multiply, fused_divide)
 from odl.space.weighting import (
     Weighting, ArrayWeighting, ConstWeighting, NoWeighting,
     CustomInner, CustomNorm, CustomDist)
-from odl.util import is_real_dtype, signature_string, indent_rows
+from odl.util import (
+    is_real_dtype, is_floating_dtype, signature_string, indent_rows)
 from odl.util.ufuncs import ProductSpaceUfuncs
 
 
@@ -82,6 +85,17 @@ class ProductSpace(LinearSpace):
 
             float : same weighting factor in each component
 
+        contiguous : bool, optional
+            If ``True``, the parts of each element are views into a
+            single contiguous array of shape ``(n,) + space.shape``.
+            Arithmetic and reductions then act on that array with one
+            vectorized call instead of looping over the parts, and
+            `ProductSpaceElement.asarray` returns the array without
+            copying. This is only possible for power spaces
+            ``ProductSpace(space, n)`` of a ``space`` with ``impl='numpy'``.
+
+            Default: ``False``
+
         Other Parameters
         ----------------
         dist : callable, optional
@@ -154,6 +168,15 @@ class ProductSpace(LinearSpace):
 
         >>> r2x2x2 = ProductSpace(odl.rn(2), 3)
 
+        Powerspace with contiguous storage of the elements
+
+        >>> r2x2x2 = ProductSpace(odl.rn(2), 3, contiguous=True)
+        >>> x = r2x2x2.one()
+        >>> x.asarray()
+        array([[ 1.,  1.],
+               [ 1.,  1.],
+               [ 1.,  1.]])
+
         Notes
         -----
         Inner product, norm and distance are evaluated by collecting
@@ -220,6 +243,7 @@ class ProductSpace(LinearSpace):
         weighting = kwargs.pop('weighting', None)
         exponent = float(kwargs.pop('exponent', 2.0))
         dist_using_inner = bool(kwargs.pop('dist_using_inner', False))
+        contiguous = bool(kwargs.pop('contiguous', False))
         if kwargs:
             raise TypeError('got unexpected keyword arguments: {}'
                             ''.format(kwargs))
@@ -262,6 +286,16 @@ class ProductSpace(LinearSpace):
         self.__is_power_space = all(spc == self.spaces[0]
                                     for spc in self.spaces[1:])
 
+        if contiguous:
+            if self.size == 0 or not self.is_power_space:
+                raise ValueError('`contiguous=True` requires a nonempty '
+                                 'power space')
+            if getattr(self.spaces[0], 'impl', None) != 'numpy':
+                raise ValueError("`contiguous=True` requires a space with "
+                                 "`impl='numpy'`, got {!r}"
+                                 "".format(self.spaces[0]))
+        self.__is_contiguous = contiguous
+
         super().__init__(field)
 
         # Assign weighting
@@ -321,6 +355,11 @@ class ProductSpace(LinearSpace):
         """``True`` if all member spaces are equal."""
         return self.__is_power_space
 
+    @property
+    def is_contiguous(self):
+        """``True`` if elements are stored in a single contiguous array."""
+        return self.__is_contiguous
+
     @property
     def exponent(self):
         """Exponent of the product space norm/dist, ``None`` for custom."""
@@ -397,15 +436,29 @@ class ProductSpace(LinearSpace):
         >>> x = prod.element([x2, x3])
         >>> print(x)
         {[1.0, 2.0], [1.0, 2.0, 3.0]}
+
+        In a contiguous power space, an array of shape
+        ``(n,) + space.shape`` is wrapped, not copied:
+
+        >>> r2x3 = ProductSpace(r2, 3, contiguous=True)
+        >>> arr = np.zeros((3, 2))
+        >>> x = r2x3.element(arr)
+        >>> x[1][0] = 5
+        >>> arr
+        array([[ 0.,  0.],
+               [ 5.,  0.],
+               [ 0.,  0.]])
         """
+        if inp in self:
+            return inp
+
+        if self.is_contiguous:
+            return self._contiguous_element(inp, cast)
 
         # If data is given as keyword arg, prefer it over arg list
         if inp is None:
             inp = [space.element() for space in self.spaces]
 
-        if inp in self:
-            return inp
-
         if len(inp) != len(self):
             raise ValueError('length of `inp` {} does not match length of '
                              'space {}'.format(len(inp), len(self)))
@@ -423,6 +476,48 @@ class ProductSpace(LinearSpace):
 
         return self.element_type(self, parts)
 
+    def _contiguous_element(self, inp, cast):
+        """Create an element backed by a single contiguous array."""
+        space = self.spaces[0]
+        if inp is None:
+            data = np.empty((self.size, space.size), dtype=space.dtype)
+            return self._element_from_data(data)
+
+        if (cast and isinstance(inp, np.ndarray) and
+                inp.shape == (self.size,) + space.shape):
+            # Wrap the array if the memory layout allows it
+            if getattr(space, 'order', 'C') == 'F':
+                inp = inp.transpose([0] + list(range(inp.ndim - 1, 0, -1)))
+            data = np.ascontiguousarray(inp, dtype=space.dtype)
+            return self._element_from_data(
+                data.reshape((self.size, space.size)))
+
+        if len(inp) != len(self):
+            raise ValueError('length of `inp` {} does not match length of '
+                             'space {}'.format(len(inp), len(self)))
+
+        if not all(isinstance(v, LinearSpaceElement) and v.space == space
+                   for v in inp):
+            if cast:
+                inp = [space.element(arg) for arg in inp]
+            else:
+                raise TypeError('input {!r} not a sequence of elements of '
+                                'the component spaces'.format(inp))
+
+        out = self.element()
+        for outp, v in zip(out.parts, inp):
+            outp.assign(v)
+        return out
+
+    def _element_from_data(self, data):
+        """Wrap a contiguous ``(size, spaces[0].size)`` data array."""
+        space = self.spaces[0]
+        if hasattr(space, 'dspace'):
+            parts = [space.element(space.dspace.element(row)) for row in data]
+        else:
+            parts = [space.element(row) for row in data]
+        return self.element_type(self, parts, data)
+
     @property
     def examples(self):
         """Return examples from all sub-spaces."""
@@ -457,6 +552,10 @@ class ProductSpace(LinearSpace):
         >>> zero_3 == zero_2x3[1]
         True
         """
+        if self.is_contiguous:
+            return self._element_from_data(
+                np.zeros((self.size, self.spaces[0].size),
+                         dtype=self.spaces[0].dtype))
         return self.element([space.zero() for space in self.spaces])
 
     def one(self):
@@ -485,10 +584,19 @@ class ProductSpace(LinearSpace):
         >>> one_3 == one_2x3[1]
         True
         """
+        if self.is_contiguous:
+            return self._element_from_data(
+                np.ones((self.size, self.spaces[0].size),
+                        dtype=self.spaces[0].dtype))
         return self.element([space.one() for space in self.spaces])
 
     def _lincomb(self, a, x, b, y, out):
         """Linear combination ``out = a*x + b*y``."""
+        data = _contiguous_data(x, y, out)
+        if data is not None and is_floating_dtype(data[0].dtype):
+            fused_lincomb(a, data[0], b, data[1], data[2])
+            return
+
         for space, xp, yp, outp in zip(self.spaces, x.parts, y.parts,
                                        out.parts):
             space._lincomb(a, xp, b, yp, outp)
@@ -507,12 +615,22 @@ class ProductSpace(LinearSpace):
 
     def _multiply(self, x1, x2, out):
         """Product ``out = x1 * x2``."""
+        data = _contiguous_data(x1, x2, out)
+        if data is not None and is_floating_dtype(data[0].dtype):
+            fused_multiply(*data)
+            return
+
         for spc, xp, yp, outp in zip(self.spaces, x1.parts, x2.parts,
                                      out.parts):
             spc._multiply(xp, yp, outp)
 
     def _divide(self, x1, x2, out):
         """Quotient ``out = x1 / x2``."""
+        data = _contiguous_data(x1, x2, out)
+        if data is not None and is_floating_dtype(data[0].dtype):
+            fused_divide(*data)
+            return
+
         for spc, xp, yp, outp in zip(self.spaces, x1.parts, x2.parts,
                                      out.parts):
             spc._divide(xp, yp, outp)
@@ -549,12 +667,14 @@ class ProductSpace(LinearSpace):
             return (isinstance(other, ProductSpace) and
                     self.shape == other.shape and
                     self.weighting == other.weighting and
+                    self.is_contiguous == other.is_contiguous and
                     all(x == y for x, y in zip(self.spaces,
                                                other.spaces)))
 
     def __hash__(self):
         """Return ``hash(self)``."""
-        return hash((type(self), self.spaces, self.weighting))
+        return hash((type(self), self.spaces, self.weighting,
+                     self.is_contiguous))
 
     def __getitem__(self, indices):
         """Return ``self[indices]``."""
@@ -585,7 +705,7 @@ class ProductSpace(LinearSpace):
             oneline = True
         elif self.is_power_space:
             posargs = [self.spaces[0], self.size]
-            optargs = []
+            optargs = [('contiguous', self.is_contiguous, False)]
             oneline = True
         else:
             posargs = self.spaces
@@ -616,16 +736,27 @@ class ProductSpaceElement(LinearSpaceElement):
 
     """Elements of a `ProductSpace`."""
 
-    def __init__(self, space, parts):
+    def __init__(self, space, parts, data=None):
         """Initialize a new instance."""
         super().__init__(space)
         self.__parts = tuple(parts)
+        # Contiguous array of which the parts are views, `None` if the
+        # parts are stored separately
+        self.__data = data
 
     @property
     def parts(self):
         """Parts of this product space element."""
         return self.__parts
 
+    @property
+    def _contiguous_data(self):
+        """Array of shape ``(size, spaces[0].size)`` viewed by the parts.
+
+        ``None`` if the space is not `ProductSpace.is_contiguous`.
+        """
+        return self.__data
+
     @property
     def size(self):
         """Number of factors of this element's space."""
@@ -640,6 +771,63 @@ class ProductSpaceElement(LinearSpaceElement):
         """Return ``len(self)``."""
         return len(self.space)
 
+    def copy(self):
+        """Return an identical (deep) copy of this element.
+
+        The parts are copied with their own ``copy`` methods. Contiguous
+        elements are copied with a single array copy.
+        """
+        if self.__data is not None:
+            return self.space._element_from_data(self.__data.copy())
+        return self.space.element([part.copy() for part in self.parts])
+
+    def asarray(self, out=None):
+        """Extract the data of this element as a numpy array.
+
+        The returned array has shape ``(size,) + spaces[0].shape``. This
+        is only defined for power spaces.
+
+        Parameters
+        ----------
+        out : `numpy.ndarray`, optional
+            Array in which the result should be written in-place.
+
+        Returns
+        -------
+        asarray : `numpy.ndarray`
+            For a `ProductSpace.is_contiguous` space and ``out=None``,
+            this is a view of the data of this element. Otherwise, the
+            data of the parts is copied.
+
+        Examples
+        --------
+        >>> r2x3 = odl.ProductSpace(odl.rn(2), 3, contiguous=True)
+        >>> x = r2x3.element([[1, 2], [3, 4], [5, 6]])
+        >>> arr = x.asarray()
+        >>> arr[0, 1] = 0
+        >>> x[0]
+        rn(2).element([1.0, 0.0])
+        """
+        if not self.space.is_power_space:
+            raise ValueError('`asarray` only defined for power spaces, '
+                             'got {!r}'.format(self.space))
+
+        if self.__data is None:
+            arr = np.array([part.asarray() for part in self.parts])
+        else:
+            space = self.space[0]
+            if getattr(space, 'order', 'C') == 'F':
+                arr = self.__data.reshape((self.size,) + space.shape[::-1])
+                arr = arr.transpose([0] + list(range(arr.ndim - 1, 0, -1)))
+            else:
+                arr = self.__data.reshape((self.size,) + space.shape)
+
+        if out is None:
+            return arr
+        else:
+            out[:] = arr
+            return out
+
     def __eq__(self, other):
         """Return ``self == other``.
 
@@ -1072,11 +1260,7 @@ class ProductSpaceArrayWeighting(ArrayWeighting):
                                       'exponent != 2 (got {})'
                                       ''.format(self.exponent))
 
-        inners = np.fromiter(
-            (x1i.inner(x2i) for x1i, x2i in zip(x1, x2)),
-            dtype=x1[0].space.dtype, count=len(x1))
-
-        inner = np.dot(inners, self.array)
+        inner = np.dot(_part_inners(x1, x2), self.array)
         if is_real_dtype(x1[0].dtype):
             return float(inner)
         else:
@@ -1099,8 +1283,7 @@ class ProductSpaceArrayWeighting(ArrayWeighting):
             norm_squared = self.inner(x, x).real  # TODO: optimize?!
             return np.sqrt(norm_squared)
         else:
-            norms = np.fromiter(
-                (xi.norm() for xi in x), dtype=np.float64, count=len(x))
+            norms = _part_norms(x)
             if self.exponent in (1.0, float('inf')):
                 norms *= self.array
             else:
@@ -1190,11 +1373,7 @@ class ProductSpaceConstWeighting(ConstWeighting):
                                       'exponent != 2 (got {})'
                                       ''.format(self.exponent))
 
-        inners = np.fromiter(
-            (x1i.inner(x2i) for x1i, x2i in zip(x1, x2)),
-            dtype=x1[0].space.dtype, count=len(x1))
-
-        inner = self.const * np.sum(inners)
+        inner = self.const * np.sum(_part_inners(x1, x2))
         return x1.space.field.element(inner)
 
     def norm(self, x):
@@ -1214,8 +1393,7 @@ class ProductSpaceConstWeighting(ConstWeighting):
             norm_squared = self.inner(x, x).real  # TODO: optimize?!
             return np.sqrt(norm_squared)
         else:
-            norms = np.fromiter(
-                (xi.norm() for xi in x), dtype=np.float64, count=len(x))
+            norms = _part_norms(x)
 
             if self.exponent in (1.0, float('inf')):
                 return (self.const *
@@ -1238,29 +1416,16 @@ class ProductSpaceConstWeighting(ConstWeighting):
             The distance between the elements.
         """
         if self.dist_using_inner:
-            norms1 = np.fromiter(
-                (x1i.norm() for x1i in x1),
-                dtype=np.float64, count=len(x1))
-            norm1 = np.linalg.norm(norms1)
-
-            norms2 = np.fromiter(
-                (x2i.norm() for x2i in x2),
-                dtype=np.float64, count=len(x2))
-            norm2 = np.linalg.norm(norms2)
-
-            inners = np.fromiter(
-                (x1i.inner(x2i) for x1i, x2i in zip(x1, x2)),
-                dtype=x1[0].space.dtype, count=len(x1))
-            inner_re = np.sum(inners.real)
+            norm1 = np.linalg.norm(_part_norms(x1))
+            norm2 = np.linalg.norm(_part_norms(x2))
+            inner_re = np.sum(_part_inners(x1, x2).real)
 
             dist_squared = norm1 ** 2 + norm2 ** 2 - 2 * inner_re
             if dist_squared < 0.0:  # Compensate for numerical error
                 dist_squared = 0.0
             return np.sqrt(self.const) * float(np.sqrt(dist_squared))
         else:
-            dnorms = np.fromiter(
-                ((x1i - x2i).norm() for x1i, x2i in zip(x1, x2)),
-                dtype=np.float64, count=len(x1))
+            dnorms = _part_dists(x1, x2)
 
             if self.exponent == float('inf'):
                 return self.const * np.linalg.norm(dnorms, ord=self.exponent)
@@ -1407,6 +1572,82 @@ class ProductSpaceCustomDist(CustomDist):
         super().__init__(dist, impl='numpy')
 
 
+def _contiguous_data(*elements):
+    """Return the contiguous data arrays of ``elements``, or ``None``.
+
+    ``None`` is returned if any of the elements does not store its parts
+    in a contiguous array.
+    """
+    data = [getattr(x, '_contiguous_data', None) for x in elements]
+    if any(d is None for d in data):
+        return None
+    else:
+        return data
+
+
+def _vectorizable_weighting(x, *others):
+    """Return the weighting of the parts if reductions can be vectorized.
+
+    This is the case for contiguous elements with a `ConstWeighting` in
+    the component space and no extra options for the accumulation.
+    Otherwise, ``None`` is returned.
+    """
+    if _contiguous_data(x, *others) is None:
+        return None
+    weighting = getattr(x.space[0], 'weighting', None)
+    if (isinstance(weighting, ConstWeighting) and
+            getattr(weighting, 'accumulate_dtype', None) is None):
+        return weighting
+    else:
+        return None
+
+
+def _part_inners(x1, x2):
+    """Return the array of inner products of the parts of two elements."""
+    weighting = _vectorizable_weighting(x1, x2)
+    if weighting is None or weighting.exponent != 2.0:
+        return np.fromiter(
+            (x1i.inner(x2i) for x1i, x2i in zip(x1, x2)),
+            dtype=x1[0].space.dtype, count=len(x1))
+
+    data1, data2 = _contiguous_data(x1, x2)
+    if not is_real_dtype(data2.dtype):
+        data2 = data2.conj()
+    return weighting.const * np.einsum('ij,ij->i', data1, data2)
+
+
+def _part_norms(x):
+    """Return the array of norms of the parts of an element."""
+    weighting = _vectorizable_weighting(x)
+    if weighting is None:
+        return np.fromiter(
+            (xi.norm() for xi in x), dtype=np.float64, count=len(x))
+
+    return _weighted_row_norms(x._contiguous_data, weighting)
+
+
+def _part_dists(x1, x2):
+    """Return the array of distances between the parts of two elements."""
+    weighting = _vectorizable_weighting(x1, x2)
+    if weighting is None or weighting.dist_using_inner:
+        return np.fromiter(
+            ((x1i - x2i).norm() for x1i, x2i in zip(x1, x2)),
+            dtype=np.float64, count=len(x1))
+
+    data1, data2 = _contiguous_data(x1, x2)
+    return _weighted_row_norms(data1 - data2, weighting)
+
+
+def _weighted_row_norms(data, weighting):
+    """Return the norms of the rows of ``data`` with a constant weighting."""
+    exponent = weighting.exponent
+    norms = np.linalg.norm(data, ord=exponent, axis=1).astype('float64')
+    if exponent == float('inf'):
+        return weighting.const * norms
+    else:
+        return weighting.const ** (1 / exponent) * norms
+
+
 def _strip_space(x):
     """Strip the SPACE.element( ... ) part from a repr."""
     r = repr(x)
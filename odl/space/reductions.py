@@ -0,0 +1,411 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Chunked and multithreaded reductions for inner products and norms.
+
+The arrays are split into one contiguous range per thread, and each thread
+reduces its range in chunks that fit into the CPU cache. Intermediate
+results like ``w * |x|^p`` or ``x1 - x2`` are stored in one chunk-sized
+buffer per thread instead of a temporary of the full size.
+
+Within a chunk, NumPy's pairwise summation is used. The partial results of
+the chunks are added up with compensated summation (`math.fsum`), such that
+the result is much more accurate than a naive running sum over large
+arrays. Optionally, the chunks are converted to a higher precision before
+the reduction, e.g., to accumulate ``float32`` data in ``float64``.
+"""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import range
+
+import atexit
+import math
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import os
+import threading
+import numpy as np
+
+from odl.space.fused_kernels import _flat_views
+from odl.util.utility import (
+    is_real_dtype, is_real_floating_dtype, is_complex_floating_dtype,
+    real_dtype)
+
+
+__all__ = ('parallel_inner', 'parallel_pnorm', 'parallel_pdist')
+
+
+# Number of elements per chunk. Chunks of all involved arrays together
+# should fit into the CPU cache.
+REDUCTION_CHUNK_SIZE = 2 ** 15
+
+# Minimum number of elements per thread. Smaller arrays are reduced with
+# fewer threads, down to a single one.
+REDUCTION_MIN_SIZE_PER_THREAD = 2 ** 19
+
+# Thread pools by number of threads, created on first use, and the
+# process that owns them
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+_POOLS_PID = os.getpid()
+
+
+def parallel_inner(x1, x2, weights=None, threads=None,
+                   accumulate_dtype=None):
+    """Return ``sum(w * x1 * conj(x2))`` of two arrays.
+
+    Parameters
+    ----------
+    x1, x2 : `numpy.ndarray`
+        Arrays of the same shape and data type. The inner product is
+        linear in ``x1``.
+    weights : `numpy.ndarray`, optional
+        Positive weights ``w``, broadcastable to the shape of the arrays.
+        ``None`` means no weighting.
+    threads : positive int, optional
+        Number of threads to use. By default, it is chosen based on the
+        size of the arrays and the number of CPUs.
+    accumulate_dtype : optional
+        Floating point data type in which the reduction is computed, e.g.,
+        ``'float64'`` for ``'float32'`` arrays. The arrays are converted
+        chunk by chunk. ``None`` means the data type of the arrays.
+
+    Returns
+    -------
+    inner : float or complex
+        The (weighted) inner product, a Python number.
+
+    Examples
+    --------
+    >>> x1 = np.array([1, 2, 3], dtype=complex)
+    >>> x2 = np.array([1j, 1, 1])
+    >>> parallel_inner(x1, x2)
+    (5-1j)
+    >>> parallel_inner(x1, x2, weights=np.array([1, 2, 1]))
+    (7-1j)
+    """
+    x1, x2 = np.asarray(x1), np.asarray(x2)
+    dtype = _accumulation_dtype(np.result_type(x1, x2), accumulate_dtype)
+    real = is_real_dtype(dtype)
+    dot = np.dot if real else np.vdot
+
+    if weights is None:
+        def chunk_inner(tmps, x1, x2):
+            # BLAS dot, no temporary
+            return dot(x2, x1)
+
+        arrays, tmp_dtypes = (x1, x2), ()
+    else:
+        def chunk_inner(tmps, x1, x2, w):
+            np.multiply(x1, w, out=tmps[0])
+            return dot(x2, tmps[0])
+
+        arrays, tmp_dtypes = (x1, x2, weights), (dtype,)
+
+    partials = _chunked_reduction(chunk_inner, arrays, tmp_dtypes, threads,
+                                  cast_dtype=dtype, num_cast=2)
+    return _fsum(partials, real)
+
+
+def parallel_pnorm(x, p, weights=None, threads=None,
+                   accumulate_dtype=None):
+    """Return the (weighted) ``p``-norm of an array.
+
+    For finite ``p``, this is ``sum(w * |x|^p)^(1/p)``, otherwise
+    ``max(w * |x|)``.
+
+    Parameters
+    ----------
+    x : `numpy.ndarray`
+        Array whose norm should be computed.
+    p : positive float or ``inf``
+        Exponent of the norm.
+    weights : `numpy.ndarray`, optional
+        Positive weights ``w``, broadcastable to the shape of ``x``.
+        ``None`` means no weighting.
+    threads : positive int, optional
+        Number of threads to use. By default, it is chosen based on the
+        size of the array and the number of CPUs.
+    accumulate_dtype : optional
+        Floating point data type in which the reduction is computed, e.g.,
+        ``'float64'`` for a ``'float32'`` array. The array is converted
+        chunk by chunk. ``None`` means the data type of the array.
+
+    Returns
+    -------
+    norm : float
+        The (weighted) norm, a Python number.
+
+    Examples
+    --------
+    >>> x = np.array([3, 0, -4])
+    >>> parallel_pnorm(x, 2)
+    5.0
+    >>> parallel_pnorm(x, 1, weights=np.array([1, 1, 2]))
+    11.0
+    >>> parallel_pnorm(x, float('inf'))
+    4.0
+    """
+    x = np.asarray(x)
+    dtype = _accumulation_dtype(x.dtype, accumulate_dtype)
+    return _pnorm_reduction(_pnorm_chunk_func(dtype, p, weights),
+                            (x,), weights, p, dtype, (), threads)
+
+
+def parallel_pdist(x1, x2, p, weights=None, threads=None,
+                   accumulate_dtype=None):
+    """Return the (weighted) ``p``-norm distance of two arrays.
+
+    This is the same as ``parallel_pnorm(x1 - x2, p, weights)``, but the
+    difference is computed in small chunks.
+
+    Parameters
+    ----------
+    x1, x2 : `numpy.ndarray`
+        Arrays of the same shape and data type.
+    p : positive float or ``inf``
+        Exponent of the norm.
+    weights : `numpy.ndarray`, optional
+        Positive weights ``w``, broadcastable to the shape of the arrays.
+        ``None`` means no weighting.
+    threads : positive int, optional
+        Number of threads to use. By default, it is chosen based on the
+        size of the arrays and the number of CPUs.
+    accumulate_dtype : optional
+        Floating point data type in which the reduction is computed, e.g.,
+        ``'float64'`` for ``'float32'`` arrays. The arrays are converted
+        chunk by chunk. ``None`` means the data type of the arrays.
+
+    Returns
+    -------
+    dist : float
+        The (weighted) distance, a Python number.
+
+    Examples
+    --------
+    >>> x1 = np.array([3.0, 1.0, -4.0])
+    >>> x2 = np.array([0.0, 1.0, 0.0])
+    >>> parallel_pdist(x1, x2, 2)
+    5.0
+    """
+    x1, x2 = np.asarray(x1), np.asarray(x2)
+    dtype = _accumulation_dtype(np.result_type(x1, x2), accumulate_dtype)
+    pnorm_chunk = _pnorm_chunk_func(dtype, p, weights)
+
+    def chunk_dist(tmps, x1, x2, *w):
+        np.subtract(x1, x2, out=tmps[0])
+        return pnorm_chunk(tmps[1:], tmps[0], *w)
+
+    return _pnorm_reduction(chunk_dist, (x1, x2), weights, p, dtype,
+                            (dtype,), threads)
+
+
+def _pnorm_chunk_func(dtype, p, weights):
+    """Return a function computing the partial result for a chunk.
+
+    The function has the signature ``func(tmps, x[, w])`` and uses the
+    buffer ``tmps[0]`` of real floating point data type.
+    """
+    p = float(p)
+    real = is_real_floating_dtype(dtype)
+
+    if p == 2.0 and real:
+        if weights is None:
+            def chunk_pnorm(tmps, x):
+                return np.dot(x, x)
+        else:
+            def chunk_pnorm(tmps, x, w):
+                np.multiply(x, w, out=tmps[0])
+                return np.dot(x, tmps[0])
+
+    elif p == 2.0 and weights is None and is_complex_floating_dtype(dtype):
+        def chunk_pnorm(tmps, x):
+            return np.vdot(x, x).real
+
+    else:
+        def chunk_pnorm(tmps, x, *w):
+            tmp = tmps[0]
+            np.abs(x, out=tmp)
+            if p == float('inf'):
+                if w:
+                    tmp *= w[0]
+                return np.max(tmp)
+
+            if p == 2.0:
+                np.multiply(tmp, tmp, out=tmp)
+            elif p != 1.0:
+                np.power(tmp, p, out=tmp)
+            if w:
+                tmp *= w[0]
+            return np.sum(tmp)
+
+    return chunk_pnorm
+
+
+def _accumulation_dtype(dtype, accumulate_dtype):
+    """Return the data type in which a reduction is computed."""
+    if accumulate_dtype is None:
+        return np.dtype(dtype)
+    else:
+        return np.result_type(dtype, accumulate_dtype)
+
+
+def _pnorm_reduction(chunk_func, arrays, weights, p, dtype, tmp_dtypes,
+                     threads):
+    """Run the reduction for a p-norm and return the final result."""
+    tmp_dtypes = tmp_dtypes + (real_dtype(dtype, default=float),)
+    num_cast = len(arrays)
+    if weights is not None:
+        arrays = arrays + (weights,)
+
+    partials = _chunked_reduction(chunk_func, arrays, tmp_dtypes, threads,
+                                  cast_dtype=dtype, num_cast=num_cast)
+    p = float(p)
+    if p == float('inf'):
+        return float(max(partials)) if partials else 0.0
+    result = _fsum(partials, real=True)
+    if p == 1.0:
+        return result
+    elif p == 2.0:
+        return math.sqrt(result)
+    else:
+        return result ** (1 / p)
+
+
+def _chunked_reduction(chunk_func, arrays, tmp_dtypes, threads,
+                       cast_dtype=None, num_cast=0):
+    """Return the partial results of ``chunk_func`` on all chunks.
+
+    Parameters
+    ----------
+    chunk_func : callable
+        Function with signature ``chunk_func(tmps, *chunks)``, where
+        ``tmps`` is a list of buffers with the chunk size and data types
+        ``tmp_dtypes``.
+    arrays : sequence of `numpy.ndarray`
+        Arrays that should be reduced. The last one may be broadcast
+        against the first one, e.g., weights.
+    tmp_dtypes : sequence of dtype
+        Data types of the temporary buffers.
+    threads : positive int or None
+        Number of threads to use. ``None`` means automatic choice.
+    cast_dtype : optional
+        Data type to which chunks of the first ``num_cast`` arrays are
+        converted before calling ``chunk_func``.
+    num_cast : nonnegative int, optional
+        Number of arrays, excluding weights, that should be converted.
+
+    Returns
+    -------
+    partials : list
+        The results of ``chunk_func`` in the order of the chunks.
+    """
+    shape = arrays[0].shape
+    arrays = [np.broadcast_to(arr, shape) for arr in arrays]
+    views = _flat_views(*arrays)
+    if views is None:
+        views = [arr.ravel() for arr in arrays]
+    size = views[0].size
+
+    if threads is None:
+        threads = min(cpu_count(), size // REDUCTION_MIN_SIZE_PER_THREAD)
+    threads = max(1, min(int(threads), size // REDUCTION_CHUNK_SIZE))
+
+    cast_dtypes = [None] * len(views)
+    for k in range(num_cast):
+        if views[k].dtype != cast_dtype:
+            cast_dtypes[k] = cast_dtype
+
+    def reduce_range(rng):
+        start, stop = rng
+        chunk_size = min(REDUCTION_CHUNK_SIZE, stop - start)
+        tmps = [np.empty(chunk_size, dtype=dt) for dt in tmp_dtypes]
+        casts = [None if dt is None else np.empty(chunk_size, dtype=dt)
+                 for dt in cast_dtypes]
+        partials = []
+        for i in range(start, stop, REDUCTION_CHUNK_SIZE):
+            j = min(i + REDUCTION_CHUNK_SIZE, stop)
+            chunks = [v[i:j] for v in views]
+            for k, cast in enumerate(casts):
+                if cast is not None:
+                    chunks[k] = cast[:j - i]
+                    np.copyto(chunks[k], views[k][i:j])
+            partials.append(chunk_func([tmp[:j - i] for tmp in tmps],
+                                       *chunks))
+        return partials
+
+    # One range per thread, with boundaries on multiples of the chunk size
+    num_chunks = -(-size // REDUCTION_CHUNK_SIZE)
+    bounds = [min(size, REDUCTION_CHUNK_SIZE * (k * num_chunks // threads))
+              for k in range(threads + 1)]
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+
+    if threads == 1:
+        results = [reduce_range(ranges[0])]
+    else:
+        results = _thread_pool(threads).map(reduce_range, ranges)
+    return [partial for result in results for partial in result]
+
+
+def _thread_pool(threads):
+    """Return a thread pool with ``threads`` threads, reused across calls."""
+    if os.getpid() != _POOLS_PID:
+        # Forked without fork handlers (Python 2)
+        _reset_pools()
+    with _POOLS_LOCK:
+        pool = _POOLS.get(threads, None)
+        if pool is None:
+            pool = _POOLS[threads] = ThreadPool(threads)
+        return pool
+
+
+def _reset_pools():
+    """Forget the thread pools after a fork.
+
+    A forked child inherits the pools without their worker threads, so
+    tasks submitted to them would never run. The lock is replaced as well
+    since it may have been held by another thread during the fork.
+    """
+    global _POOLS, _POOLS_LOCK, _POOLS_PID
+    _POOLS = {}
+    _POOLS_LOCK = threading.Lock()
+    _POOLS_PID = os.getpid()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pools)
+
+
+@atexit.register
+def _close_pools():
+    """Close the thread pools of this process at exit."""
+    if os.getpid() != _POOLS_PID:
+        return
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+        pool.join()
+
+
+def _fsum(partials, real):
+    """Return the compensated sum of ``partials`` as Python number."""
+    if real:
+        return math.fsum(np.real(partials))
+    else:
+        return complex(math.fsum(np.real(partials)),
+                       math.fsum(np.imag(partials)))
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -20,7 +20,8 @@ import scipy.linalg as linalg
 from scipy.sparse.base import isspmatrix
 
 from odl.space.base_ntuples import FnBaseVector
-from odl.util import array1d_repr, arraynd_repr, signature_string, indent_rows
+from odl.util import (array1d_repr, arraynd_repr, signature_string,
+                      indent_rows, dtype_str, is_floating_dtype)
 
 
 __all__ = ('MatrixWeighting', 'ArrayWeighting', 'ConstWeighting',
@@ -42,7 +43,8 @@ class Weighting(object):
     functions are being used.
     """
 
-    def __init__(self, impl, exponent=2.0, dist_using_inner=False):
+    def __init__(self, impl, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -64,10 +66,23 @@ class Weighting(object):
             This option can only be used if ``exponent`` is 2.0.
 
             Default: False.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. The elements are not converted
+            as a whole. ``None`` means the data type of the elements.
         """
         self.__impl = str(impl).lower()
         self.__exponent = float(exponent)
         self.__dist_using_inner = bool(dist_using_inner)
+        if accumulate_dtype is None:
+            self.__accumulate_dtype = None
+        else:
+            self.__accumulate_dtype = np.dtype(accumulate_dtype)
+            if not is_floating_dtype(self.accumulate_dtype):
+                raise ValueError('`accumulate_dtype` must be a floating '
+                                 'point data type, got {!r}'
+                                 ''.format(accumulate_dtype))
         if self.exponent <= 0:
             raise ValueError('only positive exponents or inf supported, '
                              'got {}'.format(exponent))
@@ -90,6 +105,11 @@ class Weighting(object):
         """``True`` if the distance should be calculated using inner."""
         return self.__dist_using_inner
 
+    @property
+    def accumulate_dtype(self):
+        """Data type for accumulation in reductions, or ``None``."""
+        return self.__accumulate_dtype
+
     def __eq__(self, other):
         """Return ``self == other``.
 
@@ -108,12 +128,23 @@ class Weighting(object):
         return (isinstance(other, Weighting) and
                 self.impl == other.impl and
                 self.exponent == other.exponent and
-                self.dist_using_inner == other.dist_using_inner)
+                self.dist_using_inner == other.dist_using_inner and
+                # Compare as strings since `dtype(float) == None` is True
+                (self._accumulate_dtype_str ==
+                 other._accumulate_dtype_str))
 
     def __hash__(self):
         """Return ``hash(self)``."""
         return hash((type(self), self.impl, self.exponent,
-                     self.dist_using_inner))
+                     self.dist_using_inner, self.accumulate_dtype))
+
+    @property
+    def _accumulate_dtype_str(self):
+        """String of `accumulate_dtype` for ``repr``, ``None`` if unset."""
+        if self.accumulate_dtype is None:
+            return None
+        else:
+            return dtype_str(self.accumulate_dtype)
 
     def equiv(self, other):
         """Test if ``other`` is an equivalent weighting.
@@ -524,7 +555,8 @@ class ArrayWeighting(Weighting):
     during initialization.
     """
 
-    def __init__(self, array, impl, exponent=2.0, dist_using_inner=False):
+    def __init__(self, array, impl, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -548,9 +580,15 @@ class ArrayWeighting(Weighting):
             exactly zero for equal (but not identical) ``x`` and ``y``.
 
             This option can only be used if ``exponent`` is 2.0.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. The elements are not converted
+            as a whole. ``None`` means the data type of the elements.
         """
         super().__init__(impl=impl, exponent=exponent,
-                         dist_using_inner=dist_using_inner)
+                         dist_using_inner=dist_using_inner,
+                         accumulate_dtype=accumulate_dtype)
 
         # We store our "own" data structures as-is to retain Numpy
         # compatibility while avoiding copies. Other things are run through
@@ -629,15 +667,17 @@ class ArrayWeighting(Weighting):
         """String usable in a space's ``__repr__`` method."""
         optargs = [('weighting', array1d_repr(self.array, nprint=10), ''),
                    ('exponent', self.exponent, 2.0),
-                   ('dist_using_inner', self.dist_using_inner, False)]
+                   ('dist_using_inner', self.dist_using_inner, False),
+                   ('accumulate_dtype', self._accumulate_dtype_str, None)]
         return signature_string([], optargs, sep=[',\n', ', ', ',\n'],
-                                mod=[[], ['!s', '', '']])
+                                mod=[[], ['!s', '', '', '']])
 
     def __repr__(self):
         """Return ``repr(self)``."""
         posargs = [self.array]
         optargs = [('exponent', self.exponent, 2.0),
-                   ('dist_using_inner', self.dist_using_inner, False)]
+                   ('dist_using_inner', self.dist_using_inner, False),
+                   ('accumulate_dtype', self._accumulate_dtype_str, None)]
         inner_str = signature_string(posargs, optargs,
                                      sep=[', ', ', ', ',\n'],
                                      mod=['!r', ''])
@@ -653,7 +693,8 @@ class ConstWeighting(Weighting):
 
     """Weighting of a space by a constant."""
 
-    def __init__(self, const, impl, exponent=2.0, dist_using_inner=False):
+    def __init__(self, const, impl, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -675,9 +716,15 @@ class ConstWeighting(Weighting):
             exactly zero for equal (but not identical) ``x`` and ``y``.
 
             This option can only be used if ``exponent`` is 2.0.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. The elements are not converted
+            as a whole. ``None`` means the data type of the elements.
         """
         super().__init__(impl=impl, exponent=exponent,
-                         dist_using_inner=dist_using_inner)
+                         dist_using_inner=dist_using_inner,
+                         accumulate_dtype=accumulate_dtype)
         self._const = float(const)
         if self.const <= 0:
             raise ValueError('expected positive constant, got {}'
@@ -732,15 +779,17 @@ class ConstWeighting(Weighting):
         """String usable in a space's ``__repr__`` method."""
         optargs = [('weighting', self.const, 1.0),
                    ('exponent', self.exponent, 2.0),
-                   ('dist_using_inner', self.dist_using_inner, False)]
+                   ('dist_using_inner', self.dist_using_inner, False),
+                   ('accumulate_dtype', self._accumulate_dtype_str, None)]
         return signature_string([], optargs,
-                                mod=[[], [':.4', '', '']])
+                                mod=[[], [':.4', '', '', '']])
 
     def __repr__(self):
         """Return ``repr(self)``."""
         posargs = [self.const]
         optargs = [('exponent', self.exponent, 2.0),
-                   ('dist_using_inner', self.dist_using_inner, False)]
+                   ('dist_using_inner', self.dist_using_inner, False),
+                   ('accumulate_dtype', self._accumulate_dtype_str, None)]
         return '{}({})'.format(self.__class__.__name__,
                                signature_string(posargs, optargs))
 
@@ -753,7 +802,8 @@ class NoWeighting(ConstWeighting):
 
     """Weighting with constant 1."""
 
-    def __init__(self, impl, exponent=2.0, dist_using_inner=False):
+    def __init__(self, impl, exponent=2.0, dist_using_inner=False,
+                 accumulate_dtype=None):
         """Initialize a new instance.
 
         Parameters
@@ -773,19 +823,26 @@ class NoWeighting(ConstWeighting):
             exactly zero for equal (but not identical) ``x`` and ``y``.
 
             This option can only be used if ``exponent`` is 2.0.
+        accumulate_dtype : optional
+            Floating point data type in which inner products, norms and
+            distances are accumulated, e.g., ``'float64'`` for a space
+            with ``'float32'`` elements. The elements are not converted
+            as a whole. ``None`` means the data type of the elements.
         """
         # Support singleton pattern for subclasses
         if not hasattr(self, '_initialized'):
             ConstWeighting.__init__(
                 self, const=1.0, impl=impl, exponent=exponent,
-                dist_using_inner=dist_using_inner)
+                dist_using_inner=dist_using_inner,
+                accumulate_dtype=accumulate_dtype)
             self._initialized = True
 
     def __repr__(self):
         """Return ``repr(self)``."""
         posargs = []
         optargs = [('exponent', self.exponent, 2.0),
-                   ('dist_using_inner', self.dist_using_inner, False)]
+                   ('dist_using_inner', self.dist_using_inner, False),
+                   ('accumulate_dtype', self._accumulate_dtype_str, None)]
         return '{}({})'.format(self.__class__.__name__,
                                signature_string(posargs, optargs))
 
@@ -14,7 +14,9 @@ import pytest
 
 import odl
 from odl.deform import LinDeformFixedTempl, LinDeformFixedDisp
-from odl.util.testutils import almost_equal, simple_fixture
+from odl.deform.linearized import _linear_deform
+from odl.util.testutils import (
+    almost_equal, all_almost_equal, simple_fixture)
 
 
 # --- pytest fixtures --- #
@@ -257,6 +259,28 @@ def test_fixed_disp_call(space):
     assert rlt_err < error_bound(space.interp)
 
 
+def test_fixed_disp_interp_matrix(space):
+    """Verify that the cached interpolation matrix matches interpolation."""
+    template = odl.phantom.white_noise(space)
+    disp_field = 0.2 * odl.phantom.white_noise(
+        space.real_space.tangent_bundle)
+
+    deform_op = LinDeformFixedDisp(disp_field, templ_space=space)
+    assert deform_op.interp_matrix is deform_op.interp_matrix
+
+    true_deformed_templ = space.element(
+        _linear_deform(template, disp_field))
+    assert all_almost_equal(deform_op(template), true_deformed_templ)
+
+    # Reuse of the matrix for a second template
+    template = odl.phantom.white_noise(space)
+    out = space.element()
+    deform_op(template, out=out)
+    true_deformed_templ = space.element(
+        _linear_deform(template, disp_field))
+    assert all_almost_equal(out, true_deformed_templ)
+
+
 def test_fixed_disp_inv(space):
     """Verify that the inverse of LinDeformFixedDisp is correct."""
     # Set up template and displacement field
@@ -210,6 +210,43 @@ def test_finite_diff_periodic_padding():
     assert diff_central[-1] == (DATA_1D[0] - DATA_1D[-2]) / 2
 
 
+def test_finite_diff_accumulate(method, padding):
+    """Adding finite differences to an existing array."""
+    if isinstance(padding, tuple):
+        pad_mode, pad_const = padding
+    else:
+        pad_mode, pad_const = padding, 0
+
+    data = np.random.rand(6, 7, 8)
+    for axis in range(data.ndim):
+        diff = finite_diff(data, axis=axis, dx=0.5, method=method,
+                           pad_mode=pad_mode, pad_const=pad_const)
+        out = np.ones_like(data)
+        result = finite_diff(data, axis=axis, dx=0.5, method=method,
+                             pad_mode=pad_mode, pad_const=pad_const,
+                             out=out, accumulate=True)
+        assert result is out
+        assert all_almost_equal(out, diff + 1)
+
+    # `out` is required
+    with pytest.raises(ValueError):
+        finite_diff(data, axis=0, accumulate=True)
+
+
+def test_finite_diff_slabs(monkeypatch):
+    """Finite differences computed in many slabs with several threads."""
+    data = np.random.rand(20, 30, 10)
+    expected = [finite_diff(data, axis=axis, method='central')
+                for axis in range(data.ndim)]
+
+    monkeypatch.setattr(odl.discr.diff_ops, 'FINITE_DIFF_SLAB_SIZE', 16)
+    monkeypatch.setattr(odl.discr.diff_ops,
+                        'FINITE_DIFF_MIN_SIZE_PER_THREAD', 256)
+    for axis in range(data.ndim):
+        diff = finite_diff(data, axis=axis, method='central')
+        assert all_almost_equal(diff, expected[axis])
+
+
 # --- PartialDerivative --- #
 
 
@@ -14,13 +14,18 @@ import numpy as np
 
 import odl
 from odl.discr.grid import sparse_meshgrid
+import odl.discr.discr_mappings
 from odl.discr.discr_mappings import (
     PointCollocation, NearestInterpolation, LinearInterpolation,
-    PerAxisInterpolation)
+    PerAxisInterpolation, NUMBA_AVAILABLE)
 from odl.util.testutils import (
     all_almost_equal, all_equal, almost_equal)
 
 
+skip_if_no_numba = pytest.mark.skipif(not NUMBA_AVAILABLE,
+                                      reason='Numba not available')
+
+
 def test_nearest_interpolation_1d_complex(fn_impl):
     intv = odl.IntervalProd(0, 1)
     part = odl.uniform_partition_fromintv(intv, 5, nodes_on_bdry=False)
@@ -234,10 +239,11 @@ def test_linear_interpolation_2d():
     true_val_22 = (1 - lx2) * rvals[3, 1]  # ly2 = 0, no upper for 1.0
     true_mg = [[true_val_11, true_val_12],
                [true_val_21, true_val_22]]
-    assert all_equal(function(mg), true_mg)
+    # Meshgrids are interpolated axis by axis, which changes the rounding
+    assert all_almost_equal(function(mg), true_mg)
     out = np.empty((2, 2), dtype='float64')
     function(mg, out=out)
-    assert all_equal(out, true_mg)
+    assert all_almost_equal(out, true_mg)
 
 
 def test_per_axis_interpolation():
@@ -297,6 +303,61 @@ def test_per_axis_interpolation():
     assert all_equal(out, true_mg)
 
 
+@pytest.mark.parametrize('schemes', [['linear'] * 3,
+                                     ['nearest', 'linear', 'nearest']])
+def test_interpolation_meshgrid_separable(schemes):
+    """Check that meshgrid evaluation matches evaluation in points."""
+    rect = odl.IntervalProd([0, 0, 0], [1, 1, 1])
+    part = odl.uniform_partition_fromintv(rect, [5, 4, 3])
+    space = odl.FunctionSpace(rect)
+    dspace = odl.rn(part.size)
+    interp_op = PerAxisInterpolation(space, part, dspace, schemes=schemes)
+    values = np.arange(1, part.size + 1, dtype='float64')
+    function = interp_op(values)
+
+    # Includes points outside the grid and in the middle between nodes
+    coords = [[0.0, 0.3, 0.5, 0.95, 1.0], [0.125, 0.6], [0.2, 0.5, 0.9]]
+    mg = sparse_meshgrid(*coords)
+    pts = np.array(np.meshgrid(*coords, indexing='ij')).reshape(3, -1)
+
+    true_mg = function(pts).reshape([5, 2, 3])
+    assert all_almost_equal(function(mg), true_mg)
+    out = np.empty((5, 2, 3), dtype='float64')
+    function(mg, out=out)
+    assert all_almost_equal(out, true_mg)
+
+
+@skip_if_no_numba
+@pytest.mark.parametrize('schemes', [['linear'] * 3,
+                                     ['nearest', 'linear', 'nearest']])
+def test_per_axis_interpolation_numba(schemes, monkeypatch):
+    """Check that the compiled kernel matches the NumPy implementation."""
+    monkeypatch.setattr(odl.discr.discr_mappings, 'INTERP_NUMBA_MIN_SIZE',
+                        1)
+
+    rect = odl.IntervalProd([0, 0, 0], [1, 1, 1])
+    part = odl.uniform_partition_fromintv(rect, [5, 4, 3])
+    space = odl.FunctionSpace(rect)
+    dspace = odl.rn(part.size)
+    interp_op = PerAxisInterpolation(space, part, dspace, schemes=schemes,
+                                     order='F')
+    values = np.arange(1, part.size + 1, dtype='float64')
+    function = interp_op(values)
+
+    # Includes points outside the grid and in the middle between nodes
+    pts = np.random.uniform(0, 1, size=(3, 50))
+    pts[:, 0] = [0.5, 0.5, 0.5]
+    result = function(pts)
+    out = np.empty(50, dtype='float64')
+    function(pts, out=out)
+
+    monkeypatch.setattr(odl.discr.discr_mappings, 'NUMBA_AVAILABLE', False)
+    expected = function(pts)
+
+    assert all_equal(result, expected)
+    assert all_equal(out, expected)
+
+
 def test_collocation_interpolation_identity():
     # Check if interpolation followed by collocation on the same grid
     # is the identity
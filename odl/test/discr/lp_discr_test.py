@@ -969,6 +969,25 @@ def test_norm_rectangle(exponent):
         assert almost_equal(discr_testfunc.norm(), true_norm, places=2)
 
 
+def test_accumulate_dtype():
+    """Check a float32 space with reductions accumulated in float64."""
+    space = odl.uniform_discr([0, 0], [1, 1], (300, 300), dtype='float32',
+                              accumulate_dtype='float64')
+    space64 = odl.uniform_discr([0, 0], [1, 1], (300, 300))
+    assert space.dtype == np.dtype('float32')
+    assert space.dspace.accumulate_dtype == np.dtype('float64')
+    assert repr(space) == ("uniform_discr([0.0, 0.0], [1.0, 1.0], "
+                           "(300, 300), dtype='float32', "
+                           "accumulate_dtype='float')")
+    assert eval('odl.' + repr(space)) == space
+
+    x = space.element(lambda x: x[0] ** 2 * x[1])
+    x64 = space64.element(x)
+    assert almost_equal(x.norm(), x64.norm(), places=10)
+    assert almost_equal(x.inner(x), x64.inner(x64), places=10)
+    assert (x * x).dtype == np.dtype('float32')
+
+
 def test_norm_rectangle_boundary(fn_impl, exponent):
     # Check the constant function 1 in different situations regarding the
     # placement of the outermost grid points.
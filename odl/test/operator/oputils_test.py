@@ -12,7 +12,9 @@ import pytest
 import numpy as np
 
 import odl
-from odl.operator.oputils import matrix_representation, power_method_opnorm
+from odl.operator.oputils import (
+    matrix_representation, power_method_opnorm, lanczos_opnorm,
+    cached_opnorm, clear_opnorm_cache, operator_fingerprint)
 from odl.space.pspace import ProductSpace
 from odl.operator.pspace_ops import ProductSpaceOperator
 from odl.util.testutils import almost_equal
@@ -251,5 +253,166 @@ def test_power_method_opnorm_exceptions():
 
         power_method_opnorm(op, maxiter=1, xstart=op.domain.one())
 
+
+def test_lanczos_opnorm():
+    # Test the Lanczos method on matrix operators
+
+    # Singular values 5.5 and 6, see test_power_method_opnorm_nonsymm
+    mat = np.array([[-1.52441557, 5.04276365],
+                    [1.90246927, 2.54424763],
+                    [5.32935411, 0.04573162]])
+    op = odl.MatrixOperator(mat)
+    assert almost_equal(lanczos_opnorm(op), 6, places=5)
+
+    # At most n iterations are needed for an n x n matrix
+    mat = np.random.randn(10, 10)
+    op = odl.MatrixOperator(mat)
+    true_opnorm = np.linalg.norm(mat, 2)
+    opnorm_est = lanczos_opnorm(op, maxiter=10, rtol=1e-10)
+    assert almost_equal(opnorm_est, true_opnorm, places=5)
+
+    # Lower bound for few iterations
+    assert lanczos_opnorm(op, maxiter=2) <= true_opnorm * (1 + 1e-10)
+
+    # The starting point is not modified
+    xstart = op.domain.one()
+    opnorm_est = lanczos_opnorm(op, xstart=xstart, maxiter=10, rtol=1e-10)
+    assert almost_equal(opnorm_est, true_opnorm, places=5)
+    assert xstart == op.domain.one()
+
+    with pytest.raises(ValueError):
+        lanczos_opnorm(op, maxiter=0)
+    with pytest.raises(ValueError):
+        lanczos_opnorm(op, xstart=op.domain.zero())
+    with pytest.raises(ValueError):
+        # Input vector in the nullspace
+        op = odl.MatrixOperator([[0., 1.],
+                                 [0., 0.]])
+        lanczos_opnorm(op, xstart=[1, 0])
+
+
+def test_operator_fingerprint():
+    space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+    geom = odl.tomo.parallel_beam_geometry(space)
+    ray_trafo = odl.tomo.RayTransform(space, geom, impl='odl_cpu')
+
+    # Same structure, different objects
+    fp = operator_fingerprint(ray_trafo)
+    assert fp is not None
+    geom2 = odl.tomo.parallel_beam_geometry(space)
+    assert operator_fingerprint(
+        odl.tomo.RayTransform(space, geom2, impl='odl_cpu')) == fp
+
+    # Caches do not matter
+    ray_trafo.adjoint(ray_trafo(space.one()))
+    assert operator_fingerprint(ray_trafo) == fp
+    ray_trafo.sensitivity
+    ray_trafo.subsets(2)
+    assert operator_fingerprint(ray_trafo) == fp
+
+    # Different geometry, same spaces
+    geom3 = odl.tomo.Parallel2dGeometry(geom.motion_partition,
+                                        geom.det_partition,
+                                        translation=[0, 1e-3])
+    assert operator_fingerprint(
+        odl.tomo.RayTransform(space, geom3, impl='odl_cpu')) != fp
+
+    # Arrays are compared by value
+    arr = np.random.rand(*space.shape)
+    mult_op = odl.MultiplyOperator(space.element(arr.copy()))
+    assert (operator_fingerprint(mult_op) ==
+            operator_fingerprint(odl.MultiplyOperator(space.element(arr))))
+    arr[0, 0] += 1
+    assert (operator_fingerprint(mult_op) !=
+            operator_fingerprint(odl.MultiplyOperator(space.element(arr))))
+
+    # Weightings are compared by value, also where the repr shortens them
+    weighting = np.ones(100)
+    ident = odl.IdentityOperator(odl.rn(100, weighting=weighting.copy()))
+    weighting[50] = 0.01
+    assert (operator_fingerprint(ident) !=
+            operator_fingerprint(
+                odl.IdentityOperator(odl.rn(100, weighting=weighting))))
+
+    # Composed operators
+    comp = ray_trafo * mult_op
+    assert operator_fingerprint(comp) == operator_fingerprint(
+        ray_trafo * odl.MultiplyOperator(mult_op.multiplicand.copy()))
+    assert operator_fingerprint(comp) != operator_fingerprint(
+        mult_op * ray_trafo.adjoint)
+
+    # Anonymous functions cannot be identified
+    vfunc_space = odl.FunctionSpace(odl.IntervalProd(0, 1))
+    func = vfunc_space.element(lambda x: x ** 2)
+    assert operator_fingerprint(
+        odl.ScalingOperator(vfunc_space, 2)) is not None
+    assert operator_fingerprint(
+        odl.MultiplyOperator(func, domain=vfunc_space)) is None
+
+
+def test_cached_opnorm(tmpdir):
+    clear_opnorm_cache()
+    calls = []
+
+    def estimator(op, **kwargs):
+        calls.append(kwargs)
+        return lanczos_opnorm(op, **kwargs)
+
+    mat = np.random.randn(5, 3)
+    op = odl.MatrixOperator(mat)
+    cache_file = str(tmpdir.join('opnorms.json'))
+
+    opnorm = cached_opnorm(op, estimator=estimator, cache_file=cache_file,
+                           maxiter=10)
+    assert almost_equal(opnorm, np.linalg.norm(mat, 2), places=5)
+    assert len(calls) == 1
+
+    # In-memory hit for a new, but identical operator
+    op2 = odl.MatrixOperator(mat.copy())
+    assert cached_opnorm(op2, estimator=estimator, cache_file=cache_file,
+                         maxiter=10) == opnorm
+    assert len(calls) == 1
+
+    # Different parameters result in a new estimate
+    cached_opnorm(op2, estimator=estimator, maxiter=2)
+    assert len(calls) == 2
+
+    # Arrays are part of the key
+    xstart = np.ones(3)
+    cached_opnorm(op2, estimator=estimator, maxiter=10, xstart=xstart)
+    assert len(calls) == 3
+    cached_opnorm(op2, estimator=estimator, maxiter=10, xstart=xstart.copy())
+    assert len(calls) == 3
+    xstart[0] = 2
+    cached_opnorm(op2, estimator=estimator, maxiter=10, xstart=xstart)
+    assert len(calls) == 4
+
+    # Anonymous functions bypass the cache
+    for _ in range(2):
+        cached_opnorm(op2, estimator=estimator, maxiter=10,
+                      callback=lambda x: None)
+    assert len(calls) == 6
+
+    # Hit in the file cache after clearing the memory
+    clear_opnorm_cache()
+    assert cached_opnorm(op2, estimator=estimator, cache_file=cache_file,
+                         maxiter=10) == opnorm
+    assert len(calls) == 6
+
+    # Default estimator
+    assert almost_equal(cached_opnorm(op), np.linalg.norm(mat, 2), places=5)
+
+    # Spaces differing only in the middle of the weighting are distinct
+    weighting = np.ones(100)
+    ident = odl.IdentityOperator(odl.rn(100, weighting=weighting.copy()))
+    cached_opnorm(ident, estimator=estimator, maxiter=10)
+    assert len(calls) == 7
+    weighting[50] = 0.01
+    ident = odl.IdentityOperator(odl.rn(100, weighting=weighting))
+    cached_opnorm(ident, estimator=estimator, maxiter=10)
+    assert len(calls) == 8
+    clear_opnorm_cache()
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -200,6 +200,20 @@ def test_pointwise_norm_weighted(exponent):
     assert all_almost_equal(out, true_norm.reshape(-1))
 
 
+def test_pointwise_norm_contiguous(exponent):
+    fspace = odl.uniform_discr([0, 0], [1, 1], (2, 3))
+    vfspace = ProductSpace(fspace, 3)
+    vfspace_contig = ProductSpace(fspace, 3, contiguous=True)
+    weight = np.array([1.0, 2.0, 3.0])
+
+    testarr = np.random.randn(3, 2, 3)
+    for weighting in (None, weight):
+        pwnorm = PointwiseNorm(vfspace, exponent, weighting=weighting)
+        pwnorm_contig = PointwiseNorm(vfspace_contig, exponent,
+                                      weighting=weighting)
+        assert all_almost_equal(pwnorm_contig(testarr), pwnorm(testarr))
+
+
 # ---- PointwiseInner ----
 
 
@@ -131,5 +131,20 @@ def test_steepst_descent():
 
     assert all_almost_equal(x, [1, 1, 1], places=2)
 
+
+def test_solver_accumulate_dtype(iterative_solver):
+    """Check that solvers keep the data type of a float32 space."""
+    space = odl.uniform_discr(0, 1, 1000, dtype='float32',
+                              accumulate_dtype='float64')
+    op = odl.ScalingOperator(space, 2.0)
+    rhs = space.element(lambda x: x + 1)
+    x = space.one()
+
+    iterative_solver(op, x, rhs)
+    assert x.dtype == np.dtype('float32')
+    assert x.space == space
+    assert all_almost_equal(op(x), rhs, places=2)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
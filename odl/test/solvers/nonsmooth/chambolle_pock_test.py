@@ -141,5 +141,29 @@ def test_chambolle_pock_solver_produce_space():
     assert all_almost_equal(discr_vec, vec_expl, PLACES)
 
 
+@pytest.mark.parametrize('exponent', [1, 2])
+def test_chambolle_pock_solver_tv(exponent):
+    """Test the Chambolle-Pock algorithm with a fused TV dual update."""
+
+    space = odl.uniform_discr([0, 0], [1, 1], (8, 6))
+    grad = odl.Gradient(space)
+    data = odl.phantom.white_noise(space)
+
+    f = 0.5 * odl.solvers.GroupL1Norm(grad.range, exponent=exponent)
+    g = odl.solvers.L2NormSquared(space).translated(data)
+
+    # The fused update is used for `grad`, but not for the composition
+    x_fused = space.zero()
+    chambolle_pock_solver(x_fused, f, g, grad, tau=TAU, sigma=SIGMA,
+                          theta=THETA, niter=10)
+
+    op = odl.IdentityOperator(grad.range) * grad
+    x_expl = space.zero()
+    chambolle_pock_solver(x_expl, f, g, op, tau=TAU, sigma=SIGMA,
+                          theta=THETA, niter=10)
+
+    assert all_almost_equal(x_fused, x_expl, PLACES)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -17,7 +17,7 @@ import odl
 from odl.solvers.nonsmooth.proximal_operators import (
     combine_proximals, proximal_const_func,
     proximal_box_constraint, proximal_nonnegativity,
-    proximal_convex_conj_l1,
+    proximal_convex_conj_l1, proximal_convex_conj_l1_gradient,
     proximal_l2,
     proximal_convex_conj_l2_squared,
     proximal_convex_conj_kl, proximal_convex_conj_kl_cross_entropy)
@@ -379,6 +379,38 @@ def test_proximal_convconj_l1_product_space():
     assert all_almost_equal(x_verify, x_opt)
 
 
+@pytest.mark.parametrize('isotropic', [True, False])
+@pytest.mark.parametrize('pad_mode', ['constant', 'symmetric', 'periodic'])
+def test_proximal_convconj_l1_gradient(isotropic, pad_mode, monkeypatch):
+    """Fused dual update for the L1-norm of a gradient."""
+    # Use small slabs to test the halo handling between slabs
+    monkeypatch.setattr(odl.discr.diff_ops, 'FINITE_DIFF_SLAB_SIZE', 10)
+
+    space = odl.uniform_discr([0, 0], [1, 1], (9, 7))
+    grad = odl.Gradient(space, method='central', pad_mode=pad_mode)
+
+    x = odl.phantom.white_noise(space)
+    p = odl.phantom.white_noise(grad.range)
+
+    lam = 0.5
+    sigma = 0.25
+    update = proximal_convex_conj_l1_gradient(grad, lam=lam,
+                                              isotropic=isotropic)(sigma)
+
+    assert isinstance(update, odl.Operator)
+
+    # Explicit computation: prox[sigma * F^*](p + sigma * grad(x))
+    prox = proximal_convex_conj_l1(grad.range, lam=lam,
+                                   isotropic=isotropic)(sigma)
+    expected = prox(p + sigma * grad(x))
+
+    assert all_almost_equal(update([p, x]), expected, HIGH_ACC)
+
+    # In-place evaluation
+    update([p, x], out=p)
+    assert all_almost_equal(p, expected, HIGH_ACC)
+
+
 def test_proximal_convconj_kl_simple_space():
     """Test for proximal factory for the convex conjugate of KL divergence."""
 
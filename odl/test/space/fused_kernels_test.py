@@ -0,0 +1,162 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test the fused pointwise kernels."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.space.fused_kernels import (
+    fused_lincomb, fused_multiply_add, fused_multiply, fused_divide,
+    NUMEXPR_AVAILABLE)
+from odl.util.testutils import (all_almost_equal, never_skip, noise_array,
+                                simple_fixture)
+
+
+# --- pytest fixtures --- #
+
+
+skip_if_no_numexpr = pytest.mark.skipif(not NUMEXPR_AVAILABLE,
+                                        reason='numexpr not available')
+
+impl = simple_fixture('impl', [never_skip('numpy'),
+                               skip_if_no_numexpr('numexpr')])
+dtype = simple_fixture('dtype', ['float32', 'float64', 'complex64',
+                                 'complex128'])
+# Sizes smaller and larger than a block, the latter not a multiple of it
+size = simple_fixture('size', [10, 100003])
+scalars = simple_fixture('scalars', [(0, 0), (1, 0), (0, 1), (1, 1),
+                                     (-2.5, 1), (1, 3), (2, -1.5)])
+aliasing = simple_fixture('aliasing', ['none', 'x1', 'x2', 'all'])
+
+
+def _space(dtype, size):
+    """Return a space with given data type and size."""
+    if np.dtype(dtype).kind == 'f':
+        return odl.rn(size, dtype=dtype)
+    else:
+        return odl.cn(size, dtype=dtype)
+
+
+def _arrays(dtype, size, num):
+    """Return ``num`` random arrays with given data type and size."""
+    return [noise_array(_space(dtype, size)) for _ in range(num)]
+
+
+def _places(dtype):
+    """Return the number of places to compare for ``dtype``."""
+    return 3 if dtype in ('float32', 'complex64') else 10
+
+
+# --- Tests --- #
+
+
+def test_fused_lincomb(impl, dtype, size, scalars, aliasing):
+    """Check ``a * x1 + b * x2`` against NumPy, including aliasing."""
+    if impl == 'numexpr' and dtype == 'complex64':
+        pytest.skip('complex64 not supported by numexpr')
+
+    a, b = scalars
+    x1, x2, out = _arrays(dtype, size, 3)
+    if aliasing == 'x1':
+        out = x1
+    elif aliasing == 'x2':
+        out = x2
+    elif aliasing == 'all':
+        out = x1
+        x2 = x1
+    expected = a * x1 + b * x2
+
+    result = fused_lincomb(a, x1, b, x2, out, impl=impl)
+    assert result is out
+    assert out.dtype == dtype
+    assert all_almost_equal(out, expected, places=_places(dtype))
+
+
+def test_fused_multiply_add(impl, dtype, size, scalars, aliasing):
+    """Check ``a * x1 * x2 + b * x3`` against NumPy, including aliasing."""
+    if impl == 'numexpr' and dtype == 'complex64':
+        pytest.skip('complex64 not supported by numexpr')
+
+    a, b = scalars
+    x1, x2, x3, out = _arrays(dtype, size, 4)
+    if aliasing == 'x1':
+        out = x1
+    elif aliasing == 'x2':
+        out = x3
+    elif aliasing == 'all':
+        out = x2 = x3 = x1
+    expected = a * x1 * x2 + b * x3
+
+    result = fused_multiply_add(a, x1, x2, b, x3, out, impl=impl)
+    assert result is out
+    assert all_almost_equal(out, expected, places=_places(dtype))
+
+
+def test_fused_multiply_divide(impl, dtype, size):
+    """Check pointwise product and quotient against NumPy."""
+    if impl == 'numexpr' and dtype == 'complex64':
+        pytest.skip('complex64 not supported by numexpr')
+
+    x1, x2 = _arrays(dtype, size, 2)
+    x2 += 10  # avoid small divisors
+    out = np.empty_like(x1)
+
+    fused_multiply(x1, x2, out, impl=impl)
+    assert all_almost_equal(out, x1 * x2, places=_places(dtype))
+    fused_divide(x1, x2, out, impl=impl)
+    assert all_almost_equal(out, x1 / x2, places=_places(dtype))
+
+
+def test_fused_kernels_multidim():
+    """Check non-contiguous and multi-dimensional arrays."""
+    x1 = np.random.rand(300, 200)
+    x2 = np.random.rand(200, 300).T  # Fortran-contiguous
+    out = np.empty((300, 200))
+
+    fused_lincomb(2, x1, 3, x2, out, impl='numpy')
+    assert all_almost_equal(out, 2 * x1 + 3 * x2)
+    expected = 2 * x1 * x2 - x1
+    fused_multiply_add(2, x1, x2, -1, x1, out=x1, impl='numpy')
+    assert all_almost_equal(x1, expected)
+
+    # One-dimensional strided arrays are processed in blocks
+    x = np.random.rand(2 * 100003)
+    y = np.random.rand(100003)
+    out = np.empty(2 * 100003)
+    fused_lincomb(1, x[::2], -1, y, out[1::2], impl='numpy')
+    assert all_almost_equal(out[1::2], x[::2] - y)
+
+
+def test_fused_kernels_bad_impl():
+    """Check the errors for unsupported implementations."""
+    x = np.zeros(3, dtype='complex64')
+    with pytest.raises(ValueError):
+        fused_lincomb(1, x, 1, x, x, impl='fortran')
+    with pytest.raises(ValueError):
+        fused_lincomb(1, x, 1, x, x, impl='numexpr')
+
+
+def test_lincomb_uses_fused_kernel(dtype):
+    """Check `lincomb` on `NumpyFn` between BLAS and small thresholds."""
+    space = _space(dtype, 1000)
+    x, y = [space.element(arr) for arr in _arrays(dtype, 1000, 2)]
+    x_arr, y_arr = x.asarray().copy(), y.asarray().copy()
+
+    out = space.element()
+    space.lincomb(-1.5, x, 2, y, out)
+    assert all_almost_equal(out, -1.5 * x_arr + 2 * y_arr,
+                            places=_places(dtype))
+    space.lincomb(2, x, 1, y, out=y)
+    assert all_almost_equal(y, 2 * x_arr + y_arr, places=_places(dtype))
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
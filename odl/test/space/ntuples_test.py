@@ -678,6 +678,19 @@ def test_python_copy(fn):
     assert x != z
 
 
+def test_copy_not_aliased(fn):
+    """Test that copies and assignments do not share memory."""
+    x = noise_element(fn)
+    y = x.copy()
+    assert y == x
+    assert not np.shares_memory(x.data, y.data)
+
+    z = fn.zero()
+    z.assign(x)
+    assert z == x
+    assert not np.shares_memory(x.data, z.data)
+
+
 # Vector property tests
 
 def test_space(fn):
@@ -1392,6 +1405,51 @@ def test_noweight():
     assert w != w_other_exp
     assert w != w_dist_inner
 
+    assert NumpyFnNoWeighting(accumulate_dtype='float64') is not w
+    assert NumpyFnNoWeighting(accumulate_dtype='float64') != w
+
+
+def test_accumulate_dtype(exponent):
+    """Check accumulation of float32 reductions in float64."""
+    size = 100003
+    weights = np.random.rand(size) + 0.5
+    for weighting in (None, 2.0, weights):
+        space = odl.rn(size, dtype='float32', weighting=weighting,
+                       exponent=exponent, accumulate_dtype='float64')
+        space64 = odl.rn(size, weighting=weighting, exponent=exponent)
+        assert space.accumulate_dtype == np.dtype('float64')
+        assert space != odl.rn(size, dtype='float32', weighting=weighting,
+                               exponent=exponent)
+
+        x, y = noise_elements(space, 2)[1]
+        x64, y64 = space64.element(x), space64.element(y)
+        assert x.dtype == np.dtype('float32')
+
+        # Same result as in float64 up to float64 rounding
+        assert almost_equal(x.norm(), x64.norm(), places=10)
+        assert almost_equal(x.dist(y), x64.dist(y64), places=10)
+        if exponent == 2.0:
+            assert almost_equal(x.inner(y), x64.inner(y64), places=10)
+
+        # Element-wise operations stay in float32
+        assert (x + y).dtype == np.dtype('float32')
+
+    # Complex spaces accumulate in the corresponding complex data type
+    space = odl.cn(size, dtype='complex64', accumulate_dtype='float64')
+    space128 = odl.cn(size)
+    x, y = noise_elements(space, 2)[1]
+    assert almost_equal(x.inner(y), space128.element(x).inner(
+        space128.element(y)), places=10)
+
+    assert repr(odl.rn(3, 'float32', accumulate_dtype='float64')) == (
+        "rn(3, 'float32', accumulate_dtype='float')")
+    with pytest.raises(ValueError):
+        odl.rn(3, accumulate_dtype='int')
+    with pytest.raises(ValueError):
+        odl.rn(3, weighting=np.eye(3), accumulate_dtype='float64')
+    with pytest.raises(ValueError):
+        odl.rn(3, dist=lambda x, y: 0, accumulate_dtype='float64')
+
 
 def test_custom_inner(fn):
     [xarr, yarr], [x, y] = noise_elements(fn, 2)
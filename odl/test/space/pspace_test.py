@@ -533,6 +533,20 @@ def test_element_equals():
     assert x != x_4
 
 
+def test_element_copy():
+    H = odl.ProductSpace(odl.rn(1), odl.rn(2))
+    x = H.element([[0], [1, 2]])
+
+    y = x.copy()
+    assert y == x
+    assert y is not x
+    assert all(yi is not xi for xi, yi in zip(x, y))
+
+    y[1] *= 2
+    assert x == H.element([[0], [1, 2]])
+    assert y == H.element([[0], [2, 4]])
+
+
 def test_element_getitem_single():
     H = odl.ProductSpace(odl.rn(1), odl.rn(2))
 
@@ -805,5 +819,83 @@ def test_reductions():
     assert x.ufuncs.max() == 3.0
 
 
+def test_contiguous_init():
+    r3 = odl.rn(3)
+    H = odl.ProductSpace(r3, 2, contiguous=True)
+    assert H.is_contiguous
+    assert not odl.ProductSpace(r3, 2).is_contiguous
+    assert H != odl.ProductSpace(r3, 2)
+    assert H == odl.ProductSpace(r3, 2, contiguous=True)
+    assert repr(H) == 'ProductSpace(rn(3), 2, contiguous=True)'
+
+    with pytest.raises(ValueError):
+        odl.ProductSpace(r3, odl.rn(2), contiguous=True)
+    with pytest.raises(ValueError):
+        odl.ProductSpace(odl.ProductSpace(r3, 2), 2, contiguous=True)
+
+
+def test_contiguous_element():
+    space = odl.uniform_discr([0, 0], [1, 1], (2, 3))
+    H = odl.ProductSpace(space, 2, contiguous=True)
+
+    # Wrapping of arrays
+    arr = np.arange(12, dtype=float).reshape((2, 2, 3))
+    x = H.element(arr)
+    assert x.asarray() is not arr
+    assert np.shares_memory(x.asarray(), arr)
+    assert all_equal(x[1].asarray(), arr[1])
+    x[1][:] = 0
+    assert np.all(arr[1] == 0)
+
+    # Parts are views of one array
+    y = H.element([space.one(), 2 * space.one()])
+    assert all_equal(y.asarray(), [np.ones((2, 3)), 2 * np.ones((2, 3))])
+    y[0] *= 3
+    assert np.all(y.asarray()[0] == 3)
+
+    # Copies do not share memory
+    z = y.copy()
+    assert z == y
+    assert not np.shares_memory(z.asarray(), y.asarray())
+
+    # Fortran ordering of the parts
+    space_f = odl.uniform_discr([0, 0], [1, 1], (2, 3), order='F')
+    H_f = odl.ProductSpace(space_f, 2, contiguous=True)
+    arr_f = np.asfortranarray(np.random.rand(3, 2)).T
+    x_f = H_f.element(np.array([arr_f, arr_f]))
+    assert all_equal(x_f.asarray(), [arr_f, arr_f])
+    assert all_equal(x_f[0].asarray(), arr_f)
+
+
+def test_contiguous_arithmetic(exponent):
+    r3 = odl.rn(3)
+    H = odl.ProductSpace(r3, 4, exponent=exponent)
+    H_contig = odl.ProductSpace(r3, 4, exponent=exponent, contiguous=True)
+
+    [xarr, yarr], [x, y] = noise_elements(H, 2)
+    x_contig, y_contig = H_contig.element(xarr), H_contig.element(yarr)
+
+    out = H_contig.element()
+    H_contig.lincomb(2, x_contig, -1, y_contig, out=out)
+    assert all_almost_equal(out, 2 * x - y)
+    assert all_almost_equal(x_contig * y_contig, x * y)
+    assert all_almost_equal(x_contig / y_contig, x / y)
+
+    assert almost_equal(x_contig.norm(), x.norm())
+    assert almost_equal(x_contig.dist(y_contig), x.dist(y))
+    if exponent == 2.0:
+        assert almost_equal(x_contig.inner(y_contig), x.inner(y))
+
+    for weighting in (2.0, [1.0, 2.0, 3.0, 4.0]):
+        H_w = odl.ProductSpace(r3, 4, exponent=exponent, weighting=weighting)
+        H_w_contig = odl.ProductSpace(r3, 4, exponent=exponent,
+                                      weighting=weighting, contiguous=True)
+        x_w, y_w = H_w.element(xarr), H_w.element(yarr)
+        x_w_contig = H_w_contig.element(xarr)
+        y_w_contig = H_w_contig.element(yarr)
+        assert almost_equal(x_w_contig.norm(), x_w.norm())
+        assert almost_equal(x_w_contig.dist(y_w_contig), x_w.dist(y_w))
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
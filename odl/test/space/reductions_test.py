@@ -0,0 +1,170 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test the chunked and multithreaded reductions."""
+
+from __future__ import division
+import math
+import numpy as np
+import os
+import pytest
+import signal
+import time
+
+import odl
+from odl.space.reductions import (
+    parallel_inner, parallel_pnorm, parallel_pdist)
+from odl.util.testutils import almost_equal, noise_array, simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+dtype = simple_fixture('dtype', ['float32', 'float64', 'complex64',
+                                 'complex128'])
+exponent = simple_fixture('exponent', [2.0, 1.0, float('inf'), 1.5])
+# Sizes smaller and larger than a chunk, the latter not a multiple of it
+size = simple_fixture('size', [10, 200003])
+threads = simple_fixture('threads', [None, 1, 4])
+weighted = simple_fixture('weighted', [False, True])
+
+
+def _arrays(dtype, size, num):
+    """Return ``num`` random arrays with given data type and size."""
+    if np.dtype(dtype).kind == 'f':
+        space = odl.rn(size, dtype=dtype)
+    else:
+        space = odl.cn(size, dtype=dtype)
+    return [noise_array(space) for _ in range(num)]
+
+
+def _places(dtype):
+    """Return the number of places to compare for ``dtype``."""
+    return 3 if dtype in ('float32', 'complex64') else 8
+
+
+def _pnorm(x, p, w):
+    """Reference implementation of the weighted p-norm."""
+    xp = np.abs(x).astype('float64')
+    if p == float('inf'):
+        return np.max(xp * w)
+    else:
+        return np.sum(w * xp ** p) ** (1 / p)
+
+
+# --- Tests --- #
+
+
+def test_parallel_inner(dtype, size, threads, weighted):
+    """Check the inner product against NumPy."""
+    x1, x2 = _arrays(dtype, size, 2)
+    w = np.random.rand(size) + 0.5 if weighted else 1.0
+
+    result = parallel_inner(x1, x2, weights=w if weighted else None,
+                            threads=threads)
+    expected = np.vdot(x2.astype('complex128'), w * x1)
+    if np.dtype(dtype).kind == 'f':
+        assert isinstance(result, float)
+        expected = expected.real
+    else:
+        assert isinstance(result, complex)
+    assert almost_equal(result / size, expected / size,
+                        places=_places(dtype))
+
+
+def test_parallel_pnorm_pdist(dtype, size, exponent, threads, weighted):
+    """Check norm and distance against NumPy."""
+    x1, x2 = _arrays(dtype, size, 2)
+    w = np.random.rand(size) + 0.5 if weighted else 1.0
+    weights = w if weighted else None
+    scale = size ** (1 / exponent)
+
+    result = parallel_pnorm(x1, exponent, weights=weights, threads=threads)
+    assert isinstance(result, float)
+    assert almost_equal(result / scale, _pnorm(x1, exponent, w) / scale,
+                        places=_places(dtype))
+
+    result = parallel_pdist(x1, x2, exponent, weights=weights,
+                            threads=threads)
+    assert isinstance(result, float)
+    assert almost_equal(result / scale,
+                        _pnorm(x1 - x2, exponent, w) / scale,
+                        places=_places(dtype))
+
+
+def test_parallel_reductions_accuracy():
+    """Check that the sum of the chunks is compensated."""
+    # Mixing large and small entries loses digits in a naive running sum
+    x = np.empty(2 ** 20)
+    x[::2] = 1e8
+    x[1::2] = 1e-8
+    expected = math.fsum(x)
+    assert parallel_pnorm(x, 1, threads=4) == expected
+    assert parallel_inner(x, np.ones_like(x), threads=4) == expected
+
+
+def test_parallel_reductions_empty():
+    """Check the reductions of empty arrays."""
+    x = np.zeros(0)
+    assert parallel_inner(x, x) == 0
+    assert parallel_pnorm(x, 2) == 0
+    assert parallel_pdist(x, x, 1.5) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='no os.fork')
+def test_parallel_reductions_after_fork():
+    """Check that a forked child does not use the pools of the parent."""
+    x = np.ones(2 ** 20)
+    assert parallel_pnorm(x, 1, threads=4) == x.size
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            success = parallel_pnorm(x, 1, threads=4) == x.size
+        finally:
+            os._exit(0 if success else 1)
+
+    # Kill the child if it hangs
+    for _ in range(300):
+        wpid, status = os.waitpid(pid, os.WNOHANG)
+        if wpid != 0:
+            break
+        time.sleep(0.1)
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        assert False, 'reduction in forked child did not finish'
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+
+def test_weighting_uses_parallel_reductions(exponent):
+    """Check array and constant weighting on `NumpyFn` against NumPy."""
+    size = 200003
+    weights = np.random.rand(size) + 0.5
+    space = odl.rn(size, weighting=weights, exponent=exponent)
+    x1, x2 = noise_array(space), noise_array(space)
+    x1_el, x2_el = space.element(x1.copy()), space.element(x2.copy())
+    scale = size ** (1 / exponent)
+
+    assert almost_equal(x1_el.norm() / scale,
+                        _pnorm(x1, exponent, weights) / scale)
+    assert almost_equal(x1_el.dist(x2_el) / scale,
+                        _pnorm(x1 - x2, exponent, weights) / scale)
+    if exponent == 2.0:
+        assert almost_equal(x1_el.inner(x2_el) / size,
+                            np.dot(weights * x1, x2) / size)
+
+    space = odl.rn(size, weighting=2.0, exponent=exponent)
+    x1_el, x2_el = space.element(x1.copy()), space.element(x2.copy())
+    const = 2.0 if exponent == float('inf') else 2.0 ** (1 / exponent)
+    assert almost_equal(x1_el.dist(x2_el) / scale,
+                        const * _pnorm(x1 - x2, exponent, 1.0) / scale)
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
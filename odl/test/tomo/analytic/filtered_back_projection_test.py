@@ -0,0 +1,175 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test the filtering for filtered back-projection."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.tomo.analytic.filtered_back_projection import (
+    FBPFilterOperator, _fbp_filter, _rotation_direction_in_detector)
+from odl.util.testutils import all_almost_equal, noise_element, simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+geometry_type = simple_fixture('geometry_type',
+                               ['par2d', 'cone2d', 'cone3d', 'par3d_tilted'])
+padding = simple_fixture('padding', [True, False])
+filter_type = simple_fixture('filter_type', ['Ram-Lak', 'Hann'])
+
+
+def make_ray_trafo(geometry_type):
+    """Return a small ray transform for the given geometry type."""
+    if geometry_type.endswith('2d'):
+        space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+        dpart = odl.uniform_partition(-2, 2, 15)
+    else:
+        space = odl.uniform_discr([-1, -1, -1], [1, 1, 1], (6, 6, 6))
+        dpart = odl.uniform_partition([-2, -2], [2, 2], (12, 9))
+    apart = odl.uniform_partition(0, 2 * np.pi, 8)
+
+    if geometry_type == 'par2d':
+        geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+    elif geometry_type == 'cone2d':
+        geom = odl.tomo.FanFlatGeometry(apart, dpart, src_radius=5,
+                                        det_radius=5)
+    elif geometry_type == 'cone3d':
+        geom = odl.tomo.ConeFlatGeometry(apart, dpart, src_radius=5,
+                                         det_radius=5)
+    elif geometry_type == 'par3d_tilted':
+        geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart, axis=[1, 1, 1])
+
+    return odl.tomo.RayTransform(space, geom, impl='odl_cpu')
+
+
+def fourier_filter_op(ray_trafo, filter_op, padding, filter_type):
+    """Return the filter as composition with a `FourierTransform`."""
+    space = ray_trafo.range
+    if padding:
+        ran_shp = [2 * n - 1 if i in filter_op.axes else n
+                   for i, n in enumerate(space.shape)]
+        resizing = odl.ResizingOperator(space, ran_shp=ran_shp)
+        fourier = odl.trafos.FourierTransform(resizing.range,
+                                              axes=filter_op.axes)
+        fourier = fourier * resizing
+    else:
+        fourier = odl.trafos.FourierTransform(space, axes=filter_op.axes)
+
+    geom = ray_trafo.geometry
+    if space.ndim == 2:
+        direction = [1, 0]
+    else:
+        direction = _rotation_direction_in_detector(geom)
+    scale = 1 / (2 * geom.motion_params.length)
+    if hasattr(geom, 'src_radius') and space.ndim == 3:
+        scale *= geom.src_radius / (geom.src_radius + geom.det_radius)
+
+    def fourier_filter(x):
+        abs_freq = np.abs(sum(c * xi for c, xi in zip(direction, x[1:])))
+        norm_freq = abs_freq / np.max(abs_freq)
+        return _fbp_filter(norm_freq, filter_type, 0.8) * abs_freq * scale
+
+    ramp_function = fourier.range.element(fourier_filter)
+    return fourier.inverse * ramp_function * fourier
+
+
+# --- Tests --- #
+
+
+def test_fbp_filter_op(geometry_type, padding, filter_type):
+    """Compare the filter to its definition via Fourier transforms."""
+    ray_trafo = make_ray_trafo(geometry_type)
+    filter_op = odl.tomo.fbp_filter_op(ray_trafo, padding=padding,
+                                       filter_type=filter_type,
+                                       frequency_scaling=0.8)
+    assert isinstance(filter_op, FBPFilterOperator)
+    expected_op = fourier_filter_op(ray_trafo, filter_op, padding,
+                                    filter_type)
+
+    data = noise_element(ray_trafo.range)
+    assert all_almost_equal(filter_op(data), expected_op(data))
+
+    # Filtering with threads and in-place evaluation
+    threaded_op = FBPFilterOperator(ray_trafo, padding=padding,
+                                    filter_type=filter_type,
+                                    frequency_scaling=0.8, threads=3)
+    out = ray_trafo.range.element()
+    threaded_op(data, out=out)
+    assert all_almost_equal(out, expected_op(data))
+
+
+def test_fbp_filter_op_properties():
+    """Check caching, adjoint and complex data of the filter."""
+    ray_trafo = make_ray_trafo('par2d')
+    filter_op = FBPFilterOperator(ray_trafo)
+    assert filter_op.fourier_filter is FBPFilterOperator(
+        ray_trafo).fourier_filter
+    assert filter_op.fourier_filter is not FBPFilterOperator(
+        ray_trafo, padding=False).fourier_filter
+
+    x = noise_element(ray_trafo.range)
+    y = noise_element(ray_trafo.range)
+    assert filter_op.adjoint is filter_op
+    assert filter_op(x).inner(y) == pytest.approx(x.inner(filter_op(y)))
+
+    space_c = ray_trafo.domain.complex_space
+    ray_trafo_c = odl.tomo.RayTransform(space_c, ray_trafo.geometry,
+                                        impl='odl_cpu')
+    filter_op_c = FBPFilterOperator(ray_trafo_c)
+    z = ray_trafo_c.range.element(x.asarray() + 1j * y.asarray())
+    result = filter_op_c(z)
+    assert all_almost_equal(result.real, filter_op(x))
+    assert all_almost_equal(result.imag, filter_op(y))
+
+    with pytest.raises(ValueError):
+        FBPFilterOperator(ray_trafo, filter_type='unknown')
+
+
+def test_incremental_fbp():
+    """Check that the incremental FBP reproduces `fbp_op`."""
+    space = odl.uniform_discr([-1, -1], [1, 1], (16, 16))
+    apart = odl.uniform_partition(0, np.pi + 1.2, 12)
+    dpart = odl.uniform_partition(-2, 2, 20)
+    geom = odl.tomo.FanFlatGeometry(apart, dpart, src_radius=5,
+                                    det_radius=5)
+    ray_trafo = odl.tomo.RayTransform(space, geom, impl='odl_cpu')
+    parker = odl.tomo.parker_weighting(ray_trafo)
+    data = ray_trafo(odl.phantom.shepp_logan(space, True))
+    data_arr = data.asarray().copy()
+    fbp = odl.tomo.fbp_op(ray_trafo, filter_type='Hann') * parker
+
+    inc_fbp = odl.tomo.IncrementalFBP(ray_trafo, filter_type='Hann',
+                                      weighting=parker)
+    inc_fbp.add_projections(data_arr[5:9], start=5)
+    inc_fbp.add_projections(data_arr[:5])
+    assert not inc_fbp.complete
+    assert all_almost_equal(inc_fbp.received, np.arange(12) < 9)
+    for i in range(9, 12):
+        inc_fbp.add_projections(data_arr[i])
+    assert inc_fbp.complete
+    assert all_almost_equal(inc_fbp.reconstruction, fbp(data))
+
+    # The input is not modified
+    assert all_almost_equal(data_arr, data.asarray())
+
+    with pytest.raises(ValueError):
+        inc_fbp.add_projections(data_arr[:2], start=0)
+    with pytest.raises(ValueError):
+        inc_fbp.add_projections(data_arr[:2], start=11)
+
+    inc_fbp.reset()
+    assert not np.any(inc_fbp.received)
+    assert inc_fbp.reconstruction.norm() == 0
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
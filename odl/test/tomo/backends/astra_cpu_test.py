@@ -15,8 +15,10 @@ import sys
 
 import odl
 from odl.tomo.backends.astra_cpu import (
-    astra_cpu_forward_projector, astra_cpu_back_projector)
+    astra_cpu_forward_projector, astra_cpu_back_projector,
+    AstraCpuProjectorImpl, AstraCpuBackProjectorImpl)
 from odl.tomo.util.testutils import skip_if_no_astra
+from odl.util.testutils import all_almost_equal
 
 # TODO: clean up and improve tests
 
@@ -81,5 +83,42 @@ def test_astra_cpu_projector_fanflat():
     assert backproj.norm() > 0
 
 
+@skip_if_no_astra
+def test_astra_cpu_projector_impl():
+    """ASTRA CPU wrappers with reused ASTRA objects."""
+    reco_space = odl.uniform_discr([-4, -5], [4, 5], (4, 5), dtype='float32')
+    phantom = odl.phantom.cuboid(reco_space, min_pt=[0, 0], max_pt=[4, 5])
+    angle_part = odl.uniform_partition(0, 2 * np.pi, 8)
+    det_part = odl.uniform_partition(-6, 6, 6)
+    geom = odl.tomo.Parallel2dGeometry(angle_part, det_part)
+    proj_space = odl.uniform_discr_frompartition(geom.partition,
+                                                 dtype='float32')
+
+    # Compare with the functions creating new ASTRA objects in each call
+    true_proj = astra_cpu_forward_projector(phantom, geom, proj_space)
+    true_backproj = astra_cpu_back_projector(true_proj, geom, reco_space)
+
+    with AstraCpuProjectorImpl(geom, reco_space, proj_space) as fwd_impl:
+        proj_data = fwd_impl.call_forward(phantom)
+        assert proj_data in proj_space
+        assert all_almost_equal(proj_data, true_proj)
+
+        # Repeated call with output reuses the ASTRA objects
+        out = fwd_impl.call_forward(phantom, out=proj_data)
+        assert out is proj_data
+        assert all_almost_equal(out, true_proj)
+
+    # Objects are freed when leaving the context
+    assert fwd_impl.algo_id is None
+    assert fwd_impl.vol_id is None
+    assert fwd_impl.sino_id is None
+    assert fwd_impl.proj_id is None
+
+    with AstraCpuBackProjectorImpl(geom, reco_space, proj_space) as bwd_impl:
+        backproj = bwd_impl.call_backward(true_proj)
+        assert backproj in reco_space
+        assert all_almost_equal(backproj, true_backproj)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -0,0 +1,190 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test the pure NumPy CPU backend."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.tomo.backends.odl_cpu import (
+    odl_cpu_forward_projector, odl_cpu_back_projector, odl_cpu_system_matrix)
+from odl.util.testutils import all_almost_equal, noise_element, simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+geometry_type = simple_fixture(
+    'geometry_type', ['par2d', 'cone2d', 'par3d', 'cone3d', 'helical'])
+
+
+def make_setup(geometry_type):
+    """Return reconstruction space and geometry of a small setup."""
+    if geometry_type.endswith('2d'):
+        reco_space = odl.uniform_discr([-4, -5], [4, 5], (8, 10),
+                                       dtype='float32')
+        dpart = odl.uniform_partition(-7, 7, 12)
+    else:
+        reco_space = odl.uniform_discr([-4, -5, -3], [4, 5, 3], (8, 10, 6),
+                                       dtype='float32')
+        dpart = odl.uniform_partition([-7, -7], [7, 7], (12, 12))
+
+    if geometry_type.startswith('par'):
+        apart = odl.uniform_partition(0, np.pi, 9)
+    else:
+        apart = odl.uniform_partition(0, 2 * np.pi, 9)
+
+    if geometry_type == 'par2d':
+        geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+    elif geometry_type == 'cone2d':
+        geom = odl.tomo.FanFlatGeometry(apart, dpart, src_radius=20,
+                                        det_radius=10)
+    elif geometry_type == 'par3d':
+        geom = odl.tomo.Parallel3dAxisGeometry(apart, dpart)
+    elif geometry_type == 'cone3d':
+        geom = odl.tomo.ConeFlatGeometry(apart, dpart, src_radius=20,
+                                         det_radius=10)
+    elif geometry_type == 'helical':
+        geom = odl.tomo.ConeFlatGeometry(apart, dpart, src_radius=20,
+                                         det_radius=10, pitch=2)
+
+    return reco_space, geom
+
+
+# --- Tests --- #
+
+
+def test_odl_cpu_projector(geometry_type):
+    """Forward and back projection with the NumPy CPU backend."""
+    reco_space, geom = make_setup(geometry_type)
+    proj_space = odl.uniform_discr_frompartition(geom.partition,
+                                                 dtype='float32')
+    phantom = odl.phantom.cuboid(reco_space)
+
+    # Forward evaluation
+    proj_data = odl_cpu_forward_projector(phantom, geom, proj_space)
+    assert proj_data.shape == proj_space.shape
+    assert proj_data.norm() > 0
+
+    # Backward evaluation
+    backproj = odl_cpu_back_projector(proj_data, geom, reco_space)
+    assert backproj.shape == reco_space.shape
+    assert backproj.norm() > 0
+
+
+def test_odl_cpu_adjoint(geometry_type):
+    """Verify that the back-projector is the exact adjoint."""
+    reco_space, geom = make_setup(geometry_type)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='odl_cpu')
+
+    vol = noise_element(ray_trafo.domain)
+    data = noise_element(ray_trafo.range)
+
+    inner_proj = ray_trafo(vol).inner(data)
+    inner_vol = vol.inner(ray_trafo.adjoint(data))
+    assert inner_proj == pytest.approx(inner_vol, rel=1e-4)
+
+
+def test_odl_cpu_line_integral():
+    """Verify the values of the projection of a constant volume."""
+    reco_space = odl.uniform_discr([-2, -2], [2, 2], (40, 40))
+    apart = odl.uniform_partition(0, np.pi, 4, nodes_on_bdry=True)
+    dpart = odl.uniform_partition(-1, 1, 10)
+    geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='odl_cpu')
+
+    # Rays along the coordinate axes through the center have length 4
+    proj = ray_trafo(reco_space.one())
+    assert all_almost_equal(proj[0], 4)
+    assert all_almost_equal(proj[2], 4)
+
+
+def test_odl_cpu_chunks_and_threads(geometry_type):
+    """Check that the result does not depend on chunking and threads."""
+    reco_space, geom = make_setup(geometry_type)
+    proj_space = odl.uniform_discr_frompartition(geom.partition,
+                                                 dtype='float32')
+    vol = noise_element(reco_space)
+    data = noise_element(proj_space)
+
+    fwd_single = odl_cpu_forward_projector(vol, geom, proj_space, threads=1)
+    fwd_multi = odl_cpu_forward_projector(vol, geom, proj_space,
+                                          threads=4, chunk_size=50)
+    assert all_almost_equal(fwd_single, fwd_multi, places=4)
+
+    bwd_single = odl_cpu_back_projector(data, geom, reco_space, threads=1)
+    bwd_multi = odl_cpu_back_projector(data, geom, reco_space,
+                                       threads=4, chunk_size=50)
+    assert all_almost_equal(bwd_single, bwd_multi, places=4)
+
+
+def test_odl_cpu_memory_budget(geometry_type, tmpdir):
+    """Check blocked evaluation with memory-mapped data."""
+    reco_space, geom = make_setup(geometry_type)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='odl_cpu')
+    ray_trafo_budget = odl.tomo.RayTransform(reco_space, geom,
+                                             impl='odl_cpu',
+                                             memory_budget=2000)
+    assert ray_trafo_budget.adjoint.memory_budget == 2000
+
+    vol_arr = np.memmap(str(tmpdir.join('vol.dat')), dtype='float32',
+                        mode='w+', shape=reco_space.shape)
+    proj_arr = np.memmap(str(tmpdir.join('proj.dat')), dtype='float32',
+                         mode='w+', shape=ray_trafo.range.shape)
+    vol = reco_space.element(vol_arr)
+    proj = ray_trafo.range.element(proj_arr)
+    vol[:] = noise_element(reco_space)
+
+    # Results are written to the memory-mapped arrays
+    ray_trafo_budget(vol, out=proj)
+    assert all_almost_equal(proj_arr, ray_trafo(vol).asarray(), places=4)
+    expected = ray_trafo.adjoint(proj)
+    ray_trafo_budget.adjoint(proj, out=vol)
+    assert all_almost_equal(vol_arr, expected.asarray(), places=4)
+
+    with pytest.raises(ValueError):
+        odl.tomo.RayTransform(reco_space, geom, impl='odl_cpu',
+                              memory_budget=0)
+
+
+def test_odl_cpu_system_matrix(geometry_type):
+    """Check that the system matrix reproduces the projectors."""
+    reco_space, geom = make_setup(geometry_type)
+    ray_trafo = odl.tomo.RayTransform(reco_space, geom, impl='odl_cpu')
+    matrix_trafo = odl.tomo.RayTransform(reco_space, geom,
+                                         impl='sparse_matrix')
+
+    matrix = odl_cpu_system_matrix(geom, reco_space, ray_trafo.range)
+    assert matrix.shape == (ray_trafo.range.size, reco_space.size)
+    assert matrix.dtype == reco_space.dtype
+
+    vol = noise_element(reco_space)
+    data = noise_element(ray_trafo.range)
+    assert all_almost_equal(matrix_trafo(vol), ray_trafo(vol), places=4)
+    assert all_almost_equal(matrix_trafo.adjoint(data),
+                            ray_trafo.adjoint(data), places=4)
+
+    # The matrix is assembled once and shared with the adjoint
+    assert len(geom.implementation_cache['sparse_matrix']) == 1
+
+
+def test_odl_cpu_unsupported_geometry():
+    """Check that unsupported geometries are rejected."""
+    reco_space = odl.uniform_discr([-1] * 3, [1] * 3, (4, 4, 4))
+    apart = odl.uniform_partition([0, 0], [np.pi, np.pi], (3, 3))
+    dpart = odl.uniform_partition([-1, -1], [1, 1], (4, 4))
+    geom = odl.tomo.Parallel3dEulerGeometry(apart, dpart)
+
+    with pytest.raises(TypeError):
+        odl.tomo.RayTransform(reco_space, geom, impl='odl_cpu')
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
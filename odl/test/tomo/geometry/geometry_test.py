@@ -709,5 +709,109 @@ def test_cone_beam_geometry_helper():
     assert pytest.approx(geometry.det_partition.extent, det_width)
 
 
+def make_vectorization_geometries():
+    """Return a list of geometries of all types for vectorization tests."""
+    apart = odl.uniform_partition(0, 2 * np.pi, 5)
+    dpart_1d = odl.uniform_partition(-1, 1, 4)
+    dpart_2d = odl.uniform_partition([-1, -1], [1, 1], (4, 3))
+    euler_apart = odl.uniform_partition([0, 0], [np.pi, np.pi], (3, 2))
+    return [
+        odl.tomo.Parallel2dGeometry(apart, dpart_1d, translation=[1, 0]),
+        odl.tomo.Parallel3dEulerGeometry(euler_apart, dpart_2d),
+        odl.tomo.Parallel3dAxisGeometry(apart, dpart_2d, axis=[1, 0, 1]),
+        odl.tomo.FanFlatGeometry(apart, dpart_1d, src_radius=5,
+                                 det_radius=3),
+        odl.tomo.ConeFlatGeometry(apart, dpart_2d, src_radius=5,
+                                  det_radius=3, pitch=2)]
+
+
+def test_geometry_vectorization():
+    """Check vectorized evaluation against evaluation per parameter."""
+    for geom in make_vectorization_geometries():
+        ndim = geom.ndim
+        mpts = geom.motion_grid.points()
+        dpts = geom.det_grid.points()
+        # Components along the first axis, scalars for 1 parameter
+        mpar = mpts.T if mpts.shape[1] > 1 else mpts[:, 0]
+        dpar = dpts.T if dpts.shape[1] > 1 else dpts[:, 0]
+        single_mpar = [m if m.size > 1 else m[0] for m in mpts]
+        single_dpar = [d if d.size > 1 else d[0] for d in dpts]
+
+        rot = geom.rotation_matrix(mpar)
+        refpts = geom.det_refpoint(mpar)
+        assert rot.shape == (len(mpts), ndim, ndim)
+        assert refpts.shape == (len(mpts), ndim)
+        for i, m in enumerate(single_mpar):
+            assert all_almost_equal(rot[i], geom.rotation_matrix(m))
+            assert all_almost_equal(refpts[i], geom.det_refpoint(m))
+
+        # All combinations of motion and detector parameters
+        mpar_bcast = mpar[..., None]
+        det_pts = geom.det_point_position(mpar_bcast, dpar)
+        det_to_src = geom.det_to_src(mpar_bcast, dpar)
+        assert det_pts.shape == (len(mpts), len(dpts), ndim)
+        assert det_to_src.shape == (len(mpts), len(dpts), ndim)
+        for i, m in enumerate(single_mpar):
+            for j, d in enumerate(single_dpar):
+                assert all_almost_equal(det_pts[i, j],
+                                        geom.det_point_position(m, d))
+                assert all_almost_equal(det_to_src[i, j],
+                                        geom.det_to_src(m, d))
+
+        if isinstance(geom, odl.tomo.DivergentBeamGeometry):
+            src = geom.src_position(mpar)
+            assert src.shape == (len(mpts), ndim)
+            for i, m in enumerate(single_mpar):
+                assert all_almost_equal(src[i], geom.src_position(m))
+
+        with pytest.raises(ValueError):
+            geom.det_refpoint(mpar + 10)
+        with pytest.raises(ValueError):
+            geom.det_point_position(mpar_bcast, dpar + 10)
+
+
+def test_geometry_vectors():
+    """Check the cached vector representation of geometries."""
+    for geom in make_vectorization_geometries():
+        ndim = geom.ndim
+        vectors = geom.vectors
+        assert vectors.shape == (geom.motion_partition.size,
+                                 ndim * (ndim + 1))
+        assert geom.vectors is vectors
+        assert not vectors.flags.writeable
+
+        mid_pt = geom.det_params.mid_pt
+        if geom.det_partition.ndim == 1:
+            mid_pt = mid_pt[0]
+        # Neighboring detector points are separated by the scaled axes
+        for i, mpar in enumerate(geom.motion_grid.points()):
+            if mpar.size == 1:
+                mpar = mpar[0]
+            det_mid = geom.det_point_position(mpar, mid_pt)
+            assert all_almost_equal(vectors[i, ndim:2 * ndim], det_mid)
+            if isinstance(geom, odl.tomo.DivergentBeamGeometry):
+                assert all_almost_equal(vectors[i, :ndim],
+                                        geom.src_position(mpar))
+            else:
+                assert all_almost_equal(vectors[i, :ndim],
+                                        -geom.det_to_src(mpar, mid_pt))
+
+            for k, cell_side in enumerate(geom.det_partition.cell_sides):
+                shift = np.zeros(geom.det_partition.ndim)
+                shift[k] = cell_side
+                shifted = geom.det_params.mid_pt + shift
+                if geom.det_partition.ndim == 1:
+                    shifted = shifted[0]
+                det_axis = (geom.det_point_position(mpar, shifted) - det_mid)
+                col = (2 + k) * ndim
+                assert all_almost_equal(vectors[i, col:col + ndim], det_axis)
+
+        # Subsets do not share the cache
+        sub_geom = geom.motion_subset(slice(1, None))
+        sub_vectors = vectors.reshape(geom.motion_partition.shape + (-1,))
+        assert all_almost_equal(sub_geom.vectors,
+                                sub_vectors[1:].reshape(-1, vectors.shape[1]))
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -16,7 +16,7 @@ import pytest
 import odl
 from odl.tomo.backends import ASTRA_VERSION
 from odl.tomo.util.testutils import (skip_if_no_astra, skip_if_no_astra_cuda,
-                                     skip_if_no_skimage)
+                                     skip_if_no_skimage, skip_if_no_odl_cpu)
 from odl.util.testutils import almost_equal, all_almost_equal, simple_fixture
 
 
@@ -25,7 +25,9 @@ from odl.util.testutils import almost_equal, all_almost_equal, simple_fixture
 
 impl_params = [skip_if_no_astra('astra_cpu'),
                skip_if_no_astra_cuda('astra_cuda'),
-               skip_if_no_skimage('skimage')]
+               skip_if_no_skimage('skimage'),
+               skip_if_no_odl_cpu('odl_cpu'),
+               skip_if_no_odl_cpu('sparse_matrix')]
 impl = simple_fixture('impl', impl_params, fmt=" {name} = '{value.args[1]}' ")
 
 geometry_params = ['par2d', 'par3d', 'cone2d', 'cone3d', 'helical']
@@ -87,7 +89,13 @@ projectors = [skip_if_no_astra('par2d astra_cpu uniform'),
               skip_if_no_astra_cuda('cone3d astra_cuda random'),
               skip_if_no_astra_cuda('helical astra_cuda uniform'),
               skip_if_no_skimage('par2d skimage uniform'),
-              skip_if_no_skimage('par2d skimage half_uniform')]
+              skip_if_no_skimage('par2d skimage half_uniform'),
+              skip_if_no_odl_cpu('par2d odl_cpu uniform'),
+              skip_if_no_odl_cpu('par2d odl_cpu nonuniform'),
+              skip_if_no_odl_cpu('cone2d odl_cpu uniform'),
+              skip_if_no_odl_cpu('cone2d odl_cpu random'),
+              skip_if_no_odl_cpu('par2d sparse_matrix uniform'),
+              skip_if_no_odl_cpu('cone2d sparse_matrix random')]
 
 
 projector_ids = [' geom={}, impl={}, angles={} '
@@ -351,5 +359,92 @@ def test_anisotropic_voxels(geometry):
         assert False
 
 
+@pytest.mark.parametrize('scheme', ['interleaved', 'contiguous', 'golden'])
+def test_subsets(impl, scheme):
+    """Test ray transforms on subsets of the angles."""
+    space = odl.uniform_discr([-1, -1], [1, 1], (20, 20), dtype='float32')
+    geom = odl.tomo.parallel_beam_geometry(space, num_angles=10)
+    ray_trafo = odl.tomo.RayTransform(space, geom, impl=impl)
+    vol = odl.phantom.shepp_logan(space)
+    data = ray_trafo(vol)
+
+    subset_ops = ray_trafo.subsets(3, scheme)
+    data_parts = ray_trafo.split_data(data, 3, scheme)
+    assert len(subset_ops) == len(data_parts) == 3
+    assert sum(op.range.shape[0] for op in subset_ops) == 10
+
+    # The subset operators reproduce the parts of the full data, and the
+    # sum of their adjoints is the full adjoint
+    for op, part in zip(subset_ops, data_parts):
+        assert part in op.range
+        assert all_almost_equal(op(vol), part, places=4)
+
+    backproj = sum(op.adjoint(part)
+                   for op, part in zip(subset_ops, data_parts))
+    assert all_almost_equal(backproj, ray_trafo.adjoint(data), places=3)
+
+    if scheme == 'contiguous':
+        for part in data_parts:
+            assert np.shares_memory(part.asarray(), data.asarray())
+
+    # The subset operators are cached, including their sensitivity images
+    assert all(op is cached_op
+               for op, cached_op in zip(subset_ops,
+                                        ray_trafo.subsets(3, scheme)))
+    for op in subset_ops:
+        assert op.sensitivity is op.sensitivity
+        assert all_almost_equal(op.sensitivity,
+                                op.adjoint(op.range.one()), places=4)
+
+    with pytest.raises(ValueError):
+        ray_trafo.subsets(11, scheme)
+
+
+def test_apply_batch(projector):
+    """Test batched evaluation of the ray transform and its adjoint."""
+    vols = [odl.phantom.cuboid(projector.domain),
+            odl.phantom.indicate_proj_axis(projector.domain)]
+    data = projector.apply_batch(vols)
+    assert data in projector.range ** 2
+    for vol, part in zip(vols, data):
+        assert all_almost_equal(part, projector(vol), places=4)
+
+    # Array input and in-place evaluation of the adjoint
+    backproj = (projector.domain ** 2).element()
+    out = projector.adjoint.apply_batch(data.asarray(), out=backproj)
+    assert out is backproj
+    for part, proj in zip(backproj, data):
+        assert all_almost_equal(part, projector.adjoint(proj), places=2)
+
+    # Flattened inputs
+    flat = np.array([part.ntuple.asarray() for part in data])
+    backproj_flat = projector.adjoint.apply_batch(flat)
+    assert all_almost_equal(backproj_flat, backproj, places=4)
+
+
+def test_apply_batch_complex(impl):
+    """Test batched evaluation of the ray transform in complex spaces."""
+    space = odl.uniform_discr([-1, -1], [1, 1], (10, 10), dtype='complex64')
+    geom = odl.tomo.parallel_beam_geometry(space)
+    ray_trafo = odl.tomo.RayTransform(space, geom, impl=impl)
+    vol = odl.phantom.shepp_logan(space)
+    vol.imag = odl.phantom.cuboid(space.real_space)
+
+    vols = (ray_trafo.domain ** 2).element([vol, 2 * vol])
+    data = ray_trafo.apply_batch(vols)
+    assert all_almost_equal(data[0], ray_trafo(vol), places=4)
+    assert all_almost_equal(data[1], 2 * ray_trafo(vol), places=4)
+
+    # Results are written directly to contiguous power space elements
+    out = odl.ProductSpace(ray_trafo.range, 2, contiguous=True).element()
+    out_arr = out.asarray()
+    assert ray_trafo.apply_batch(vols, out=out) is out
+    assert all_almost_equal(out_arr[1], (2 * ray_trafo(vol)).asarray(),
+                            places=4)
+
+    with pytest.raises(ValueError):
+        ray_trafo.apply_batch([])
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -10,7 +10,10 @@ from __future__ import division
 import numpy as np
 import pytest
 
-from odl.trafos.backends import pyfftw_call, PYFFTW_AVAILABLE
+import odl.trafos.backends.pyfftw_bindings
+from odl.trafos.backends import (
+    pyfftw_call, pyfftw_import_wisdom, pyfftw_export_wisdom,
+    pyfftw_clear_plan_cache, PYFFTW_AVAILABLE)
 from odl.util import (
     is_real_dtype, complex_dtype)
 from odl.util.testutils import (
@@ -380,5 +383,94 @@ def test_pyfftw_call_backward_with_plan():
         assert all_almost_equal(idft_arr, true_idft)
 
 
+def test_pyfftw_call_plan_cache(monkeypatch):
+    import pyfftw
+
+    pyfftw_clear_plan_cache()
+    shape = (6, 8)
+    arr = pyfftw.empty_aligned(shape, dtype='complex128')
+    arr[:] = _random_array(shape, dtype='complex128')
+    true_dft = np.fft.fftn(arr)
+
+    # Same layout -> cached plan is reused for new arrays
+    dft_arr = pyfftw.empty_aligned(shape, dtype='complex128')
+    plan = pyfftw_call(arr, dft_arr, direction='forward', threads=1)
+    assert all_almost_equal(dft_arr, true_dft)
+
+    arr2 = pyfftw.empty_aligned(shape, dtype='complex128')
+    arr2[:] = arr
+    dft_arr2 = pyfftw.empty_aligned(shape, dtype='complex128')
+    plan2 = pyfftw_call(arr2, dft_arr2, direction='forward', threads=1)
+    assert plan2 is plan
+    assert all_almost_equal(dft_arr2, true_dft)
+
+    # The cached plan does not hold on to the arrays of the caller
+    for plan_arr in (plan.input_array, plan.output_array):
+        assert not np.shares_memory(plan_arr, arr2)
+        assert not np.shares_memory(plan_arr, dft_arr2)
+
+    # Other direction, in-place and disabled cache -> new plans
+    idft_arr = pyfftw.empty_aligned(shape, dtype='complex128')
+    plan_bwd = pyfftw_call(arr, idft_arr, direction='backward', threads=1)
+    assert plan_bwd is not plan
+    plan_inplace = pyfftw_call(arr2, arr2, direction='forward', threads=1)
+    assert plan_inplace is not plan
+    assert all_almost_equal(arr2, true_dft)
+    plan_nocache = pyfftw_call(arr, dft_arr, direction='forward', threads=1,
+                               plan_cache=False)
+    assert plan_nocache is not plan
+
+    # Least recently used plans are evicted
+    monkeypatch.setattr(odl.trafos.backends.pyfftw_bindings,
+                        'FFTW_PLAN_CACHE_MAX_BYTES', 2 * arr.nbytes)
+    arr_1d = _random_array((10,), dtype='complex128')
+    pyfftw_call(arr_1d, np.empty_like(arr_1d), direction='forward',
+                threads=1)
+    assert pyfftw_call(arr, dft_arr, direction='forward',
+                       threads=1) is not plan
+
+    pyfftw_clear_plan_cache()
+
+
+def test_pyfftw_call_plan_cache_threads():
+    from multiprocessing.pool import ThreadPool
+
+    pyfftw_clear_plan_cache()
+    shape = (128, 256)
+    arrs = [_random_array(shape, dtype='complex128') for _ in range(40)]
+
+    def dft(arr):
+        out = np.empty_like(arr)
+        pyfftw_call(arr, out, direction='forward', threads=1)
+        return out
+
+    pool = ThreadPool(8)
+    try:
+        results = pool.map(dft, arrs)
+    finally:
+        pool.close()
+        pool.join()
+
+    for arr, result in zip(arrs, results):
+        assert all_almost_equal(result, np.fft.fftn(arr))
+
+    pyfftw_clear_plan_cache()
+
+
+def test_pyfftw_wisdom(tmpdir):
+    shape = (10,)
+    arr = _random_array(shape, dtype='complex128')
+    dft_arr = np.empty(shape, dtype='complex128')
+    pyfftw_call(arr, dft_arr, direction='forward', planning_effort='measure')
+
+    wisdom_file = str(tmpdir.join('fftw_wisdom.pkl'))
+    pyfftw_export_wisdom(wisdom_file)
+    assert any(pyfftw_import_wisdom(wisdom_file))
+
+    # Missing files are ignored
+    missing_file = str(tmpdir.join('no_wisdom.pkl'))
+    assert not any(pyfftw_import_wisdom(missing_file))
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -21,7 +21,8 @@ from odl.trafos.backends.pywt_bindings import (
     pywt_coeff_shapes,
     pywt_flat_array_from_coeffs, pywt_coeffs_from_flat_array,
     pywt_single_level_decomp,
-    pywt_multi_level_decomp, pywt_multi_level_recon)
+    pywt_multi_level_decomp, pywt_multi_level_recon,
+    pywt_multi_level_decomp_flat, pywt_multi_level_recon_flat)
 from odl.util.testutils import (all_almost_equal, all_equal, noise_array,
                                 simple_fixture)
 
@@ -188,6 +189,47 @@ def test_multilevel_decomp_inverts_recon(shape_setup):
     assert all_almost_equal(coeffs, wave_decomp)
 
 
+def test_multilevel_flat(shape_setup, floating_dtype):
+    """Test the decomposition to and reconstruction from flat arrays."""
+    wavelet, pywt_mode, nlevels, image_shape, coeff_shapes = shape_setup
+
+    image = np.random.uniform(size=image_shape).astype(floating_dtype)
+    true_decomp = pywt_flat_array_from_coeffs(
+        pywt_multi_level_decomp(image, wavelet, nlevels, pywt_mode))
+
+    for threads in (1, 3):
+        wave_decomp = pywt_multi_level_decomp_flat(
+            image, wavelet, nlevels, pywt_mode, threads=threads)
+        assert wave_decomp.dtype == true_decomp.dtype
+        assert all_equal(wave_decomp, true_decomp)
+
+        out = np.empty_like(true_decomp)
+        result = pywt_multi_level_decomp_flat(
+            image, wavelet, nlevels, pywt_mode, out=out, threads=threads)
+        assert result is out
+        assert all_equal(out, true_decomp)
+
+        recon = pywt_multi_level_recon_flat(
+            wave_decomp, image_shape, wavelet, nlevels, pywt_mode,
+            threads=threads)
+        assert recon.dtype == true_decomp.dtype
+        assert all_almost_equal(recon, image)
+
+        out = np.empty(image_shape, dtype=floating_dtype)
+        result = pywt_multi_level_recon_flat(
+            wave_decomp, image_shape, wavelet, nlevels, pywt_mode, out=out,
+            threads=threads)
+        assert result is out
+        assert all_almost_equal(out, image)
+
+    with pytest.raises(ValueError):
+        pywt_multi_level_decomp_flat(image, wavelet, nlevels, pywt_mode,
+                                     out=np.empty(true_decomp.size + 1))
+    with pytest.raises(ValueError):
+        pywt_multi_level_recon_flat(true_decomp[:-1], image_shape, wavelet,
+                                    nlevels, pywt_mode)
+
+
 def test_explicit_example(floating_dtype):
     """Comparison with hand-calculated wavelet transform."""
 
@@ -0,0 +1,162 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import numpy as np
+import pytest
+from scipy import signal
+
+import odl
+from odl.trafos.convolution import Convolution
+from odl.trafos.fourier import SCIPY_FFT_AVAILABLE
+from odl.util import (all_almost_equal, never_skip, skip_if_no_pyfftw,
+                      noise_element)
+from odl.util.testutils import simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+skip_if_no_scipy_fft = pytest.mark.skipif(not SCIPY_FFT_AVAILABLE,
+                                          reason='scipy.fft not available')
+impl = simple_fixture('impl', [never_skip('numpy'),
+                               skip_if_no_scipy_fft('scipy'),
+                               skip_if_no_pyfftw('pyfftw')])
+engine = simple_fixture('engine', ['direct', 'fft', 'oadd'])
+dtype = simple_fixture('dtype', ['float32', 'float64', 'complex128'])
+
+# Pairs of image and kernel shapes. The last ones are split into several
+# blocks by the overlap-add engine.
+shape_params = [((10,), (3,)),
+                ((10,), (4,)),
+                ((5,), (12,)),
+                ((12, 9), (3, 4)),
+                ((7, 6, 5), (2, 3, 1)),
+                ((300,), (20,)),
+                ((130, 140), (17, 1))]
+shapes = simple_fixture('shapes', shape_params)
+
+
+# --- helper functions --- #
+
+
+def _conv_reference(x, kernel, center):
+    """Return the convolution by cropping the full convolution."""
+    full = signal.convolve(x, kernel, mode='full')
+    return full[tuple(slice(c, c + n) for c, n in zip(center, x.shape))]
+
+
+# --- Convolution --- #
+
+
+def test_convolution_init():
+    space = odl.uniform_discr([0, 0], [1, 1], (4, 5))
+    kernel = np.ones((3, 3))
+
+    conv = Convolution(space, kernel)
+    assert conv.domain == conv.range == space
+    assert conv.is_linear
+    assert conv.center == (1, 1)
+    assert all_almost_equal(conv.kernel, kernel)
+    assert Convolution(space, np.ones((2, 4))).center == (1, 2)
+
+    with pytest.raises(TypeError):
+        Convolution(odl.rn(4), np.ones(3))
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones(3))  # wrong ndim
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones((0, 3)))  # empty
+    with pytest.raises(ValueError):
+        Convolution(space, 1j * kernel)  # complex kernel, real space
+    with pytest.raises(ValueError):
+        Convolution(space, kernel, center=(1, 3))
+    with pytest.raises(ValueError):
+        Convolution(space, kernel, center=(1,))
+    with pytest.raises(ValueError):
+        Convolution(space, kernel, engine='fast')
+    with pytest.raises(ValueError):
+        Convolution(space, kernel, impl='fftpack')
+
+
+def test_convolution_call(engine, dtype, shapes):
+    shape, kernel_shape = shapes
+    space = odl.uniform_discr([0] * len(shape), [1] * len(shape), shape,
+                              dtype=dtype)
+    x = noise_element(space)
+    kernel = noise_element(odl.uniform_discr(
+        [0] * len(shape), [1] * len(shape), kernel_shape, dtype=dtype))
+    kernel = kernel.asarray()
+
+    centers = [None, tuple(m - 1 for m in kernel_shape), (0,) * len(shape)]
+    for center in centers:
+        conv = Convolution(space, kernel, center=center, engine=engine)
+        true_conv = _conv_reference(x.asarray(), kernel, conv.center)
+        places = 3 if dtype == 'float32' else 8
+        assert all_almost_equal(conv(x).asarray(), true_conv, places=places)
+
+        out = space.element()
+        conv(x, out=out)
+        assert all_almost_equal(out.asarray(), true_conv, places=places)
+
+
+def test_convolution_impl(impl):
+    space = odl.uniform_discr([0, 0], [1, 1], (130, 20))
+    kernel = np.random.rand(17, 4)
+    x = noise_element(space)
+    true_conv = _conv_reference(x.asarray(), kernel, (8, 2))
+
+    for engine in ('fft', 'oadd'):
+        conv = Convolution(space, kernel, engine=engine, impl=impl)
+        assert conv.impl == impl
+        assert all_almost_equal(conv(x).asarray(), true_conv)
+
+
+def test_convolution_adjoint(engine, dtype):
+    space = odl.uniform_discr([0, 0], [1, 1], (80, 70), dtype=dtype)
+    kernel = noise_element(odl.uniform_discr(
+        [0, 0], [1, 1], (6, 5), dtype=dtype)).asarray()
+    conv = Convolution(space, kernel, engine=engine)
+
+    x = noise_element(space)
+    y = noise_element(space)
+    places = 2 if dtype == 'float32' else 8
+    assert pytest.approx(conv(x).inner(y), rel=10 ** -places) == \
+        x.inner(conv.adjoint(y))
+
+    # The adjoint is cached and its adjoint is the original operator
+    assert conv.adjoint is conv.adjoint
+    assert conv.adjoint.adjoint is conv
+    assert conv.adjoint.engine == engine
+
+    # Symmetric real kernels give self-adjoint operators
+    if dtype != 'complex128':
+        sym_kernel = np.outer([1, 2, 1], [1, 3, 5, 3, 1])
+        sym_conv = Convolution(space, sym_kernel, engine=engine)
+        assert sym_conv.adjoint is sym_conv
+
+    # No adjoint outside of Hilbert spaces
+    space_l1 = odl.uniform_discr([0, 0], [1, 1], (80, 70), exponent=1)
+    with pytest.raises(NotImplementedError):
+        Convolution(space_l1, np.ones((3, 3))).adjoint
+
+
+def test_convolution_engine_selection():
+    # Small kernel: direct summation
+    space = odl.uniform_discr([0, 0], [1, 1], (256, 256))
+    assert Convolution(space, np.ones((3, 3))).engine == 'direct'
+
+    # Large kernel: one FFT
+    assert Convolution(space, np.ones((31, 31))).engine == 'fft'
+
+    # Long signal with a medium-sized kernel: overlap-add
+    space = odl.uniform_discr(0, 1, 10 ** 6)
+    assert Convolution(space, np.ones(101)).engine == 'oadd'
+
+
+if __name__ == '__main__':
+    pytest.main([str(__file__.replace('\\', '/')), '-v'])
@@ -16,7 +16,7 @@ from odl.trafos.util.ft_utils import (
     _interp_kernel_ft)
 from odl.trafos.fourier import (
     DiscreteFourierTransform, DiscreteFourierTransformInverse,
-    FourierTransform)
+    FourierTransform, SCIPY_FFT_AVAILABLE)
 from odl.util import (all_almost_equal, never_skip, skip_if_no_pyfftw,
                       noise_element,
                       is_real_dtype, conj_exponent, complex_dtype)
@@ -26,7 +26,10 @@ from odl.util.testutils import simple_fixture
 # --- pytest fixtures --- #
 
 
+skip_if_no_scipy_fft = pytest.mark.skipif(not SCIPY_FFT_AVAILABLE,
+                                          reason='scipy.fft not available')
 impl = simple_fixture('impl', [never_skip('numpy'),
+                               skip_if_no_scipy_fft('scipy'),
                                skip_if_no_pyfftw('pyfftw')])
 exponent = simple_fixture('exponent', [2.0, 1.0, float('inf'), 1.5])
 sign = simple_fixture('sign', ['-', '+'])
@@ -323,6 +326,22 @@ def test_dft_init_plan(impl):
         assert dft._fftw_plan is None
 
 
+@skip_if_no_scipy_fft
+def test_dft_scipy_threads():
+
+    # 2d, complex, compare multi-threaded scipy with numpy
+    shape = (64, 80)
+    dft_dom = odl.discr_sequence_space(shape, dtype='complex128')
+    dft_npy = DiscreteFourierTransform(dft_dom, impl='numpy')
+    dft_scipy = DiscreteFourierTransform(dft_dom, impl='scipy')
+    assert dft_scipy.inverse.impl == 'scipy'
+
+    x = noise_element(dft_dom)
+    x_dft = dft_npy(x)
+    assert all_almost_equal(dft_scipy(x, threads=2), x_dft)
+    assert all_almost_equal(dft_scipy.inverse(x_dft, threads=2), x)
+
+
 # ---- FourierTransform ---- #
 
 
@@ -447,6 +466,53 @@ def test_fourier_trafo_create_temp():
     assert ft._tmp_f is None
 
 
+def test_fourier_trafo_reuse_temp():
+
+    # Temporaries are only stored if created explicitly
+    shape = (4, 6)
+    space_discr = odl.uniform_discr([0, 0], [1, 1], shape, dtype='float64')
+    x = noise_element(space_discr)
+
+    ft = FourierTransform(space_discr, halfcomplex=False, impl='numpy')
+    x_ft = ft(x)
+    assert ft._tmp_r is None
+    assert ft._tmp_f is None
+
+    ft.create_temporaries()
+    tmp_f = ft._tmp_f
+    assert all_almost_equal(ft(x), x_ft)
+    assert ft._tmp_f is tmp_f
+
+    ift = ft.inverse
+    assert np.shares_memory(ift._tmp_f, tmp_f)
+    assert all_almost_equal(ift(x_ft), x)
+
+    ft.clear_temporaries()
+    assert all_almost_equal(ft(x), x_ft)
+    assert ft._tmp_f is None
+
+
+def test_fourier_trafo_threads(impl):
+    # Concurrent calls without stored temporaries must not interfere
+    from multiprocessing.pool import ThreadPool
+
+    space_discr = odl.uniform_discr([0, 0], [1, 1], (64, 32),
+                                    dtype='complex128')
+    ft = FourierTransform(space_discr, impl=impl)
+    xs = [noise_element(space_discr) for _ in range(20)]
+    expected = [ft(x) for x in xs]
+
+    pool = ThreadPool(4)
+    try:
+        results = pool.map(ft, xs)
+    finally:
+        pool.close()
+        pool.join()
+
+    for res, exp in zip(results, expected):
+        assert all_almost_equal(res, exp)
+
+
 def test_fourier_trafo_call(impl, floating_dtype):
     # Test if all variants can be called without error
 
@@ -10,7 +10,7 @@ from __future__ import division
 import pytest
 
 import odl
-from odl.util.testutils import (all_almost_equal, noise_element,
+from odl.util.testutils import (all_almost_equal, all_equal, noise_element,
                                 skip_if_no_pywavelets, simple_fixture)
 
 
@@ -107,5 +107,34 @@ def test_wavelet_transform(wave_impl, shape_setup, floating_dtype):
     assert all_almost_equal(image, reco_image)
 
 
+def test_wavelet_transform_out(wave_impl):
+    # Verify that the operators write to `out` and use several threads
+    space = odl.uniform_discr([-1, -1], [1, 1], (32, 33))
+    image = noise_element(space)
+
+    wave_trafo = odl.trafos.WaveletTransform(space, 'sym2', nlevels=2,
+                                             impl=wave_impl)
+    wave_trafo_thr = odl.trafos.WaveletTransform(space, 'sym2', nlevels=2,
+                                                 impl=wave_impl, threads=3)
+    assert wave_trafo_thr.threads == 3
+    assert wave_trafo_thr.inverse.threads == 3
+
+    coeffs = wave_trafo(image)
+    out = wave_trafo.range.element()
+    result = wave_trafo_thr(image, out=out)
+    assert result is out
+    assert all_equal(out, coeffs)
+
+    reco_image = wave_trafo.inverse(coeffs)
+    out = space.element()
+    result = wave_trafo_thr.inverse(coeffs, out=out)
+    assert result is out
+    assert all_almost_equal(out, reco_image)
+    assert all_almost_equal(out, image)
+
+    with pytest.raises(ValueError):
+        odl.trafos.WaveletTransform(space, 'sym2', impl=wave_impl, threads=0)
+
+
 if __name__ == '__main__':
     pytest.main([str(__file__.replace('\\', '/')), '-v'])
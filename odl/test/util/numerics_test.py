@@ -10,6 +10,7 @@ from __future__ import division
 import numpy as np
 import pytest
 
+import odl.util.numerics
 from odl.util import (
     apply_on_boundary, fast_1d_tensor_mult, resize_array, is_real_dtype)
 from odl.util.numerics import _SUPPORTED_RESIZE_PAD_MODES
@@ -279,6 +280,29 @@ def test_fast_1d_tensor_mult():
     assert all_equal(out, true_result)
 
 
+def test_fast_1d_tensor_mult_blocks(monkeypatch):
+
+    # Multiplication in blocks along the axis with the largest stride
+    shape = (5, 3, 4)
+    x, y, z = (np.arange(1, size + 1, dtype='float64') for size in shape)
+    true_result = x[:, None, None] * y[None, :, None] * z[None, None, :]
+
+    monkeypatch.setattr(odl.util.numerics, 'TENSOR_MULT_BLOCK_SIZE', 24)
+    test_arr = np.ones(shape)
+    out = np.empty(shape, dtype='complex128')
+    fast_1d_tensor_mult(test_arr, [x, y, z], out=out)
+    assert all_equal(out, true_result)
+
+    test_arr = np.asfortranarray(np.ones(shape))
+    fast_1d_tensor_mult(test_arr, [x, y, z], out=test_arr)
+    assert all_equal(test_arr, true_result)
+
+    # Input broadcast to the shape of `out`
+    out = np.empty(shape)
+    fast_1d_tensor_mult(np.ones(4), [x, y, z], out=out)
+    assert all_equal(out, true_result)
+
+
 def test_fast_1d_tensor_mult_error():
 
     shape = (2, 3, 4)
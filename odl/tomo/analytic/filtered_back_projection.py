@@ -11,14 +11,22 @@ from __future__ import print_function, division, absolute_import
 from future import standard_library
 standard_library.install_aliases()
 
+from builtins import super
+
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 import scipy as sp
-from odl.discr import ResizingOperator
-from odl.trafos import FourierTransform, PYFFTW_AVAILABLE
+import scipy.fftpack
+import scipy.special
 
+from odl.operator import Operator
+from odl.util import writable_array
 
-__all__ = ('fbp_op', 'fbp_filter_op', 'tam_danielson_window',
-           'parker_weighting')
+
+__all__ = ('fbp_op', 'fbp_filter_op', 'FBPFilterOperator', 'IncrementalFBP',
+           'tam_danielson_window', 'parker_weighting')
 
 
 def _axis_in_detector(geometry):
@@ -295,6 +303,290 @@ def parker_weighting(ray_trafo, q=0.25):
     return ray_trafo.range.element(S_sum * scale)
 
 
+# Maximum number of cached filters, see `_cached_fourier_filter`
+_FILTER_CACHE_SIZE = 32
+_FILTER_CACHE = {}
+
+# Number of (padded) data points filtered at once by one thread
+_FILTER_BLOCK_SIZE = 2 ** 18
+
+
+def _cached_fourier_filter(shape, cell_sides, directions, filter_type,
+                           frequency_scaling, scaling):
+    """Return the FBP filter for the half-complex Fourier grid.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Padded shape of the filtered detector axes.
+    cell_sides : tuple of float
+        Cell sides of the detector along the filtered axes.
+    directions : tuple of float
+        Components of the filter direction in the detector plane along
+        the filtered axes.
+    filter_type, frequency_scaling :
+        Parameters of the filter, see `_fbp_filter`.
+    scaling : float
+        Constant factor of the filter.
+
+    Returns
+    -------
+    fourier_filter : `numpy.ndarray`
+        Read-only real filter on the grid of `numpy.fft.rfftn` for the
+        given shape, using angular frequencies. As in `FourierTransform`
+        with ``shift=True``, the frequencies are shifted by half the
+        sampling frequency, which corresponds to a multiplication of
+        the data with ``(-1) ** k`` before and after filtering. Filters
+        are cached per combination of parameters.
+    """
+    key = (tuple(shape), tuple(cell_sides), tuple(directions), filter_type,
+           float(frequency_scaling), float(scaling))
+    try:
+        return _FILTER_CACHE[key]
+    except KeyError:
+        pass
+
+    # The last axis is half-complex, the others have all frequencies
+    num_freqs = list(shape[:-1]) + [shape[-1] // 2 + 1]
+    freqs = [2 * np.pi / (n * d) * (np.arange(num) - n / 2)
+             for n, d, num in zip(shape, cell_sides, num_freqs)]
+    freq_grid = np.meshgrid(*freqs, indexing='ij', sparse=True)
+
+    abs_freq = np.abs(sum(c * xi for c, xi in zip(directions, freq_grid)))
+    norm_freq = abs_freq / np.max(abs_freq)
+    fourier_filter = _fbp_filter(norm_freq, filter_type, frequency_scaling)
+    fourier_filter = fourier_filter * abs_freq * scaling
+    fourier_filter.flags.writeable = False
+
+    if len(_FILTER_CACHE) >= _FILTER_CACHE_SIZE:
+        _FILTER_CACHE.clear()
+    _FILTER_CACHE[key] = fourier_filter
+    return fourier_filter
+
+
+class FBPFilterOperator(Operator):
+
+    """Filtering of projection data for filtered back-projection.
+
+    The data are convolved with a (smoothed) ramp filter along the
+    detector, which is implemented as a multiplication in frequency space.
+    The filter is computed only once for each set of parameters and
+    cached. Blocks of angles are filtered in parallel, and padding is
+    applied per block, such that no padded copy of the full data is
+    created.
+
+    See Also
+    --------
+    fbp_filter_op : Create a filter from a `RayTransform`
+    fbp_op : Filtered back-projection operator
+    """
+
+    def __init__(self, ray_trafo, padding=True, filter_type='Ram-Lak',
+                 frequency_scaling=1.0, threads=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        ray_trafo : `RayTransform`
+            The ray transform whose range is filtered, see `fbp_filter_op`
+            for the supported geometries.
+        padding : bool, optional
+            If the data should be zero padded along the filtered axes.
+            Without padding, the data may be corrupted due to the circular
+            convolution used.
+        filter_type : string, optional
+            The type of filter to be used. The options are, approximate
+            order from most noise senstive to least noise sensitive:
+            'Ram-Lak', 'Shepp-Logan', 'Cosine', 'Hamming' and 'Hann'.
+        frequency_scaling : float, optional
+            Relative cutoff frequency for the filter, see `fbp_filter_op`.
+        threads : positive int, optional
+            Number of threads used for filtering. Default: number of CPUs
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (20, 20))
+        >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=10)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geom)
+        >>> filter_op = FBPFilterOperator(ray_trafo, filter_type='Hann')
+        >>> filtered = filter_op(ray_trafo(odl.phantom.cuboid(space)))
+        >>> filtered in ray_trafo.range
+        True
+        """
+        super().__init__(ray_trafo.range, ray_trafo.range, linear=True)
+        geometry = ray_trafo.geometry
+        alen = geometry.motion_params.length
+        shape = self.domain.shape
+
+        if self.domain.ndim == 2:
+            axes = (1,)
+            directions = (1.0,)
+            scale = 1.0
+        elif self.domain.ndim == 3:
+            # Find the direction that the filter should be taken in
+            rot_dir = _rotation_direction_in_detector(geometry)
+            axes = tuple(i + 1 for i in range(2) if rot_dir[i] != 0)
+            directions = tuple(float(rot_dir[i - 1]) for i in axes)
+
+            # Add scaling for cone-beam case
+            if hasattr(geometry, 'src_radius'):
+                scale = (geometry.src_radius /
+                         (geometry.src_radius + geometry.det_radius))
+
+                if geometry.pitch != 0:
+                    # In helical geometry the whole volume is not in each
+                    # projection and we need to use another weighting.
+                    # Ideally each point in the volume effects only
+                    # the projections in a half rotation, so we assume
+                    # that that is the case.
+                    scale *= alen / np.pi
+            else:
+                scale = 1.0
+        else:
+            raise NotImplementedError('FBP only implemented in 2d and 3d')
+
+        self.__padding = bool(padding)
+        self.__filter_type = filter_type
+        self.__frequency_scaling = float(frequency_scaling)
+        self.__threads = cpu_count() if threads is None else int(threads)
+        self.__axes = axes
+
+        padded_shape = list(shape)
+        if self.padding:
+            for i in axes:
+                padded_shape[i] = 2 * shape[i] - 1
+        self.__padded_shape = tuple(padded_shape)
+
+        self.__fourier_filter = _cached_fourier_filter(
+            [padded_shape[i] for i in axes],
+            [self.domain.cell_sides[i] for i in axes], directions,
+            filter_type, frequency_scaling, scale / (2 * alen))
+
+        # Factor ``(-1) ** k`` along the filtered axes for the shifted
+        # frequencies, see `_cached_fourier_filter`
+        sign_flip = np.ones([shape[i] if i in axes else 1
+                             for i in range(self.domain.ndim)],
+                            dtype=self.domain.real_space.dtype)
+        for i in axes:
+            index = [slice(None)] * self.domain.ndim
+            index[i] = slice(1, None, 2)
+            sign_flip[tuple(index)] *= -1
+        self.__sign_flip = sign_flip
+
+        if len(axes) == 1:
+            # Filter for the packed real format of `scipy.fftpack.rfft`,
+            # ``[y(0), Re y(1), Im y(1), ...]``, which avoids complex
+            # arrays and keeps single precision
+            packed = np.repeat(self.__fourier_filter, 2)[
+                1:padded_shape[axes[0]] + 1]
+            bcast = [1] * self.domain.ndim
+            bcast[axes[0]] = packed.size
+            self.__packed_filter = packed.reshape(bcast).astype(
+                self.domain.real_space.dtype)
+        else:
+            self.__packed_filter = None
+
+    @property
+    def padding(self):
+        """Whether the data is zero padded before filtering."""
+        return self.__padding
+
+    @property
+    def filter_type(self):
+        """Type of the smoothing filter."""
+        return self.__filter_type
+
+    @property
+    def frequency_scaling(self):
+        """Relative cutoff frequency of the filter."""
+        return self.__frequency_scaling
+
+    @property
+    def threads(self):
+        """Number of threads used for filtering."""
+        return self.__threads
+
+    @property
+    def axes(self):
+        """Axes of the data along which the filter is applied."""
+        return self.__axes
+
+    @property
+    def fourier_filter(self):
+        """Filter on the half-complex grid of the padded data.
+
+        The grid is given by `numpy.fft.rfftn` over `axes`, with the last
+        of `axes` as half-complex axis.
+        """
+        return self.__fourier_filter
+
+    def _filter_block(self, arr, out, block):
+        """Filter the angles ``block`` of real ``arr`` and write to ``out``."""
+        axes = self.axes
+        block_shape = (block.stop - block.start,) + self.__padded_shape[1:]
+        data_slc = (slice(None),) + tuple(slice(0, n)
+                                          for n in arr.shape[1:])
+
+        padded = np.zeros(block_shape, dtype=arr.dtype)
+        padded[data_slc] = arr[block]
+        padded[data_slc] *= self.__sign_flip
+        if self.__packed_filter is not None:
+            transformed = scipy.fftpack.rfft(padded, axis=axes[0],
+                                             overwrite_x=True)
+            transformed *= self.__packed_filter
+            result = scipy.fftpack.irfft(transformed, axis=axes[0],
+                                         overwrite_x=True)
+        else:
+            transformed = np.fft.rfftn(padded, axes=axes)
+            transformed *= self.fourier_filter
+            result = np.fft.irfftn(transformed,
+                                   s=[block_shape[i] for i in axes],
+                                   axes=axes)
+        out[block] = result[data_slc]
+        out[block] *= self.__sign_flip
+
+    def _filter_real(self, arr, out):
+        """Filter the real array ``arr`` and write the result to ``out``."""
+        row_size = int(np.prod(self.__padded_shape[1:]))
+        block_len = max(1, _FILTER_BLOCK_SIZE // row_size)
+        blocks = [slice(i, min(i + block_len, arr.shape[0]))
+                  for i in range(0, arr.shape[0], block_len)]
+
+        threads = min(self.threads, len(blocks))
+        if threads <= 1:
+            for block in blocks:
+                self._filter_block(arr, out, block)
+        else:
+            pool = ThreadPool(threads)
+            try:
+                pool.map(lambda block: self._filter_block(arr, out, block),
+                         blocks)
+            finally:
+                pool.close()
+
+    def _call(self, x, out):
+        """Filter ``x`` and write the result to ``out``."""
+        with writable_array(out) as out_arr:
+            x_arr = x.asarray()
+            if self.domain.is_rn:
+                self._filter_real(x_arr, out_arr)
+            else:
+                out_real = np.empty(out_arr.shape, dtype=x_arr.real.dtype)
+                self._filter_real(x_arr.real, out_real)
+                out_arr.real = out_real
+                self._filter_real(x_arr.imag, out_real)
+                out_arr.imag = out_real
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator, which is the operator itself.
+
+        The filter is real and symmetric, hence the filtering is
+        self-adjoint.
+        """
+        return self
+
+
 def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
                   frequency_scaling=1.0):
     """Create a filter operator for FBP from a `RayTransform`.
@@ -336,111 +628,16 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
 
     Returns
     -------
-    filter_op : `Operator`
+    filter_op : `FBPFilterOperator`
         Filtering operator for FBP based on ``ray_trafo``.
 
     See Also
     --------
     tam_danielson_window : Windowing for helical data
     """
-    impl = 'pyfftw' if PYFFTW_AVAILABLE else 'numpy'
-    alen = ray_trafo.geometry.motion_params.length
-
-    if ray_trafo.domain.ndim == 2:
-        # Define ramp filter
-        def fourier_filter(x):
-            abs_freq = np.abs(x[1])
-            norm_freq = abs_freq / np.max(abs_freq)
-            filt = _fbp_filter(norm_freq, filter_type, frequency_scaling)
-            scaling = 1 / (2 * alen)
-            return filt * abs_freq * scaling
-
-        # Define (padded) fourier transform
-        if padding:
-            # Define padding operator
-            ran_shp = (ray_trafo.range.shape[0],
-                       ray_trafo.range.shape[1] * 2 - 1)
-            resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
-
-            fourier = FourierTransform(resizing.range, axes=1, impl=impl)
-            fourier = fourier * resizing
-        else:
-            fourier = FourierTransform(ray_trafo.range, axes=1, impl=impl)
-
-    elif ray_trafo.domain.ndim == 3:
-        # Find the direction that the filter should be taken in
-        rot_dir = _rotation_direction_in_detector(ray_trafo.geometry)
-
-        # Find what axes should be used in the fourier transform
-        used_axes = (rot_dir != 0)
-        if used_axes[0] and not used_axes[1]:
-            axes = [1]
-        elif not used_axes[0] and used_axes[1]:
-            axes = [2]
-        else:
-            axes = [1, 2]
-
-        # Add scaling for cone-beam case
-        if hasattr(ray_trafo.geometry, 'src_radius'):
-            scale = (ray_trafo.geometry.src_radius /
-                     (ray_trafo.geometry.src_radius +
-                      ray_trafo.geometry.det_radius))
-
-            if ray_trafo.geometry.pitch != 0:
-                # In helical geometry the whole volume is not in each
-                # projection and we need to use another weighting.
-                # Ideally each point in the volume effects only
-                # the projections in a half rotation, so we assume that that
-                # is the case.
-                scale *= alen / (np.pi)
-        else:
-            scale = 1.0
-
-        # Define ramp filter
-        def fourier_filter(x):
-            # If axis is aligned to a coordinate axis, save some memory and
-            # time by using broadcasting
-            if not used_axes[0]:
-                abs_freq = np.abs(rot_dir[1] * x[2])
-            elif not used_axes[1]:
-                abs_freq = np.abs(rot_dir[0] * x[1])
-            else:
-                abs_freq = np.abs(rot_dir[0] * x[1] + rot_dir[1] * x[2])
-            norm_freq = abs_freq / np.max(abs_freq)
-            filt = _fbp_filter(norm_freq, filter_type, frequency_scaling)
-            scaling = scale / (2 * alen)
-            return filt * abs_freq * scaling
-
-        # Define (padded) fourier transform
-        if padding:
-            # Define padding operator
-            if used_axes[0]:
-                padded_shape_u = ray_trafo.range.shape[1] * 2 - 1
-            else:
-                padded_shape_u = ray_trafo.range.shape[1]
-
-            if used_axes[1]:
-                padded_shape_v = ray_trafo.range.shape[2] * 2 - 1
-            else:
-                padded_shape_v = ray_trafo.range.shape[2]
-
-            ran_shp = (ray_trafo.range.shape[0],
-                       padded_shape_u,
-                       padded_shape_v)
-            resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
-
-            fourier = FourierTransform(resizing.range, axes=axes, impl=impl)
-            fourier = fourier * resizing
-        else:
-            fourier = FourierTransform(ray_trafo.range, axes=axes, impl=impl)
-    else:
-        raise NotImplementedError('FBP only implemented in 2d and 3d')
-
-    # Create ramp in the detector direction
-    ramp_function = fourier.range.element(fourier_filter)
-
-    # Create ramp filter via the convolution formula with fourier transforms
-    return fourier.inverse * ramp_function * fourier
+    return FBPFilterOperator(ray_trafo, padding=padding,
+                             filter_type=filter_type,
+                             frequency_scaling=frequency_scaling)
 
 
 def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
@@ -498,6 +695,150 @@ def fbp_op(ray_trafo, padding=True, filter_type='Ram-Lak',
                                              frequency_scaling)
 
 
+class IncrementalFBP(object):
+
+    """Filtered back-projection of projections arriving in batches.
+
+    Each batch of projections is weighted, filtered and back-projected
+    as soon as it is added, and the result is accumulated in
+    `reconstruction`. After the last batch, `reconstruction` is equal to
+    the result of the corresponding `fbp_op` applied to the full data,
+    up to rounding errors.
+
+    See Also
+    --------
+    fbp_op : Filtered back-projection of the full data
+    """
+
+    def __init__(self, ray_trafo, padding=True, filter_type='Ram-Lak',
+                 frequency_scaling=1.0, weighting=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        ray_trafo : `RayTransform`
+            The ray transform (forward operator) whose approximate
+            inverse should be computed, see `fbp_op` for the supported
+            geometries.
+        padding, filter_type, frequency_scaling :
+            Parameters of the filter, see `fbp_filter_op`.
+        weighting : ``ray_trafo.range`` `element-like`, optional
+            Weights multiplied with the projections before filtering,
+            e.g., `parker_weighting` or `tam_danielson_window`.
+
+        Examples
+        --------
+        Add the projections in batches of two angles:
+
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (20, 20))
+        >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=10)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geom)
+        >>> data = ray_trafo(odl.phantom.shepp_logan(space, True))
+        >>> inc_fbp = IncrementalFBP(ray_trafo)
+        >>> for i in range(0, 10, 2):
+        ...     reco = inc_fbp.add_projections(data.asarray()[i:i + 2])
+        >>> inc_fbp.complete
+        True
+        >>> fbp = odl.tomo.fbp_op(ray_trafo)
+        >>> np.allclose(inc_fbp.reconstruction, fbp(data), atol=1e-6)
+        True
+        """
+        self.__ray_trafo = ray_trafo
+        self.__filter_op = fbp_filter_op(ray_trafo, padding, filter_type,
+                                         frequency_scaling)
+        if weighting is None:
+            self.__weighting = None
+        else:
+            self.__weighting = ray_trafo.range.element(weighting).asarray()
+        self.__reconstruction = ray_trafo.domain.zero()
+        self.__received = np.zeros(ray_trafo.range.shape[0], dtype=bool)
+
+    @property
+    def ray_trafo(self):
+        """Ray transform of the full data."""
+        return self.__ray_trafo
+
+    @property
+    def filter_op(self):
+        """Filter applied to the projections, see `fbp_filter_op`."""
+        return self.__filter_op
+
+    @property
+    def reconstruction(self):
+        """Accumulated back-projection of the added projections."""
+        return self.__reconstruction
+
+    @property
+    def received(self):
+        """Boolean array indicating the angles added so far."""
+        return self.__received.copy()
+
+    @property
+    def complete(self):
+        """Whether the projections for all angles have been added."""
+        return bool(np.all(self.__received))
+
+    def add_projections(self, projections, start=None):
+        """Reconstruct a batch of projections and add the result.
+
+        Parameters
+        ----------
+        projections : `array-like`
+            Projections for consecutive angles, with shape
+            ``(k,) + ray_trafo.range.shape[1:]``. A single projection
+            can also be given without the first axis.
+        start : int, optional
+            Index of the angle of the first projection in ``projections``.
+            Default: Index of the first angle that has not been added yet.
+
+        Returns
+        -------
+        reconstruction : ``ray_trafo.domain`` element
+            The updated `reconstruction`.
+        """
+        range_shape = self.ray_trafo.range.shape
+        # Copy since filtering is done in place
+        projections = np.array(projections,
+                               dtype=self.ray_trafo.range.dtype)
+        if projections.shape == range_shape[1:]:
+            projections = projections[None]
+        if projections.shape[1:] != range_shape[1:]:
+            raise ValueError('`projections` must have shape (k,) + {}, '
+                             'got {}'.format(range_shape[1:],
+                                             projections.shape))
+
+        if start is None:
+            start = int(np.argmin(self.__received))
+        start, start_in = int(start), start
+        stop = start + projections.shape[0]
+        if start != start_in or not 0 <= start < stop <= range_shape[0]:
+            raise ValueError('`start` {} invalid for {} projections and {} '
+                             'angles'.format(start_in, projections.shape[0],
+                                             range_shape[0]))
+        if np.any(self.__received[start:stop]):
+            raise ValueError('projections for angles {} to {} already '
+                             'added'.format(start, stop - 1))
+
+        angles = slice(start, stop)
+        if self.__weighting is not None:
+            projections *= self.__weighting[angles]
+        if self.filter_op.domain.is_rn:
+            self.filter_op._filter_real(projections, projections)
+        else:
+            for part in (projections.real, projections.imag):
+                self.filter_op._filter_real(part, part)
+
+        sub_ray_trafo = self.ray_trafo._angle_subset(angles)
+        self.__reconstruction += sub_ray_trafo.adjoint(projections)
+        self.__received[angles] = True
+        return self.reconstruction
+
+    def reset(self):
+        """Discard all projections added so far."""
+        self.__reconstruction.set_zero()
+        self.__received[:] = False
+
+
 if __name__ == '__main__':
     import odl
     import matplotlib.pyplot as plt
@@ -25,3 +25,6 @@ __all__ += astra_cuda.__all__
 
 from .skimage_radon import *
 __all__ += skimage_radon.__all__
+
+from .odl_cpu import *
+__all__ += odl_cpu.__all__
@@ -27,7 +27,8 @@ from odl.tomo.geometry import Geometry
 from odl.util import writable_array
 
 
-__all__ = ('astra_cpu_forward_projector', 'astra_cpu_back_projector')
+__all__ = ('astra_cpu_forward_projector', 'astra_cpu_back_projector',
+           'AstraCpuProjectorImpl', 'AstraCpuBackProjectorImpl')
 
 
 # TODO: use context manager when creating data structures
@@ -215,6 +216,205 @@ def astra_cpu_back_projector(proj_data, geometry, reco_space, out=None):
     return out
 
 
+class AstraCpuImplBase(object):
+
+    """Base class for ASTRA CPU wrappers with persistent objects.
+
+    The ASTRA data objects are linked to ``float32`` arrays which are
+    allocated once, such that repeated evaluations only need to copy
+    input and output data. All ASTRA objects are deleted when the
+    instance is garbage collected, or deterministically when leaving a
+    ``with`` block or calling `delete_ids`.
+    """
+
+    def __init__(self, geometry, reco_space, proj_space):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        geometry : `Geometry`
+            Geometry defining the tomographic setup.
+        reco_space : `DiscreteLp`
+            Reconstruction space, the space of the volume data.
+        proj_space : `DiscreteLp`
+            Projection space, the space of the projection data.
+        """
+        # Set first such that cleanup works after errors
+        self.algo_id = self.vol_id = self.sino_id = self.proj_id = None
+
+        assert isinstance(geometry, Geometry)
+        assert isinstance(reco_space, DiscreteLp)
+        assert isinstance(proj_space, DiscreteLp)
+
+        self.geometry = geometry
+        self.reco_space = reco_space
+        self.proj_space = proj_space
+
+        self.create_ids()
+
+    def create_ids(self):
+        """Create ASTRA objects."""
+        raise NotImplementedError('abstract method')
+
+    def _create_ids(self, direction, interp):
+        """Create ASTRA objects for the given ``direction``."""
+        if self.geometry.ndim != 2:
+            raise ValueError('ASTRA CPU back-end only supports 2d, got '
+                             'geometry with `ndim` {}'
+                             ''.format(self.geometry.ndim))
+
+        self.vol_array = np.empty(self.reco_space.shape, dtype='float32',
+                                  order='C')
+        self.sino_array = np.empty(self.proj_space.shape, dtype='float32',
+                                   order='C')
+
+        vol_geom = astra_volume_geometry(self.reco_space)
+        proj_geom = astra_projection_geometry(self.geometry)
+        self.vol_id = astra_data(vol_geom, datatype='volume',
+                                 data=self.vol_array, allow_copy=False)
+        self.sino_id = astra_data(proj_geom, datatype='projection',
+                                  data=self.sino_array, allow_copy=False)
+        self.proj_id = astra_projector(interp, vol_geom, proj_geom, ndim=2,
+                                       impl='cpu')
+        self.algo_id = astra_algorithm(direction, 2, self.vol_id,
+                                       self.sino_id, self.proj_id,
+                                       impl='cpu')
+
+    def delete_ids(self):
+        """Delete ASTRA objects, making this instance unusable."""
+        if self.algo_id is not None:
+            astra.algorithm.delete(self.algo_id)
+            self.algo_id = None
+        if self.vol_id is not None:
+            astra.data2d.delete(self.vol_id)
+            self.vol_id = None
+        if self.sino_id is not None:
+            astra.data2d.delete(self.sino_id)
+            self.sino_id = None
+        if self.proj_id is not None:
+            astra.projector.delete(self.proj_id)
+            self.proj_id = None
+
+    def __enter__(self):
+        """Return ``self`` in a ``with`` statement."""
+        return self
+
+    def __exit__(self, *exc):
+        """Delete ASTRA objects when leaving a ``with`` block."""
+        self.delete_ids()
+
+    def __del__(self):
+        """Delete ASTRA objects."""
+        self.delete_ids()
+
+
+class AstraCpuProjectorImpl(AstraCpuImplBase):
+
+    """Thin wrapper around the ASTRA CPU forward projector.
+
+    The ASTRA objects are created once and reused in each call. They can
+    be freed deterministically by using the instance as context manager::
+
+        with AstraCpuProjectorImpl(geometry, reco_space, proj_space) as impl:
+            proj_data = impl.call_forward(vol_data)
+    """
+
+    def call_forward(self, vol_data, out=None):
+        """Run an ASTRA forward projection on the given data using the CPU.
+
+        Parameters
+        ----------
+        vol_data : `reco_space` element
+            Volume data to which the projector is applied.
+        out : `proj_space` element, optional
+            Element of the projection space to which the result is written. If
+            ``None``, an element in `proj_space` is created.
+
+        Returns
+        -------
+        out : ``proj_space`` element
+            Projection data resulting from the application of the projector.
+            If ``out`` was provided, the returned object is a reference to it.
+        """
+        assert vol_data in self.reco_space
+        if out is not None:
+            assert out in self.proj_space
+        else:
+            out = self.proj_space.element()
+
+        # Copy data to the linked input array
+        self.vol_array[:] = vol_data.asarray()
+
+        # Run algorithm
+        astra.algorithm.run(self.algo_id)
+
+        out[:] = self.sino_array
+        return out
+
+    def create_ids(self):
+        """Create ASTRA objects."""
+        if not all(s == self.reco_space.interp_byaxis[0]
+                   for s in self.reco_space.interp_byaxis):
+            raise ValueError('volume interpolation must be the same in each '
+                             'dimension, got {}'
+                             ''.format(self.reco_space.interp))
+        self._create_ids('forward', self.reco_space.interp)
+
+
+class AstraCpuBackProjectorImpl(AstraCpuImplBase):
+
+    """Thin wrapper around the ASTRA CPU back-projector."""
+
+    def call_backward(self, proj_data, out=None):
+        """Run an ASTRA back-projection on the given data using the CPU.
+
+        Parameters
+        ----------
+        proj_data : `proj_space` element
+            Projection data to which the back-projector is applied.
+        out : `reco_space` element, optional
+            Element of the reconstruction space to which the result is written.
+            If ``None``, an element in ``reco_space`` is created.
+
+        Returns
+        -------
+        out : ``reco_space`` element
+            Reconstruction data resulting from the application of the
+            back-projector. If ``out`` was provided, the returned object is a
+            reference to it.
+        """
+        assert proj_data in self.proj_space
+        if out is not None:
+            assert out in self.reco_space
+        else:
+            out = self.reco_space.element()
+
+        # Copy data to the linked input array
+        self.sino_array[:] = proj_data.asarray()
+
+        # Run algorithm
+        astra.algorithm.run(self.algo_id)
+
+        out[:] = self.vol_array
+
+        # Weight the adjoint by appropriate weights
+        scaling_factor = float(self.proj_space.weighting.const)
+        scaling_factor /= float(self.reco_space.weighting.const)
+
+        out *= scaling_factor
+        return out
+
+    def create_ids(self):
+        """Create ASTRA objects."""
+        # TODO: implement with different schemes for angles and detector
+        if not all(s == self.proj_space.interp_byaxis[0]
+                   for s in self.proj_space.interp_byaxis):
+            raise ValueError('data interpolation must be the same in each '
+                             'dimension, got {}'
+                             ''.format(self.proj_space.interp_byaxis))
+        self._create_ids('backward', self.proj_space.interp)
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -95,6 +95,11 @@ ASTRA_FEATURES = {
 }
 
 
+# Column indices mapping ODL geometry vectors `(src, d, u, v)` in (x, y, z)
+# order to ASTRA `(src, d, v, u)` in (z, y, x) order
+_VEC_3D_INDICES = [2, 1, 0, 5, 4, 3, 11, 10, 9, 8, 7, 6]
+
+
 def astra_supports(feature):
     """Return bool indicating whether current ASTRA supports ``feature``.
 
@@ -242,39 +247,17 @@ def astra_conebeam_3d_geom_to_vec(geometry):
     .. _ASTRA projection geometry documentation:
        http://www.astra-toolbox.com/docs/geom3d.html#projection-geometries
     """
-    angles = geometry.angles
-    vectors = np.zeros((angles.size, 12))
-
-    for ang_idx, angle in enumerate(angles):
-        # Source position
-        vectors[ang_idx, 0:3] = geometry.src_position(angle)
-
-        # Center of detector in 3D space
-        mid_pt = geometry.det_params.mid_pt
-        vectors[ang_idx, 3:6] = geometry.det_point_position(angle, mid_pt)
-
-        # Vectors from detector pixel (0, 0) to (1, 0) and (0, 0) to (0, 1)
-        det_axes = geometry.det_axes(angle)
-        px_sizes = geometry.det_partition.cell_sides
-
-        # Swap detector axes to have better memory layout in  projection data.
-        # ASTRA produces `(v, theta, u)` layout, and to map to ODL layout
-        # `(theta, u, v)` a complete roll must be performed, which is the
-        # worst case (compeltely discontiguous).
-        # Instead we swap `u` and `v`, resulting in the effective ASTRA result
-        # `(u, theta, v)`. Here we only need to swap axes 0 and 1, which
-        # keeps at least contiguous blocks in `v`.
-        vectors[ang_idx, 9:12] = det_axes[0] * px_sizes[0]
-        vectors[ang_idx, 6:9] = det_axes[1] * px_sizes[1]
-
+    # Swap detector axes to have better memory layout in  projection data.
+    # ASTRA produces `(v, theta, u)` layout, and to map to ODL layout
+    # `(theta, u, v)` a complete roll must be performed, which is the
+    # worst case (compeltely discontiguous).
+    # Instead we swap `u` and `v`, resulting in the effective ASTRA result
+    # `(u, theta, v)`. Here we only need to swap axes 0 and 1, which
+    # keeps at least contiguous blocks in `v`.
+    #
     # ASTRA has (z, y, x) axis convention, in contrast to (x, y, z) in ODL,
     # so we need to adapt to this by changing the order.
-    newind = []
-    for i in range(4):
-        newind += [2 + 3 * i, 1 + 3 * i, 0 + 3 * i]
-    vectors = vectors[:, newind]
-
-    return vectors
+    return geometry.vectors[:, _VEC_3D_INDICES]
 
 
 def astra_conebeam_2d_geom_to_vec(geometry):
@@ -314,24 +297,12 @@ def astra_conebeam_2d_geom_to_vec(geometry):
     # we subtract pi/2 from the geometry angles, thereby rotating the
     # geometry by 90 degrees clockwise
     rot_minus_90 = euler_matrix(-np.pi / 2)
-    angles = geometry.angles
-    vectors = np.zeros((angles.size, 6))
-
-    for ang_idx, angle in enumerate(angles):
-        # Source position
-        vectors[ang_idx, 0:2] = rot_minus_90.dot(geometry.src_position(angle))
-
-        # Center of detector
-        mid_pt = geometry.det_params.mid_pt
-        vectors[ang_idx, 2:4] = rot_minus_90.dot(
-            geometry.det_point_position(angle, mid_pt))
-
-        # Vector from detector pixel 0 to 1
-        det_axis = rot_minus_90.dot(geometry.det_axis(angle))
-        px_size = geometry.det_partition.cell_sides[0]
-        vectors[ang_idx, 4:6] = det_axis * px_size
-
-    return vectors
+    vectors = geometry.vectors
+    num_angles = vectors.shape[0]
+    # All three vectors (source, detector center and detector axis)
+    # are rotated at once
+    return vectors.reshape(num_angles, 3, 2).dot(rot_minus_90.T).reshape(
+        num_angles, 6)
 
 
 def astra_parallel_3d_geom_to_vec(geometry):
@@ -368,39 +339,9 @@ def astra_parallel_3d_geom_to_vec(geometry):
     .. _ASTRA projection geometry documentation:
        http://www.astra-toolbox.com/docs/geom3d.html#projection-geometries
     """
-    angles = geometry.angles
-    vectors = np.zeros((angles.shape[0], 12))
-
-    for ang_idx, angle in enumerate(angles):
-        mid_pt = geometry.det_params.mid_pt
-
-        # Ray direction = -(detector-to-source normal vector)
-        vectors[ang_idx, 0:3] = -geometry.det_to_src(angle, mid_pt)
-
-        # Center of the detector in 3D space
-        vectors[ang_idx, 3:6] = geometry.det_point_position(angle, mid_pt)
-
-        # Vectors from detector pixel (0, 0) to (1, 0) and (0, 0) to (0, 1)
-        det_axes = geometry.det_axes(angle)
-        px_sizes = geometry.det_partition.cell_sides
-
-        # Swap detector axes to have better memory layout in  projection data.
-        # ASTRA produces `(v, theta, u)` layout, and to map to ODL layout
-        # `(theta, u, v)` a complete roll must be performed, which is the
-        # worst case (compeltely discontiguous).
-        # Instead we swap `u` and `v`, resulting in the effective ASTRA result
-        # `(u, theta, v)`. Here we only need to swap axes 0 and 1, which
-        # keeps at least contiguous blocks in `v`.
-        vectors[ang_idx, 9:12] = det_axes[0] * px_sizes[0]
-        vectors[ang_idx, 6:9] = det_axes[1] * px_sizes[1]
-
-    # ASTRA has (z, y, x) axis convention, in contrast to (x, y, z) in ODL,
-    # so we need to adapt to this by changing the order.
-    new_ind = []
-    for i in range(4):
-        new_ind += [2 + 3 * i, 1 + 3 * i, 0 + 3 * i]
-    vectors = vectors[:, new_ind]
-    return vectors
+    # See `astra_conebeam_3d_geom_to_vec` for the reordering. Here the
+    # first vector is the ray direction instead of the source position.
+    return geometry.vectors[:, _VEC_3D_INDICES]
 
 
 def astra_projection_geometry(geometry):
@@ -0,0 +1,882 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Pure NumPy ray transform back-end using the CPU.
+
+The forward projector is an implementation of Joseph's method: each ray
+is traversed slice by slice along the coordinate axis it is most aligned
+with, and the volume is linearly interpolated in the remaining axes at
+the intersection points. The back-projector is the exact transpose of
+this scheme, hence the pair is matched up to the weighting of the
+spaces.
+
+Work is distributed over chunks of rays, which are processed by a pool
+of threads. The chunks are independent of the angles, i.e., a chunk can
+contain rays of several angles or a part of the detector for one angle.
+The chunk size bounds the size of the temporary arrays and thus the
+memory overhead.
+
+References
+----------
+Joseph, P M. *An Improved Algorithm for Reprojecting Rays through Pixel
+Images*. IEEE Transactions on Medical Imaging, 1 (1982), pp 192--196.
+"""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import range
+
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import threading
+
+import numpy as np
+import scipy.sparse
+
+from odl.discr import DiscreteLp, DiscreteLpElement
+from odl.tomo.geometry import (
+    Geometry, Parallel2dGeometry, Parallel3dAxisGeometry, FanFlatGeometry,
+    ConeFlatGeometry, DivergentBeamGeometry)
+from odl.util import writable_array
+
+
+__all__ = ('ODL_CPU_AVAILABLE', 'odl_cpu_supports',
+           'odl_cpu_forward_projector', 'odl_cpu_back_projector',
+           'odl_cpu_forward_projector_batch', 'odl_cpu_back_projector_batch',
+           'odl_cpu_system_matrix')
+
+
+# Always available since only NumPy is required
+ODL_CPU_AVAILABLE = True
+
+# Maximum number of (ray, slice) samples handled at once by one thread
+CHUNK_SIZE = 2 ** 20
+
+_SUPPORTED_GEOMETRIES = (Parallel2dGeometry, Parallel3dAxisGeometry,
+                         FanFlatGeometry, ConeFlatGeometry)
+
+
+def odl_cpu_supports(geometry):
+    """Return ``True`` if ``geometry`` is supported by this back-end."""
+    return (isinstance(geometry, _SUPPORTED_GEOMETRIES) and
+            geometry.motion_partition.ndim == 1)
+
+
+def ray_bundle(geometry, angle):
+    """Return origins and directions of all rays at ``angle``.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry with a flat detector and one motion parameter, see
+        `odl_cpu_supports` for the supported geometries.
+    angle : float or `array-like`
+        Angle(s) for which the rays should be computed.
+
+    Returns
+    -------
+    origins : `numpy.ndarray`
+        For each detector pixel, a point on the ray through that pixel.
+        The shape is ``(geometry.det_partition.size, ndim)`` for a
+        single angle and ``angle.shape + (det_size, ndim)`` for an
+        array of angles.
+    directions : `numpy.ndarray`
+        Unit vectors of the rays, with the same shape as ``origins``.
+        The orientation of the vectors is not specified.
+
+    Examples
+    --------
+    In the default parallel beam geometry, all rays at angle 0 are
+    parallel to the second coordinate axis:
+
+    >>> apart = odl.uniform_partition(0, np.pi, 4)
+    >>> dpart = odl.uniform_partition(-1, 1, 2)
+    >>> geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+    >>> origins, directions = ray_bundle(geom, 0)
+    >>> np.allclose(origins, [[-0.5, 1], [0.5, 1]])
+    True
+    >>> np.allclose(np.abs(directions), [[0, 1], [0, 1]])
+    True
+
+    The rays for all angles can be computed at once:
+
+    >>> origins, directions = ray_bundle(geom, geom.angles)
+    >>> origins.shape
+    (4, 2, 2)
+    """
+    # Extra axis in the angles to broadcast against the detector points
+    angle = np.array(angle, dtype=float, copy=False)[..., None]
+    det_pts = geometry.det_grid.points().T
+    if geometry.det_partition.ndim == 1:
+        det_pts = det_pts[0]
+    return _rays(geometry, angle, det_pts)
+
+
+def _rays(geometry, angle, dparams):
+    """Return origins and directions of rays, broadcasting the parameters.
+
+    See `ray_bundle` for details. The detector parameters ``dparams``
+    are given with the components along the first axis.
+    """
+    det_points = geometry.det_point_position(angle, dparams)
+
+    if isinstance(geometry, DivergentBeamGeometry):
+        src = geometry.src_position(angle)
+        directions = det_points - src
+        directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+        origins = np.broadcast_to(src, det_points.shape)
+    else:
+        mid_pt = geometry.det_params.mid_pt
+        if geometry.det_partition.ndim == 1:
+            mid_pt = mid_pt[0]
+        direction = geometry.det_to_src(angle, mid_pt)
+        directions = np.broadcast_to(direction, det_points.shape)
+        origins = det_points
+
+    return origins, directions
+
+
+def _moved_padded_shape(vol_shape, axis):
+    """Return the shape of the volume as used by `_joseph_stencils`."""
+    return ((vol_shape[axis],) +
+            tuple(n + 3 for i, n in enumerate(vol_shape) if i != axis))
+
+
+def _moved_padded_slices(vol_shape, axis):
+    """Return the index expression of the unpadded volume part."""
+    return ((slice(None),) +
+            tuple(slice(1, n + 1) for i, n in enumerate(vol_shape)
+                  if i != axis))
+
+
+def _joseph_stencils(origins, directions, axis, vol_shape, min_pt,
+                     cell_sides, chunk_size, dtype, k_range=None):
+    """Yield the interpolation stencils of rays along ``axis``.
+
+    The volume is assumed to be given with ``axis`` moved to the front,
+    zero-padded by 1 at the start and 2 at the end of all other axes and
+    flattened in C order, see `_moved_padded_shape`. For each block of
+    slices ``k0:k1`` along ``axis``, this function yields
+    ``(k0, k1, indices, weights)``, where ``indices`` and ``weights``
+    are lists of ``2 ** (ndim - 1)`` arrays of shape
+    ``(num_rays, k1 - k0)``. The indices refer to the flat slab
+    ``vol[k0:k1]``, and the weights include the step length of the rays.
+    If given, only the slices in ``range(*k_range)`` are visited.
+    """
+    padded_shape = _moved_padded_shape(vol_shape, axis)
+    slice_shape = padded_shape[1:]
+    slice_size = int(np.prod(slice_shape))
+    slice_strides = [int(np.prod(slice_shape[j + 1:]))
+                     for j in range(len(slice_shape))]
+
+    num_rays = origins.shape[0]
+    dir_axis = directions[:, axis]
+    step = (cell_sides[axis] / np.abs(dir_axis)).astype(dtype)
+    slab_len = max(1, chunk_size // max(num_rays, slice_size))
+
+    # The continuous indices at which the rays intersect the slices are
+    # affine in the slice index k, i.e., ``offset + k * slope`` with
+    # integer values at the cell midpoints. The offsets account for the
+    # padding.
+    t_first = (min_pt[axis] + 0.5 * cell_sides[axis] -
+               origins[:, axis]) / dir_axis
+    t_step = cell_sides[axis] / dir_axis
+    offsets, slopes = [], []
+    for i in range(len(vol_shape)):
+        if i == axis:
+            continue
+        start = origins[:, i] + t_first * directions[:, i]
+        offsets.append((start - min_pt[i]) / cell_sides[i] + 0.5)
+        slopes.append(t_step * directions[:, i] / cell_sides[i])
+
+    if k_range is None:
+        k_range = (0, vol_shape[axis])
+    for k0 in range(k_range[0], k_range[1], slab_len):
+        k1 = min(k0 + slab_len, k_range[1])
+        kvec = np.arange(k0, k1, dtype=float)
+
+        indices = [np.arange(k1 - k0)[None, :] * slice_size]
+        weights = [np.broadcast_to(step[:, None], (num_rays, k1 - k0))]
+        for offset, slope, n, stride in zip(offsets, slopes,
+                                            slice_shape, slice_strides):
+            cont_idx = offset[:, None] + slope[:, None] * kvec[None, :]
+            # Points outside end up in the zero padding
+            np.clip(cont_idx, 0, n - 2, out=cont_idx)
+            idx_lo = cont_idx.astype(int)
+            w_hi = (cont_idx - idx_lo).astype(dtype)
+            w_lo = 1 - w_hi
+            idx_lo *= stride
+
+            indices = ([ind + idx_lo for ind in indices] +
+                       [ind + (idx_lo + stride) for ind in indices])
+            weights = ([w * w_lo for w in weights] +
+                       [w * w_hi for w in weights])
+
+        yield k0, k1, indices, weights
+
+
+def _chunk_rays(geometry, chunk):
+    """Return origins, directions and dominant axes of rays in ``chunk``.
+
+    The chunk is a slice of the flat indices of all rays, with the
+    detector index varying fastest. The rays are computed individually,
+    hence a chunk can end in the middle of the detector.
+    """
+    num_det = geometry.det_partition.size
+    idx = np.arange(chunk.start, chunk.stop)
+    angle_idx = idx // num_det
+    det_idx = idx % num_det
+    det_idx = np.unravel_index(det_idx, geometry.det_partition.shape)
+    dparams = [vec[idx] for vec, idx in
+               zip(geometry.det_grid.coord_vectors, det_idx)]
+    if geometry.det_partition.ndim == 1:
+        dparams = dparams[0]
+    else:
+        dparams = np.array(dparams)
+
+    origins, directions = _rays(geometry, geometry.angles[angle_idx],
+                                dparams)
+    ndim = geometry.ndim
+    origins = origins.reshape(-1, ndim)
+    directions = directions.reshape(-1, ndim)
+    dom_axes = np.argmax(np.abs(directions), axis=1)
+    return origins, directions, dom_axes
+
+
+def _ray_chunks(geometry, vol_shape, k_range, chunk_size):
+    """Return slices of the flat ray index set for the work items.
+
+    The rays of a chunk contain at most ``chunk_size`` sampling points
+    in the slices ``range(*k_range)``. For short ranges of slices, the
+    chunks contain at most ``chunk_size // min(vol_shape)`` rays, which
+    bounds the memory used for the geometry of the rays.
+    """
+    num_rays = geometry.motion_partition.size * geometry.det_partition.size
+    num_slices = max(k_range[1] - k_range[0], min(vol_shape))
+    rays_per_chunk = max(1, chunk_size // num_slices)
+    return [slice(i, min(i + rays_per_chunk, num_rays))
+            for i in range(0, num_rays, rays_per_chunk)]
+
+
+def _run_threaded(func, chunks, threads):
+    """Apply ``func`` to all chunks using a pool of ``threads`` threads."""
+    if threads is None:
+        threads = cpu_count()
+    threads = min(int(threads), len(chunks))
+    if threads <= 1:
+        for chunk in chunks:
+            func(chunk)
+    else:
+        pool = ThreadPool(threads)
+        try:
+            pool.map(func, chunks)
+        finally:
+            pool.close()
+            pool.join()
+
+
+def _slab_blocks(vol_shape, axis, num_vols, dtype, memory_budget):
+    """Return ranges of slices along ``axis`` processed at once.
+
+    Each block of slices, padded and with ``axis`` moved to the front,
+    takes at most half of ``memory_budget`` bytes for all ``num_vols``
+    volumes, or a single block is used if ``memory_budget`` is ``None``.
+    """
+    num_slices = vol_shape[axis]
+    if memory_budget is None:
+        block_len = num_slices
+    else:
+        padded_shape = _moved_padded_shape(vol_shape, axis)
+        slice_bytes = (num_vols * int(np.prod(padded_shape[1:])) *
+                       np.dtype(dtype).itemsize)
+        block_len = int(min(max(1, memory_budget // (2 * slice_bytes)),
+                            num_slices))
+    return [(k0, min(k0 + block_len, num_slices))
+            for k0 in range(0, num_slices, block_len)]
+
+
+def _padded_block(vol_arr, axis, k_range, dtype):
+    """Return a flat padded copy of a block of slices of a volume stack.
+
+    The slices ``range(*k_range)`` along ``axis`` of the volumes in
+    ``vol_arr`` are copied with ``axis`` moved to the front, as used
+    by `_joseph_stencils`. Only this part of ``vol_arr`` is read, hence
+    ``vol_arr`` can be a memory-mapped array.
+    """
+    num_vols = vol_arr.shape[0]
+    vol_shape = vol_arr.shape[1:]
+    block_shape = ((k_range[1] - k_range[0],) +
+                   _moved_padded_shape(vol_shape, axis)[1:])
+    index = [slice(None)] * vol_arr.ndim
+    index[axis + 1] = slice(*k_range)
+
+    padded = np.zeros((num_vols,) + block_shape, dtype=dtype)
+    padded[(slice(None),) + _moved_padded_slices(vol_shape, axis)] = (
+        np.moveaxis(vol_arr[tuple(index)], axis + 1, 1))
+    return padded.reshape(num_vols, -1)
+
+
+def _chunk_size_for_budget(memory_budget, num_vols, vol_shape, dtype,
+                           threads):
+    """Return the chunk size for temporary arrays of all threads.
+
+    Half of ``memory_budget`` is shared between the threads. Each
+    sampling point of a ray takes the index and weight of all stencil
+    points, the interpolated or back-projected values of all volumes
+    and an accumulator entry of the back-projector. Each ray also needs
+    its geometry, i.e., origin, direction and interpolation parameters
+    in double precision, which is spread over the slices of the ray.
+    """
+    if memory_budget is None:
+        return CHUNK_SIZE
+    if threads is None:
+        threads = cpu_count()
+    ndim = len(vol_shape)
+    itemsize = np.dtype(dtype).itemsize
+    # Stencil arrays, including the previous ones while they are built
+    # and the temporaries of one interpolation step
+    stencil_bytes = 3 * 2 ** (ndim - 2) * (8 + itemsize) + 3 * 8
+    value_bytes = num_vols * (2 * 8 + itemsize)
+    accum_bytes = num_vols * 2 * 8
+    ray_bytes = 8 * (ndim ** 2 + 10 * ndim + 8) + 2 * num_vols * itemsize
+    sample_bytes = (stencil_bytes + value_bytes + accum_bytes +
+                    ray_bytes / min(vol_shape))
+    return int(min(max(1, memory_budget // (2 * threads * sample_bytes)),
+                   CHUNK_SIZE))
+
+
+def _check_args(data, geometry, space, data_name, space_name):
+    """Perform sanity checks common to forward and back-projector."""
+    if not isinstance(data, DiscreteLpElement):
+        raise TypeError('{} {!r} is not a `DiscreteLpElement` instance'
+                        ''.format(data_name, data))
+    _check_batch_args(geometry, [(space, space_name)])
+
+
+def _check_batch_args(geometry, spaces):
+    """Check geometry and ``(space, name)`` pairs for the projectors."""
+    if not isinstance(geometry, Geometry):
+        raise TypeError('geometry {!r} is not a `Geometry` instance'
+                        ''.format(geometry))
+    if not odl_cpu_supports(geometry):
+        raise TypeError('geometry {!r} not supported by the `odl_cpu` '
+                        'back-end'.format(geometry))
+    for space, name in spaces:
+        if not isinstance(space, DiscreteLp):
+            raise TypeError('{} {!r} is not a `DiscreteLp` instance'
+                            ''.format(name, space))
+
+
+def _stack_array(stack, space, stack_name):
+    """Return ``stack`` as array of shape ``(K,) + space.shape``."""
+    if not isinstance(stack, np.ndarray):
+        # Convert members separately, `DiscreteLpElement` would otherwise
+        # be converted as flat sequences
+        stack = [np.asarray(member) for member in stack]
+    stack_arr = np.asarray(stack, dtype=space.dtype)
+    if stack_arr.ndim != space.ndim + 1 or stack_arr.shape[1:] != space.shape:
+        raise ValueError('{} must have shape (K,) + {}, got {}'
+                         ''.format(stack_name, space.shape, stack_arr.shape))
+    return stack_arr
+
+
+def _stack_out(out, num, space):
+    """Return a C-contiguous array for the results of a stack."""
+    shape = (num,) + space.shape
+    if out is None:
+        return np.empty(shape, dtype=space.dtype)
+    if not isinstance(out, np.ndarray):
+        raise TypeError('`out` {!r} is not a `numpy.ndarray` instance'
+                        ''.format(out))
+    if out.shape != shape:
+        raise ValueError('`out` must have shape {}, got {}'
+                         ''.format(shape, out.shape))
+    return out
+
+
+def odl_cpu_forward_projector(vol_data, geometry, proj_space, out=None,
+                              threads=None, chunk_size=None,
+                              memory_budget=None):
+    """Run a forward projection on the given data using the CPU.
+
+    Parameters
+    ----------
+    vol_data : `DiscreteLpElement`
+        Volume data to which the forward projector is applied.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    proj_space : `DiscreteLp`
+        Space to which the calling operator maps.
+    out : ``proj_space`` element, optional
+        Element of the projection space to which the result is written. If
+        ``None``, an element in ``proj_space`` is created.
+    threads : positive int, optional
+        Number of threads to use. Default: number of CPUs
+    chunk_size : positive int, optional
+        Maximum number of sampling points along rays processed at once by
+        each thread. Smaller values reduce the memory overhead.
+        Default: `CHUNK_SIZE`, or derived from ``memory_budget``
+    memory_budget : positive int, optional
+        Approximate number of bytes used for temporary arrays, see
+        `odl_cpu_forward_projector_batch`. Default: no limit
+
+    Returns
+    -------
+    out : ``proj_space`` element
+        Projection data resulting from the application of the projector.
+        If ``out`` was provided, the returned object is a reference to it.
+    """
+    _check_args(vol_data, geometry, proj_space, 'volume data',
+                'projection space')
+    if vol_data.ndim != geometry.ndim:
+        raise ValueError('dimensions {} of volume data and {} of geometry '
+                         'do not match'
+                         ''.format(vol_data.ndim, geometry.ndim))
+    if out is None:
+        out = proj_space.element()
+    elif out not in proj_space:
+        raise TypeError('`out` {} is neither None nor a '
+                        'DiscreteLpElement instance'.format(out))
+
+    with writable_array(out, dtype=proj_space.dtype,
+                        order='C') as out_arr:
+        odl_cpu_forward_projector_batch(
+            np.asarray(vol_data)[None], geometry, vol_data.space,
+            proj_space, out=out_arr[None], threads=threads,
+            chunk_size=chunk_size, memory_budget=memory_budget)
+
+    return out
+
+
+def odl_cpu_forward_projector_batch(vol_stack, geometry, reco_space,
+                                    proj_space, out=None, threads=None,
+                                    chunk_size=None, memory_budget=None):
+    """Run forward projections of a stack of volumes using the CPU.
+
+    The ray stencils are computed only once and applied to all volumes,
+    which is considerably faster than projecting the volumes one by one.
+
+    Parameters
+    ----------
+    vol_stack : `array-like`
+        Volumes to which the forward projector is applied, of shape
+        ``(K,) + reco_space.shape``.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    reco_space : `DiscreteLp`
+        Real reconstruction space, the domain of the forward projector.
+    proj_space : `DiscreteLp`
+        Real projection space, the range of the forward projector.
+    out : `numpy.ndarray`, optional
+        Array of shape ``(K,) + proj_space.shape`` to which the result
+        is written.
+    threads : positive int, optional
+        Number of threads to use. Default: number of CPUs
+    chunk_size : positive int, optional
+        Maximum number of sampling points along rays processed at once by
+        each thread. Smaller values reduce the memory overhead.
+        Default: `CHUNK_SIZE`, or derived from ``memory_budget``
+    memory_budget : positive int, optional
+        Approximate number of bytes used for temporary arrays. The volumes
+        are then processed in blocks of slices, and only the current
+        block is copied to memory. Together with ``vol_stack`` and
+        ``out`` given as `numpy.memmap`, this allows to project volumes
+        larger than the main memory. Default: no limit
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        Projection data of shape ``(K,) + proj_space.shape``. If ``out``
+        was provided, the returned object is a reference to it.
+
+    Examples
+    --------
+    >>> space = odl.uniform_discr([-1, -1], [1, 1], (4, 4))
+    >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=3)
+    >>> proj_space = odl.uniform_discr_frompartition(geom.partition)
+    >>> x = odl.phantom.cuboid(space)
+    >>> proj = odl_cpu_forward_projector_batch([x, 2 * x], geom, space,
+    ...                                        proj_space)
+    >>> proj.shape
+    (2, 3, 7)
+    >>> np.allclose(proj[1], 2 * odl_cpu_forward_projector(x, geom,
+    ...                                                    proj_space))
+    True
+
+    A small memory budget gives the same result:
+
+    >>> proj_budget = odl_cpu_forward_projector_batch(
+    ...     [x, 2 * x], geom, space, proj_space, memory_budget=1000)
+    >>> np.allclose(proj_budget, proj)
+    True
+    """
+    _check_batch_args(geometry, [(reco_space, 'reconstruction space'),
+                                 (proj_space, 'projection space')])
+    if reco_space.ndim != geometry.ndim:
+        raise ValueError('dimensions {} of reconstruction space and {} of '
+                         'geometry do not match'.format(
+                             reco_space.ndim, geometry.ndim))
+    vol_arr = _stack_array(vol_stack, reco_space, '`vol_stack`')
+    out = _stack_out(out, vol_arr.shape[0], proj_space)
+
+    num_vols = vol_arr.shape[0]
+    ndim = reco_space.ndim
+    dtype = reco_space.dtype
+    vol_shape = reco_space.shape
+    min_pt = reco_space.min_pt
+    cell_sides = reco_space.cell_sides
+    if chunk_size is None:
+        chunk_size = _chunk_size_for_budget(memory_budget, num_vols,
+                                            vol_shape, dtype, threads)
+
+    with writable_array(out, dtype=dtype, order='C') as out_arr:
+        out_arr[:] = 0
+        out_flat = out_arr.reshape(num_vols, -1)
+
+        # Rays are handled per dominant axis, and the volumes are visited
+        # in padded blocks of slices with that axis moved to the front
+        for axis in range(ndim):
+            slab_size = int(np.prod(_moved_padded_shape(vol_shape,
+                                                        axis)[1:]))
+            for k_range in _slab_blocks(vol_shape, axis, num_vols, dtype,
+                                        memory_budget):
+                vol = _padded_block(vol_arr, axis, k_range, dtype)
+
+                def project_chunk(chunk, axis=axis, k_range=k_range,
+                                  vol=vol):
+                    origins, directions, dom_axes = _chunk_rays(geometry,
+                                                                chunk)
+                    rays = np.nonzero(dom_axes == axis)[0]
+                    if rays.size == 0:
+                        return
+
+                    result = np.zeros((num_vols, rays.size), dtype=dtype)
+                    stencils = _joseph_stencils(
+                        origins[rays], directions[rays], axis, vol_shape,
+                        min_pt, cell_sides, chunk_size, dtype, k_range)
+                    for k0, k1, indices, weights in stencils:
+                        k0, k1 = k0 - k_range[0], k1 - k_range[0]
+                        slab = vol[:, k0 * slab_size:k1 * slab_size]
+                        for ind, wts in zip(indices, weights):
+                            result += np.sum(slab.take(ind, axis=1) * wts,
+                                             axis=2)
+
+                    # Chunks contain disjoint rays, no locking needed
+                    out_flat[:, rays + chunk.start] += result
+
+                chunks = _ray_chunks(geometry, vol_shape, k_range,
+                                     chunk_size)
+                _run_threaded(project_chunk, chunks, threads)
+
+    return out
+
+
+def odl_cpu_back_projector(proj_data, geometry, reco_space, out=None,
+                           threads=None, chunk_size=None,
+                           memory_budget=None):
+    """Run a back-projection on the given data using the CPU.
+
+    The back-projector is the adjoint of `odl_cpu_forward_projector`
+    with respect to the inner products of the given spaces.
+
+    Parameters
+    ----------
+    proj_data : `DiscreteLpElement`
+        Projection data to which the back-projector is applied.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    reco_space : `DiscreteLp`
+        Space to which the calling operator maps.
+    out : ``reco_space`` element, optional
+        Element of the reconstruction space to which the result is written.
+        If ``None``, an element in ``reco_space`` is created.
+    threads : positive int, optional
+        Number of threads to use. Default: number of CPUs
+    chunk_size : positive int, optional
+        Maximum number of sampling points along rays processed at once by
+        each thread. Smaller values reduce the memory overhead.
+        Default: `CHUNK_SIZE`, or derived from ``memory_budget``
+    memory_budget : positive int, optional
+        Approximate number of bytes used for temporary arrays, see
+        `odl_cpu_back_projector_batch`. Default: no limit
+
+    Returns
+    -------
+    out : ``reco_space`` element
+        Reconstruction data resulting from the application of the
+        back-projector. If ``out`` was provided, the returned object is a
+        reference to it.
+    """
+    _check_args(proj_data, geometry, reco_space, 'projection data',
+                'reconstruction space')
+    if out is None:
+        out = reco_space.element()
+    elif out not in reco_space:
+        raise TypeError('`out` {} is neither None nor a '
+                        'DiscreteLpElement instance'.format(out))
+
+    with writable_array(out, dtype=reco_space.dtype,
+                        order='C') as out_arr:
+        odl_cpu_back_projector_batch(
+            np.asarray(proj_data)[None], geometry, proj_data.space,
+            reco_space, out=out_arr[None], threads=threads,
+            chunk_size=chunk_size, memory_budget=memory_budget)
+
+    return out
+
+
+def odl_cpu_back_projector_batch(proj_stack, geometry, proj_space,
+                                 reco_space, out=None, threads=None,
+                                 chunk_size=None, memory_budget=None):
+    """Run back-projections of a stack of projection data using the CPU.
+
+    The ray stencils are computed only once and applied to all data sets,
+    which is considerably faster than back-projecting them one by one.
+
+    Parameters
+    ----------
+    proj_stack : `array-like`
+        Projection data to which the back-projector is applied, of shape
+        ``(K,) + proj_space.shape``.
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    proj_space : `DiscreteLp`
+        Real projection space, the domain of the back-projector.
+    reco_space : `DiscreteLp`
+        Real reconstruction space, the range of the back-projector.
+    out : `numpy.ndarray`, optional
+        Array of shape ``(K,) + reco_space.shape`` to which the result
+        is written.
+    threads : positive int, optional
+        Number of threads to use. Default: number of CPUs
+    chunk_size : positive int, optional
+        Maximum number of sampling points along rays processed at once by
+        each thread. Smaller values reduce the memory overhead.
+        Default: `CHUNK_SIZE`, or derived from ``memory_budget``
+    memory_budget : positive int, optional
+        Approximate number of bytes used for temporary arrays. The result
+        is then accumulated in blocks of slices, each of which is added
+        to ``out`` when finished. Together with ``proj_stack`` and
+        ``out`` given as `numpy.memmap`, this allows to back-project
+        to volumes larger than the main memory. Default: no limit
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        Reconstruction data of shape ``(K,) + reco_space.shape``. If
+        ``out`` was provided, the returned object is a reference to it.
+    """
+    _check_batch_args(geometry, [(proj_space, 'projection space'),
+                                 (reco_space, 'reconstruction space')])
+    if reco_space.ndim != geometry.ndim:
+        raise ValueError('dimensions {} of reconstruction space and {} of '
+                         'geometry do not match'.format(
+                             reco_space.ndim, geometry.ndim))
+    proj_arr = _stack_array(proj_stack, proj_space, '`proj_stack`')
+    out = _stack_out(out, proj_arr.shape[0], reco_space)
+
+    num_vols = proj_arr.shape[0]
+    ndim = reco_space.ndim
+    dtype = reco_space.dtype
+    vol_shape = reco_space.shape
+    min_pt = reco_space.min_pt
+    cell_sides = reco_space.cell_sides
+    if chunk_size is None:
+        chunk_size = _chunk_size_for_budget(memory_budget, num_vols,
+                                            vol_shape, dtype, threads)
+
+    proj_flat = np.ascontiguousarray(proj_arr).reshape(num_vols, -1)
+    lock = threading.Lock()
+
+    out[:] = 0
+    for axis in range(ndim):
+        padded_shape = _moved_padded_shape(vol_shape, axis)
+        slab_size = int(np.prod(padded_shape[1:]))
+        for k_range in _slab_blocks(vol_shape, axis, num_vols, dtype,
+                                    memory_budget):
+            # Padded accumulator for the block, with the axis moved to
+            # the front, created lazily since not all axes are dominant
+            # for some ray
+            accum = []
+
+            def backproject_chunk(chunk, axis=axis, k_range=k_range,
+                                  accum=accum):
+                origins, directions, dom_axes = _chunk_rays(geometry, chunk)
+                rays = np.nonzero(dom_axes == axis)[0]
+                if rays.size == 0:
+                    return
+
+                values = proj_flat[:, rays + chunk.start, None]
+                stencils = _joseph_stencils(
+                    origins[rays], directions[rays], axis, vol_shape,
+                    min_pt, cell_sides, chunk_size, dtype, k_range)
+                for k0, k1, indices, weights in stencils:
+                    k0, k1 = k0 - k_range[0], k1 - k_range[0]
+                    # Offset the indices per data set to use a single
+                    # bincount
+                    size = (k1 - k0) * slab_size
+                    vol_offsets = (np.arange(num_vols) * size)[:, None, None]
+                    contrib = None
+                    for ind, wts in zip(indices, weights):
+                        counts = np.bincount(
+                            (ind + vol_offsets).ravel(),
+                            weights=(wts * values).ravel(),
+                            minlength=num_vols * size)
+                        if contrib is None:
+                            contrib = counts
+                        else:
+                            contrib += counts
+                        # Release before the next call allocates again
+                        del counts
+
+                    with lock:
+                        if not accum:
+                            accum.append(np.zeros(
+                                (num_vols, k_range[1] - k_range[0]) +
+                                padded_shape[1:], dtype=dtype))
+                        accum[0].reshape(num_vols, -1)[
+                            :, k0 * slab_size:k1 * slab_size] += (
+                            contrib.reshape(num_vols, size))
+
+            chunks = _ray_chunks(geometry, vol_shape, k_range,
+                                 chunk_size)
+            _run_threaded(backproject_chunk, chunks, threads)
+
+            if accum:
+                index = [slice(None)] * out.ndim
+                index[axis + 1] = slice(*k_range)
+                unpadded = accum[0][(slice(None),) +
+                                    _moved_padded_slices(vol_shape, axis)]
+                out[tuple(index)] += np.moveaxis(unpadded, 1, axis + 1)
+
+    # Weight the adjoint by appropriate weights
+    scaling_factor = float(proj_space.weighting.const)
+    scaling_factor /= float(reco_space.weighting.const)
+
+    out *= scaling_factor
+
+    return out
+
+
+def odl_cpu_system_matrix(geometry, reco_space, proj_space):
+    """Return the matrix of `odl_cpu_forward_projector` in CSR format.
+
+    Parameters
+    ----------
+    geometry : `Geometry`
+        Geometry defining the tomographic setup.
+    reco_space : `DiscreteLp`
+        Real reconstruction space, the domain of the forward projector.
+    proj_space : `DiscreteLp`
+        Real projection space, the range of the forward projector.
+
+    Returns
+    -------
+    matrix : `scipy.sparse.csr_matrix`
+        Matrix of shape ``(proj_space.size, reco_space.size)`` with
+        data type ``reco_space.dtype``. Rows and columns are ordered
+        according to the storage order of ``proj_space`` and
+        ``reco_space``, respectively, i.e., the matrix acts on the
+        flattened `DiscreteLpElement.ntuple` data.
+
+    Notes
+    -----
+    The number of nonzero entries is about ``2 ** (ndim - 1)`` times
+    the number of rays times the number of slices along the dominant
+    axis, hence the matrix is only practical for small to medium size
+    problems. SciPy uses 32-bit indices whenever this number allows it.
+
+    Examples
+    --------
+    The matrix reproduces the forward projector:
+
+    >>> space = odl.uniform_discr([-1, -1], [1, 1], (4, 4))
+    >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=3)
+    >>> proj_space = odl.uniform_discr_frompartition(geom.partition)
+    >>> matrix = odl_cpu_system_matrix(geom, space, proj_space)
+    >>> matrix.shape
+    (21, 16)
+    >>> x = odl.phantom.cuboid(space)
+    >>> proj = odl_cpu_forward_projector(x, geom, proj_space)
+    >>> np.allclose(matrix.dot(x.ntuple), proj.ntuple)
+    True
+    """
+    if not isinstance(geometry, Geometry):
+        raise TypeError('geometry {!r} is not a `Geometry` instance'
+                        ''.format(geometry))
+    if not odl_cpu_supports(geometry):
+        raise TypeError('geometry {!r} not supported by the `odl_cpu` '
+                        'back-end'.format(geometry))
+    for space, name in [(reco_space, 'reconstruction space'),
+                        (proj_space, 'projection space')]:
+        if not isinstance(space, DiscreteLp):
+            raise TypeError('{} {!r} is not a `DiscreteLp` instance'
+                            ''.format(name, space))
+    if reco_space.ndim != geometry.ndim:
+        raise ValueError('dimensions {} of reconstruction space and {} of '
+                         'geometry do not match'.format(
+                             reco_space.ndim, geometry.ndim))
+
+    ndim = reco_space.ndim
+    dtype = reco_space.dtype
+    vol_shape = reco_space.shape
+    min_pt = reco_space.min_pt
+    cell_sides = reco_space.cell_sides
+
+    rows, cols, values = [], [], []
+    all_slices = (0, max(vol_shape))
+    for chunk in _ray_chunks(geometry, vol_shape, all_slices, CHUNK_SIZE):
+        origins, directions, dom_axes = _chunk_rays(geometry, chunk)
+        for axis in range(ndim):
+            rays = np.nonzero(dom_axes == axis)[0]
+            if rays.size == 0:
+                continue
+
+            ray_idcs = (rays + chunk.start)[:, None]
+            padded_shape = _moved_padded_shape(vol_shape, axis)
+            slab_size = int(np.prod(padded_shape[1:]))
+            stencils = _joseph_stencils(
+                origins[rays], directions[rays], axis, vol_shape,
+                min_pt, cell_sides, CHUNK_SIZE, dtype)
+            for k0, k1, indices, weights in stencils:
+                for ind, wts in zip(indices, weights):
+                    wts = np.broadcast_to(wts, ind.shape)
+                    coords = np.unravel_index((ind + k0 * slab_size).ravel(),
+                                              padded_shape)
+
+                    # Remove the padding and entries without contribution
+                    moved = [coords[0]] + [c - 1 for c in coords[1:]]
+                    keep = wts.ravel() != 0
+                    for c, n in zip(moved[1:], padded_shape[1:]):
+                        keep &= (c >= 0) & (c < n - 3)
+
+                    vol_coords = [c[keep] for c in moved[1:]]
+                    vol_coords.insert(axis, moved[0][keep])
+                    cols.append(np.ravel_multi_index(
+                        vol_coords, vol_shape, order=reco_space.order))
+                    rows.append(
+                        np.broadcast_to(ray_idcs, ind.shape).ravel()[keep])
+                    values.append(wts.ravel()[keep])
+
+    # Rays are enumerated in C order, re-order according to the space
+    rows = np.concatenate(rows)
+    if proj_space.order != 'C':
+        rows = np.ravel_multi_index(np.unravel_index(rows, proj_space.shape),
+                                    proj_space.shape, order=proj_space.order)
+
+    matrix = scipy.sparse.coo_matrix(
+        (np.concatenate(values), (rows, np.concatenate(cols))),
+        shape=(proj_space.size, reco_space.size), dtype=dtype)
+    return matrix.tocsr()
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -20,7 +20,8 @@ from odl.discr import uniform_partition, nonuniform_partition
 from odl.tomo.geometry.detector import Flat1dDetector, Flat2dDetector
 from odl.tomo.geometry.geometry import (
     DivergentBeamGeometry, AxisOrientedGeometry)
-from odl.tomo.util.utility import euler_matrix, transform_system
+from odl.tomo.util.utility import (
+    euler_matrix, transform_system, is_inside_bounds)
 from odl.util import signature_string, indent_rows
 
 
@@ -320,7 +321,11 @@ class FanFlatGeometry(DivergentBeamGeometry):
         return self.detector.axis
 
     def det_axis(self, angle):
-        """Return the detector axis at ``angle``."""
+        """Return the detector axis at ``angle``.
+
+        For an array of angles, the axes are stacked with shape
+        ``angle.shape + (2,)``.
+        """
         return self.rotation_matrix(angle).dot(self.det_axis_init)
 
     @property
@@ -341,14 +346,16 @@ class FanFlatGeometry(DivergentBeamGeometry):
 
         Parameters
         ----------
-        angle : float
-            Rotation angle given in radians, must be contained in
+        angle : float or `array-like`
+            Rotation angle(s) given in radians, must be contained in
             this geometry's `motion_params`.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape ``(2,)``
-            Source position corresponding to the given angle.
+        point : `numpy.ndarray`
+            Source position corresponding to the given angle, with shape
+            ``(2,)`` for a single angle and ``angle.shape + (2,)`` for
+            an array of angles.
 
         Examples
         --------
@@ -362,8 +369,11 @@ class FanFlatGeometry(DivergentBeamGeometry):
         array([ 0., -2.])
         >>> np.allclose(geom.src_position(np.pi / 2), [2, 0])
         True
+        >>> np.allclose(geom.src_position([0, np.pi / 2]), [[0, -2],
+        ...                                                 [2, 0]])
+        True
         """
-        if angle not in self.motion_params:
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} is not in the valid range {}'
                              ''.format(angle, self.motion_params))
 
@@ -387,14 +397,16 @@ class FanFlatGeometry(DivergentBeamGeometry):
 
         Parameters
         ----------
-        angle : float
-            Rotation angle given in radians, must be contained in
+        angle : float or `array-like`
+            Rotation angle(s) given in radians, must be contained in
             this geometry's `motion_params`
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (2,)
-            Detector reference point corresponding to the given angle
+        point : `numpy.ndarray`
+            Detector reference point corresponding to the given angle,
+            with shape ``(2,)`` for a single angle and
+            ``angle.shape + (2,)`` for an array of angles
 
         See Also
         --------
@@ -413,7 +425,7 @@ class FanFlatGeometry(DivergentBeamGeometry):
         >>> np.allclose(geom.det_refpoint(np.pi / 2), [-5, 0])
         True
         """
-        if angle not in self.motion_params:
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} is not in the valid range {}'
                              ''.format(angle, self.motion_params))
 
@@ -434,20 +446,20 @@ class FanFlatGeometry(DivergentBeamGeometry):
 
         Parameters
         ----------
-        angle : float
-            Rotation angle given in radians, must be contained in
+        angle : float or `array-like`
+            Rotation angle(s) given in radians, must be contained in
             this geometry's `motion_params`.
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape (2, 2)
+        rot : `numpy.ndarray`
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
-            expressed in the fixed system.
+            expressed in the fixed system. The shape is ``(2, 2)`` for
+            a single angle and ``angle.shape + (2, 2)`` otherwise.
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} not in the valid range {}'
                              ''.format(angle, self.motion_params))
         return euler_matrix(angle)
@@ -848,7 +860,11 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         return self.motion_grid.coord_vectors[0]
 
     def det_axes(self, angles):
-        """Return the detector axes tuple at ``angle``."""
+        """Return the detector axes tuple at ``angle``.
+
+        For an array of angles, each axis in the tuple is a stack of
+        vectors with shape ``angle_shape + (3,)``.
+        """
         return tuple(self.rotation_matrix(angles).dot(axis)
                      for axis in self.det_axes_init)
 
@@ -866,14 +882,16 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         Parameters
         ----------
-        angle : float
-            Rotation angle given in radians, must be contained in
+        angle : float or `array-like`
+            Rotation angle(s) given in radians, must be contained in
             this geometry's `motion_params`
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (3,)
-            Detector reference point corresponding to the given angle
+        point : `numpy.ndarray`
+            Detector reference point corresponding to the given angle,
+            with shape ``(3,)`` for a single angle and
+            ``angle.shape + (3,)`` for an array of angles
 
         See Also
         --------
@@ -894,8 +912,8 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         >>> np.allclose(geom.det_refpoint(np.pi / 2), [-10, 0, 0.5])
         True
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
+        angle = np.array(angle, dtype=float, copy=False)
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} is not in the valid range {}'
                              ''.format(angle, self.motion_params))
 
@@ -907,8 +925,9 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         # Increment along the rotation axis according to pitch and
         # offset_along_axis
-        pitch_component = self.axis * (self.offset_along_axis +
-                                       self.pitch * angle / (2 * np.pi))
+        pitch_component = np.multiply.outer(
+            self.offset_along_axis + self.pitch * angle / (2 * np.pi),
+            self.axis)
 
         return self.translation + circle_component + pitch_component
 
@@ -926,14 +945,16 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
 
         Parameters
         ----------
-        angle : float
-            Rotation angle given in radians, must be contained in
+        angle : float or `array-like`
+            Rotation angle(s) given in radians, must be contained in
             this geometry's `motion_params`
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (3,)
-            Detector reference point corresponding to the given angle
+        point : `numpy.ndarray`
+            Source position corresponding to the given angle, with
+            shape ``(3,)`` for a single angle and ``angle.shape + (3,)``
+            for an array of angles
 
         See Also
         --------
@@ -953,9 +974,17 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         array([ 0., -5.,  0.])
         >>> np.allclose(geom.src_position(np.pi / 2), [5, 0, 0.5])
         True
+
+        Arrays of angles result in stacked positions:
+
+        >>> angles = np.linspace(0, 4 * np.pi, 9)
+        >>> geom.src_position(angles).shape
+        (9, 3)
+        >>> np.allclose(geom.src_position(angles)[1], [5, 0, 0.5])
+        True
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
+        angle = np.array(angle, dtype=float, copy=False)
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} is not in the valid range {}'
                              ''.format(angle, self.motion_params))
 
@@ -966,8 +995,9 @@ class ConeFlatGeometry(DivergentBeamGeometry, AxisOrientedGeometry):
         circle_component = self.rotation_matrix(angle).dot(origin_to_src_init)
 
         # Increment by pitch (including offset)
-        pitch_component = self.axis * (self.offset_along_axis +
-                                       self.pitch * angle / (np.pi * 2))
+        pitch_component = np.multiply.outer(
+            self.offset_along_axis + self.pitch * angle / (np.pi * 2),
+            self.axis)
 
         return self.translation + circle_component + pitch_component
 
@@ -17,7 +17,8 @@ from builtins import object, super
 import numpy as np
 
 from odl.discr import RectPartition
-from odl.tomo.util.utility import perpendicular_vector
+from odl.tomo.util.utility import (
+    perpendicular_vector, is_inside_bounds)
 from odl.util import indent_rows, signature_string
 
 
@@ -226,20 +227,32 @@ class Flat1dDetector(FlatDetector):
 
         Parameters
         ----------
-        param : `params` element
-            Parameter value where to evaluate the function.
+        param : `params` element or `array-like`
+            Parameter value(s) where to evaluate the function.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (2,)
-            The point on the detector surface corresponding to the
-            given parameters.
+        point : `numpy.ndarray`
+            The point(s) on the detector surface corresponding to the
+            given parameters. The shape is ``(2,)`` for a single
+            parameter and ``param.shape + (2,)`` for an array.
+
+        Examples
+        --------
+        >>> part = odl.uniform_partition(-1, 1, 10)
+        >>> det = Flat1dDetector(part, axis=[1, 0])
+        >>> det.surface(0.5)
+        array([ 0.5,  0. ])
+        >>> det.surface([0, 0.5, 1])
+        array([[ 0. ,  0. ],
+               [ 0.5,  0. ],
+               [ 1. ,  0. ]])
         """
-        param = float(param)
-        if param not in self.params:
+        param = np.array(param, dtype=float, copy=False)
+        if not is_inside_bounds(param, self.params):
             raise ValueError('`param` {} not in the valid range '
                              '{}'.format(param, self.params))
-        return self.axis * param
+        return np.multiply.outer(param, self.axis)
 
     def surface_deriv(self, param=None):
         """Derivative of the surface parametrization.
@@ -330,20 +343,40 @@ class Flat2dDetector(FlatDetector):
 
         Parameters
         ----------
-        param : `params` element
-            Parameter value where to evaluate the function.
+        param : `params` element or sequence of `array-like`'s
+            Parameter value(s) where to evaluate the function. For
+            multiple points, the two components can be arrays, which
+            are broadcast against each other.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (3,)
-            The point on the detector surface corresponding to the
-            given parameters.
+        point : `numpy.ndarray`
+            The point(s) on the detector surface corresponding to the
+            given parameters. The shape is ``(3,)`` for a single
+            parameter and ``bcast_shape + (3,)`` otherwise, where
+            ``bcast_shape`` is the broadcast shape of the components.
+
+        Examples
+        --------
+        >>> part = odl.uniform_partition([-1, -1], [1, 1], (10, 10))
+        >>> det = Flat2dDetector(part, axes=[(1, 0, 0), (0, 0, 1)])
+        >>> det.surface([0.5, 1])
+        array([ 0.5,  0. ,  1. ])
+
+        Evaluating on a sparse grid of parameters:
+
+        >>> pts = det.surface(([0, 1], [[-1], [0], [1]]))
+        >>> pts.shape
+        (3, 2, 3)
+        >>> pts[2, 1]
+        array([ 1.,  0.,  1.])
         """
-        if param not in self.params:
+        if not is_inside_bounds(param, self.params):
             raise ValueError('`param` {} not in the valid range '
                              '{}'.format(param, self.params))
 
-        return sum(float(p) * ax for p, ax in zip(param, self.axes))
+        return sum(np.multiply.outer(np.array(p, dtype=float, copy=False), ax)
+                   for p, ax in zip(param, self.axes))
 
     def surface_deriv(self, param=None):
         """Derivative of the surface parametrization.
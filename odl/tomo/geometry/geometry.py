@@ -14,11 +14,12 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import object
 
+import copy
 import numpy as np
 
 from odl.discr import RectPartition
 from odl.tomo.geometry.detector import Detector
-from odl.tomo.util import axis_rotation_matrix
+from odl.tomo.util import axis_rotation_matrix, is_inside_bounds
 
 
 __all__ = ('Geometry', 'DivergentBeamGeometry', 'AxisOrientedGeometry')
@@ -133,6 +134,38 @@ class Geometry(object):
         """
         return self.motion_partition.append(self.det_partition)
 
+    def motion_subset(self, indices):
+        """Return a copy restricted to a subset of the motion parameters.
+
+        Parameters
+        ----------
+        indices : index expression
+            Object determining which part of `motion_partition` to use,
+            see `RectPartition.__getitem__`.
+
+        Returns
+        -------
+        geometry : `Geometry`
+            Geometry of the same type and configuration, with motion
+            partition ``motion_partition[indices]`` and an empty
+            `implementation_cache`.
+
+        Examples
+        --------
+        >>> apart = odl.uniform_partition(0, np.pi, 6)
+        >>> dpart = odl.uniform_partition(-1, 1, 10)
+        >>> geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+        >>> sub_geom = geom.motion_subset(slice(1, None, 2))
+        >>> np.allclose(sub_geom.angles, geom.angles[1::2])
+        True
+        >>> sub_geom.det_partition == geom.det_partition
+        True
+        """
+        geometry = copy.copy(self)
+        geometry.__motion_partition = self.motion_partition[indices]
+        geometry.__implementation_cache = {}
+        return geometry
+
     @property
     def params(self):
         """Joined parameter set for motion and detector.
@@ -160,14 +193,16 @@ class Geometry(object):
 
         Parameters
         ----------
-        mpar : `motion_params` element
-            Motion parameter for which to calculate the detector
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) for which to calculate the detector
             reference point.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (`ndim`,)
-            The reference point, an `ndim`-dimensional vector.
+        point : `numpy.ndarray`
+            The reference point, an `ndim`-dimensional vector. For an
+            array of motion parameters, the points are stacked along
+            the leading axes, with shape ``mpar_shape + (ndim,)``.
         """
         raise NotImplementedError('abstract method')
 
@@ -176,16 +211,18 @@ class Geometry(object):
 
         Parameters
         ----------
-        mpar : `motion_params` element
-            Motion parameter for which to calculate the rotation matrix.
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) for which to calculate the rotation
+            matrix.
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape (`ndim`, `ndim`)
+        rot : `numpy.ndarray`
             The rotation matrix mapping vectors at the initial state
             to the ones in the state defined by ``mpar``. The rotation
             is extrinsic, i.e., defined in the fixed ("world") coordinate
-            system.
+            system. For an array of motion parameters, the matrices
+            are stacked, with shape ``mpar_shape + (ndim, ndim)``.
         """
         raise NotImplementedError('abstract method')
 
@@ -196,17 +233,19 @@ class Geometry(object):
 
         Parameters
         ----------
-        mpar : `motion_params` element
-            Motion parameter at which to evaluate.
-        dpar : `det_params` element
-            Detector parameter at which to evaluate.
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) at which to evaluate.
+        dpar : `det_params` element or `array-like`
+            Detector parameter(s) at which to evaluate. Arrays of
+            ``mpar`` and ``dpar`` are broadcast against each other.
         normalized : bool, optional
             If ``True``, return a normalized (unit) vector.
 
         Returns
         -------
-        vec : `numpy.ndarray`, shape (`ndim`,)
-            (Unit) vector pointing from the detector to the source
+        vec : `numpy.ndarray`
+            (Unit) vector pointing from the detector to the source,
+            with shape ``bcast_shape + (ndim,)``.
         """
         raise NotImplementedError('abstract method')
 
@@ -219,20 +258,112 @@ class Geometry(object):
 
         Parameters
         ----------
-        mpar : `motion_params` element
-            Motion parameter at which to evaluate.
-        dpar : `det_params` element
-            Detector parameter at which to evaluate.
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) at which to evaluate. For more than one
+            motion parameter per point, the first axis indexes the
+            components.
+        dpar : `det_params` element or `array-like`
+            Detector parameter(s) at which to evaluate. For a detector
+            with more than one parameter, the first axis indexes the
+            components.
 
         Returns
         -------
-        pos : `numpy.ndarray`, shape ``(ndim,)``
-            Source position, an `ndim`-dimensional vector.
+        pos : `numpy.ndarray`
+            Detector point position, an `ndim`-dimensional vector for
+            single parameters. For arrays, the motion and detector
+            parameters are broadcast against each other, and the result
+            has shape ``bcast_shape + (ndim,)``.
+
+        Examples
+        --------
+        Evaluating all combinations of 3 angles and 4 detector
+        parameters by broadcasting:
+
+        >>> apart = odl.uniform_partition(0, np.pi, 10)
+        >>> dpart = odl.uniform_partition(-1, 1, 20)
+        >>> geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+        >>> angles = np.array([0, np.pi / 2, np.pi])
+        >>> dparams = np.array([-1, -0.5, 0.5, 1])
+        >>> pts = geom.det_point_position(angles[:, None], dparams[None, :])
+        >>> pts.shape
+        (3, 4, 2)
+        >>> np.allclose(pts[1, 3], geom.det_point_position(np.pi / 2, 1))
+        True
         """
-        # Offset relative to the detector reference point
-        offset = self.rotation_matrix(mpar).dot(self.detector.surface(dpar))
+        # Offset relative to the detector reference point, with the
+        # rotation matrices broadcast against the surface points
+        rot = self.rotation_matrix(mpar)
+        surf = self.detector.surface(dpar)
+        offset = np.matmul(rot, surf[..., None])[..., 0]
         return self.det_refpoint(mpar) + offset
 
+    @property
+    def vectors(self):
+        """Vector representation of this geometry for all motion parameters.
+
+        Each row corresponds to one point of `motion_grid` (in
+        C order) and consists of the concatenated vectors ::
+
+            (src, d, u)       # if ndim == 2
+            (src, d, u, v)    # if ndim == 3
+
+        with
+
+            - ``src``: the source position for divergent beam geometries,
+              otherwise the ray direction, i.e., the negative of
+              `det_to_src`,
+            - ``d``  : the position of the detector midpoint,
+            - ``u``  : the vector from detector pixel 0 to pixel 1 along
+              the first detector axis,
+            - ``v``  : the same along the second detector axis.
+
+        This layout corresponds to the ``'vec'`` geometries of the ASTRA
+        toolbox, apart from the axis ordering. The array is computed in
+        one vectorized pass, cached in `implementation_cache` and
+        read-only.
+
+        Examples
+        --------
+        >>> apart = odl.uniform_partition(0, np.pi, 4, nodes_on_bdry=True)
+        >>> dpart = odl.uniform_partition(-1, 1, 10)
+        >>> geom = odl.tomo.Parallel2dGeometry(apart, dpart)
+        >>> geom.vectors.shape
+        (4, 6)
+        >>> np.allclose(geom.vectors[0], [0, 1, 0, 1, 0.2, 0])
+        True
+        """
+        vectors = self.implementation_cache.get('vectors', None)
+        if vectors is not None:
+            return vectors
+
+        # Motion parameters with the components along the first axis
+        mpar = self.motion_grid.points().T
+        if self.motion_partition.ndim == 1:
+            mpar = mpar[0]
+
+        mid_pt = self.det_params.mid_pt
+        if self.det_partition.ndim == 1:
+            mid_pt = mid_pt[0]
+        if isinstance(self, DivergentBeamGeometry):
+            src = self.src_position(mpar)
+        else:
+            src = -self.det_to_src(mpar, mid_pt)
+        det_mid = self.det_point_position(mpar, mid_pt)
+
+        rot = self.rotation_matrix(mpar)
+        derivs = self.detector.surface_deriv(mid_pt)
+        if self.det_partition.ndim == 1:
+            derivs = [derivs]
+        px_sizes = self.det_partition.cell_sides
+        det_axes = [rot.dot(deriv) * px_size
+                    for deriv, px_size in zip(derivs, px_sizes)]
+
+        vectors = np.concatenate([src, det_mid] + det_axes, axis=-1)
+        vectors.flags.writeable = False
+        self.implementation_cache['vectors'] = vectors
+        return vectors
+
     @property
     def implementation_cache(self):
         """Dictionary acting as a cache for this geometry.
@@ -262,13 +393,16 @@ class DivergentBeamGeometry(Geometry):
 
         Parameters
         ----------
-        mpar : `motion_params` element
-            Motion parameter for which to calculate the source position.
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) for which to calculate the source
+            position.
 
         Returns
         -------
-        pos : `numpy.ndarray` (shape (`ndim`,))
-            Source position, an `ndim`-dimensional vector.
+        pos : `numpy.ndarray`
+            Source position, an `ndim`-dimensional vector. For an
+            array of motion parameters, the shape is
+            ``mpar_shape + (ndim,)``.
         """
         raise NotImplementedError('abstract method')
 
@@ -283,22 +417,24 @@ class DivergentBeamGeometry(Geometry):
 
         Parameters
         ----------
-        mpar : `motion_params` element
-            Motion parameter at which to evaluate.
-        dpar : `det_params` element
-            Detector parameter at which to evaluate.
+        mpar : `motion_params` element or `array-like`
+            Motion parameter(s) at which to evaluate.
+        dpar : `det_params` element or `array-like`
+            Detector parameter(s) at which to evaluate. Arrays of
+            ``mpar`` and ``dpar`` are broadcast against each other.
         normalized : bool, optional
             If ``True``, return a normalized (unit) vector.
 
         Returns
         -------
-        vec : `numpy.ndarray`, shape (`ndim`,)
-            (Unit) vector pointing from the detector to the source.
+        vec : `numpy.ndarray`
+            (Unit) vector pointing from the detector to the source,
+            with shape ``bcast_shape + (ndim,)``.
         """
-        if mpar not in self.motion_params:
+        if not is_inside_bounds(mpar, self.motion_params):
             raise ValueError('`mpar` {} not in the valid range {}'
                              ''.format(mpar, self.motion_params))
-        if dpar not in self.det_params:
+        if not is_inside_bounds(dpar, self.det_params):
             raise ValueError('`dpar` {} not in the valid range {}'
                              ''.format(dpar, self.det_params))
 
@@ -306,7 +442,7 @@ class DivergentBeamGeometry(Geometry):
 
         if normalized:
             # axis = -1 allows this to be vectorized
-            vec /= np.linalg.norm(vec, axis=-1)
+            vec /= np.linalg.norm(vec, axis=-1, keepdims=True)
 
         return vec
 
@@ -347,20 +483,21 @@ class AxisOrientedGeometry(object):
 
         Parameters
         ----------
-        angle : float
-            Motion parameter given in radians. It must be
+        angle : float or `array-like`
+            Motion parameter(s) given in radians. It must be
             contained in this geometry's `motion_params`.
 
         Returns
         -------
-        rot_mat : `numpy.ndarray`, shape ``(3, 3)``
+        rot_mat : `numpy.ndarray`
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
-            expressed in the fixed system.
+            expressed in the fixed system. The shape is ``(3, 3)`` for
+            a single angle and ``angle.shape + (3, 3)`` otherwise.
         """
-        angle = float(angle)
-        if angle not in self.motion_params:
+        angle = np.array(angle, dtype=float, copy=False)
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} is not in the valid range {}'
                              ''.format(angle, self.motion_params))
 
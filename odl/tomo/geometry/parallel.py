@@ -19,7 +19,8 @@ import numpy as np
 from odl.discr import uniform_partition, nonuniform_partition
 from odl.tomo.geometry.detector import Flat1dDetector, Flat2dDetector
 from odl.tomo.geometry.geometry import Geometry, AxisOrientedGeometry
-from odl.tomo.util import euler_matrix, transform_system
+from odl.tomo.util import (
+    euler_matrix, transform_system, is_inside_bounds)
 from odl.util import signature_string, indent_rows
 
 
@@ -99,14 +100,17 @@ class ParallelBeamGeometry(Geometry):
 
         Parameters
         ----------
-        angle : float
-            Parameter describing the detector rotation, must be
-            contained in `motion_params`.
+        angle : float or `array-like`
+            Parameter(s) describing the detector rotation, must be
+            contained in `motion_params`. For more than one motion
+            parameter, the first axis indexes the components.
 
         Returns
         -------
-        point : `numpy.ndarray`, shape (`ndim`,)
-            The reference point for the given parameter.
+        point : `numpy.ndarray`
+            The reference point for the given parameter, with shape
+            ``(ndim,)`` for a single parameter and
+            ``angle_shape + (ndim,)`` for an array of parameters.
 
         Examples
         --------
@@ -121,6 +125,12 @@ class ParallelBeamGeometry(Geometry):
         >>> np.allclose(geom.det_refpoint(np.pi / 2), [-1, 0])
         True
 
+        Arrays of angles result in stacked points:
+
+        >>> np.allclose(geom.det_refpoint([0, np.pi / 2]), [[0, 1],
+        ...                                                 [-1, 0]])
+        True
+
         In 3d with single rotation axis ``e_z``, we have the same situation,
         except that the vectors have a third component equal to 0:
 
@@ -132,7 +142,7 @@ class ParallelBeamGeometry(Geometry):
         >>> np.allclose(geom.det_refpoint(np.pi / 2), [-1, 0, 0])
         True
         """
-        if angle not in self.motion_params:
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} not in the valid range {}'
                              ''.format(angle, self.motion_params))
         rot_part = self.rotation_matrix(angle).dot(
@@ -150,10 +160,10 @@ class ParallelBeamGeometry(Geometry):
 
         Parameters
         ----------
-        angles : float
+        angles : float or `array-like`
             Euler angles given in radians, must be contained
             in this geometry's `motion_params`
-        dpar : float
+        dpar : float or `array-like`
             Detector parameters, must be contained in this
             geometry's `det_params`
         normalized : bool, optional
@@ -162,8 +172,11 @@ class ParallelBeamGeometry(Geometry):
 
         Returns
         -------
-        vec : `numpy.ndarray`, shape (`ndim`,)
-            Unit vector pointing from the detector to the source
+        vec : `numpy.ndarray`
+            Unit vector pointing from the detector to the source. For
+            arrays of parameters, ``angles`` and ``dpar`` are broadcast
+            against each other, and the shape is
+            ``bcast_shape + (ndim,)``.
 
         Raises
         ------
@@ -171,17 +184,25 @@ class ParallelBeamGeometry(Geometry):
             if ``normalized=False`` is given, since this case is not
             well defined.
         """
-        if angles not in self.motion_params:
+        if not is_inside_bounds(angles, self.motion_params):
             raise ValueError('`angles` {} not in the valid range {}'
                              ''.format(angles, self.motion_params))
-        if dpar not in self.det_params:
+        if not is_inside_bounds(dpar, self.det_params):
             raise ValueError('`dpar` {} not in the valid range '
                              '{}'.format(dpar, self.det_params))
         if not normalized:
             raise NotImplementedError('non-normalized detector to source is '
                                       'not available in parallel case')
 
-        return self.rotation_matrix(angles).dot(self.detector.normal)
+        vec = self.rotation_matrix(angles).dot(self.detector.normal)
+
+        # The direction does not depend on the detector parameter, but
+        # the result is broadcast against it nonetheless
+        if self.det_params.ndim == 1:
+            dpar_shape = np.shape(dpar)
+        else:
+            dpar_shape = np.broadcast_arrays(*dpar)[0].shape
+        return vec + np.zeros(dpar_shape + (1,))
 
 
 class Parallel2dGeometry(ParallelBeamGeometry):
@@ -420,7 +441,11 @@ class Parallel2dGeometry(ParallelBeamGeometry):
         return self.detector.axis
 
     def det_axis(self, angle):
-        """Return the detector axis at ``angle``."""
+        """Return the detector axis at ``angle``.
+
+        For an array of angles, the axes are stacked with shape
+        ``angle.shape + (2,)``.
+        """
         return self.rotation_matrix(angle).dot(self.det_axis_init)
 
     def rotation_matrix(self, angle):
@@ -433,19 +458,20 @@ class Parallel2dGeometry(ParallelBeamGeometry):
 
         Parameters
         ----------
-        angle : float
-            Rotation angle given in radians, must be contained in
+        angle : float or `array-like`
+            Rotation angle(s) given in radians, must be contained in
             this geometry's `motion_params`
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape (2, 2)
+        rot : `numpy.ndarray`
             The rotation matrix mapping the standard basis vectors in
             the fixed ("lab") coordinate system to the basis vectors of
             the local coordinate system of the detector reference point,
-            expressed in the fixed system.
+            expressed in the fixed system. The shape is ``(2, 2)`` for
+            a single angle and ``angle.shape + (2, 2)`` otherwise.
         """
-        if angle not in self.motion_params:
+        if not is_inside_bounds(angle, self.motion_params):
             raise ValueError('`angle` {} not in the valid range {}'
                              ''.format(angle, self.motion_params))
         return euler_matrix(angle)
@@ -713,7 +739,11 @@ class Parallel3dEulerGeometry(ParallelBeamGeometry):
         return self.detector.axes
 
     def det_axes(self, angles):
-        """Return the detector axes tuple at ``angle``."""
+        """Return the detector axes tuple at ``angle``.
+
+        For an array of angles, each axis in the tuple is a stack of
+        vectors with shape ``angle_shape + (3,)``.
+        """
         return tuple(self.rotation_matrix(angles).dot(axis)
                      for axis in self.det_axes_init)
 
@@ -724,17 +754,20 @@ class Parallel3dEulerGeometry(ParallelBeamGeometry):
         ----------
         angles : `array-like`
             Angles in radians defining the rotation, must be contained
-            in this geometry's ``motion_params``
+            in this geometry's ``motion_params``. To compute several
+            matrices at once, the entries can be arrays, which are
+            broadcast against each other.
 
         Returns
         -------
-        rot : `numpy.ndarray`, shape ``(3, 3)``
+        rot : `numpy.ndarray`
             Rotation matrix from the initial configuration of detector
             position and axes (all angles zero) to the configuration at
             ``angles``. The rotation is extrinsic, i.e., expressed in the
-            "world" coordinate system.
+            "world" coordinate system. The shape is ``(3, 3)`` for a
+            single set of angles and ``bcast_shape + (3, 3)`` otherwise.
         """
-        if angles not in self.motion_params:
+        if not is_inside_bounds(angles, self.motion_params):
             raise ValueError('`angles` {} not in the valid range {}'
                              ''.format(angles, self.motion_params))
         return euler_matrix(*angles)
@@ -1029,7 +1062,11 @@ class Parallel3dAxisGeometry(ParallelBeamGeometry, AxisOrientedGeometry):
         return self.detector.axes
 
     def det_axes(self, angles):
-        """Return the detector axes tuple at ``angle``."""
+        """Return the detector axes tuple at ``angle``.
+
+        For an array of angles, each axis in the tuple is a stack of
+        vectors with shape ``angle_shape + (3,)``.
+        """
         return tuple(self.rotation_matrix(angles).dot(axis)
                      for axis in self.det_axes_init)
 
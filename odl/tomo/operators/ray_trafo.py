@@ -18,21 +18,25 @@ import numpy as np
 import warnings
 
 from odl.discr import DiscreteLp
-from odl.operator import Operator
-from odl.space import FunctionSpace
+from odl.operator import Operator, MatrixOperator
+from odl.space import FunctionSpace, ProductSpace, ProductSpaceElement
 from odl.tomo.geometry import (
     Geometry, Parallel2dGeometry, Parallel3dAxisGeometry)
 from odl.space.weighting import NoWeighting, ConstWeighting
 from odl.tomo.backends import (
     ASTRA_AVAILABLE, ASTRA_CUDA_AVAILABLE, SKIMAGE_AVAILABLE,
     astra_supports, ASTRA_VERSION,
-    astra_cpu_forward_projector, astra_cpu_back_projector,
+    AstraCpuProjectorImpl, AstraCpuBackProjectorImpl,
     AstraCudaProjectorImpl, AstraCudaBackProjectorImpl,
-    skimage_radon_forward, skimage_radon_back_projector)
+    skimage_radon_forward, skimage_radon_back_projector,
+    ODL_CPU_AVAILABLE, odl_cpu_supports,
+    odl_cpu_forward_projector, odl_cpu_back_projector, odl_cpu_system_matrix,
+    odl_cpu_forward_projector_batch, odl_cpu_back_projector_batch)
 
 
 ASTRA_CPU_AVAILABLE = ASTRA_AVAILABLE
-_SUPPORTED_IMPL = ('astra_cpu', 'astra_cuda', 'skimage')
+_SUPPORTED_IMPL = ('astra_cpu', 'astra_cuda', 'skimage', 'odl_cpu',
+                   'sparse_matrix')
 _AVAILABLE_IMPLS = []
 if ASTRA_CPU_AVAILABLE:
     _AVAILABLE_IMPLS.append('astra_cpu')
@@ -40,11 +44,38 @@ if ASTRA_CUDA_AVAILABLE:
     _AVAILABLE_IMPLS.append('astra_cuda')
 if SKIMAGE_AVAILABLE:
     _AVAILABLE_IMPLS.append('skimage')
+if ODL_CPU_AVAILABLE:
+    _AVAILABLE_IMPLS.append('odl_cpu')
+    _AVAILABLE_IMPLS.append('sparse_matrix')
 
 
 __all__ = ('RayTransform', 'RayBackProjection')
 
 
+def _angle_subset_slices(num_angles, n, scheme):
+    """Return slices along the angle axis defining ``n`` subsets."""
+    n, n_in = int(n), n
+    if n != n_in or not 1 <= n <= num_angles:
+        raise ValueError('`n` must be an integer between 1 and the number '
+                         'of angles {}, got {}'.format(num_angles, n_in))
+
+    scheme, scheme_in = str(scheme).lower(), scheme
+    if scheme == 'contiguous':
+        bounds = [(i * num_angles) // n for i in range(n + 1)]
+        return [slice(bounds[i], bounds[i + 1]) for i in range(n)]
+    elif scheme == 'interleaved':
+        return [slice(i, None, n) for i in range(n)]
+    elif scheme == 'golden':
+        # Interleaved subsets visited in the order of the golden ratio
+        # sequence, such that consecutive subsets are far apart
+        golden_ratio = (1 + np.sqrt(5)) / 2
+        positions = np.mod(np.arange(n) * golden_ratio, 1)
+        offsets = np.argsort(np.argsort(positions))
+        return [slice(i, None, n) for i in offsets]
+    else:
+        raise ValueError('`scheme` {!r} not understood'.format(scheme_in))
+
+
 class RayTransformBase(Operator):
 
     """Base class for ray transforms containing common attributes."""
@@ -66,13 +97,20 @@ class RayTransformBase(Operator):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
+        impl : str, optional
             Implementation back-end for the transform. Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
+            - ``'odl_cpu'``: Multithreaded NumPy implementation of
+              Joseph's method, 2D or 3D parallel and flat detector cone
+              beam geometries with a single rotation angle.
+            - ``'sparse_matrix'``: The ``'odl_cpu'`` projector assembled
+              once into a sparse matrix, which is cached in
+              `Geometry.implementation_cache`. Fast repeated evaluation
+              for small and medium size problems.
 
             For the default ``None``, the fastest available back-end is
             used.
@@ -91,6 +129,12 @@ class RayTransformBase(Operator):
             and on the CPU, since a full volume and a projection dataset
             are stored. That may be prohibitive in 3D.
             Default: True
+        memory_budget : positive int, optional
+            Approximate number of bytes used for temporary arrays by the
+            ``'odl_cpu'`` back-end, which then processes the volume in
+            blocks of slices. See Notes for volumes larger than the main
+            memory.
+            Default: no limit
 
         Notes
         -----
@@ -125,13 +169,16 @@ class RayTransformBase(Operator):
                                'check the install docs')
         impl = kwargs.pop('impl', None)
         if impl is None:
-            # Select fastest available
+            # Select fastest available that supports the geometry
             if ASTRA_CUDA_AVAILABLE:
                 impl = 'astra_cuda'
-            elif ASTRA_AVAILABLE:
+            elif ASTRA_AVAILABLE and geometry.ndim == 2:
                 impl = 'astra_cpu'
-            elif SKIMAGE_AVAILABLE:
+            elif (SKIMAGE_AVAILABLE and
+                  isinstance(geometry, Parallel2dGeometry)):
                 impl = 'skimage'
+            elif ODL_CPU_AVAILABLE:
+                impl = 'odl_cpu'
             else:
                 raise RuntimeError('bad impl')
         else:
@@ -144,6 +191,14 @@ class RayTransformBase(Operator):
         # Cache for input/output arrays of transforms
         self.use_cache = kwargs.pop('use_cache', True)
 
+        memory_budget = kwargs.pop('memory_budget', None)
+        if memory_budget is not None:
+            memory_budget, budget_in = int(memory_budget), memory_budget
+            if memory_budget <= 0:
+                raise ValueError('`memory_budget` must be positive, got {}'
+                                 ''.format(budget_in))
+        self.memory_budget = memory_budget
+
         # Sanity checks
         if impl.startswith('astra'):
             if geometry.ndim > 2 and impl.endswith('cpu'):
@@ -157,18 +212,17 @@ class RayTransformBase(Operator):
                     not astra_supports('par3d_det_mid_pt_perp_to_axis')):
                 axis = geometry.axis
                 mid_pt = geometry.det_params.mid_pt
-                for i, angle in enumerate(geometry.angles):
-                    if abs(np.dot(axis,
-                                  geometry.det_to_src(angle, mid_pt))) < 1e-4:
-                        warnings.warn(
-                            'angle {}: detector midpoint normal {} is '
-                            'perpendicular to the geometry axis {} in '
-                            '`Parallel3dAxisGeometry`; this is broken in '
-                            'ASTRA v{}, please upgrade to v1.8 or later'
-                            ''.format(i, geometry.det_to_src(angle, mid_pt),
-                                      axis, ASTRA_VERSION),
-                            RuntimeWarning)
-                        break
+                normals = geometry.det_to_src(geometry.angles, mid_pt)
+                perp = np.abs(normals.dot(axis)) < 1e-4
+                if np.any(perp):
+                    i = np.argmax(perp)
+                    warnings.warn(
+                        'angle {}: detector midpoint normal {} is '
+                        'perpendicular to the geometry axis {} in '
+                        '`Parallel3dAxisGeometry`; this is broken in '
+                        'ASTRA v{}, please upgrade to v1.8 or later'
+                        ''.format(i, normals[i], axis, ASTRA_VERSION),
+                        RuntimeWarning)
 
         elif impl == 'skimage':
             if not isinstance(geometry, Parallel2dGeometry):
@@ -190,6 +244,11 @@ class RayTransformBase(Operator):
                 raise ValueError('`{}.extent` must have equal entries, '
                                  'got {}'.format(reco_name, extent))
 
+        elif impl in ('odl_cpu', 'sparse_matrix'):
+            if not odl_cpu_supports(geometry):
+                raise TypeError('{!r} backend does not support geometry '
+                                '{!r}'.format(impl, geometry))
+
         if reco_space.ndim != geometry.ndim:
             raise ValueError('`{}.ndim` not equal to `geometry.ndim`: '
                              '{} != {}'.format(reco_name, reco_space.ndim,
@@ -276,6 +335,10 @@ class RayTransformBase(Operator):
         # Reserve name for cached properties (used for efficiency reasons)
         self._adjoint = None
         self._astra_wrapper = None
+        self._sensitivity = None
+        self._subset_ops = {}
+        # Parent operator and angle indices for operators on angle subsets
+        self._subset_parent = None
 
         # Extra kwargs that can be reused for adjoint etc. These must
         # be retrieved with `get` instead of `pop` above.
@@ -297,6 +360,47 @@ class RayTransformBase(Operator):
         """Geometry of this operator."""
         return self.__geometry
 
+    def _matrix_operators(self, reco_space, proj_space):
+        """Return forward and backward matrix operators for the spaces.
+
+        The system matrix is assembled on first use and stored in
+        ``geometry.implementation_cache``, such that it is shared between
+        the ray transform and its adjoint.
+
+        Returns
+        -------
+        forward, backward : `MatrixOperator`
+            Operators acting on the flat data of the real spaces.
+            ``backward`` is the transposed matrix operator and does not
+            include the weighting of the spaces.
+        """
+        cache = self.geometry.implementation_cache.setdefault(
+            'sparse_matrix', {})
+        key = (reco_space, proj_space)
+        if key not in cache:
+            if self._subset_parent is None:
+                matrix = odl_cpu_system_matrix(self.geometry, reco_space,
+                                               proj_space)
+            else:
+                # Take the rows for the angle subset from the matrix of
+                # the parent operator instead of assembling a new one
+                parent, indices = self._subset_parent
+                parent_fwd, _ = parent._matrix_operators(
+                    parent.domain.real_space, parent.range.real_space)
+                parent_proj = parent.range.real_space
+                rows = np.arange(parent_proj.size).reshape(
+                    parent_proj.shape, order=parent_proj.order)[indices]
+                matrix = parent_fwd.matrix[rows.ravel(order=proj_space.order)]
+            forward = MatrixOperator(matrix, domain=reco_space.dspace,
+                                     range=proj_space.dspace)
+            backward = MatrixOperator(matrix.T, domain=proj_space.dspace,
+                                      range=reco_space.dspace)
+            if not self.use_cache:
+                return forward, backward
+            cache[key] = (forward, backward)
+
+        return cache[key]
+
     def _call(self, x, out=None):
         """Return ``self(x[, out])``."""
         if self.domain.is_rn:
@@ -317,6 +421,145 @@ class RayTransformBase(Operator):
         else:
             raise RuntimeError('bad domain {!r}'.format(self.domain))
 
+    def apply_batch(self, x_stack, out=None):
+        """Evaluate the operator on a stack of inputs.
+
+        All inputs are processed with a single set-up of the back-end.
+        For ``impl='odl_cpu'`` and ``impl='sparse_matrix'``, the inputs
+        are processed simultaneously, which is considerably faster than
+        evaluating the operator for each input separately. For complex
+        spaces, the real and imaginary parts are processed as two
+        batches.
+
+        The inputs are gathered in one array of shape
+        ``(K,) + domain.shape``, which is not copied if ``x_stack`` is
+        such an array or an element of a contiguous power space, see
+        `ProductSpace`. Likewise, results are written directly to ``out``
+        if it is an element of a contiguous power space.
+
+        Parameters
+        ----------
+        x_stack : `ProductSpaceElement` or `array-like`
+            Inputs to which the operator is applied, either an element
+            of a power space of `domain`, a sequence of `domain` elements
+            or an array of shape ``(K,) + domain.shape``. Arrays of
+            shape ``(K, domain.size)`` are interpreted as flattened
+            inputs in the axis order of `domain`.
+        out : `ProductSpaceElement`, optional
+            Element of ``range ** K``, optionally with contiguous
+            storage, to which the results are written.
+
+        Returns
+        -------
+        out : `ProductSpaceElement`
+            Results in ``range ** K``. If ``out`` was provided, the
+            returned object is a reference to it.
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+        >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=6)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geom)
+        >>> x = odl.phantom.cuboid(space)
+        >>> y = ray_trafo.apply_batch([x, 2 * x, 3 * x])
+        >>> y.space == ray_trafo.range ** 3
+        True
+        >>> np.allclose(y[2], 3 * ray_trafo(x))
+        True
+        """
+        x_arr = self._batch_array(x_stack)
+        num = x_arr.shape[0]
+        if num == 0:
+            raise ValueError('`x_stack` contains no inputs')
+        out_space = ProductSpace(self.range, num)
+
+        if out is not None and not (
+                isinstance(out, ProductSpaceElement) and
+                out.space.shape == (num,) and
+                out.space.is_power_space and out.space[0] == self.range):
+            raise TypeError('`out` {!r} not an element of {!r}'
+                            ''.format(out, out_space))
+
+        if out is None or not out.space.is_contiguous:
+            out_arr = np.empty((num,) + self.range.shape,
+                               dtype=self.range.dtype)
+        else:
+            out_arr = out.asarray()  # view
+
+        if self.domain.is_rn:
+            self._call_real_batch(x_arr, out_arr)
+        elif self.domain.is_cn:
+            self._call_real_batch(x_arr.real, out_arr.real)
+            self._call_real_batch(x_arr.imag, out_arr.imag)
+        else:
+            raise RuntimeError('bad domain {!r}'.format(self.domain))
+
+        if out is None:
+            # The parts are views into `out_arr`
+            return out_space.element([self.range.element(res)
+                                      for res in out_arr])
+        elif not out.space.is_contiguous:
+            for out_part, res in zip(out, out_arr):
+                out_part[:] = res
+        return out
+
+    def _batch_array(self, x_stack):
+        """Return ``x_stack`` as array of shape ``(K,) + domain.shape``.
+
+        The array is a view if possible and copied at most once.
+        """
+        if isinstance(x_stack, ProductSpaceElement):
+            if not x_stack.space.is_power_space:
+                raise TypeError('`x_stack` {!r} not an element of a power '
+                                'space'.format(x_stack))
+            x_arr = x_stack.asarray()
+        elif isinstance(x_stack, np.ndarray):
+            x_arr = x_stack
+        else:
+            x_arr = np.empty((len(x_stack),) + self.domain.shape,
+                             dtype=self.domain.dtype)
+            for x, x_part in zip(x_stack, x_arr):
+                x_part[:] = self.domain.element(x)
+
+        x_arr = np.asarray(x_arr, dtype=self.domain.dtype)
+        if (x_arr.ndim == 2 and self.domain.ndim > 1 and
+                x_arr.shape[1] == self.domain.size):
+            # Flattened inputs, e.g., from `numpy.asarray` of a power
+            # space element, reshaped in the axis order of the domain
+            shape = self.domain.shape
+            if self.domain.order == 'C':
+                x_arr = x_arr.reshape((-1,) + shape)
+            else:
+                x_arr = x_arr.reshape((-1,) + shape[::-1]).transpose(
+                    (0,) + tuple(range(len(shape), 0, -1)))
+        if x_arr.shape[1:] != self.domain.shape:
+            raise ValueError('`x_stack` must have shape (K,) + {}, got {}'
+                             ''.format(self.domain.shape, x_arr.shape))
+        return x_arr
+
+    def _call_real_batch(self, x_stack, out):
+        """Evaluate in real space for a stack, writing to array ``out``.
+
+        This default implementation evaluates `_call_real` for each
+        input, re-using the back-end set-up if ``use_cache`` is enabled.
+        """
+        real_domain = self.domain.real_space
+        for x, y in zip(x_stack, out):
+            y[:] = self._call_real(real_domain.element(x), None)
+
+    @staticmethod
+    def _matrix_batch(matrix, x_stack, domain, range, out):
+        """Write the matrix product with a stack of inputs to ``out``.
+
+        All inputs are flattened into the columns of one dense matrix,
+        such that a single sparse-dense product is computed.
+        """
+        flat = np.stack([x.ravel(order=domain.order) for x in x_stack],
+                        axis=1)
+        result = matrix.dot(flat)
+        for y, res in zip(out, result.T):
+            y[:] = res.reshape(range.shape, order=range.order)
+
 
 class RayTransform(RayTransformBase):
 
@@ -336,13 +579,20 @@ class RayTransform(RayTransformBase):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
+        impl : str, optional
             Implementation back-end for the transform. Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
+            - ``'odl_cpu'``: Multithreaded NumPy implementation of
+              Joseph's method, 2D or 3D parallel and flat detector cone
+              beam geometries with a single rotation angle.
+            - ``'sparse_matrix'``: The ``'odl_cpu'`` projector assembled
+              once into a sparse matrix, which is cached in
+              `Geometry.implementation_cache`. Fast repeated evaluation
+              for small and medium size problems.
 
             For the default ``None``, the fastest available back-end is
             used.
@@ -360,11 +610,29 @@ class RayTransform(RayTransformBase):
             and on the CPU, since a full volume and a projection dataset
             are stored. That may be prohibitive in 3D.
             Default: True
+        memory_budget : positive int, optional
+            Approximate number of bytes used for temporary arrays by the
+            ``'odl_cpu'`` back-end, which then processes the volume in
+            blocks of slices. See Notes for volumes larger than the main
+            memory.
+            Default: no limit
 
         Notes
         -----
         The ASTRA backend is faster if data is given with ``dtype`` 'float32'
         and storage order 'C'. Otherwise copies will be needed.
+
+        With ``impl='odl_cpu'`` and a ``memory_budget``, only the volume
+        and projection data themselves need to be stored as a whole.
+        If they are too large for the main memory, they can be stored as
+        `numpy.memmap` arrays wrapped with ``space.element(memmap)`` and
+        passed as input and ``out`` argument, e.g., for ``reco_space``
+        with ``dtype`` 'float32' and storage order 'C'::
+
+            vol_arr = np.memmap('vol.dat', dtype='float32', mode='w+',
+                                shape=reco_space.shape)
+            vol = reco_space.element(vol_arr)
+            ray_trafo.adjoint(proj_data, out=vol)
         """
         range = kwargs.pop('range', None)
         super().__init__(reco_space=domain, proj_space=range,
@@ -373,37 +641,64 @@ class RayTransform(RayTransformBase):
     def _call_real(self, x_real, out_real):
         """Real-space forward projection for the current set-up.
 
-        This method also sets ``self._astra_projector`` for
-        ``impl='astra_cuda'`` and enabled cache.
+        This method also sets ``self._astra_wrapper`` for
+        ``impl='astra_cpu'`` or ``impl='astra_cuda'`` and enabled cache.
         """
         if self.impl.startswith('astra'):
             backend, data_impl = self.impl.split('_')
 
             if data_impl == 'cpu':
-                return astra_cpu_forward_projector(
-                    x_real, self.geometry, self.range.real_space, out_real)
-
+                wrapper_cls = AstraCpuProjectorImpl
             elif data_impl == 'cuda':
-                if self._astra_wrapper is None:
-                    astra_wrapper = AstraCudaProjectorImpl(
-                        self.geometry, self.domain.real_space,
-                        self.range.real_space)
-                    if self.use_cache:
-                        self._astra_wrapper = astra_wrapper
-                else:
-                    astra_wrapper = self._astra_wrapper
-
-                return astra_wrapper.call_forward(x_real, out_real)
+                wrapper_cls = AstraCudaProjectorImpl
             else:
                 # Should never happen
                 raise RuntimeError('bad `impl` {!r}'.format(self.impl))
+
+            if self._astra_wrapper is None:
+                astra_wrapper = wrapper_cls(self.geometry,
+                                            self.domain.real_space,
+                                            self.range.real_space)
+                if self.use_cache:
+                    self._astra_wrapper = astra_wrapper
+            else:
+                astra_wrapper = self._astra_wrapper
+
+            return astra_wrapper.call_forward(x_real, out_real)
         elif self.impl == 'skimage':
             return skimage_radon_forward(x_real, self.geometry,
                                          self.range.real_space, out_real)
+        elif self.impl == 'odl_cpu':
+            return odl_cpu_forward_projector(
+                x_real, self.geometry, self.range.real_space, out_real,
+                memory_budget=self.memory_budget)
+        elif self.impl == 'sparse_matrix':
+            forward, _ = self._matrix_operators(self.domain.real_space,
+                                                self.range.real_space)
+            if out_real is None:
+                out_real = self.range.real_space.element()
+            forward(x_real.ntuple, out=out_real.ntuple)
+            return out_real
         else:
             # Should never happen
             raise RuntimeError('bad `impl` {!r}'.format(self.impl))
 
+    def _call_real_batch(self, x_stack, out):
+        """Real-space forward projection of a stack of volumes."""
+        if self.impl == 'odl_cpu':
+            odl_cpu_forward_projector_batch(
+                x_stack, self.geometry, self.domain.real_space,
+                self.range.real_space, out=out,
+                memory_budget=self.memory_budget)
+        elif self.impl == 'sparse_matrix':
+            forward, _ = self._matrix_operators(self.domain.real_space,
+                                                self.range.real_space)
+            self._matrix_batch(forward.matrix, x_stack,
+                               self.domain.real_space,
+                               self.range.real_space, out)
+        else:
+            super()._call_real_batch(x_stack, out)
+
     @property
     def adjoint(self):
         """Adjoint of this operator.
@@ -420,9 +715,160 @@ class RayTransform(RayTransformBase):
         self._adjoint = RayBackProjection(self.domain, self.geometry,
                                           impl=self.impl,
                                           use_cache=self.use_cache,
+                                          memory_budget=self.memory_budget,
                                           **kwargs)
+        self._adjoint._subset_parent = self._subset_parent
         return self._adjoint
 
+    @property
+    def sensitivity(self):
+        """Back-projection ``adjoint(range.one())`` of constant data.
+
+        The sensitivity image is computed on first access and cached. It
+        is the ``A^T 1`` term in `mlem` and `osmlem`, e.g.::
+
+            subset_ops = ray_trafo.subsets(10)
+            osmlem(subset_ops, x, data_parts, niter,
+                   sensitivities=[op.sensitivity for op in subset_ops])
+        """
+        if self._sensitivity is not None:
+            return self._sensitivity
+
+        sensitivity = self.adjoint(self.range.one())
+        if self.use_cache:
+            self._sensitivity = sensitivity
+        return sensitivity
+
+    def subsets(self, n, scheme='interleaved'):
+        """Return ray transforms on ``n`` disjoint subsets of the angles.
+
+        The returned operators can be used in ordered subsets methods
+        like `osmlem` or `kaczmarz`. Their ranges have the same weighting
+        as `range`, hence the sum of their adjoints applied to the parts
+        of some projection data is the adjoint of this operator applied
+        to the full data.
+
+        The subset operators are created once and cached in this
+        operator, such that their back-end set-up, adjoints and
+        `sensitivity` images are reused in subsequent calls. With
+        ``impl='sparse_matrix'``, their system matrices are row blocks
+        of the matrix of this operator, which is assembled only once.
+
+        Parameters
+        ----------
+        n : positive int
+            Number of subsets, at most the number of angles.
+        scheme : {'interleaved', 'contiguous', 'golden'}, optional
+            Way of assigning the angles to the subsets:
+
+            - ``'interleaved'``: Subset ``i`` contains every ``n``-th
+              angle, starting from angle ``i``.
+            - ``'contiguous'``: Each subset contains a block of
+              consecutive angles.
+            - ``'golden'``: Same subsets as ``'interleaved'``, ordered
+              using the golden ratio, such that consecutive subsets
+              differ strongly in their angles.
+
+        Returns
+        -------
+        subset_ops : list of `RayTransform`
+            Ray transforms with geometries restricted to the subsets,
+            see `Geometry.motion_subset`.
+
+        See Also
+        --------
+        split_data : Corresponding parts of projection data
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+        >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=6)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geom)
+        >>> subset_ops = ray_trafo.subsets(3)
+        >>> len(subset_ops)
+        3
+        >>> np.allclose(subset_ops[1].geometry.angles, geom.angles[1::3])
+        True
+        >>> ray_trafo.subsets(3)[1] is subset_ops[1]
+        True
+        """
+        slices = _angle_subset_slices(self.geometry.motion_partition.shape[0],
+                                      n, scheme)
+        return [self._angle_subset(slc) for slc in slices]
+
+    def _angle_subset(self, indices):
+        """Return the ray transform restricted to the angles ``indices``.
+
+        The range of the returned operator has the same weighting as
+        `range`, see `subsets`. For slices, the operator is cached.
+        """
+        if isinstance(indices, slice):
+            key = (indices.start, indices.stop, indices.step)
+            subset_op = self._subset_ops.get(key, None)
+            if subset_op is None:
+                subset_op = self._new_angle_subset(indices)
+                if self.use_cache:
+                    self._subset_ops[key] = subset_op
+            return subset_op
+        else:
+            return self._new_angle_subset(indices)
+
+    def _new_angle_subset(self, indices):
+        """Create the ray transform restricted to the angles ``indices``."""
+        geometry = self.geometry.motion_subset(indices)
+        ran = DiscreteLp(
+            FunctionSpace(geometry.params, out_dtype=self.range.dtype),
+            geometry.partition,
+            self.range.dspace_type(geometry.partition.size,
+                                   weighting=self.range.weighting,
+                                   dtype=self.range.dtype),
+            exponent=self.range.exponent, interp=self.range.interp,
+            order=self.range.order, axis_labels=self.range.axis_labels)
+        kwargs = self._extra_kwargs.copy()
+        kwargs['range'] = ran
+        subset_op = RayTransform(self.domain, geometry, impl=self.impl,
+                                 use_cache=self.use_cache,
+                                 memory_budget=self.memory_budget, **kwargs)
+        subset_op._subset_parent = (self, indices)
+        return subset_op
+
+    def split_data(self, data, n, scheme='interleaved'):
+        """Return the parts of ``data`` corresponding to `subsets`.
+
+        Parameters
+        ----------
+        data : `range` `element-like`
+            Projection data to split.
+        n : positive int
+            Number of subsets.
+        scheme : {'interleaved', 'contiguous', 'golden'}, optional
+            Way of assigning the angles to the subsets, see `subsets`.
+
+        Returns
+        -------
+        data_parts : list of `DiscreteLpElement`
+            Elements in the ranges of ``self.subsets(n, scheme)``. For the
+            ``'contiguous'`` scheme and ``data`` stored contiguously in
+            C order, the parts are views into ``data`` and no data is
+            copied. For the other schemes, the angles of a subset are not
+            adjacent in memory, hence the parts are copies.
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr([-1, -1], [1, 1], (10, 10))
+        >>> geom = odl.tomo.parallel_beam_geometry(space, num_angles=6)
+        >>> ray_trafo = odl.tomo.RayTransform(space, geom)
+        >>> data = ray_trafo(odl.phantom.cuboid(space))
+        >>> parts = ray_trafo.split_data(data, 3, scheme='contiguous')
+        >>> np.allclose(parts[1], data.asarray()[2:4])
+        True
+        """
+        slices = _angle_subset_slices(self.geometry.motion_partition.shape[0],
+                                      n, scheme)
+        data_arr = self.range.element(data).asarray()
+        return [self._angle_subset(slc).range.element(data_arr[slc])
+                for slc in slices]
+
 
 class RayBackProjection(RayTransformBase):
     """Adjoint of the discrete Ray transform between L^p spaces."""
@@ -441,13 +887,20 @@ class RayBackProjection(RayTransformBase):
 
         Other Parameters
         ----------------
-        impl : {`None`, 'astra_cuda', 'astra_cpu', 'skimage'}, optional
+        impl : str, optional
             Implementation back-end for the transform. Supported back-ends:
 
             - ``'astra_cuda'``: ASTRA toolbox, using CUDA, 2D or 3D
             - ``'astra_cpu'``: ASTRA toolbox using CPU, only 2D
             - ``'skimage'``: scikit-image, only 2D parallel with square
               reconstruction space.
+            - ``'odl_cpu'``: Multithreaded NumPy implementation of
+              Joseph's method, 2D or 3D parallel and flat detector cone
+              beam geometries with a single rotation angle.
+            - ``'sparse_matrix'``: The ``'odl_cpu'`` projector assembled
+              once into a sparse matrix, which is cached in
+              `Geometry.implementation_cache`. Fast repeated evaluation
+              for small and medium size problems.
 
             For the default ``None``, the fastest available back-end is
             used.
@@ -465,11 +918,29 @@ class RayBackProjection(RayTransformBase):
             and on the CPU, since a full volume and a projection dataset
             are stored. That may be prohibitive in 3D.
             Default: True
+        memory_budget : positive int, optional
+            Approximate number of bytes used for temporary arrays by the
+            ``'odl_cpu'`` back-end, which then processes the volume in
+            blocks of slices. See Notes for volumes larger than the main
+            memory.
+            Default: no limit
 
         Notes
         -----
         The ASTRA backend is faster if data is given with ``dtype`` 'float32'
         and storage order 'C'. Otherwise copies will be needed.
+
+        With ``impl='odl_cpu'`` and a ``memory_budget``, only the volume
+        and projection data themselves need to be stored as a whole.
+        If they are too large for the main memory, they can be stored as
+        `numpy.memmap` arrays wrapped with ``space.element(memmap)`` and
+        passed as input and ``out`` argument, e.g., for ``reco_space``
+        with ``dtype`` 'float32' and storage order 'C'::
+
+            vol_arr = np.memmap('vol.dat', dtype='float32', mode='w+',
+                                shape=reco_space.shape)
+            vol = reco_space.element(vol_arr)
+            ray_trafo.adjoint(proj_data, out=vol)
         """
         domain = kwargs.pop('domain', None)
         super().__init__(reco_space=range, proj_space=domain,
@@ -478,38 +949,75 @@ class RayBackProjection(RayTransformBase):
     def _call_real(self, x_real, out_real):
         """Real-space back-projection for the current set-up.
 
-        This method also sets ``self._astra_backprojector`` for
-        ``impl='astra_cuda'`` and enabled cache.
+        This method also sets ``self._astra_wrapper`` for
+        ``impl='astra_cpu'`` or ``impl='astra_cuda'`` and enabled cache.
         """
         if self.impl.startswith('astra'):
             backend, data_impl = self.impl.split('_')
             if data_impl == 'cpu':
-                return astra_cpu_back_projector(x_real, self.geometry,
-                                                self.range.real_space,
-                                                out_real)
+                wrapper_cls = AstraCpuBackProjectorImpl
             elif data_impl == 'cuda':
-                if self._astra_wrapper is None:
-                    astra_wrapper = AstraCudaBackProjectorImpl(
-                        self.geometry, self.range.real_space,
-                        self.domain.real_space)
-                    if self.use_cache:
-                        self._astra_wrapper = astra_wrapper
-                else:
-                    astra_wrapper = self._astra_wrapper
-
-                return astra_wrapper.call_backward(x_real, out_real)
+                wrapper_cls = AstraCudaBackProjectorImpl
             else:
                 # Should never happen
                 raise RuntimeError('bad `impl` {!r}'.format(self.impl))
 
+            if self._astra_wrapper is None:
+                astra_wrapper = wrapper_cls(self.geometry,
+                                            self.range.real_space,
+                                            self.domain.real_space)
+                if self.use_cache:
+                    self._astra_wrapper = astra_wrapper
+            else:
+                astra_wrapper = self._astra_wrapper
+
+            return astra_wrapper.call_backward(x_real, out_real)
+
         elif self.impl == 'skimage':
             return skimage_radon_back_projector(x_real, self.geometry,
                                                 self.range.real_space,
                                                 out_real)
+        elif self.impl == 'odl_cpu':
+            return odl_cpu_back_projector(
+                x_real, self.geometry, self.range.real_space, out_real,
+                memory_budget=self.memory_budget)
+        elif self.impl == 'sparse_matrix':
+            _, backward = self._matrix_operators(self.range.real_space,
+                                                 self.domain.real_space)
+            if out_real is None:
+                out_real = self.range.real_space.element()
+            backward(x_real.ntuple, out=out_real.ntuple)
+
+            # Weight the adjoint by appropriate weights
+            scaling_factor = float(self.domain.weighting.const)
+            scaling_factor /= float(self.range.weighting.const)
+            out_real *= scaling_factor
+            return out_real
         else:
             # Should never happen
             raise RuntimeError('bad `impl` {!r}'.format(self.impl))
 
+    def _call_real_batch(self, x_stack, out):
+        """Real-space back-projection of a stack of projection data."""
+        if self.impl == 'odl_cpu':
+            odl_cpu_back_projector_batch(
+                x_stack, self.geometry, self.domain.real_space,
+                self.range.real_space, out=out,
+                memory_budget=self.memory_budget)
+        elif self.impl == 'sparse_matrix':
+            _, backward = self._matrix_operators(self.range.real_space,
+                                                 self.domain.real_space)
+            self._matrix_batch(backward.matrix, x_stack,
+                               self.domain.real_space,
+                               self.range.real_space, out)
+
+            # Weight the adjoint by appropriate weights
+            scaling_factor = float(self.domain.weighting.const)
+            scaling_factor /= float(self.range.weighting.const)
+            out *= scaling_factor
+        else:
+            super()._call_real_batch(x_stack, out)
+
     @property
     def adjoint(self):
         """Adjoint of this operator.
@@ -526,6 +1034,7 @@ class RayBackProjection(RayTransformBase):
         self._adjoint = RayTransform(self.range, self.geometry,
                                      impl=self.impl,
                                      use_cache=self.use_cache,
+                                     memory_budget=self.memory_budget,
                                      **kwargs)
         return self._adjoint
 
@@ -11,7 +11,8 @@ from __future__ import print_function, division, absolute_import
 from future import standard_library
 standard_library.install_aliases()
 
-__all__ = ('skip_if_no_astra', 'skip_if_no_astra_cuda', 'skip_if_no_skimage')
+__all__ = ('skip_if_no_astra', 'skip_if_no_astra_cuda', 'skip_if_no_skimage',
+           'skip_if_no_odl_cpu')
 
 try:
     import pytest
@@ -19,6 +20,7 @@ except ImportError:
     # Use the identity decorator (default of OptionalArgDecorator)
     from odl.util import OptionalArgDecorator as ident
     skip_if_no_astra = skip_if_no_astra_cuda = skip_if_no_skimage = ident
+    skip_if_no_odl_cpu = ident
 
 else:
     skip_if_no_astra = pytest.mark.skipif('not odl.tomo.ASTRA_AVAILABLE',
@@ -27,3 +29,5 @@ else:
         'not odl.tomo.ASTRA_CUDA_AVAILABLE', reason='ASTRA CUDA not available')
     skip_if_no_skimage = pytest.mark.skipif(
         'not odl.tomo.SKIMAGE_AVAILABLE', reason='skimage not available')
+    skip_if_no_odl_cpu = pytest.mark.skipif(
+        'not odl.tomo.ODL_CPU_AVAILABLE', reason='odl_cpu not available')
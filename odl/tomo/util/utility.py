@@ -15,7 +15,7 @@ import numpy as np
 
 __all__ = ('euler_matrix', 'axis_rotation', 'axis_rotation_matrix',
            'rotation_matrix_from_to', 'transform_system',
-           'perpendicular_vector')
+           'perpendicular_vector', 'is_inside_bounds')
 
 
 def euler_matrix(*angles):
@@ -28,38 +28,57 @@ def euler_matrix(*angles):
 
     Parameters
     ----------
-    angle1,...,angleN : float
+    angle1,...,angleN : float or `array-like`
         One angle results in a (2x2) matrix representing a
         counter-clockwise rotation. Two or three angles result in a
         (3x3) matrix and are interpreted as Euler angles of a 3d
         rotation according to the 'ZXZ' rotation order, see the
         Wikipedia article `Euler angles`_.
+        Arrays of angles are broadcast against each other, resulting
+        in one matrix per entry.
 
     Returns
     -------
-    mat : `numpy.ndarray`, shape ``(2, 2)`` or ``(3, 3)``
-        The rotation matrix
+    mat : `numpy.ndarray`
+        The rotation matrix, with shape ``(2, 2)`` or ``(3, 3)`` for
+        scalar angles. For arrays of angles, the shape is
+        ``bcast_shape + (2, 2)`` or ``bcast_shape + (3, 3)``, where
+        ``bcast_shape`` is the broadcast shape of the angles.
+
+    Examples
+    --------
+    >>> np.allclose(euler_matrix(np.pi / 2), [[0, -1],
+    ...                                       [1, 0]])
+    True
+
+    Several angles result in a stack of matrices:
+
+    >>> mats = euler_matrix([0, np.pi / 2, np.pi])
+    >>> mats.shape
+    (3, 2, 2)
+    >>> np.allclose(mats[1], euler_matrix(np.pi / 2))
+    True
 
     .. _Euler angles:
         https://en.wikipedia.org/wiki/Euler_angles#Rotation_matrix
     """
     if len(angles) == 1:
-        phi = float(angles[0])
+        phi = angles[0]
         theta = psi = 0.
         ndim = 2
     elif len(angles) == 2:
-        phi = float(angles[0])
-        theta = float(angles[1])
+        phi, theta = angles
         psi = 0.
         ndim = 3
     elif len(angles) == 3:
-        phi = float(angles[0])
-        theta = float(angles[1])
-        psi = float(angles[2])
+        phi, theta, psi = angles
         ndim = 3
     else:
         raise ValueError('number of angles must be between 1 and 3')
 
+    phi, theta, psi = np.broadcast_arrays(
+        *[np.array(a, dtype=float, copy=False) for a in (phi, theta, psi)])
+
     cph = np.cos(phi)
     sph = np.sin(phi)
     cth = np.cos(theta)
@@ -82,7 +101,8 @@ def euler_matrix(*angles):
              sth * cps,
              cth]])
 
-    return mat
+    # Move the matrix axes to the end for stacks of matrices
+    return np.moveaxis(mat, (0, 1), (-2, -1))
 
 
 def axis_rotation(axis, angle, vectors, axis_shift=(0, 0, 0)):
@@ -188,37 +208,112 @@ def axis_rotation_matrix(axis, angle):
     ----------
     axis : `array-like`, shape ``(3,)``
         Rotation axis, assumed to be a unit vector.
-    angle : float
-        Angle of the counter-clockwise rotation.
+    angle : float or `array-like`
+        Angle of the counter-clockwise rotation. For an array of angles,
+        one matrix per entry is returned.
 
     Returns
     -------
-    mat : `numpy.ndarray`, shape ``(3, 3)``
-        The axis rotation matrix.
+    mat : `numpy.ndarray`
+        The axis rotation matrix, with shape ``(3, 3)`` for a scalar
+        ``angle`` and ``angle.shape + (3, 3)`` otherwise.
 
     References
     ----------
     .. _Rodriguez' rotation formula:
         https://en.wikipedia.org/wiki/Rodrigues'_rotation_formula
+
+    Examples
+    --------
+    >>> axis = (0, 0, 1)
+    >>> np.allclose(axis_rotation_matrix(axis, np.pi / 2),
+    ...             [[0, -1, 0],
+    ...              [1, 0, 0],
+    ...              [0, 0, 1]])
+    True
+    >>> axis_rotation_matrix(axis, np.linspace(0, np.pi, 5)).shape
+    (5, 3, 3)
     """
     axis = np.asarray(axis)
     if axis.shape != (3,):
         raise ValueError('`axis` shape must be (3,), got {}'
                          ''.format(axis.shape))
 
-    angle = float(angle)
+    angle = np.array(angle, dtype=float, copy=False)
 
     cross_mat = np.array([[0, -axis[2], axis[1]],
                           [axis[2], 0, -axis[0]],
                           [-axis[1], axis[0], 0]])
     dy_mat = np.outer(axis, axis)
     id_mat = np.eye(3)
-    cos_ang = np.cos(angle)
-    sin_ang = np.sin(angle)
+    # Extra axes for broadcasting against the (3, 3) matrices
+    cos_ang = np.cos(angle)[..., None, None]
+    sin_ang = np.sin(angle)[..., None, None]
 
     return cos_ang * id_mat + (1. - cos_ang) * dy_mat + sin_ang * cross_mat
 
 
+def is_inside_bounds(value, params):
+    """Return ``True`` if ``value`` is contained in ``params``.
+
+    In contrast to ``value in params``, this function also accepts
+    arrays of values of arbitrary shape. For ``params.ndim >= 2``,
+    the first axis of ``value`` indexes the components, and the
+    components are broadcast against each other.
+
+    Parameters
+    ----------
+    value : float or `array-like`
+        Value(s) to be checked. For ``params.ndim >= 2``, a sequence
+        of length ``params.ndim``.
+    params : `IntervalProd`
+        Set in which the value(s) are supposed to lie.
+
+    Returns
+    -------
+    is_inside_bounds : bool
+        ``True`` if all values lie in ``params``, ``False`` otherwise.
+
+    Examples
+    --------
+    >>> params = odl.IntervalProd(0, 2)
+    >>> is_inside_bounds(1, params)
+    True
+    >>> is_inside_bounds([[0, 1], [1.5, 2]], params)
+    True
+    >>> is_inside_bounds([0, 3], params)
+    False
+
+    In multiple dimensions, the components are broadcast:
+
+    >>> params = odl.IntervalProd([0, 0], [1, 2])
+    >>> is_inside_bounds([0.5, 1.5], params)
+    True
+    >>> is_inside_bounds(([0, 0.5, 1], [[0], [2]]), params)
+    True
+    """
+    if value in params:
+        # Single parameter, the common case
+        return True
+
+    try:
+        if params.ndim == 1:
+            values = np.array(value, dtype=float, copy=False).reshape(1, -1)
+        else:
+            if len(value) != params.ndim:
+                return False
+            comps = np.broadcast_arrays(
+                *[np.array(v, dtype=float, copy=False) for v in value])
+            values = np.array([c.ravel() for c in comps])
+    except (ValueError, TypeError):
+        return False
+
+    if values.size == 0:
+        return False
+    return (np.all(values.min(axis=1) >= params.min_pt) and
+            np.all(values.max(axis=1) <= params.max_pt))
+
+
 def rotation_matrix_from_to(from_vec, to_vec):
     """Return a matrix that rotates ``from_vec`` to ``to_vec`` in 2d or 3d.
 
@@ -17,11 +17,13 @@ Fourier transforms.
 from __future__ import print_function, division, absolute_import
 from future import standard_library
 standard_library.install_aliases()
-from builtins import range
+from builtins import range, super
 from future.utils import raise_from
 
+from collections import OrderedDict
 from multiprocessing import cpu_count
 from pkg_resources import parse_version
+import threading
 import warnings
 import numpy as np
 from odl.util import (
@@ -37,7 +39,16 @@ except ImportError:
     PYFFTW_AVAILABLE = False
 
 
-__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE')
+__all__ = ('pyfftw_call', 'pyfftw_import_wisdom', 'pyfftw_export_wisdom',
+           'pyfftw_clear_plan_cache', 'PYFFTW_AVAILABLE')
+
+
+# Maximum total size in bytes of the scratch arrays of the plans in the
+# process-wide plan cache
+FFTW_PLAN_CACHE_MAX_BYTES = 2 ** 27
+
+_FFTW_PLAN_CACHE = OrderedDict()
+_FFTW_PLAN_CACHE_LOCK = threading.Lock()
 
 
 def pyfftw_call(array_in, array_out, direction='forward', axes=None,
@@ -95,6 +106,15 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         Number of threads to use.
         Default: Number of CPUs if the number of data points is larger
         than 4096, else 1.
+    plan_cache : bool, optional
+        If ``True``, look up the plan in the process-wide plan cache
+        before planning, and store newly created plans there.
+        Plans are keyed by shape, data type, memory order, alignment,
+        axes, ``halfcomplex``, direction, planning effort and number of
+        threads. Only contiguous arrays are supported. The least
+        recently used plans are evicted when the arrays of the cached
+        plans take more than ``FFTW_PLAN_CACHE_MAX_BYTES`` bytes.
+        Default: ``True``
     normalise_idft : bool, optional
         If ``True``, the result of the backward transform is divided by
         ``1 / N``, where ``N`` is the total number of points in
@@ -105,7 +125,7 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         File to load FFTW wisdom from. If the file does not exist,
         it is ignored.
     export_wisdom : filename or file handle, optional
-        File to append the accumulated FFTW wisdom to
+        File to write the accumulated FFTW wisdom to
 
     Returns
     -------
@@ -131,10 +151,13 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
       'measure' is a good compromise. If you cannot afford the copy,
       use ``'estimate'``.
     * If a plan is provided via the ``fftw_plan`` parameter, no copy
-      is needed internally.
+      is needed internally. The same holds for plans found in the
+      plan cache.
+    * Cached plans are created on their own scratch arrays, hence they
+      do not keep the arrays of the caller alive. They can be executed
+      from several threads, one thread at a time.
+      Use `pyfftw_clear_plan_cache` to release them.
     """
-    import pickle
-
     if not array_in.flags.aligned:
         raise ValueError('input array not aligned')
 
@@ -155,6 +178,7 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
     normalise_idft = kwargs.pop('normalise_idft', False)
     wimport = kwargs.pop('import_wisdom', '')
     wexport = kwargs.pop('export_wisdom', '')
+    plan_cache = kwargs.pop('plan_cache', True)
 
     # Cast input to complex if necessary
     array_in_copied = False
@@ -168,56 +192,247 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
 
     # Import wisdom if possible
     if wimport:
-        try:
-            with open(wimport, 'rb') as wfile:
-                wisdom = pickle.load(wfile)
-        except IOError:
-            wisdom = []
-        except TypeError:  # Got file handle
-            wisdom = pickle.load(wimport)
-
-        if wisdom:
-            pyfftw.import_wisdom(wisdom)
-
-    # Copy input array if it hasn't been done yet and the planner is likely
-    # to destroy it. If we already have a plan, we don't have to worry.
-    planner_destroys = _pyfftw_destroys_input(
-        [planning_effort], direction, halfcomplex, array_in.ndim)
-    must_copy_array_in = fftw_plan_in is None and planner_destroys
-
-    if must_copy_array_in and not array_in_copied:
-        plan_arr_in = np.empty_like(array_in)
-        flags = [_local_to_pyfftw(planning_effort), 'FFTW_DESTROY_INPUT']
-    else:
-        plan_arr_in = array_in
-        flags = [_local_to_pyfftw(planning_effort)]
+        pyfftw_import_wisdom(wimport)
 
     if fftw_plan_in is None:
         if threads is None:
-            if plan_arr_in.size <= 4096:  # Trade-off wrt threading overhead
+            if array_in.size <= 4096:  # Trade-off wrt threading overhead
                 threads = 1
             else:
                 threads = cpu_count()
 
-        fftw_plan = pyfftw.FFTW(
-            plan_arr_in, array_out, direction=_local_to_pyfftw(direction),
-            flags=flags, planning_timelimit=planning_timelimit,
-            threads=threads, axes=axes)
+        if plan_cache:
+            cache_key = _plan_cache_key(array_in, array_out, axes,
+                                        halfcomplex, direction,
+                                        planning_effort, threads)
+        else:
+            cache_key = None
+
+        if cache_key is not None:
+            fftw_plan = _plan_cache_get(cache_key)
+        else:
+            fftw_plan = None
+
+        if fftw_plan is None:
+            # Copy input array if it hasn't been done yet and the planner
+            # is likely to destroy it.
+            planner_destroys = _pyfftw_destroys_input(
+                [planning_effort], direction, halfcomplex, array_in.ndim)
+
+            if planner_destroys and not array_in_copied:
+                flags = [_local_to_pyfftw(planning_effort),
+                         'FFTW_DESTROY_INPUT']
+            else:
+                flags = [_local_to_pyfftw(planning_effort)]
+
+            plan_kwargs = dict(direction=_local_to_pyfftw(direction),
+                               flags=flags,
+                               planning_timelimit=planning_timelimit,
+                               threads=threads, axes=axes)
+
+            if cache_key is not None:
+                # Plan on scratch arrays with the same layout, such that
+                # the cached plan does not reference the arrays of the
+                # caller
+                scratch_in = _scratch_like(array_in)
+                if array_in.ctypes.data == array_out.ctypes.data:
+                    scratch_out = scratch_in
+                else:
+                    scratch_out = _scratch_like(array_out)
+                fftw_plan = _CachedFFTW(scratch_in, scratch_out,
+                                        **plan_kwargs)
+                _plan_cache_put(cache_key, fftw_plan)
+            else:
+                if planner_destroys and not array_in_copied:
+                    plan_arr_in = np.empty_like(array_in)
+                else:
+                    plan_arr_in = array_in
+                fftw_plan = pyfftw.FFTW(plan_arr_in, array_out,
+                                        **plan_kwargs)
     else:
         fftw_plan = fftw_plan_in
 
     fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
 
     if wexport:
-        try:
-            with open(wexport, 'ab') as wfile:
-                pickle.dump(pyfftw.export_wisdom(), wfile)
-        except TypeError:  # Got file handle
-            pickle.dump(pyfftw.export_wisdom(), wexport)
+        pyfftw_export_wisdom(wexport)
 
     return fftw_plan
 
 
+def pyfftw_import_wisdom(wisdom_file):
+    """Load FFTW wisdom from a file.
+
+    Parameters
+    ----------
+    wisdom_file : filename or file handle
+        File written by `pyfftw_export_wisdom`. If the file does not
+        exist, nothing is imported.
+
+    Returns
+    -------
+    success : tuple of bool
+        Flags indicating whether the wisdom for double, single and
+        long double precision was imported.
+    """
+    import pickle
+
+    try:
+        with open(wisdom_file, 'rb') as wfile:
+            wisdom = pickle.load(wfile)
+    except IOError:
+        wisdom = ()
+    except TypeError:  # Got file handle
+        wisdom = pickle.load(wisdom_file)
+
+    if wisdom:
+        return pyfftw.import_wisdom(wisdom)
+    else:
+        return (False, False, False)
+
+
+def pyfftw_export_wisdom(wisdom_file):
+    """Write the accumulated FFTW wisdom to a file.
+
+    Storing the wisdom makes expensive planning (e.g. with
+    ``planning_effort='patient'``) a one-time cost: a later process
+    can load it with `pyfftw_import_wisdom` and plans the same
+    transforms almost instantly.
+
+    Parameters
+    ----------
+    wisdom_file : filename or file handle
+        File to write the wisdom to. An existing file is overwritten.
+    """
+    import pickle
+
+    try:
+        with open(wisdom_file, 'wb') as wfile:
+            pickle.dump(pyfftw.export_wisdom(), wfile)
+    except TypeError:  # Got file handle
+        pickle.dump(pyfftw.export_wisdom(), wisdom_file)
+
+
+def pyfftw_clear_plan_cache():
+    """Remove all plans from the process-wide FFTW plan cache."""
+    with _FFTW_PLAN_CACHE_LOCK:
+        _FFTW_PLAN_CACHE.clear()
+
+
+if PYFFTW_AVAILABLE:
+
+    class _CachedFFTW(pyfftw.FFTW):
+
+        """FFTW plan on private scratch arrays, used in the plan cache.
+
+        The plan is executed while holding a lock, since it may be shared
+        between threads. Afterwards, the scratch arrays are restored, such
+        that the plan does not keep the arrays of the caller alive.
+        """
+
+        def __init__(self, scratch_in, scratch_out, **kwargs):
+            """Initialize a new instance.
+
+            Parameters
+            ----------
+            scratch_in, scratch_out : `numpy.ndarray`
+                Arrays on which the plan is created.
+            kwargs :
+                Further keyword arguments passed to ``pyfftw.FFTW``.
+            """
+            super().__init__(scratch_in, scratch_out, **kwargs)
+            self.lock = threading.Lock()
+            self.nbytes = scratch_in.nbytes
+            if scratch_out is not scratch_in:
+                self.nbytes += scratch_out.nbytes
+
+        def __call__(self, *args, **kwargs):
+            """Execute the plan, see ``pyfftw.FFTW.__call__``."""
+            with self.lock:
+                scratch_in, scratch_out = self.input_array, self.output_array
+                try:
+                    return super().__call__(*args, **kwargs)
+                finally:
+                    self.update_arrays(scratch_in, scratch_out)
+
+
+def _array_alignment(arr):
+    """Return the offset of ``arr`` from the SIMD alignment boundary."""
+    return arr.ctypes.data % pyfftw.simd_alignment
+
+
+def _array_order(arr):
+    """Return the memory order of ``arr``, or ``None`` if not contiguous."""
+    if arr.flags.c_contiguous:
+        return 'C'
+    elif arr.flags.f_contiguous:
+        return 'F'
+    else:
+        return None
+
+
+def _scratch_like(arr):
+    """Return a new array with the same layout and alignment as ``arr``."""
+    offset = _array_alignment(arr)
+    buffer = pyfftw.empty_aligned(arr.nbytes + offset, dtype='uint8')
+    return buffer[offset:offset + arr.nbytes].view(arr.dtype).reshape(
+        arr.shape, order=_array_order(arr))
+
+
+def _plan_cache_key(array_in, array_out, axes, halfcomplex, direction,
+                    planning_effort, threads):
+    """Return the plan cache key for the given transform.
+
+    A plan can only be executed on arrays with the same layout as the
+    ones it was created with, hence shapes, memory order and alignment
+    are part of the key. In-place plans cannot be used out of place and
+    vice versa. ``None`` is returned for arrays that are not contiguous
+    and for in-place transforms with different input and output layout.
+    """
+    order_in, order_out = _array_order(array_in), _array_order(array_out)
+    if order_in is None or order_out is None:
+        return None
+
+    in_place = array_in.ctypes.data == array_out.ctypes.data
+    if in_place and (array_in.shape != array_out.shape or
+                     array_in.dtype != array_out.dtype or
+                     order_in != order_out):
+        return None
+
+    return (array_in.shape, array_out.shape,
+            array_in.dtype, array_out.dtype, order_in, order_out,
+            _array_alignment(array_in), _array_alignment(array_out),
+            in_place, axes, bool(halfcomplex), direction, planning_effort,
+            int(threads))
+
+
+def _plan_cache_get(key):
+    """Return the cached plan for ``key`` or ``None``."""
+    with _FFTW_PLAN_CACHE_LOCK:
+        try:
+            plan = _FFTW_PLAN_CACHE.pop(key)
+        except KeyError:
+            return None
+        # Re-insert to mark as most recently used
+        _FFTW_PLAN_CACHE[key] = plan
+        return plan
+
+
+def _plan_cache_put(key, plan):
+    """Store ``plan`` under ``key`` and evict the oldest plans.
+
+    Plans are evicted until the total size of the scratch arrays is at
+    most ``FFTW_PLAN_CACHE_MAX_BYTES``, which may include ``plan`` itself.
+    """
+    with _FFTW_PLAN_CACHE_LOCK:
+        _FFTW_PLAN_CACHE.pop(key, None)
+        _FFTW_PLAN_CACHE[key] = plan
+        nbytes = sum(p.nbytes for p in _FFTW_PLAN_CACHE.values())
+        while nbytes > FFTW_PLAN_CACHE_MAX_BYTES:
+            _, evicted = _FFTW_PLAN_CACHE.popitem(last=False)
+            nbytes -= evicted.nbytes
+
+
 def _pyfftw_to_local(flag):
     return flag.lstrip('FFTW_').lower()
 
@@ -19,6 +19,7 @@ from future import standard_library
 standard_library.install_aliases()
 
 from itertools import product
+from multiprocessing import cpu_count
 import numpy as np
 
 try:
@@ -27,13 +28,16 @@ try:
 except ImportError:
     PYWT_AVAILABLE = False
 
+from odl.space.reductions import _thread_pool
+
 
 __all__ = ('PAD_MODES_ODL2PYWT', 'PYWT_SUPPORTED_MODES', 'PYWT_AVAILABLE',
            'pywt_wavelet', 'pywt_pad_mode', 'pywt_coeff_shapes',
            'pywt_flat_coeff_size', 'pywt_max_nlevels',
            'pywt_flat_array_from_coeffs', 'pywt_coeffs_from_flat_array',
            'pywt_single_level_decomp', 'pywt_single_level_recon',
-           'pywt_multi_level_decomp', 'pywt_multi_level_recon')
+           'pywt_multi_level_decomp', 'pywt_multi_level_recon',
+           'pywt_multi_level_decomp_flat', 'pywt_multi_level_recon_flat')
 
 
 PAD_MODES_ODL2PYWT = {'constant': 'zero',
@@ -47,6 +51,10 @@ PAD_MODES_ODL2PYWT = {'constant': 'zero',
                       }
 PYWT_SUPPORTED_MODES = PAD_MODES_ODL2PYWT.values()
 
+# Minimum number of array entries for which the bands of a level are
+# computed in several threads by default
+WAVELET_MIN_SIZE_THREADED = 2 ** 16
+
 
 def pywt_wavelet(wavelet):
     """Convert ``wavelet`` to a `pywt.Wavelet` instance."""
@@ -813,6 +821,285 @@ modes.html
                                    recon_shape=recon_shape)
 
 
+def _pywt_dtype(dtype):
+    """Return the data type of the coefficients PyWavelets computes.
+
+    Single and double precision are kept, half precision is promoted to
+    single precision, and all other types are converted to double
+    precision, where complex types stay complex.
+    """
+    dtype = np.dtype(dtype)
+    if dtype in (np.dtype('float32'), np.dtype('float64'),
+                 np.dtype('complex64'), np.dtype('complex128')):
+        return dtype
+    elif dtype == np.dtype('float16'):
+        return np.dtype('float32')
+    elif dtype.kind == 'c':
+        return np.dtype('complex128')
+    else:
+        return np.dtype('float64')
+
+
+def _pywt_threads(size, threads):
+    """Return the number of threads for an array with ``size`` entries."""
+    if threads is None:
+        return cpu_count() if size >= WAVELET_MIN_SIZE_THREADED else 1
+    else:
+        return max(int(threads), 1)
+
+
+def _pywt_map(func, args, threads):
+    """Return ``[func(a) for a in args]``, computed in ``threads`` threads."""
+    if threads == 1 or len(args) == 1:
+        return [func(a) for a in args]
+    else:
+        return _thread_pool(min(threads, len(args))).map(func, args)
+
+
+def _pywt_dwtn_bands(arr, wavelet, mode, threads, out=None):
+    """Return the single-level decomposition bands of ``arr``.
+
+    The transform is computed axis by axis, where the 1d transforms of
+    the bands from the previous axis run in parallel. The bands are
+    ordered as in `pywt_dict_keys`.
+
+    If ``out`` is given, it must be a sequence of ``2 ** ndim`` arrays
+    or ``None`` entries, and the bands with non-``None`` entry are
+    written to those arrays and returned as references to them.
+    """
+    ndim = arr.ndim
+    bands = [arr]
+    for axis in range(ndim):
+        last = (axis == ndim - 1)
+
+        def split(i, axis=axis, last=last):
+            coeff_dict = pywt.dwtn(bands[i], wavelet, mode, axes=(axis,))
+            approx, detail = coeff_dict['a'], coeff_dict['d']
+            bands[i] = None  # Free memory as early as possible
+            if last and out is not None:
+                if out[2 * i] is not None:
+                    out[2 * i][:] = approx
+                    approx = out[2 * i]
+                if out[2 * i + 1] is not None:
+                    out[2 * i + 1][:] = detail
+                    detail = out[2 * i + 1]
+            return approx, detail
+
+        bands = [band for pair in _pywt_map(split, list(range(len(bands))),
+                                            threads)
+                 for band in pair]
+
+    return bands
+
+
+def _pywt_idwtn_bands(bands, wavelet, mode, threads, recon_shape):
+    """Return the single-level reconstruction from ``bands``.
+
+    This is the inverse of `_pywt_dwtn_bands`. The reconstruction is
+    computed axis by axis, starting with the last one, where pairs of
+    bands are merged in parallel and cut to ``recon_shape`` in the
+    current axis.
+    """
+    ndim = len(recon_shape)
+    for axis in reversed(range(ndim)):
+
+        def merge(i, axis=axis):
+            coeff_dict = {'a': bands[2 * i], 'd': bands[2 * i + 1]}
+            bands[2 * i] = bands[2 * i + 1] = None
+            recon = pywt.idwtn(coeff_dict, wavelet, mode, axes=(axis,))
+            n_recon, n_intended = recon.shape[axis], recon_shape[axis]
+            if n_recon == n_intended + 1:
+                # Upsampling added one entry too much in this axis, drop
+                # last one
+                slc = [slice(None)] * ndim
+                slc[axis] = slice(-1)
+                recon = recon[tuple(slc)]
+            elif n_recon != n_intended:
+                raise ValueError('in axis {}: expected size {} or {} in '
+                                 '`recon_shape`, got {}'
+                                 ''.format(axis, n_recon - 1, n_recon,
+                                           n_intended))
+            return recon
+
+        bands = _pywt_map(merge, list(range(len(bands) // 2)), threads)
+
+    return bands[0]
+
+
+def pywt_multi_level_decomp_flat(arr, wavelet, nlevels, mode, out=None,
+                                 threads=None):
+    """Return the multi-level decomposition of ``arr`` as flat array.
+
+    This function computes the same coefficients as
+    `pywt_multi_level_decomp` followed by `pywt_flat_array_from_coeffs`,
+    but writes the coefficient bands directly into their parts of the
+    flat array, without intermediate coefficient lists.
+
+    Parameters
+    ----------
+    arr : `array-like`
+        Input array to the wavelet decomposition.
+    wavelet :  string or `pywt.Wavelet`
+        Specification of the wavelet to be used in the transform.
+        Use `pywt.wavelist` to get a list of available wavelets.
+    nlevels : positive int
+        Number of scaling levels to be used in the decomposition. The
+        maximum number of levels can be calculated with
+        `pywt.dwt_max_level`.
+    mode : string, optional
+        PyWavelets style signal extension mode. See `signal extension modes`_
+        for available options.
+    out : `numpy.ndarray`, optional
+        Contiguous one-dimensional array to which the coefficients are
+        written. Its size must be given by `pywt_flat_coeff_size`.
+    threads : positive int, optional
+        Number of threads computing the bands of one level in parallel.
+        Default: Number of CPUs if ``arr`` has at least
+        ``WAVELET_MIN_SIZE_THREADED`` entries, else 1.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        Flat coefficient vector containing approximation and detail
+        coefficients in the order ``[aN, DN, ... D1]``. If ``out`` was
+        given, the returned object is a reference to it.
+
+    See Also
+    --------
+    pywt_multi_level_recon_flat : Multi-level reconstruction from a flat
+        array, i.e. the inverse of this function.
+
+    Examples
+    --------
+    Decompose the array from the example in `pywt_multi_level_decomp`:
+
+    >>> arr = [[1, 1, 0, 0],
+    ...        [0, 0, 0, 1],
+    ...        [1, 1, 1, 1],
+    ...        [0, 1, 1, 0]]
+    >>> pywt_multi_level_decomp_flat(arr, 'haar', 2, 'zero')
+    array([ 2.25,  0.25, -0.75,  0.25,  0.  , -0.5 , -0.5 ,  0.5 ,  1.  ,
+           -0.5 ,  0.5 ,  0.5 ,  0.  ,  0.5 ,  0.5 , -0.5 ])
+
+    References
+    ----------
+    .. _signal extension modes:
+       https://pywavelets.readthedocs.io/en/latest/ref/signal-extension-\
+modes.html
+    """
+    arr = np.asarray(arr)
+    wavelet = pywt_wavelet(wavelet)
+    shapes = pywt_coeff_shapes(arr.shape, wavelet, nlevels, mode)
+    flat_size = pywt_flat_coeff_size(arr.shape, wavelet, nlevels, mode)
+    if out is None:
+        out = np.empty(flat_size, dtype=_pywt_dtype(arr.dtype))
+    elif out.shape != (flat_size,):
+        raise ValueError('`out` must have shape {}, got {}'
+                         ''.format((flat_size,), out.shape))
+
+    threads = _pywt_threads(arr.size, threads)
+    coeff_views = pywt_coeffs_from_flat_array(out, shapes)
+
+    # Decompose the approximation of the previous level, from finest to
+    # coarsest, with the details written to their part of `out`
+    approx = arr
+    for details_view in reversed(coeff_views[1:]):
+        approx = _pywt_dwtn_bands(approx, wavelet, mode, threads,
+                                  out=[None] + list(details_view))[0]
+    coeff_views[0][:] = approx
+    return out
+
+
+def pywt_multi_level_recon_flat(arr, recon_shape, wavelet, nlevels, mode,
+                                out=None, threads=None):
+    """Return the multi-level reconstruction from a flat array.
+
+    This function computes the same reconstruction as
+    `pywt_coeffs_from_flat_array` followed by `pywt_multi_level_recon`,
+    where the coefficient bands are read directly from the flat array.
+
+    Parameters
+    ----------
+    arr : `array-like`
+        Flat coefficient vector as returned by
+        `pywt_multi_level_decomp_flat`.
+    recon_shape : sequence of ints
+        Shape of the array to be reconstructed.
+    wavelet :  string or `pywt.Wavelet`
+        Specification of the wavelet to be used in the transform.
+        Use `pywt.wavelist` to get a list of available wavelets.
+    nlevels : positive int
+        Number of scaling levels used in the decomposition.
+    mode : string, optional
+        PyWavelets style signal extension mode. See `signal extension modes`_
+        for available options.
+    out : `numpy.ndarray`, optional
+        Array of shape ``recon_shape`` to which the reconstruction is
+        written.
+    threads : positive int, optional
+        Number of threads merging the bands of one level in parallel.
+        Default: Number of CPUs if the reconstruction has at least
+        ``WAVELET_MIN_SIZE_THREADED`` entries, else 1.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        Wavelet reconstruction from the given coefficients. If ``out``
+        was given, the returned object is a reference to it.
+
+    See Also
+    --------
+    pywt_multi_level_decomp_flat : Multi-level decomposition to a flat
+        array, i.e. the inverse of this function.
+
+    Examples
+    --------
+    >>> arr = [[1, 1, 0, 0],
+    ...        [0, 0, 0, 1],
+    ...        [1, 1, 1, 1],
+    ...        [0, 1, 1, 0]]
+    >>> coeffs = pywt_multi_level_decomp_flat(arr, 'haar', 2, 'zero')
+    >>> recon = pywt_multi_level_recon_flat(coeffs, (4, 4), 'haar', 2,
+    ...                                     'zero')
+    >>> np.allclose(recon, arr)
+    True
+
+    References
+    ----------
+    .. _signal extension modes:
+       https://pywavelets.readthedocs.io/en/latest/ref/signal-extension-\
+modes.html
+    """
+    arr = np.asarray(arr)
+    recon_shape, recon_shape_in = tuple(recon_shape), recon_shape
+    if any(int(s) != s for s in recon_shape):
+        raise ValueError('`recon_shape` may only contain integers, got {}'
+                         ''.format(recon_shape_in))
+    wavelet = pywt_wavelet(wavelet)
+    shapes = pywt_coeff_shapes(recon_shape, wavelet, nlevels, mode)
+    flat_size = pywt_flat_coeff_size(recon_shape, wavelet, nlevels, mode)
+    if arr.shape != (flat_size,):
+        raise ValueError('`arr` must have shape {}, got {}'
+                         ''.format((flat_size,), arr.shape))
+
+    threads = _pywt_threads(int(np.prod(recon_shape)), threads)
+    coeff_views = pywt_coeffs_from_flat_array(arr, shapes)
+
+    # Merge the approximation with the details of the next level, cut to
+    # the shape of the details of the level after that
+    next_shapes = list(shapes[2:]) + [recon_shape]
+    recon = coeff_views[0]
+    for details, next_shape in zip(coeff_views[1:], next_shapes):
+        recon = _pywt_idwtn_bands([recon] + list(details), wavelet, mode,
+                                  threads, next_shape)
+
+    if out is None:
+        return recon.astype(_pywt_dtype(arr.dtype), copy=False)
+    else:
+        out[:] = recon
+        return out
+
+
 if __name__ == '__main__':
     # pylint: disable=wrong-import-position
     from odl.util.testutils import run_doctests
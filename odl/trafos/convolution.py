@@ -0,0 +1,444 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Discrete convolution with a fixed kernel."""
+
+# Imports for common Python 2/3 codebase
+from __future__ import print_function, division, absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import super
+
+from itertools import product
+import numpy as np
+from scipy import ndimage
+
+from odl.discr import DiscreteLp
+from odl.operator import Operator
+from odl.trafos.backends.pyfftw_bindings import pyfftw_call
+from odl.trafos.fourier import (
+    _fft_call, _SUPPORTED_FOURIER_IMPLS, _DEFAULT_FOURIER_IMPL)
+from odl.util import (is_real_dtype, complex_dtype, signature_string,
+                      indent_rows)
+
+
+__all__ = ('Convolution',)
+
+
+_SUPPORTED_CONV_ENGINES = ('direct', 'fft', 'oadd')
+
+# Rough cost of the engines relative to one multiply-add in the direct
+# evaluation, used to choose the engine. The direct evaluation has an
+# overhead per image point, the FFT cost is per point and per ``log2`` of
+# the transform size, and the overhead of cutting the image into blocks
+# and adding them up again is per image point and grows with the number
+# of dimensions.
+_DIRECT_COST = 1.0
+_DIRECT_OVERHEAD = 10.0
+_FFT_COST = 2.5
+_OADD_OVERHEAD = 8.0
+
+# Minimum size of the overlap-add blocks, and their size relative to the
+# kernel. Smaller blocks waste most of their work on the overlap.
+_OADD_MIN_BLOCK = 64
+_OADD_BLOCK_FACTOR = 8
+
+
+def _next_fast_len(n):
+    """Return the smallest 5-smooth integer ``>= n``.
+
+    FFT implementations are fastest for sizes with only the prime
+    factors 2, 3 and 5.
+    """
+    best = 1
+    while best < n:
+        best *= 2
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # Smallest power of 2 such that p35 * p2 >= n
+            p2 = 1
+            while p35 * p2 < n:
+                p2 *= 2
+            best = min(best, p35 * p2)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _conv_layout(image_shape, kernel_shape, center, engine):
+    """Return the block shape, block step and block count per axis.
+
+    Block ``i`` along an axis starts at ``i * step`` in the zero-padded
+    full convolution. Along axes that are not split into blocks, the
+    "block" is a single circular convolution which is long enough to
+    avoid wrap-around in the part of the output that is used, and the
+    step is equal to its length.
+    """
+    block_shape, steps, nblocks = [], [], []
+    for n, m, c in zip(image_shape, kernel_shape, center):
+        if engine == 'oadd' and m > 1:
+            b = _next_fast_len(max(_OADD_MIN_BLOCK,
+                                   _OADD_BLOCK_FACTOR * (m - 1)))
+            s = b - m + 1
+            nb = -(-n // s)
+            if nb > 1:
+                block_shape.append(b)
+                steps.append(s)
+                nblocks.append(nb)
+                continue
+
+        block_shape.append(_next_fast_len(max(n + max(c, m - 1 - c), m)))
+        steps.append(block_shape[-1])
+        nblocks.append(1)
+
+    return tuple(block_shape), tuple(steps), tuple(nblocks)
+
+
+def _conv_cost(image_shape, kernel_shape, center, engine):
+    """Return the estimated cost of a convolution with ``engine``."""
+    if engine == 'direct':
+        return np.prod(image_shape, dtype='float64') * (
+            _DIRECT_COST * np.prod(kernel_shape) + _DIRECT_OVERHEAD)
+
+    block_shape, _, nblocks = _conv_layout(image_shape, kernel_shape,
+                                           center, engine)
+    size = np.prod(block_shape, dtype='float64')
+    cost = _FFT_COST * np.prod(nblocks) * size * np.log2(max(size, 2))
+    if any(nb > 1 for nb in nblocks):
+        cost += (_OADD_OVERHEAD * 4 ** (len(image_shape) - 1) *
+                 np.prod(image_shape, dtype='float64'))
+    return cost
+
+
+def _select_conv_engine(image_shape, kernel_shape, center):
+    """Return the engine with the lowest estimated cost."""
+    costs = [_conv_cost(image_shape, kernel_shape, center, engine)
+             for engine in _SUPPORTED_CONV_ENGINES]
+    return _SUPPORTED_CONV_ENGINES[int(np.argmin(costs))]
+
+
+class Convolution(Operator):
+
+    """Discrete convolution with a fixed kernel.
+
+    This operator computes ::
+
+        out[n] = sum_m( kernel[m] * x[n + center - m] ),
+
+        0 <= m < kernel.shape,
+
+    where ``x`` is extended by zeros outside of its domain. The output
+    has the same shape as the input, and the kernel entry with index
+    ``center`` is the one that is applied to ``x[n]`` for ``out[n]``.
+
+    Three engines can evaluate the convolution:
+
+    - ``'direct'``: Evaluate the sum directly with `scipy.ndimage`.
+      This is fastest for small kernels.
+    - ``'fft'``: Multiply with the Fourier transform of the kernel in
+      a single zero-padded real FFT of the image.
+    - ``'oadd'``: Overlap-add, i.e., FFT convolution of blocks of the
+      image whose size depends on the kernel size. This is fastest for
+      medium-sized kernels in large images.
+
+    The Fourier transforms of the kernel are computed once when the
+    operator is created.
+
+    See Also
+    --------
+    FourierTransform : Continuous Fourier transform
+    scipy.ndimage.convolve : direct evaluation
+    scipy.signal.oaconvolve : overlap-add in SciPy
+    """
+
+    def __init__(self, space, kernel, center=None, engine=None, impl=None,
+                 threads=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `DiscreteLp`
+            Domain and range of the operator.
+        kernel : array-like
+            Convolution kernel with the same number of dimensions as
+            ``space``. It can be smaller or larger than ``space``.
+            A complex kernel requires a complex ``space``.
+        center : sequence of ints, optional
+            Index of the kernel entry that acts as the origin.
+            Default: ``kernel.shape // 2``
+        engine : {'direct', 'fft', 'oadd'}, optional
+            Method used to evaluate the convolution.
+            ``None`` selects the engine with the lowest estimated cost
+            for the sizes of the image and the kernel.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFTs of the ``'fft'`` and ``'oadd'`` engines.
+            ``None`` selects the fastest available backend.
+        threads : int, optional
+            Number of threads used by the ``'scipy'`` and ``'pyfftw'``
+            backends. Default: Number of CPUs if the number of data points
+            is larger than 4096, else 1.
+
+        Examples
+        --------
+        A smoothing kernel in 1D. The values outside the domain are
+        taken to be zero:
+
+        >>> space = odl.uniform_discr(0, 5, 5)
+        >>> conv = Convolution(space, [1, 2, 1])
+        >>> conv([0, 1, 0, 0, 1])
+        uniform_discr(0.0, 5.0, 5).element([1.0, 2.0, 1.0, 1.0, 2.0])
+
+        All engines compute the same result:
+
+        >>> x = [1, 2, 3, 4, 5]
+        >>> conv_fft = Convolution(space, [1, 2, 1], engine='fft')
+        >>> np.allclose(conv(x), conv_fft(x))
+        True
+
+        The adjoint is the convolution with the flipped kernel, which
+        is the same operator for symmetric kernels:
+
+        >>> conv.adjoint is conv
+        True
+        """
+        if not isinstance(space, DiscreteLp):
+            raise TypeError('`space` {!r} is not a `DiscreteLp` instance'
+                            ''.format(space))
+
+        kernel, kernel_in = np.array(kernel, copy=True, ndmin=1), kernel
+        if kernel.ndim != space.ndim:
+            raise ValueError('`kernel` has {} dimensions, expected {}'
+                             ''.format(kernel.ndim, space.ndim))
+        if kernel.size == 0:
+            raise ValueError('`kernel` {!r} is empty'.format(kernel_in))
+        if not is_real_dtype(kernel.dtype) and is_real_dtype(space.dtype):
+            raise ValueError('complex `kernel` requires a complex `space`, '
+                             'got {!r}'.format(space))
+        self.__kernel = kernel.astype(space.dtype)
+        self.__kernel.setflags(write=False)
+
+        if center is None:
+            center = tuple(m // 2 for m in kernel.shape)
+        else:
+            center, center_in = tuple(int(c) for c in center), center
+            if (len(center) != kernel.ndim or
+                    any(not 0 <= c < m
+                        for c, m in zip(center, kernel.shape))):
+                raise ValueError('`center` {} not a valid index in `kernel` '
+                                 'with shape {}'.format(center_in,
+                                                        kernel.shape))
+        self.__center = center
+
+        if engine is None:
+            engine = _select_conv_engine(space.shape, kernel.shape, center)
+        engine, engine_in = str(engine).lower(), engine
+        if engine not in _SUPPORTED_CONV_ENGINES:
+            raise ValueError("`engine` '{}' not understood".format(engine_in))
+        self.__engine = engine
+
+        if impl is None:
+            impl = _DEFAULT_FOURIER_IMPL
+        impl, impl_in = str(impl).lower(), impl
+        if impl not in _SUPPORTED_FOURIER_IMPLS:
+            raise ValueError("`impl` '{}' not supported".format(impl_in))
+        self.__impl = impl
+        self.__threads = threads
+
+        super().__init__(domain=space, range=space, linear=True)
+
+        self._halfcomplex = is_real_dtype(space.dtype)
+        if self.engine != 'direct':
+            self._block_shape, self._steps, self._nblocks = _conv_layout(
+                space.shape, kernel.shape, center, self.engine)
+            self._kernel_ft = self._fftn(self.kernel)
+        self._adjoint = None
+
+    @property
+    def kernel(self):
+        """Convolution kernel as a read-only array."""
+        return self.__kernel
+
+    @property
+    def center(self):
+        """Index of the kernel entry acting as origin."""
+        return self.__center
+
+    @property
+    def engine(self):
+        """Method used to evaluate the convolution."""
+        return self.__engine
+
+    @property
+    def impl(self):
+        """Backend for the FFT implementation."""
+        return self.__impl
+
+    def _fftn(self, arr):
+        """Return the FFT of ``arr`` zero-padded to the block shape.
+
+        The transform is taken along the last ``ndim`` axes, and it is
+        half-complex for real spaces.
+        """
+        ndim = self.domain.ndim
+        axes = tuple(range(arr.ndim - ndim, arr.ndim))
+        shape = self._block_shape
+        if self.impl == 'pyfftw':
+            arr_in = np.zeros(arr.shape[:-ndim] + shape, dtype=arr.dtype)
+            arr_in[tuple(slice(None, n) for n in arr.shape)] = arr
+            out_shape = list(arr_in.shape)
+            if self._halfcomplex:
+                out_shape[-1] = out_shape[-1] // 2 + 1
+            arr_out = np.empty(out_shape, dtype=complex_dtype(arr.dtype))
+            pyfftw_call(arr_in, arr_out, direction='forward', axes=axes,
+                        halfcomplex=self._halfcomplex, normalise_idft=True,
+                        threads=self.__threads)
+            return arr_out
+        else:
+            fname = 'rfftn' if self._halfcomplex else 'fftn'
+            return _fft_call(self.impl, fname, arr, self.__threads, s=shape,
+                             axes=axes)
+
+    def _ifftn(self, arr):
+        """Return the inverse of `_fftn`, overwriting ``arr``."""
+        ndim = self.domain.ndim
+        axes = tuple(range(arr.ndim - ndim, arr.ndim))
+        shape = self._block_shape
+        if self.impl == 'pyfftw':
+            dtype = self.domain.dtype
+            arr_out = np.empty(arr.shape[:-ndim] + shape, dtype=dtype)
+            pyfftw_call(arr, arr_out, direction='backward', axes=axes,
+                        halfcomplex=self._halfcomplex, normalise_idft=True,
+                        threads=self.__threads)
+            return arr_out
+        else:
+            fname = 'irfftn' if self._halfcomplex else 'ifftn'
+            kwargs = {'overwrite_x': True} if self.impl == 'scipy' else {}
+            return _fft_call(self.impl, fname, arr, self.__threads, s=shape,
+                             axes=axes, **kwargs)
+
+    def _call(self, x, out):
+        """Implement ``self(x, out)``."""
+        if self.engine == 'direct':
+            self._call_direct(x.asarray(), out)
+        else:
+            self._call_fft(x.asarray(), out)
+
+    def _call_direct(self, x, out):
+        """Evaluate the sum directly and write it to ``out``."""
+        origin = [c - m // 2 for c, m in zip(self.center, self.kernel.shape)]
+        if self._halfcomplex:
+            out[:] = ndimage.convolve(x, self.kernel, mode='constant',
+                                      origin=origin)
+        else:
+            # `ndimage` only handles real data
+            def conv(arr, kernel):
+                return ndimage.convolve(arr, kernel, mode='constant',
+                                        origin=origin)
+
+            x_r, x_i = x.real, x.imag
+            k_r, k_i = self.kernel.real, self.kernel.imag
+            out[:] = (conv(x_r, k_r) - conv(x_i, k_i) +
+                      1j * (conv(x_r, k_i) + conv(x_i, k_r)))
+
+    def _call_fft(self, x, out):
+        """Evaluate the convolution with FFTs and write it to ``out``."""
+        ndim = x.ndim
+        block_shape, steps, nblocks = (self._block_shape, self._steps,
+                                       self._nblocks)
+        crop = tuple(slice(c, c + n) for c, n in zip(self.center, out.shape))
+
+        if all(nb == 1 for nb in nblocks):
+            x_ft = self._fftn(x)
+            x_ft *= self._kernel_ft
+            out[:] = self._ifftn(x_ft)[crop]
+            return
+
+        # Cut `x` into pieces of length `step` along the blocked axes,
+        # arranged as `(nb[0], ..., nb[d-1], s[0], ..., s[d-1])`
+        in_steps = tuple(s if nb > 1 else n
+                         for s, nb, n in zip(steps, nblocks, x.shape))
+        padded_shape = tuple(nb * s for nb, s in zip(nblocks, in_steps))
+        if padded_shape != x.shape:
+            x_pad = np.zeros(padded_shape, dtype=x.dtype)
+            x_pad[tuple(slice(None, n) for n in x.shape)] = x
+            x = x_pad
+        perm = list(range(0, 2 * ndim, 2)) + list(range(1, 2 * ndim, 2))
+        x = x.reshape(sum(zip(nblocks, in_steps), ())).transpose(perm)
+
+        x_ft = self._fftn(x)
+        x_ft *= self._kernel_ft
+        y = self._ifftn(x_ft)
+
+        # Overlap-add: chunk `j` of length `step` of block `q` is added at
+        # `(q + j) * step` along each axis
+        nchunks = [-(-b // s) for b, s in zip(block_shape, steps)]
+        full_shape = tuple((nb + nc - 1) * s
+                           for nb, nc, s in zip(nblocks, nchunks, steps))
+        full = np.zeros(full_shape, dtype=y.dtype)
+        for chunk_idx in product(*[range(nc) for nc in nchunks]):
+            chunk = y[(slice(None),) * ndim +
+                      tuple(slice(j * s, (j + 1) * s)
+                            for j, s in zip(chunk_idx, steps))]
+            full_view = full[tuple(slice(j * s, (j + nb) * s)
+                                   for j, s, nb in zip(chunk_idx, steps,
+                                                       nblocks))]
+            full_view = full_view.reshape(
+                sum(zip(nblocks, steps), ())).transpose(perm)
+            chunk_part = tuple(slice(None, n) for n in chunk.shape[ndim:])
+            full_view[(slice(None),) * ndim + chunk_part] += chunk
+
+        out[:] = full[crop]
+
+    @property
+    def adjoint(self):
+        """Adjoint operator, the convolution with the flipped kernel.
+
+        For a symmetric real kernel with centered origin, the operator
+        is self-adjoint, and the adjoint is this operator itself.
+        Otherwise, the adjoint is created once and then cached.
+        """
+        if self.domain.exponent != 2.0:
+            raise NotImplementedError(
+                'no adjoint defined for exponent {} != 2'
+                ''.format(self.domain.exponent))
+
+        if self._adjoint is None:
+            adj_kernel = np.conj(self.kernel[(slice(None, None, -1),) *
+                                             self.kernel.ndim])
+            adj_center = tuple(m - 1 - c for m, c in zip(self.kernel.shape,
+                                                         self.center))
+            if (adj_center == self.center and
+                    np.array_equal(adj_kernel, self.kernel)):
+                self._adjoint = self
+            else:
+                self._adjoint = Convolution(
+                    self.domain, adj_kernel, center=adj_center,
+                    engine=self.engine, impl=self.impl,
+                    threads=self.__threads)
+                self._adjoint._adjoint = self
+        return self._adjoint
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.domain, self.kernel]
+        optargs = [('center', self.center,
+                    tuple(m // 2 for m in self.kernel.shape)),
+                   ('engine', self.engine, ''),
+                   ('impl', self.impl, _DEFAULT_FOURIER_IMPL)]
+        inner_str = signature_string(posargs, optargs, mod=['!r', ''],
+                                     sep=[',\n', ', ', ',\n'])
+        return '{}(\n{}\n)'.format(self.__class__.__name__,
+                                   indent_rows(inner_str))
+
+
+if __name__ == '__main__':
+    # pylint: disable=wrong-import-position
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -14,7 +14,13 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import super
 
+from multiprocessing import cpu_count
 import numpy as np
+try:
+    import scipy.fft
+    SCIPY_FFT_AVAILABLE = True
+except ImportError:
+    SCIPY_FFT_AVAILABLE = False
 
 from odl.discr import DiscreteLp, discr_sequence_space
 from odl.operator import Operator
@@ -22,11 +28,13 @@ from odl.set import RealNumbers, ComplexNumbers
 from odl.trafos.backends.pyfftw_bindings import (
     pyfftw_call, PYFFTW_AVAILABLE, _pyfftw_to_local)
 from odl.trafos.util import (
-    reciprocal_grid, reciprocal_space,
-    dft_preprocess_data, dft_postprocess_data)
+    reciprocal_grid, reciprocal_space, dft_preprocess_data)
+from odl.trafos.util.ft_utils import (
+    _dft_preprocess_factors, _dft_postprocess_factors)
 from odl.util import (is_real_dtype, is_complex_floating_dtype,
                       dtype_repr, conj_exponent, complex_dtype,
-                      normalized_scalar_param_list, normalized_axes_tuple)
+                      normalized_scalar_param_list, normalized_axes_tuple,
+                      fast_1d_tensor_mult)
 
 
 __all__ = ('DiscreteFourierTransform', 'DiscreteFourierTransformInverse',
@@ -35,11 +43,28 @@ __all__ = ('DiscreteFourierTransform', 'DiscreteFourierTransformInverse',
 
 _SUPPORTED_FOURIER_IMPLS = ('numpy',)
 _DEFAULT_FOURIER_IMPL = 'numpy'
+if SCIPY_FFT_AVAILABLE:
+    _SUPPORTED_FOURIER_IMPLS += ('scipy',)
+    _DEFAULT_FOURIER_IMPL = 'scipy'
 if PYFFTW_AVAILABLE:
     _SUPPORTED_FOURIER_IMPLS += ('pyfftw',)
     _DEFAULT_FOURIER_IMPL = 'pyfftw'
 
 
+def _fft_call(impl, fname, x, threads=None, **kwargs):
+    """Call the FFT function ``fname`` of the numpy or scipy back-end.
+
+    For ``impl='scipy'``, the transform runs on ``threads`` workers. By
+    default, all CPUs are used if ``x`` has more than 4096 entries.
+    """
+    if impl == 'scipy':
+        if threads is None:
+            threads = cpu_count() if x.size > 4096 else 1
+        return getattr(scipy.fft, fname)(x, workers=threads, **kwargs)
+    else:
+        return getattr(np.fft, fname)(x, **kwargs)
+
+
 class DiscreteFourierTransformBase(Operator):
 
     """Base class for discrete fourier transform classes."""
@@ -79,9 +104,10 @@ class DiscreteFourierTransformBase(Operator):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw', ``None``}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw', ``None``}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster and multi-threaded, but require the
+            ``scipy.fft`` module or the ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         """
         if not isinstance(domain, DiscreteLp):
@@ -167,10 +193,11 @@ class DiscreteFourierTransformBase(Operator):
         pyfftw_call : Call pyfftw backend directly
         """
         # TODO: Implement zero padding
-        if self.impl == 'numpy':
-            out[:] = self._call_numpy(x.asarray())
-        else:
+        if self.impl == 'pyfftw':
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
+        else:
+            out[:] = self._call_numpy(x.asarray(),
+                                      threads=kwargs.pop('threads', None))
 
     @property
     def impl(self):
@@ -215,13 +242,17 @@ class DiscreteFourierTransformBase(Operator):
         """
         raise NotImplementedError('abstract method')
 
-    def _call_numpy(self, x):
-        """Return ``self(x)`` using numpy.
+    def _call_numpy(self, x, threads=None):
+        """Return ``self(x)`` using numpy or scipy.
 
         Parameters
         ----------
         x : `numpy.ndarray`
             Input array to be transformed
+        threads : int, optional
+            Number of worker threads for the ``'scipy'`` back-end.
+            Default: Number of CPUs if the number of data points is
+            larger than 4096, else 1.
 
         Returns
         -------
@@ -246,7 +277,8 @@ class DiscreteFourierTransformBase(Operator):
             for futher information.
             Default: ``('FFTW_MEASURE',)``
         threads : positive int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
         planning_timelimit : float or ``None``, optional
             Rough upper limit in seconds for the planning step of the
             transform. ``None`` means no limit. See the
@@ -285,7 +317,9 @@ class DiscreteFourierTransformBase(Operator):
         self._fftw_plan = pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
-            fftw_plan=self._fftw_plan, normalise_idft=False)
+            fftw_plan=self._fftw_plan, normalise_idft=False,
+            threads=kwargs.pop('threads', None),
+            planning_timelimit=kwargs.pop('planning_timelimit', None))
 
         return out
 
@@ -306,7 +340,8 @@ class DiscreteFourierTransformBase(Operator):
             Limit planning time to roughly this amount of seconds.
             Default: None (no limit)
         threads : int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
 
         Raises
         ------
@@ -409,9 +444,11 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The ``'pyfftw'`` backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The ``'scipy'`` and
+            ``'pyfftw'`` backends are faster and multi-threaded, but
+            require the ``scipy.fft`` module or the ``pyfftw`` package,
+            respectively.
             ``None`` selects the fastest available backend.
 
         Examples
@@ -441,7 +478,7 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         super().__init__(inverse=False, domain=domain, range=range, axes=axes,
                          sign=sign, halfcomplex=halfcomplex, impl=impl)
 
-    def _call_numpy(self, x):
+    def _call_numpy(self, x, threads=None):
         """Return ``self(x)`` using numpy.
 
         See Also
@@ -451,14 +488,15 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         assert isinstance(x, np.ndarray)
 
         if self.halfcomplex:
-            return np.fft.rfftn(x, axes=self.axes)
+            return _fft_call(self.impl, 'rfftn', x, threads, axes=self.axes)
         else:
             if self.sign == '-':
-                return np.fft.fftn(x, axes=self.axes)
+                return _fft_call(self.impl, 'fftn', x, threads, axes=self.axes)
             else:
                 # Need to undo Numpy IFFT scaling
                 return (np.prod(np.take(self.domain.shape, self.axes)) *
-                        np.fft.ifftn(x, axes=self.axes))
+                        _fft_call(self.impl, 'ifftn', x, threads,
+                                  axes=self.axes))
 
     def _call_pyfftw(self, x, out, **kwargs):
         """Implement ``self(x[, out, **kwargs])`` using pyfftw.
@@ -489,7 +527,9 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         self._fftw_plan = pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
-            fftw_plan=self._fftw_plan, normalise_idft=False)
+            fftw_plan=self._fftw_plan, normalise_idft=False,
+            threads=kwargs.pop('threads', None),
+            planning_timelimit=kwargs.pop('planning_timelimit', None))
 
         return out
 
@@ -499,7 +539,7 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         sign = '+' if self.sign == '-' else '-'
         return DiscreteFourierTransformInverse(
             domain=self.range, range=self.domain, axes=self.axes,
-            halfcomplex=self.halfcomplex, sign=sign)
+            halfcomplex=self.halfcomplex, sign=sign, impl=self.impl)
 
 
 class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
@@ -559,9 +599,10 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             ``floor(N[i]/2) + 1`` in this axis ``i``.
             Otherwise, domain and range have the same shape. If
             ``range`` is a complex space, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster and multi-threaded, but require the
+            ``scipy.fft`` module or the ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
 
         Examples
@@ -591,13 +632,17 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
         super().__init__(inverse=True, domain=range, range=domain, axes=axes,
                          sign=sign, halfcomplex=halfcomplex, impl=impl)
 
-    def _call_numpy(self, x):
-        """Return ``self(x)`` using numpy.
+    def _call_numpy(self, x, threads=None):
+        """Return ``self(x)`` using numpy or scipy.
 
         Parameters
         ----------
         x : `numpy.ndarray`
             Input array to be transformed
+        threads : int, optional
+            Number of worker threads for the ``'scipy'`` back-end.
+            Default: Number of CPUs if the number of data points is
+            larger than 4096, else 1.
 
         Returns
         -------
@@ -605,12 +650,14 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             Result of the transform
         """
         if self.halfcomplex:
-            return np.fft.irfftn(x, axes=self.axes)
+            return _fft_call(self.impl, 'irfftn', x, threads, axes=self.axes)
         else:
             if self.sign == '+':
-                return np.fft.ifftn(x, axes=self.axes)
+                return _fft_call(self.impl, 'ifftn', x, threads,
+                                 axes=self.axes)
             else:
-                return (np.fft.fftn(x, axes=self.axes) /
+                return (_fft_call(self.impl, 'fftn', x, threads,
+                                  axes=self.axes) /
                         np.prod(np.take(self.domain.shape, self.axes)))
 
     def _call_pyfftw(self, x, out, **kwargs):
@@ -629,7 +676,8 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             for futher information.
             Default: ``('FFTW_MEASURE',)``
         threads : positive int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
         planning_timelimit : float, optional
             Rough upper limit in seconds for the planning step of the
             transform. The default is no limit. See the
@@ -665,7 +713,9 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
         self._fftw_plan = pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
-            fftw_plan=self._fftw_plan, normalise_idft=True)
+            fftw_plan=self._fftw_plan, normalise_idft=True,
+            threads=kwargs.pop('threads', None),
+            planning_timelimit=kwargs.pop('planning_timelimit', None))
 
         # Need to normalize for 'forward', no way to force pyfftw
         if self.sign == '-':
@@ -679,7 +729,7 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
         sign = '-' if self.sign == '+' else '+'
         return DiscreteFourierTransform(
             domain=self.range, range=self.domain, axes=self.axes,
-            halfcomplex=self.halfcomplex, sign=sign)
+            halfcomplex=self.halfcomplex, sign=sign, impl=self.impl)
 
 
 class FourierTransformBase(Operator):
@@ -728,9 +778,10 @@ class FourierTransformBase(Operator):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster and multi-threaded, but require the
+            ``scipy.fft`` module or the ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -863,6 +914,9 @@ class FourierTransformBase(Operator):
         self._tmp_r = tmp_r
         self._tmp_f = tmp_f
 
+        # 1d factors of pre- and post-processing, computed on first use
+        self._factors = {}
+
     def _call(self, x, out, **kwargs):
         """Implement ``self(x, out[, **kwargs])``.
 
@@ -884,19 +938,24 @@ class FourierTransformBase(Operator):
         pyfftw_call : Call pyfftw backend directly
         """
         # TODO: Implement zero padding
-        if self.impl == 'numpy':
-            out[:] = self._call_numpy(x.asarray())
-        else:
+        if self.impl == 'pyfftw':
             # 0-overhead assignment if asarray() does not copy
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
+        else:
+            out[:] = self._call_numpy(x.asarray(),
+                                      threads=kwargs.pop('threads', None))
 
-    def _call_numpy(self, x):
-        """Return ``self(x)`` for numpy back-end.
+    def _call_numpy(self, x, threads=None):
+        """Return ``self(x)`` for numpy or scipy back-end.
 
         Parameters
         ----------
         x : `numpy.ndarray`
             Array representing the function to be transformed
+        threads : int, optional
+            Number of worker threads for the ``'scipy'`` back-end.
+            Default: Number of CPUs if the number of data points is
+            larger than 4096, else 1.
 
         Returns
         -------
@@ -922,7 +981,8 @@ class FourierTransformBase(Operator):
             Limit planning time to roughly this many seconds.
             Default: ``None`` (no limit)
         threads : int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
 
         Returns
         -------
@@ -1000,8 +1060,11 @@ class FourierTransformBase(Operator):
 
         Notes
         -----
-        To save memory, clear the temporaries when the transform is
-        no longer used.
+        Without stored temporaries, each call allocates new arrays.
+        Stored temporaries are shared by all calls of this transform,
+        hence it must not be called from several threads at the same
+        time. To save memory, clear the temporaries when the transform
+        is no longer used.
 
         See Also
         --------
@@ -1027,6 +1090,23 @@ class FourierTransformBase(Operator):
         self._tmp_r = None
         self._tmp_f = None
 
+    def _workspace(self, r):
+        """Return the real (``r=True``) or frequency space temporary.
+
+        If the temporary has not been created with `create_temporaries`,
+        a new array is returned, which is not stored.
+        """
+        tmp = self._tmp_r if r else self._tmp_f
+        if tmp is not None:
+            return tmp
+
+        inverse = isinstance(self, FourierTransformInverse)
+        if r:
+            space = self.range if inverse else self.domain
+        else:
+            space = self.domain if inverse else self.range
+        return np.empty(space.shape, dtype=space.dtype)
+
     def init_fftw_plan(self, planning_effort='measure', **kwargs):
         """Initialize the FFTW plan for this transform for later use.
 
@@ -1044,7 +1124,8 @@ class FourierTransformBase(Operator):
             Limit planning time to roughly this many seconds.
             Default: ``None`` (no limit)
         threads : int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
 
         Raises
         ------
@@ -1171,9 +1252,10 @@ class FourierTransform(FourierTransformBase):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster and multi-threaded, but require the
+            ``scipy.fft`` module or the ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1244,18 +1326,26 @@ class FourierTransform(FourierTransformBase):
         HALFC: use ``tmp_r`` (R2R operation)
 
         The result is stored in ``out`` if given, otherwise in
-        a temporary or a new array.
+        the temporary from `create_temporaries` or a new array.
         """
+        if self.halfcomplex and not all(self.shifts):
+            # Complex factors, cannot use the real temporary
+            return dft_preprocess_data(
+                x, shift=self.shifts, axes=self.axes, sign=self.sign,
+                out=out)
+
         if out is None:
             if self.domain.field == ComplexNumbers():
-                out = self._tmp_r if self._tmp_r is not None else self._tmp_f
+                if self._tmp_r is None and self._tmp_f is not None:
+                    out = self._tmp_f
+                else:
+                    out = self._workspace(r=True)
             elif self.domain.field == RealNumbers() and not self.halfcomplex:
-                out = self._tmp_f
+                out = self._workspace(r=False)
             else:
-                out = self._tmp_r
-        return dft_preprocess_data(
-            x, shift=self.shifts, axes=self.axes, sign=self.sign,
-            out=out)
+                out = self._workspace(r=True)
+        return fast_1d_tensor_mult(x, self._preprocess_factors(out.dtype),
+                                   axes=self.axes, out=out)
 
     def _postprocess(self, x, out=None):
         """Return the post-processed version of ``x``.
@@ -1265,25 +1355,52 @@ class FourierTransform(FourierTransformBase):
         HALFC: use ``tmp_f`` (C2C operation)
 
         The result is stored in ``out`` if given, otherwise in
-        a temporary or a new array.
+        the temporary from `create_temporaries` or a new array.
         """
         if out is None:
-            if self.domain.field == ComplexNumbers():
-                out = self._tmp_r if self._tmp_r is not None else self._tmp_f
+            if (self.domain.field == ComplexNumbers() and
+                    self._tmp_r is not None):
+                out = self._tmp_r
             else:
-                out = self._tmp_f
-        return dft_postprocess_data(
-            out, real_grid=self.domain.grid, recip_grid=self.range.grid,
-            shift=self.shifts, axes=self.axes, sign=self.sign,
-            interp=self.domain.interp, op='multiply', out=out)
-
-    def _call_numpy(self, x):
-        """Return ``self(x)`` for numpy back-end.
+                out = self._workspace(r=False)
+        return fast_1d_tensor_mult(x, self._postprocess_factors(out.dtype),
+                                   axes=self.axes, out=out)
+
+    def _preprocess_factors(self, dtype):
+        """Return the 1d factors used in `_preprocess`."""
+        key = ('pre', np.dtype(dtype))
+        if key not in self._factors:
+            self._factors[key] = _dft_preprocess_factors(
+                self.domain.shape, self.shifts, self.axes, self.sign, dtype)
+        return self._factors[key]
+
+    def _postprocess_factors(self, dtype):
+        """Return the 1d factors used in `_postprocess`.
+
+        For the numpy and scipy back-ends, the factors also undo the
+        scaling of the inverse FFT used for ``sign='+'``.
+        """
+        key = ('post', np.dtype(dtype))
+        if key not in self._factors:
+            factors = _dft_postprocess_factors(
+                self.domain.grid, self.range.grid, self.shifts, self.axes,
+                self.domain.interp, self.sign, 'multiply', dtype)
+            if self.impl != 'pyfftw' and self.sign == '+':
+                factors[0] *= np.prod(np.take(self.domain.shape, self.axes))
+            self._factors[key] = factors
+        return self._factors[key]
+
+    def _call_numpy(self, x, threads=None):
+        """Return ``self(x)`` for numpy or scipy back-end.
 
         Parameters
         ----------
         x : `numpy.ndarray`
             Array representing the function to be transformed
+        threads : int, optional
+            Number of worker threads for the ``'scipy'`` back-end.
+            Default: Number of CPUs if the number of data points is
+            larger than 4096, else 1.
 
         Returns
         -------
@@ -1299,15 +1416,17 @@ class FourierTransform(FourierTransformBase):
 
         # The actual call to the FFT library, out-of-place unfortunately
         if self.halfcomplex:
-            out = np.fft.rfftn(preproc, axes=self.axes)
+            out = _fft_call(self.impl, 'rfftn', preproc, threads,
+                            axes=self.axes)
         else:
             if self.sign == '-':
-                out = np.fft.fftn(preproc, axes=self.axes)
+                out = _fft_call(self.impl, 'fftn', preproc, threads,
+                                axes=self.axes)
             else:
-                out = np.fft.ifftn(preproc, axes=self.axes)
-                # Numpy's FFT normalizes by 1 / prod(shape[axes]), we
-                # need to undo that
-                out *= np.prod(np.take(self.domain.shape, self.axes))
+                # Numpy's FFT normalizes by 1 / prod(shape[axes]), which is
+                # undone in the post-processing
+                out = _fft_call(self.impl, 'ifftn', preproc, threads,
+                                axes=self.axes)
 
         # Post-processing accounting for shift, scaling and interpolation
         self._postprocess(out, out=out)
@@ -1330,7 +1449,8 @@ class FourierTransform(FourierTransformBase):
             Limit planning time to roughly this many seconds.
             Default: ``None`` (no limit)
         threads : int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
 
         Returns
         -------
@@ -1407,9 +1527,10 @@ class FourierTransformInverse(FourierTransformBase):
             domain is determined from ``range`` and the other parameters.
             The exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'scipy', 'pyfftw'}, optional
+            Backend for the FFT implementation. The 'scipy' and 'pyfftw'
+            backends are faster and multi-threaded, but require the
+            ``scipy.fft`` module or the ``pyfftw`` package, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1485,17 +1606,16 @@ class FourierTransformInverse(FourierTransformBase):
         HALFC: use ``tmp_f`` (C2C operation)
 
         The result is stored in ``out`` if given, otherwise in
-        a temporary or a new array.
+        the temporary from `create_temporaries` or a new array.
         """
         if out is None:
-            if self.range.field == ComplexNumbers():
-                out = self._tmp_r if self._tmp_r is not None else self._tmp_f
+            if (self.range.field == ComplexNumbers() and
+                    self._tmp_r is not None):
+                out = self._tmp_r
             else:
-                out = self._tmp_f
-        return dft_postprocess_data(
-            x, real_grid=self.range.grid, recip_grid=self.domain.grid,
-            shift=self.shifts, axes=self.axes, sign=self.sign,
-            interp=self.domain.interp, op='divide', out=out)
+                out = self._workspace(r=False)
+        return fast_1d_tensor_mult(x, self._preprocess_factors(out.dtype),
+                                   axes=self.axes, out=out)
 
     def _postprocess(self, x, out=None):
         """Return the post-processed version of ``x``.
@@ -1505,25 +1625,59 @@ class FourierTransformInverse(FourierTransformBase):
         HALFC: use ``tmp_r`` (R2R operation)
 
         The result is stored in ``out`` if given, otherwise in
-        a temporary or a new array.
+        the temporary from `create_temporaries` or a new array. For
+        real ``out``, the imaginary part of ``x`` is discarded.
         """
         if out is None:
             if self.range.field == ComplexNumbers():
-                out = self._tmp_r if self._tmp_r is not None else self._tmp_f
+                if self._tmp_r is None and self._tmp_f is not None:
+                    out = self._tmp_f
+                else:
+                    out = self._workspace(r=True)
             elif self.range.field == RealNumbers() and not self.halfcomplex:
-                out = self._tmp_f
+                out = self._workspace(r=False)
             else:  # halfcomplex
-                out = self._tmp_r
-        return dft_preprocess_data(
-            x, shift=self.shifts, axes=self.axes, sign=self.sign, out=out)
+                out = self._workspace(r=True)
+        if is_real_dtype(out.dtype) and is_complex_floating_dtype(x.dtype):
+            x = x.real
+        return fast_1d_tensor_mult(x, self._postprocess_factors(out.dtype),
+                                   axes=self.axes, out=out)
+
+    def _preprocess_factors(self, dtype):
+        """Return the 1d factors used in `_preprocess`.
 
-    def _call_numpy(self, x):
-        """Return ``self(x)`` for numpy back-end.
+        For ``sign='-'``, the factors also include the normalization
+        by ``1 / prod(shape[axes])`` of the FFT.
+        """
+        key = ('pre', np.dtype(dtype))
+        if key not in self._factors:
+            factors = _dft_postprocess_factors(
+                self.range.grid, self.domain.grid, self.shifts, self.axes,
+                self.domain.interp, self.sign, 'divide', dtype)
+            if self.sign == '-':
+                factors[0] /= np.prod(np.take(self.domain.shape, self.axes))
+            self._factors[key] = factors
+        return self._factors[key]
+
+    def _postprocess_factors(self, dtype):
+        """Return the 1d factors used in `_postprocess`."""
+        key = ('post', np.dtype(dtype))
+        if key not in self._factors:
+            self._factors[key] = _dft_preprocess_factors(
+                self.range.shape, self.shifts, self.axes, self.sign, dtype)
+        return self._factors[key]
+
+    def _call_numpy(self, x, threads=None):
+        """Return ``self(x)`` for numpy or scipy back-end.
 
         Parameters
         ----------
         x : `numpy.ndarray`
             Array representing the function to be transformed
+        threads : int, optional
+            Number of worker threads for the ``'scipy'`` back-end.
+            Default: Number of CPUs if the number of data points is
+            larger than 4096, else 1.
 
         Returns
         -------
@@ -1535,17 +1689,19 @@ class FourierTransformInverse(FourierTransformBase):
 
         # The actual call to the FFT library
         # Normalization by 1 / prod(shape[axes]) is done by Numpy's FFT if
-        # one of the "i" functions is used. For sign='-' we need to do it
-        # ourselves.
+        # one of the "i" functions is used. For sign='-' it is part of
+        # the pre-processing.
         if self.halfcomplex:
             s = np.asarray(self.range.shape)[list(self.axes)]
-            out = np.fft.irfftn(preproc, axes=self.axes, s=s)
+            out = _fft_call(self.impl, 'irfftn', preproc, threads,
+                            axes=self.axes, s=s)
         else:
             if self.sign == '-':
-                out = np.fft.fftn(preproc, axes=self.axes)
-                out /= np.prod(np.take(self.domain.shape, self.axes))
+                out = _fft_call(self.impl, 'fftn', preproc, threads,
+                                axes=self.axes)
             else:
-                out = np.fft.ifftn(preproc, axes=self.axes)
+                out = _fft_call(self.impl, 'ifftn', preproc, threads,
+                                axes=self.axes)
 
         # Post-processing in IFT = pre-processing in FT (in-place)
         self._postprocess(out, out=out)
@@ -1574,7 +1730,8 @@ class FourierTransformInverse(FourierTransformBase):
             Limit planning time to roughly this many seconds.
             Default: ``None`` (no limit)
         threads : int, optional
-            Number of threads to use. Default: 1
+            Number of threads to use. Default: Number of CPUs if the
+            number of data points is larger than 4096, else 1.
 
         Returns
         -------
@@ -1615,10 +1772,8 @@ class FourierTransformInverse(FourierTransformBase):
                 normalise_idft=True, **kwargs)
             fft_arr = out
 
-        # Normalization is only done for 'backward', we need it for 'forward',
-        # too.
-        if self.sign == '-':
-            fft_arr /= np.prod(np.take(self.domain.shape, self.axes))
+        # Normalization is only done for 'backward', for 'forward' it is
+        # part of the pre-processing.
 
         # Post-processing in IFT = pre-processing in FT. In-place for
         # C2C and HC2R. For C2R, this is out-of-place and discards the
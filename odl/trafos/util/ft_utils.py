@@ -314,23 +314,34 @@ def dft_preprocess_data(arr, shift=True, axes=None, sign='-', out=None):
         except TypeError:
             axes = list(axes)
 
-    shape = arr.shape
     shift_list = normalized_scalar_param_list(shift, length=len(axes),
                                               param_conv=bool)
 
-    # Make a copy of arr with correct data type if necessary, or copy values.
+    # Allocate an array with correct data type if necessary. The values
+    # are written by the multiplication below.
     if out is None:
         if is_real_dtype(arr.dtype) and not all(shift_list):
-            out = np.array(arr, dtype=complex_dtype(arr.dtype), copy=True)
+            out = np.empty(arr.shape, dtype=complex_dtype(arr.dtype))
         else:
-            out = arr.copy()
-    else:
-        out[:] = arr
+            out = np.empty_like(arr)
 
     if is_real_dtype(out.dtype) and not shift:
         raise ValueError('cannot pre-process real input in-place without '
                          'shift')
 
+    onedim_arrs = _dft_preprocess_factors(arr.shape, shift_list, axes, sign,
+                                          out.dtype)
+    fast_1d_tensor_mult(arr, onedim_arrs, axes=axes, out=out)
+    return out
+
+
+def _dft_preprocess_factors(shape, shift_list, axes, sign, dtype):
+    """Return the 1d factors of the pre-processing in each axis.
+
+    See `dft_preprocess_data` for the meaning of the parameters. The
+    factors have data type ``dtype`` and can be applied to an array
+    of shape ``shape`` with `fast_1d_tensor_mult`.
+    """
     if sign == '-':
         imag = -1j
     elif sign == '+':
@@ -341,21 +352,16 @@ def dft_preprocess_data(arr, shift=True, axes=None, sign='-', out=None):
     def _onedim_arr(length, shift):
         if shift:
             # (-1)^indices
-            factor = np.ones(length, dtype=out.dtype)
+            factor = np.ones(length, dtype=dtype)
             factor[1::2] = -1
         else:
-            factor = np.arange(length, dtype=out.dtype)
+            factor = np.arange(length, dtype=dtype)
             factor *= -imag * np.pi * (1 - 1.0 / length)
             np.exp(factor, out=factor)
-        return factor.astype(out.dtype, copy=False)
+        return factor.astype(dtype, copy=False)
 
-    onedim_arrs = []
-    for axis, shift in zip(axes, shift_list):
-        length = shape[axis]
-        onedim_arrs.append(_onedim_arr(length, shift))
-
-    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
-    return out
+    return [_onedim_arr(shape[axis], shift)
+            for axis, shift in zip(axes, shift_list)]
 
 
 def _interp_kernel_ft(norm_freqs, interp):
@@ -471,9 +477,7 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
                          'data type'.format(dtype_repr(arr.dtype)))
 
     if out is None:
-        out = arr.copy()
-    elif out is not arr:
-        out[:] = arr
+        out = np.empty_like(arr)
 
     if axes is None:
         axes = list(range(arr.ndim))
@@ -486,6 +490,20 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
     shift_list = normalized_scalar_param_list(shift, length=len(axes),
                                               param_conv=bool)
 
+    onedim_arrs = _dft_postprocess_factors(real_grid, recip_grid, shift_list,
+                                           axes, interp, sign, op, out.dtype)
+    fast_1d_tensor_mult(arr, onedim_arrs, axes=axes, out=out)
+    return out
+
+
+def _dft_postprocess_factors(real_grid, recip_grid, shift_list, axes,
+                             interp, sign, op, dtype):
+    """Return the 1d factors of the post-processing in each axis.
+
+    See `dft_postprocess_data` for the meaning of the parameters. The
+    factors have data type ``dtype`` and can be applied to an array on
+    ``recip_grid`` with `fast_1d_tensor_mult`.
+    """
     if sign == '-':
         imag = -1j
     elif sign == '+':
@@ -504,7 +522,7 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
     except TypeError:
         pass
     else:
-        interp = [str(interp).lower()] * arr.ndim
+        interp = [str(interp).lower()] * real_grid.ndim
 
     onedim_arrs = []
     for ax, shift, intp in zip(axes, shift_list, interp):
@@ -550,10 +568,9 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
         else:
             onedim_arr /= interp_kernel
 
-        onedim_arrs.append(onedim_arr.astype(out.dtype, copy=False))
+        onedim_arrs.append(onedim_arr.astype(dtype, copy=False))
 
-    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
-    return out
+    return onedim_arrs
 
 
 def reciprocal_space(space, axes=None, halfcomplex=False, shift=True,
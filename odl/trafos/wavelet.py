@@ -21,8 +21,9 @@ from odl.operator import Operator
 from odl.trafos.backends.pywt_bindings import (
     PYWT_AVAILABLE, PAD_MODES_ODL2PYWT,
     pywt_pad_mode, pywt_wavelet, pywt_flat_coeff_size, pywt_coeff_shapes,
-    pywt_max_nlevels, pywt_flat_array_from_coeffs, pywt_coeffs_from_flat_array,
-    pywt_multi_level_decomp, pywt_multi_level_recon)
+    pywt_max_nlevels, pywt_flat_array_from_coeffs,
+    pywt_multi_level_decomp_flat, pywt_multi_level_recon_flat)
+from odl.util import writable_array
 
 __all__ = ('WaveletTransform', 'WaveletTransformInverse')
 
@@ -41,7 +42,7 @@ class WaveletTransformBase(Operator):
     """
 
     def __init__(self, space, wavelet, nlevels, variant, pad_mode='constant',
-                 pad_const=0, impl='pywt'):
+                 pad_const=0, impl='pywt', threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -106,6 +107,9 @@ class WaveletTransformBase(Operator):
             ``pywt`` back-end.
         impl : {'pywt'}, optional
             Back-end for the wavelet transform.
+        threads : positive int, optional
+            Number of threads computing the bands of one scaling level
+            in parallel. Default: Number of CPUs for large arrays, else 1.
         """
         if not isinstance(space, DiscreteLp):
             raise TypeError('`space` {!r} is not a `DiscreteLp` instance.'
@@ -122,6 +126,13 @@ class WaveletTransformBase(Operator):
         if self.impl not in _SUPPORTED_WAVELET_IMPLS:
             raise ValueError("`impl` '{}' not supported".format(impl_in))
 
+        if threads is not None:
+            threads, threads_in = int(threads), threads
+            if threads < 1:
+                raise ValueError('`threads` must be positive, got {}'
+                                 ''.format(threads_in))
+        self.__threads = threads
+
         self.__wavelet = getattr(wavelet, 'name', str(wavelet).lower())
         self.__pad_mode = str(pad_mode).lower()
         self.__pad_const = space.field.element(pad_const)
@@ -151,6 +162,11 @@ class WaveletTransformBase(Operator):
         """Implementation back-end of this wavelet transform."""
         return self.__impl
 
+    @property
+    def threads(self):
+        """Number of threads per scaling level, ``None`` for automatic."""
+        return self.__threads
+
     @property
     def nlevels(self):
         """Number of scaling levels in this wavelet transform."""
@@ -216,7 +232,7 @@ class WaveletTransform(WaveletTransformBase):
     """Discrete wavelet transform between discretized Lp spaces."""
 
     def __init__(self, domain, wavelet, nlevels=None, pad_mode='constant',
-                 pad_const=0, impl='pywt'):
+                 pad_const=0, impl='pywt', threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -277,6 +293,9 @@ class WaveletTransform(WaveletTransformBase):
             ``pywt`` back-end.
         impl : {'pywt'}, optional
             Backend for the wavelet transform.
+        threads : positive int, optional
+            Number of threads computing the bands of one scaling level
+            in parallel. Default: Number of CPUs for large arrays, else 1.
 
         Examples
         --------
@@ -299,15 +318,20 @@ class WaveletTransform(WaveletTransformBase):
         """
         super().__init__(space=domain, wavelet=wavelet, nlevels=nlevels,
                          variant='forward', pad_mode=pad_mode,
-                         pad_const=pad_const, impl=impl)
+                         pad_const=pad_const, impl=impl, threads=threads)
+
+    def _call(self, x, out):
+        """Write the wavelet transform of ``x`` to ``out``.
 
-    def _call(self, x):
-        """Return wavelet transform of ``x``."""
+        The coefficient bands are written directly to their parts of
+        ``out``.
+        """
         if self.impl == 'pywt':
-            coeff_list = pywt_multi_level_decomp(
-                x, wavelet=self.pywt_wavelet, nlevels=self.nlevels,
-                mode=self.pywt_pad_mode)
-            return pywt_flat_array_from_coeffs(coeff_list)
+            with writable_array(out) as out_arr:
+                pywt_multi_level_decomp_flat(
+                    x.asarray(), wavelet=self.pywt_wavelet,
+                    nlevels=self.nlevels, mode=self.pywt_pad_mode,
+                    out=out_arr, threads=self.threads)
         else:
             raise RuntimeError("bad `impl` '{}'".format(self.impl))
 
@@ -346,7 +370,8 @@ class WaveletTransform(WaveletTransformBase):
         """
         return WaveletTransformInverse(
             range=self.domain, wavelet=self.pywt_wavelet, nlevels=self.nlevels,
-            pad_mode=self.pad_mode, pad_const=self.pad_const, impl=self.impl)
+            pad_mode=self.pad_mode, pad_const=self.pad_const, impl=self.impl,
+            threads=self.threads)
 
 
 class WaveletTransformInverse(WaveletTransformBase):
@@ -359,7 +384,7 @@ class WaveletTransformInverse(WaveletTransformBase):
     """
 
     def __init__(self, range, wavelet, nlevels=None, pad_mode='constant',
-                 pad_const=0, impl='pywt'):
+                 pad_const=0, impl='pywt', threads=None):
         """Initialize a new instance.
 
          Parameters
@@ -421,6 +446,9 @@ class WaveletTransformInverse(WaveletTransformBase):
             ``pywt`` back-end.
         impl : {'pywt'}, optional
             Back-end for the wavelet transform.
+        threads : positive int, optional
+            Number of threads computing the bands of one scaling level
+            in parallel. Default: Number of CPUs for large arrays, else 1.
 
         Examples
         --------
@@ -441,17 +469,20 @@ class WaveletTransformInverse(WaveletTransformBase):
         """
         super().__init__(space=range, wavelet=wavelet, variant='inverse',
                          nlevels=nlevels, pad_mode=pad_mode,
-                         pad_const=pad_const, impl=impl)
+                         pad_const=pad_const, impl=impl, threads=threads)
+
+    def _call(self, coeffs, out):
+        """Write the inverse wavelet transform of ``coeffs`` to ``out``.
 
-    def _call(self, coeffs):
-        """Return the inverse wavelet transform of ``coeffs``."""
+        The coefficient bands are read from views into ``coeffs``.
+        """
         if self.impl == 'pywt':
-            shapes = pywt_coeff_shapes(self.range.shape, self.pywt_wavelet,
-                                       self.nlevels, self.pywt_pad_mode)
-            coeff_list = pywt_coeffs_from_flat_array(coeffs, shapes)
-            return pywt_multi_level_recon(
-                coeff_list, recon_shape=self.range.shape,
-                wavelet=self.pywt_wavelet, mode=self.pywt_pad_mode)
+            with writable_array(out) as out_arr:
+                pywt_multi_level_recon_flat(
+                    coeffs.asarray(), self.range.shape,
+                    wavelet=self.pywt_wavelet, nlevels=self.nlevels,
+                    mode=self.pywt_pad_mode, out=out_arr,
+                    threads=self.threads)
         else:
             raise RuntimeError("bad `impl` '{}'".format(self.impl))
 
@@ -494,7 +525,8 @@ class WaveletTransformInverse(WaveletTransformBase):
         """
         return WaveletTransform(
             domain=self.range, wavelet=self.pywt_wavelet, nlevels=self.nlevels,
-            pad_mode=self.pad_mode, pad_const=self.pad_const, impl=self.impl)
+            pad_mode=self.pad_mode, pad_const=self.pad_const, impl=self.impl,
+            threads=self.threads)
 
 
 if __name__ == '__main__':
@@ -24,6 +24,9 @@ __all__ = ('apply_on_boundary', 'fast_1d_tensor_mult', 'resize_array')
 _SUPPORTED_RESIZE_PAD_MODES = ('constant', 'symmetric', 'periodic',
                                'order0', 'order1')
 
+# Number of array entries processed per block in `fast_1d_tensor_mult`
+TENSOR_MULT_BLOCK_SIZE = 2 ** 16
+
 
 def apply_on_boundary(array, func, only_once=True, which_boundaries=None,
                       axis_order=None, out=None):
@@ -202,8 +205,11 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
       and multiply it to the large array. Finally, multiply with the
       last 1d array.
 
-    The advantage of this approach is that it is memory-friendly and
-    loops over the big array only twice.
+    The advantage of this approach is that it is memory-friendly. The
+    product with ``ndarr`` is written directly to ``out``, and in the
+    second case, both multiplications are done block by block along the
+    axis with the largest stride. Hence the big array is traversed
+    only once from main memory.
 
     Parameters
     ----------
@@ -224,10 +230,15 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
         Result of the modification. If ``out`` was given, the returned
         object is a reference to it.
     """
+    ndarr = np.asarray(ndarr)
     if out is None:
         out = np.array(ndarr, copy=True)
-    else:
+        ndarr = out
+    elif (ndarr.shape != out.shape or
+          not np.can_cast(ndarr.dtype, out.dtype, casting='same_kind')):
+        # Broadcast or cast explicitly, multiply in-place below
         out[:] = ndarr  # Self-assignment is free if out is ndarr
+        ndarr = out
 
     if not onedim_arrs:
         raise ValueError('no 1d arrays given')
@@ -260,9 +271,9 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
             # Meshgrid-style slice
             slc = [None] * out.ndim
             slc[ax] = slice(None)
-            factor = factor * arr[slc]
+            factor = factor * arr[tuple(slc)]
 
-        out *= factor
+        np.multiply(ndarr, factor, out=out)
 
     else:
         # Hybrid approach
@@ -272,7 +283,7 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
         last_ax = np.argmax(out.strides)
         last_arr = alist[axes.index(last_ax)]
 
-        # Build the semi-big array and multiply
+        # Build the semi-big array
         factor = np.array(1.0)
         for ax, arr in zip(axes, alist):
             if ax == last_ax:
@@ -280,14 +291,22 @@ def fast_1d_tensor_mult(ndarr, onedim_arrs, axes=None, out=None):
 
             slc = [None] * out.ndim
             slc[ax] = slice(None)
-            factor = factor * arr[slc]
-
-        out *= factor
-
-        # Finally multiply by the remaining 1d array
-        slc = [None] * out.ndim
-        slc[last_ax] = slice(None)
-        out *= last_arr[slc]
+            factor = factor * arr[tuple(slc)]
+
+        # Multiply by the semi-big array and the remaining 1d array in
+        # blocks along `last_ax`, such that the second multiplication
+        # finds the block in cache
+        last_len = out.shape[last_ax]
+        block_len = max(TENSOR_MULT_BLOCK_SIZE * last_len //
+                        max(out.size, 1), 1)
+        last_slc = [None] * out.ndim
+        block_slc = [slice(None)] * out.ndim
+        for start in range(0, last_len, block_len):
+            block_slc[last_ax] = slice(start, start + block_len)
+            last_slc[last_ax] = slice(start, start + block_len)
+            out_block = out[tuple(block_slc)]
+            np.multiply(ndarr[tuple(block_slc)], factor, out=out_block)
+            out_block *= last_arr[tuple(last_slc)]
 
     return out
 
@@ -152,6 +152,7 @@ setup(
         'fftw': 'pyfftw',
         'pywavelets': 'Pywavelets>=0.4',
         'skimage': 'scikit-image',
+        'numba': 'numba',
         'proximal': 'proximal',
     },
 